@@ -0,0 +1,8 @@
+# -*- coding: utf-8 -*-
+"""
+Colour - Benchmarks
+===================
+
+*Airspeed Velocity* benchmarks of *Colour* hot paths, see the *asv.conf.json*
+configuration file and the *benchmarks* task of the *tasks.py* file.
+"""
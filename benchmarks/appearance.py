@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+Colour Appearance Models Benchmarks
+===================================
+
+Defines the :mod:`colour.appearance` sub-package benchmarks:
+
+-   :class:`benchmarks.appearance.XYZ_to_CIECAM02`
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+
+import colour
+from colour.utilities import filter_warnings
+
+from .common import SIZES, random_array
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['XYZ_to_CIECAM02']
+
+
+class XYZ_to_CIECAM02(object):
+    """
+    Benchmarks :func:`colour.XYZ_to_CIECAM02` definition.
+    """
+
+    params = list(SIZES.keys())
+    param_names = ['size']
+
+    timeout = 300
+
+    def setup(self, size):
+        """
+        Initialises the benchmark attributes.
+        """
+
+        filter_warnings()
+
+        self._XYZ = random_array(size, [0, 0, 0], [95.05, 100.00, 108.88])
+        self._XYZ_w = np.array([95.05, 100.00, 108.88])
+        self._L_A = 318.31
+        self._Y_b = 20.0
+
+    def time_XYZ_to_CIECAM02(self, size):
+        """
+        Times :func:`colour.XYZ_to_CIECAM02` definition.
+        """
+
+        colour.XYZ_to_CIECAM02(self._XYZ, self._XYZ_w, self._L_A, self._Y_b)
+
+    def peakmem_XYZ_to_CIECAM02(self, size):
+        """
+        Measures :func:`colour.XYZ_to_CIECAM02` definition peak memory.
+        """
+
+        colour.XYZ_to_CIECAM02(self._XYZ, self._XYZ_w, self._L_A, self._Y_b)
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+Colorimetry Benchmarks
+======================
+
+Defines the :mod:`colour.colorimetry` sub-package benchmarks:
+
+-   :class:`benchmarks.colorimetry.Spectral_to_XYZ`
+-   :class:`benchmarks.colorimetry.Multi_spectral_to_XYZ`
+-   :class:`benchmarks.colorimetry.SpectralPowerDistributionInterpolate`
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+
+from colour.colorimetry import (ILLUMINANTS_SPDS, SpectralShape,
+                                multi_spectral_to_XYZ, spectral_to_XYZ)
+from colour.utilities import filter_warnings
+
+from .common import random_array
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'Spectral_to_XYZ', 'Multi_spectral_to_XYZ',
+    'SpectralPowerDistributionInterpolate'
+]
+
+
+class Spectral_to_XYZ(object):
+    """
+    Benchmarks :func:`colour.spectral_to_XYZ` definition.
+    """
+
+    params = ['ASTM E308-15', 'Integration']
+    param_names = ['method']
+
+    def setup(self, method):
+        """
+        Initialises the benchmark attributes.
+        """
+
+        filter_warnings()
+
+        self._spd = ILLUMINANTS_SPDS['D65'].copy()
+
+    def time_spectral_to_XYZ(self, method):
+        """
+        Times :func:`colour.spectral_to_XYZ` definition.
+        """
+
+        spectral_to_XYZ(self._spd, method=method)
+
+    def peakmem_spectral_to_XYZ(self, method):
+        """
+        Measures :func:`colour.spectral_to_XYZ` definition peak memory.
+        """
+
+        spectral_to_XYZ(self._spd, method=method)
+
+
+class Multi_spectral_to_XYZ(object):
+    """
+    Benchmarks :func:`colour.multi_spectral_to_XYZ` definition.
+
+    Notes
+    -----
+    -   The *4K image* size is not benchmarked as its multi-spectral array
+        would not fit in memory.
+    """
+
+    params = ['scalar', '1k', '1M']
+    param_names = ['size']
+
+    timeout = 300
+
+    def setup(self, size):
+        """
+        Initialises the benchmark attributes.
+        """
+
+        filter_warnings()
+
+        self._shape = SpectralShape(360, 780, 10)
+        self._msa = random_array(size, np.zeros(len(self._shape)),
+                                 np.ones(len(self._shape)))
+
+    def time_multi_spectral_to_XYZ(self, size):
+        """
+        Times :func:`colour.multi_spectral_to_XYZ` definition.
+        """
+
+        multi_spectral_to_XYZ(self._msa, self._shape)
+
+    def peakmem_multi_spectral_to_XYZ(self, size):
+        """
+        Measures :func:`colour.multi_spectral_to_XYZ` definition peak memory.
+        """
+
+        multi_spectral_to_XYZ(self._msa, self._shape)
+
+
+class SpectralPowerDistributionInterpolate(object):
+    """
+    Benchmarks :meth:`colour.SpectralPowerDistribution.interpolate` method.
+
+    Notes
+    -----
+    -   The interpolation being performed in place, the timed code includes
+        the copy of the spectral power distribution.
+    """
+
+    params = [[1, 0.1], ['Sprague', 'Linear']]
+    param_names = ['interval', 'interpolator']
+
+    def setup(self, interval, interpolator):
+        """
+        Initialises the benchmark attributes.
+        """
+
+        from colour.algebra import LinearInterpolator, SpragueInterpolator
+
+        filter_warnings()
+
+        self._spd = ILLUMINANTS_SPDS['D65'].copy()
+        self._shape = SpectralShape(interval=interval)
+        self._interpolator = {
+            'Sprague': SpragueInterpolator,
+            'Linear': LinearInterpolator
+        }[interpolator]
+
+    def time_interpolate(self, interval, interpolator):
+        """
+        Times :meth:`colour.SpectralPowerDistribution.interpolate` method.
+        """
+
+        self._spd.copy().interpolate(self._shape, self._interpolator)
+
+    def peakmem_interpolate(self, interval, interpolator):
+        """
+        Measures :meth:`colour.SpectralPowerDistribution.interpolate` method
+        peak memory.
+        """
+
+        self._spd.copy().interpolate(self._shape, self._interpolator)
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+Common Benchmarks Utilities
+===========================
+
+Defines the common benchmarks utilities objects:
+
+-   :attr:`benchmarks.common.SIZES`
+-   :func:`benchmarks.common.random_array`
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+from collections import OrderedDict
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['SIZES', 'SEED', 'random_array']
+
+SIZES = OrderedDict((
+    ('scalar', ()),
+    ('1k', (1000, )),
+    ('1M', (1000000, )),
+    ('4K image', (2160, 3840)),
+))
+"""
+Benchmarked input sizes, i.e. the input arrays shape without their last
+dimension.
+
+SIZES : OrderedDict
+    **{'scalar', '1k', '1M', '4K image'}**
+"""
+
+SEED = 4
+"""
+Random number generator seed used to generate the benchmarked input arrays.
+
+SEED : int
+"""
+
+
+def random_array(size, low, high, dtype=np.float_, seed=SEED):
+    """
+    Returns a uniformly distributed random array of given benchmarked size.
+
+    Parameters
+    ----------
+    size : unicode
+        **{'scalar', '1k', '1M', '4K image'}**,
+        Benchmarked size, see :attr:`benchmarks.common.SIZES` attribute.
+    low : array_like
+        Lower bound of the last dimension values.
+    high : array_like
+        Upper bound of the last dimension values.
+    dtype : type, optional
+        Array dtype.
+    seed : int, optional
+        Random number generator seed.
+
+    Returns
+    -------
+    ndarray
+        Random array of shape ``SIZES[size] + np.shape(low)``.
+
+    Examples
+    --------
+    >>> random_array('1k', [0, 0, 0], [1, 1, 1]).shape
+    (1000, 3)
+    """
+
+    low = np.asarray(low)
+
+    return np.random.RandomState(seed).uniform(
+        low, high, SIZES[size] + low.shape).astype(dtype)
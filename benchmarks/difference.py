@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+Colour Difference Benchmarks
+============================
+
+Defines the :mod:`colour.difference` sub-package benchmarks:
+
+-   :class:`benchmarks.difference.Delta_E_CIE2000`
+"""
+
+from __future__ import division, unicode_literals
+
+from colour.difference import delta_E_CIE2000
+from colour.utilities import filter_warnings
+
+from .common import SEED, SIZES, random_array
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['Delta_E_CIE2000']
+
+
+class Delta_E_CIE2000(object):
+    """
+    Benchmarks :func:`colour.difference.delta_E_CIE2000` definition.
+    """
+
+    params = list(SIZES.keys())
+    param_names = ['size']
+
+    timeout = 300
+
+    def setup(self, size):
+        """
+        Initialises the benchmark attributes.
+        """
+
+        filter_warnings()
+
+        self._Lab_1 = random_array(size, [0, -100, -100], [100, 100, 100])
+        self._Lab_2 = random_array(
+            size, [0, -100, -100], [100, 100, 100], seed=SEED + 1)
+
+    def time_delta_E_CIE2000(self, size):
+        """
+        Times :func:`colour.difference.delta_E_CIE2000` definition.
+        """
+
+        delta_E_CIE2000(self._Lab_1, self._Lab_2)
+
+    def peakmem_delta_E_CIE2000(self, size):
+        """
+        Measures :func:`colour.difference.delta_E_CIE2000` definition peak
+        memory.
+        """
+
+        delta_E_CIE2000(self._Lab_1, self._Lab_2)
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+Import Benchmarks
+=================
+
+Defines the packages import benchmarks:
+
+-   :class:`benchmarks.imports.Import`
+"""
+
+from __future__ import division, unicode_literals
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['Import']
+
+
+class Import(object):
+    """
+    Benchmarks the packages import in a new interpreter.
+    """
+
+    params = ['colour', 'colour.plotting']
+    param_names = ['package']
+
+    def timeraw_import(self, package):
+        """
+        Times given package import.
+        """
+
+        return 'import {0}'.format(package)
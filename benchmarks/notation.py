@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+Colour Notation Systems Benchmarks
+==================================
+
+Defines the :mod:`colour.notation` sub-package benchmarks:
+
+-   :class:`benchmarks.notation.XyY_to_munsell_specification`
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+
+from colour.notation.munsell import xyY_to_munsell_specification
+from colour.utilities import filter_warnings
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['XyY_to_munsell_specification']
+
+
+class XyY_to_munsell_specification(object):
+    """
+    Benchmarks :func:`colour.notation.munsell.xyY_to_munsell_specification`
+    definition.
+
+    Notes
+    -----
+    -   The definition only supports scalar *CIE xyY* colourspace arrays, the
+        colours are converted one at a time.
+    """
+
+    params = [1, 10]
+    param_names = ['colours']
+
+    timeout = 300
+
+    def setup(self, colours):
+        """
+        Initialises the benchmark attributes.
+        """
+
+        filter_warnings()
+
+        state = np.random.RandomState(4)
+        self._xyY = np.column_stack((
+            state.uniform(0.30, 0.36, colours),
+            state.uniform(0.30, 0.36, colours),
+            state.uniform(0.20, 0.80, colours),
+        ))
+
+    def time_xyY_to_munsell_specification(self, colours):
+        """
+        Times :func:`colour.notation.munsell.xyY_to_munsell_specification`
+        definition.
+        """
+
+        for xyY in self._xyY:
+            xyY_to_munsell_specification(xyY)
+
+    def peakmem_xyY_to_munsell_specification(self, colours):
+        """
+        Measures :func:`colour.notation.munsell.xyY_to_munsell_specification`
+        definition peak memory.
+        """
+
+        for xyY in self._xyY:
+            xyY_to_munsell_specification(xyY)
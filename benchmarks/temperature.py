@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""
+Colour Temperature Benchmarks
+=============================
+
+Defines the :mod:`colour.temperature` sub-package benchmarks:
+
+-   :class:`benchmarks.temperature.Uv_to_CCT`
+"""
+
+from __future__ import division, unicode_literals
+
+import colour
+from colour.utilities import filter_warnings
+
+from .common import SIZES, random_array
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['Uv_to_CCT']
+
+
+class Uv_to_CCT(object):
+    """
+    Benchmarks :func:`colour.uv_to_CCT` definition.
+
+    Notes
+    -----
+    -   *Ohno (2013)* method only supports scalar chromaticity coordinates,
+        the other sizes are skipped.
+    """
+
+    params = [list(SIZES.keys()), ['Ohno 2013', 'Robertson 1968']]
+    param_names = ['size', 'method']
+
+    timeout = 300
+
+    def setup(self, size, method):
+        """
+        Initialises the benchmark attributes.
+        """
+
+        if method == 'Ohno 2013' and size != 'scalar':
+            raise NotImplementedError()
+
+        filter_warnings()
+
+        self._uv = random_array(size, [0.18, 0.28], [0.28, 0.36])
+
+    def time_uv_to_CCT(self, size, method):
+        """
+        Times :func:`colour.uv_to_CCT` definition.
+        """
+
+        colour.uv_to_CCT(self._uv, method)
+
+    def peakmem_uv_to_CCT(self, size, method):
+        """
+        Measures :func:`colour.uv_to_CCT` definition peak memory.
+        """
+
+        colour.uv_to_CCT(self._uv, method)
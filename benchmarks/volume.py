@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+Colour Volume Benchmarks
+========================
+
+Defines the :mod:`colour.volume` sub-package benchmarks:
+
+-   :class:`benchmarks.volume.RGB_colourspace_volume_MonteCarlo`
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+
+import colour
+from colour.models import RGB_COLOURSPACES
+from colour.utilities import filter_warnings
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['RGB_colourspace_volume_MonteCarlo']
+
+
+class RGB_colourspace_volume_MonteCarlo(object):
+    """
+    Benchmarks :func:`colour.RGB_colourspace_volume_MonteCarlo` definition.
+    """
+
+    params = [[10e3, 10e5], [1, None]]
+    param_names = ['samples', 'processes']
+
+    timeout = 300
+
+    def setup(self, samples, processes):
+        """
+        Initialises the benchmark attributes.
+        """
+
+        filter_warnings()
+
+        self._colourspace = RGB_COLOURSPACES['sRGB']
+
+    def time_RGB_colourspace_volume_MonteCarlo(self, samples, processes):
+        """
+        Times :func:`colour.RGB_colourspace_volume_MonteCarlo` definition.
+        """
+
+        colour.RGB_colourspace_volume_MonteCarlo(
+            self._colourspace,
+            samples,
+            random_state=np.random.RandomState(4),
+            processes=processes)
+
+    def peakmem_RGB_colourspace_volume_MonteCarlo(self, samples, processes):
+        """
+        Measures :func:`colour.RGB_colourspace_volume_MonteCarlo` definition
+        peak memory.
+        """
+
+        colour.RGB_colourspace_volume_MonteCarlo(
+            self._colourspace,
+            samples,
+            random_state=np.random.RandomState(4),
+            processes=processes)
@@ -60,14 +60,15 @@ from .colorimetry import (
     PHOTOPIC_LEFS, RGB_CMFS, SCOTOPIC_LEFS, SPECTRAL_TO_XYZ_METHODS,
     STANDARD_OBSERVERS_CMFS, SpectralPowerDistribution, SpectralShape,
     WHITENESS_METHODS, YELLOWNESS_METHODS, bandpass_correction, blackbody_spd,
-    colorimetric_purity, complementary_wavelength, constant_spd,
-    dominant_wavelength, excitation_purity, lightness, luminance,
-    luminous_efficacy, luminous_efficiency, luminous_flux,
+    blackbody_spds, colorimetric_purity, complementary_wavelength,
+    constant_spd, dominant_wavelength, excitation_purity, lightness,
+    luminance, luminous_efficacy, luminous_efficiency, luminous_flux,
     mesopic_luminous_efficiency_function, multi_spectral_to_XYZ, ones_spd,
     spectral_to_XYZ, wavelength_to_XYZ, whiteness, yellowness, zeros_spd)
 from .blindness import (
     CVD_MATRICES_MACHADO2010, anomalous_trichromacy_cmfs_Machado2009,
-    anomalous_trichromacy_matrix_Machado2009, cvd_matrix_Machado2009)
+    anomalous_trichromacy_matrix_Machado2009, cvd_matrix_Machado2009,
+    CVD_Simulator_Machado2009)
 from .appearance import (
     ATD95_Specification, CAM16_Specification, CAM16_VIEWING_CONDITIONS,
     CAM16_to_XYZ, CIECAM02_Specification, CIECAM02_VIEWING_CONDITIONS,
@@ -76,13 +77,17 @@ from .appearance import (
     RLAB_D_FACTOR, RLAB_Specification, RLAB_VIEWING_CONDITIONS, XYZ_to_ATD95,
     XYZ_to_CAM16, XYZ_to_CIECAM02, XYZ_to_Hunt, XYZ_to_LLAB, XYZ_to_Nayatani95,
     XYZ_to_RLAB)
-from .difference import DELTA_E_METHODS, delta_E
+from .difference import DELTA_E_METHODS, delta_E, delta_E_pairwise
 from .characterisation import (CAMERAS_RGB_SPECTRAL_SENSITIVITIES,
                                COLOURCHECKERS, COLOURCHECKERS_SPDS,
                                DISPLAYS_RGB_PRIMARIES, first_order_colour_fit)
-from .io import (IES_TM2714_Spd, read_image, read_spds_from_csv_file,
-                 read_spds_from_xrite_file, read_spectral_data_from_csv_file,
-                 write_image, write_spds_to_csv_file)
+from .io import (
+    IES_TM2714_Spd, iterate_spectral_array_from_csv_file, iterate_xrite_file,
+    read_image, read_multi_spd_from_csv_file,
+    read_multi_spd_from_ies_tm2714_directory, read_spds_from_csv_file,
+    read_spds_from_xrite_file, read_spectral_array_from_csv_file,
+    read_spectral_data_from_csv_file, read_spectral_data_from_xrite_file,
+    write_image, write_multi_spd_to_csv_file, write_spds_to_csv_file)
 from .models import (
     CAM02LCD_to_JMh_CIECAM02, CAM02SCD_to_JMh_CIECAM02,
     CAM02UCS_to_JMh_CIECAM02, CAM16LCD_to_JMh_CAM16, CAM16SCD_to_JMh_CAM16,
@@ -121,7 +126,9 @@ from .phenomena import (rayleigh_scattering, rayleigh_scattering_spd,
 from .notation import (MUNSELL_COLOURS, MUNSELL_VALUE_METHODS,
                        munsell_colour_to_xyY, munsell_value,
                        xyY_to_munsell_colour)
-from .quality import (colour_quality_scale, colour_rendering_index)
+from .quality import (colour_quality_scale, colour_rendering_index,
+                      multi_spd_colour_quality_scale,
+                      multi_spd_colour_rendering_index)
 from .recovery import (REFLECTANCE_RECOVERY_METHODS, XYZ_to_spectral)
 from .temperature import (CCT_TO_UV_METHODS, CCT_TO_XY_METHODS, CCT_to_uv,
                           CCT_to_xy, UV_TO_CCT_METHODS, XY_TO_CCT_METHODS,
@@ -163,16 +170,17 @@ __all__ += [
     'PHOTOPIC_LEFS', 'RGB_CMFS', 'SCOTOPIC_LEFS', 'SPECTRAL_TO_XYZ_METHODS',
     'STANDARD_OBSERVERS_CMFS', 'SpectralPowerDistribution', 'SpectralShape',
     'WHITENESS_METHODS', 'YELLOWNESS_METHODS', 'bandpass_correction',
-    'blackbody_spd', 'colorimetric_purity', 'complementary_wavelength',
-    'constant_spd', 'dominant_wavelength', 'excitation_purity', 'lightness',
-    'luminance', 'luminous_efficacy', 'luminous_efficiency', 'luminous_flux',
-    'multi_spectral_to_XYZ', 'mesopic_luminous_efficiency_function',
-    'ones_spd', 'spectral_to_XYZ', 'wavelength_to_XYZ', 'whiteness',
-    'yellowness', 'zeros_spd'
+    'blackbody_spd', 'blackbody_spds', 'colorimetric_purity',
+    'complementary_wavelength', 'constant_spd', 'dominant_wavelength',
+    'excitation_purity', 'lightness', 'luminance', 'luminous_efficacy',
+    'luminous_efficiency', 'luminous_flux', 'multi_spectral_to_XYZ',
+    'mesopic_luminous_efficiency_function', 'ones_spd', 'spectral_to_XYZ',
+    'wavelength_to_XYZ', 'whiteness', 'yellowness', 'zeros_spd'
 ]
 __all__ += [
     'CVD_MATRICES_MACHADO2010', 'anomalous_trichromacy_cmfs_Machado2009',
-    'anomalous_trichromacy_matrix_Machado2009', 'cvd_matrix_Machado2009'
+    'anomalous_trichromacy_matrix_Machado2009', 'cvd_matrix_Machado2009',
+    'CVD_Simulator_Machado2009'
 ]
 __all__ += [
     'ATD95_Specification', 'CAM16_Specification', 'CAM16_VIEWING_CONDITIONS',
@@ -184,15 +192,19 @@ __all__ += [
     'XYZ_to_CIECAM02', 'XYZ_to_Hunt', 'XYZ_to_LLAB', 'XYZ_to_Nayatani95',
     'XYZ_to_RLAB'
 ]
-__all__ += ['DELTA_E_METHODS', 'delta_E']
+__all__ += ['DELTA_E_METHODS', 'delta_E', 'delta_E_pairwise']
 __all__ += [
     'CAMERAS_RGB_SPECTRAL_SENSITIVITIES', 'COLOURCHECKERS',
     'COLOURCHECKERS_SPDS', 'DISPLAYS_RGB_PRIMARIES', 'first_order_colour_fit'
 ]
 __all__ += [
-    'IES_TM2714_Spd', 'read_image', 'read_spds_from_csv_file',
-    'read_spds_from_xrite_file', 'read_spectral_data_from_csv_file',
-    'write_image', 'write_spds_to_csv_file'
+    'IES_TM2714_Spd', 'iterate_spectral_array_from_csv_file',
+    'iterate_xrite_file', 'read_image', 'read_multi_spd_from_csv_file',
+    'read_multi_spd_from_ies_tm2714_directory',
+    'read_spds_from_csv_file', 'read_spds_from_xrite_file',
+    'read_spectral_array_from_csv_file', 'read_spectral_data_from_csv_file',
+    'read_spectral_data_from_xrite_file', 'write_image',
+    'write_multi_spd_to_csv_file', 'write_spds_to_csv_file'
 ]
 __all__ += [
     'CAM02LCD_to_JMh_CIECAM02', 'CAM02SCD_to_JMh_CIECAM02',
@@ -241,7 +253,10 @@ __all__ += [
     'MUNSELL_COLOURS', 'MUNSELL_VALUE_METHODS', 'munsell_colour_to_xyY',
     'munsell_value', 'xyY_to_munsell_colour'
 ]
-__all__ += ['colour_quality_scale', 'colour_rendering_index']
+__all__ += [
+    'colour_quality_scale', 'colour_rendering_index',
+    'multi_spd_colour_quality_scale', 'multi_spd_colour_rendering_index'
+]
 __all__ += ['REFLECTANCE_RECOVERY_METHODS', 'XYZ_to_spectral']
 __all__ += [
     'CCT_TO_UV_METHODS', 'CCT_TO_XY_METHODS', 'CCT_to_uv', 'CCT_to_xy',
@@ -23,9 +23,8 @@ References
 
 from __future__ import absolute_import
 
-import numpy as np
-
-from colour.utilities import CaseInsensitiveMapping, filter_kwargs
+from colour.utilities import (CaseInsensitiveMapping, as_float_array,
+                              cache_signature, filter_kwargs)
 
 from .dataset import *  # noqa
 from . import dataset
@@ -52,12 +51,12 @@ __all__ += [
 ]
 __all__ += ['chromatic_adaptation_CIE1994']
 
-CHROMATIC_ADAPTATION_METHODS = CaseInsensitiveMapping({
+CHROMATIC_ADAPTATION_METHODS = cache_signature(CaseInsensitiveMapping({
     'CIE 1994': chromatic_adaptation_CIE1994,
     'CMCCAT2000': chromatic_adaptation_CMCCAT2000,
     'Fairchild 1990': chromatic_adaptation_Fairchild1990,
     'Von Kries': chromatic_adaptation_VonKries,
-})
+}))
 CHROMATIC_ADAPTATION_METHODS.__doc__ = """
 Supported chromatic adaptation methods.
 
@@ -200,9 +199,9 @@ def chromatic_adaptation(XYZ, XYZ_w, XYZ_wr, method='Von Kries', **kwargs):
     array([ 0.2332526...,  0.2332455...,  0.7611593...])
     """
 
-    XYZ = np.asarray(XYZ)
-    XYZ_w = np.asarray(XYZ_w)
-    XYZ_wr = np.asarray(XYZ_wr)
+    XYZ = as_float_array(XYZ)
+    XYZ_w = as_float_array(XYZ_w)
+    XYZ_wr = as_float_array(XYZ_wr)
 
     function = CHROMATIC_ADAPTATION_METHODS[method]
 
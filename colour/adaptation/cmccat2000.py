@@ -33,7 +33,7 @@ import numpy as np
 from collections import namedtuple
 
 from colour.adaptation import CMCCAT2000_CAT
-from colour.utilities import CaseInsensitiveMapping, dot_vector
+from colour.utilities import CaseInsensitiveMapping, as_float_array, dot_vector
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -152,11 +152,11 @@ def chromatic_adaptation_forward_CMCCAT2000(
     array([ 19.5269832...,  23.0683396...,  24.9717522...])
     """
 
-    XYZ = np.asarray(XYZ)
-    XYZ_w = np.asarray(XYZ_w)
-    XYZ_wr = np.asarray(XYZ_wr)
-    L_A1 = np.asarray(L_A1)
-    L_A2 = np.asarray(L_A2)
+    XYZ = as_float_array(XYZ)
+    XYZ_w = as_float_array(XYZ_w)
+    XYZ_wr = as_float_array(XYZ_wr)
+    L_A1 = as_float_array(L_A1)
+    L_A2 = as_float_array(L_A2)
 
     RGB = dot_vector(CMCCAT2000_CAT, XYZ)
     RGB_w = dot_vector(CMCCAT2000_CAT, XYZ_w)
@@ -236,11 +236,11 @@ def chromatic_adaptation_reverse_CMCCAT2000(
     array([ 22.4839876...,  22.7419485...,   8.5393392...])
     """
 
-    XYZ_c = np.asarray(XYZ_c)
-    XYZ_w = np.asarray(XYZ_w)
-    XYZ_wr = np.asarray(XYZ_wr)
-    L_A1 = np.asarray(L_A1)
-    L_A2 = np.asarray(L_A2)
+    XYZ_c = as_float_array(XYZ_c)
+    XYZ_w = as_float_array(XYZ_w)
+    XYZ_wr = as_float_array(XYZ_wr)
+    L_A1 = as_float_array(L_A1)
+    L_A2 = as_float_array(L_A2)
 
     RGB_c = dot_vector(CMCCAT2000_CAT, XYZ_c)
     RGB_w = dot_vector(CMCCAT2000_CAT, XYZ_w)
@@ -12,7 +12,7 @@ from itertools import permutations
 
 from colour.adaptation import (chromatic_adaptation_matrix_VonKries,
                                chromatic_adaptation_VonKries)
-from colour.utilities import ignore_numpy_errors
+from colour.utilities import ignore_numpy_errors, set_default_float_dtype
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -244,6 +244,27 @@ class TestChromaticAdaptationVonKries(unittest.TestCase):
             XYZ_a,
             decimal=7)
 
+    def test_float_precision_chromatic_adaptation_VonKries(self):
+        """
+        Tests :func:`colour.adaptation.vonkries.chromatic_adaptation_VonKries`
+        definition float precision support.
+        """
+
+        XYZ = np.random.RandomState(4).random_sample((256, 3))
+        XYZ_w = np.array([1.09846607, 1.00000000, 0.35582280])
+        XYZ_wr = np.array([0.95042855, 1.00000000, 1.08890037])
+        XYZ_a = chromatic_adaptation_VonKries(XYZ, XYZ_w, XYZ_wr)
+
+        previous_dtype = set_default_float_dtype(np.float32)
+        try:
+            XYZ_a_f = chromatic_adaptation_VonKries(XYZ.astype(np.float32),
+                                                    XYZ_w, XYZ_wr)
+        finally:
+            set_default_float_dtype(previous_dtype)
+
+        self.assertEqual(XYZ_a_f.dtype, np.float32)
+        np.testing.assert_allclose(XYZ_a_f, XYZ_a, rtol=0.00001, atol=0.00001)
+
     @ignore_numpy_errors
     def test_nan_chromatic_adaptation_VonKries(self):
         """
@@ -63,8 +63,9 @@ class Extrapolator(object):
         Value to return for x < xi[0].
     right : numeric, optional
         Value to return for x > xi[-1].
-    dtype : type
-        Data type used for internal conversions.
+    dtype : type, optional
+        Data type used for internal conversions, default to the type defined
+        by :attr:`colour.constants.DEFAULT_FLOAT_DTYPE` attribute.
 
     Methods
     -------
@@ -120,7 +121,7 @@ class Extrapolator(object):
                  method='Linear',
                  left=None,
                  right=None,
-                 dtype=DEFAULT_FLOAT_DTYPE):
+                 dtype=None):
 
         self._interpolator = None
         self.interpolator = interpolator
@@ -131,6 +132,9 @@ class Extrapolator(object):
         self._left = None
         self.left = left
 
+        if dtype is None:
+            dtype = DEFAULT_FLOAT_DTYPE
+
         self._dtype = dtype
 
     @property
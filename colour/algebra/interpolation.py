@@ -271,8 +271,9 @@ class KernelInterpolator(object):
     padding_args : dict, optional
          Arguments to use when padding :math:`y` variable values with the
          :func:`np.pad` definition.
-    dtype : type
-        Data type used for internal conversions.
+    dtype : type, optional
+        Data type used for internal conversions, default to the type defined
+        by :attr:`colour.constants.DEFAULT_FLOAT_DTYPE` attribute.
 
     Attributes
     ----------
@@ -333,7 +334,10 @@ class KernelInterpolator(object):
                  kernel=kernel_lanczos,
                  kernel_args=None,
                  padding_args=None,
-                 dtype=DEFAULT_FLOAT_DTYPE):
+                 dtype=None):
+        if dtype is None:
+            dtype = DEFAULT_FLOAT_DTYPE
+
         self._x_p = None
         self._y_p = None
 
@@ -668,8 +672,9 @@ class LinearInterpolator(object):
     y : array_like
         Dependent and already known :math:`y` variable values to
         interpolate.
-    dtype : type
-        Data type used for internal conversions.
+    dtype : type, optional
+        Data type used for internal conversions, default to the type defined
+        by :attr:`colour.constants.DEFAULT_FLOAT_DTYPE` attribute.
 
     Attributes
     ----------
@@ -702,7 +707,10 @@ class LinearInterpolator(object):
     array([ 6.7825,  8.5075])
     """
 
-    def __init__(self, x, y, dtype=DEFAULT_FLOAT_DTYPE):
+    def __init__(self, x, y, dtype=None):
+        if dtype is None:
+            dtype = DEFAULT_FLOAT_DTYPE
+
         self._x = None
         self._y = None
         self._dtype = dtype
@@ -862,8 +870,9 @@ class SpragueInterpolator(object):
     y : array_like
         Dependent and already known :math:`y` variable values to
         interpolate.
-    dtype : type
-        Data type used for internal conversions.
+    dtype : type, optional
+        Data type used for internal conversions, default to the type defined
+        by :attr:`colour.constants.DEFAULT_FLOAT_DTYPE` attribute.
 
     Attributes
     ----------
@@ -918,7 +927,10 @@ class SpragueInterpolator(object):
     -   :cite:`CIETC1-382005h`
     """
 
-    def __init__(self, x, y, dtype=DEFAULT_FLOAT_DTYPE):
+    def __init__(self, x, y, dtype=None):
+        if dtype is None:
+            dtype = DEFAULT_FLOAT_DTYPE
+
         self._xp = None
         self._yp = None
 
@@ -1185,8 +1197,9 @@ class NullInterpolator(object):
         Relative tolerance.
     default : numeric, optional
         Default value for interpolation outside tolerances.
-    dtype : type
-        Data type used for internal conversions.
+    dtype : type, optional
+        Data type used for internal conversions, default to the type defined
+        by :attr:`colour.constants.DEFAULT_FLOAT_DTYPE` attribute.
 
     Attributes
     ----------
@@ -1221,7 +1234,10 @@ class NullInterpolator(object):
                  absolute_tolerance=10e-7,
                  relative_tolerance=10e-7,
                  default=np.nan,
-                 dtype=DEFAULT_FLOAT_DTYPE):
+                 dtype=None):
+        if dtype is None:
+            dtype = DEFAULT_FLOAT_DTYPE
+
         self._x = None
         self._y = None
         self._absolute_tolerance = None
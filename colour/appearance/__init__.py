@@ -7,9 +7,10 @@ from .hunt import (Hunt_InductionFactors, HUNT_VIEWING_CONDITIONS,
 from .atd95 import ATD95_Specification, XYZ_to_ATD95
 from .ciecam02 import (CIECAM02_InductionFactors, CIECAM02_VIEWING_CONDITIONS,
                        CIECAM02_Specification, XYZ_to_CIECAM02,
-                       CIECAM02_to_XYZ)
+                       CIECAM02_to_XYZ, CIECAM02Model)
 from .cam16 import (CAM16_InductionFactors, CAM16_VIEWING_CONDITIONS,
-                    CAM16_Specification, XYZ_to_CAM16, CAM16_to_XYZ)
+                    CAM16_Specification, XYZ_to_CAM16, CAM16_to_XYZ,
+                    CAM16Model)
 from .llab import (LLAB_InductionFactors, LLAB_VIEWING_CONDITIONS,
                    LLAB_Specification, XYZ_to_LLAB)
 from .nayatani95 import Nayatani95_Specification, XYZ_to_Nayatani95
@@ -23,11 +24,12 @@ __all__ = [
 __all__ += ['ATD95_Specification', 'XYZ_to_ATD95']
 __all__ += [
     'CIECAM02_InductionFactors', 'CIECAM02_VIEWING_CONDITIONS',
-    'CIECAM02_Specification', 'XYZ_to_CIECAM02', 'CIECAM02_to_XYZ'
+    'CIECAM02_Specification', 'XYZ_to_CIECAM02', 'CIECAM02_to_XYZ',
+    'CIECAM02Model'
 ]
 __all__ += [
     'CAM16_InductionFactors', 'CAM16_VIEWING_CONDITIONS',
-    'CAM16_Specification', 'XYZ_to_CAM16', 'CAM16_to_XYZ'
+    'CAM16_Specification', 'XYZ_to_CAM16', 'CAM16_to_XYZ', 'CAM16Model'
 ]
 __all__ += [
     'LLAB_InductionFactors', 'LLAB_VIEWING_CONDITIONS', 'LLAB_Specification',
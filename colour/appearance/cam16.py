@@ -10,6 +10,7 @@ Defines *CAM16* colour appearance model objects:
 -   :class:`colour.CAM16_Specification`
 -   :func:`colour.XYZ_to_CAM16`
 -   :func:`colour.CAM16_to_XYZ`
+-   :class:`colour.appearance.CAM16Model`
 
 See Also
 --------
@@ -31,18 +32,9 @@ import numpy as np
 from collections import namedtuple
 
 from colour.appearance.ciecam02 import (
-    CIECAM02_VIEWING_CONDITIONS, P, achromatic_response_forward,
-    achromatic_response_reverse, brightness_correlate, chroma_correlate,
-    colourfulness_correlate, degree_of_adaptation, eccentricity_factor,
-    hue_angle, hue_quadrature, lightness_correlate,
-    opponent_colour_dimensions_forward, opponent_colour_dimensions_reverse,
-    post_adaptation_non_linear_response_compression_forward,
-    post_adaptation_non_linear_response_compression_reverse,
-    post_adaptation_non_linear_response_compression_matrix,
-    saturation_correlate, temporary_magnitude_quantity_reverse,
-    viewing_condition_dependent_parameters)
-from colour.utilities import (CaseInsensitiveMapping, as_namedtuple,
-                              dot_vector, tsplit)
+    CIECAM02Model, CIECAM02_VIEWING_CONDITIONS, degree_of_adaptation)
+from colour.constants import DEFAULT_FLOAT_DTYPE
+from colour.utilities import CaseInsensitiveMapping
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2015-2018 - Colour Developers'
@@ -54,7 +46,7 @@ __status__ = 'Production'
 __all__ = [
     'M_16', 'M_16_INVERSE', 'CAM16_InductionFactors',
     'CAM16_VIEWING_CONDITIONS', 'CAM16_Specification', 'XYZ_to_CAM16',
-    'CAM16_to_XYZ'
+    'CAM16_to_XYZ', 'CAM16Model'
 ]
 
 M_16 = np.array([
@@ -214,84 +206,13 @@ def XYZ_to_CAM16(XYZ,
     >>> surround = CAM16_VIEWING_CONDITIONS['Average']
     >>> XYZ_to_CAM16(XYZ, XYZ_w, L_A, Y_b, surround)  # doctest: +ELLIPSIS
     CAM16_Specification(J=41.7312079..., C=0.1033557..., h=217.0679597..., \
-s=2.3450150..., Q=195.3717089..., M=0.1074367..., H=275.5949861..., HC=None)
+s=2.3450150..., Q=195.3717089..., M=0.1074367..., H=275.5949861..., \
+HC=array([  0...,   0...,  24.4050138...,  75.5949861...]))
     """
 
-    _X_w, Y_w, _Z_w = tsplit(XYZ_w)
-    L_A = np.asarray(L_A)
-    Y_b = np.asarray(Y_b)
+    model = CAM16Model(XYZ_w, L_A, Y_b, surround, discount_illuminant)
 
-    # Step 0
-    # Converting *CIE XYZ* tristimulus values to sharpened *RGB* values.
-    RGB_w = dot_vector(M_16, XYZ_w)
-
-    # Computing degree of adaptation :math:`D`.
-    D = (np.clip(degree_of_adaptation(surround.F, L_A), 0, 1)
-         if not discount_illuminant else np.ones(L_A.shape))
-
-    n, F_L, N_bb, N_cb, z = tsplit(
-        viewing_condition_dependent_parameters(Y_b, Y_w, L_A))
-
-    D_RGB = (D[..., np.newaxis] * Y_w[..., np.newaxis] / RGB_w + 1 -
-             D[..., np.newaxis])
-    RGB_wc = D_RGB * RGB_w
-
-    # Applying forward post-adaptation non linear response compression.
-    RGB_aw = post_adaptation_non_linear_response_compression_forward(
-        RGB_wc, F_L)
-
-    # Computing achromatic responses for the whitepoint.
-    A_w = achromatic_response_forward(RGB_aw, N_bb)
-
-    # Step 1
-    # Converting *CIE XYZ* tristimulus values to sharpened *RGB* values.
-    RGB = dot_vector(M_16, XYZ)
-
-    # Step 2
-    RGB_c = D_RGB * RGB
-
-    # Step 3
-    # Applying forward post-adaptation non linear response compression.
-    RGB_a = post_adaptation_non_linear_response_compression_forward(RGB_c, F_L)
-
-    # Step 4
-    # Converting to preliminary cartesian coordinates.
-    a, b = tsplit(opponent_colour_dimensions_forward(RGB_a))
-
-    # Computing the *hue* angle :math:`h`.
-    h = hue_angle(a, b)
-
-    # Step 5
-    # Computing eccentricity factor *e_t*.
-    e_t = eccentricity_factor(h)
-
-    # Computing hue :math:`h` quadrature :math:`H`.
-    H = hue_quadrature(h)
-    # TODO: Compute hue composition.
-
-    # Step 6
-    # Computing achromatic responses for the stimulus.
-    A = achromatic_response_forward(RGB_a, N_bb)
-
-    # Step 7
-    # Computing the correlate of *Lightness* :math:`J`.
-    J = lightness_correlate(A, A_w, surround.c, z)
-
-    # Step 8
-    # Computing the correlate of *brightness* :math:`Q`.
-    Q = brightness_correlate(surround.c, J, A_w, F_L)
-
-    # Step 9
-    # Computing the correlate of *chroma* :math:`C`.
-    C = chroma_correlate(J, n, surround.N_c, N_cb, e_t, a, b, RGB_a)
-
-    # Computing the correlate of *colourfulness* :math:`M`.
-    M = colourfulness_correlate(C, F_L)
-
-    # Computing the correlate of *saturation* :math:`s`.
-    s = saturation_correlate(M, Q)
-
-    return CAM16_Specification(J, C, h, s, Q, M, H, None)
+    return model.forward(XYZ)
 
 
 def CAM16_to_XYZ(CAM16_specification,
@@ -362,70 +283,77 @@ def CAM16_to_XYZ(CAM16_specification,
     array([ 19.01...,  20...  ,  21.78...])
     """
 
-    J, C, h, _s, _Q, M, _H, _HC = as_namedtuple(CAM16_specification,
-                                                CAM16_Specification)
+    model = CAM16Model(XYZ_w, L_A, Y_b, surround, discount_illuminant)
 
-    _X_w, Y_w, _Zw = tsplit(XYZ_w)
+    return model.reverse(CAM16_specification)
 
-    # Step 0
-    # Converting *CIE XYZ* tristimulus values to sharpened *RGB* values.
-    RGB_w = dot_vector(M_16, XYZ_w)
 
-    # Computing degree of adaptation :math:`D`.
-    D = (np.clip(degree_of_adaptation(surround.F, L_A), 0, 1)
-         if not discount_illuminant else np.ones(L_A.shape))
-
-    n, F_L, N_bb, N_cb, z = tsplit(
-        viewing_condition_dependent_parameters(Y_b, Y_w, L_A))
-
-    D_RGB = (D[..., np.newaxis] * Y_w[..., np.newaxis] / RGB_w + 1 -
-             D[..., np.newaxis])
-    RGB_wc = D_RGB * RGB_w
+class CAM16Model(CIECAM02Model):
+    """
+    Defines a reusable *CAM16* colour appearance model for given viewing
+    conditions.
 
-    # Applying forward post-adaptation non linear response compression.
-    RGB_aw = post_adaptation_non_linear_response_compression_forward(
-        RGB_wc, F_L)
+    The terms depending only on the reference white and surround viewing
+    conditions are computed once at instantiation, the chromatic adaptation
+    is fused with the :math:`M_{16}` adaptation matrix.
 
-    # Computing achromatic responses for the whitepoint.
-    A_w = achromatic_response_forward(RGB_aw, N_bb)
+    Parameters
+    ----------
+    XYZ_w : array_like
+        *CIE XYZ* tristimulus values of reference white normalised to domain
+        [0, 100].
+    L_A : numeric or array_like
+        Adapting field *luminance* :math:`L_A` in :math:`cd/m^2`, (often taken
+        to be 20% of the luminance of a white object in the scene).
+    Y_b : numeric or array_like
+        Relative luminance of background :math:`Y_b` in :math:`cd/m^2`.
+    surround : CAM16_InductionFactors, optional
+        Surround viewing conditions induction factors.
+    discount_illuminant : bool, optional
+        Truth value indicating if the illuminant should be discounted.
 
-    # Step 1
-    if C is None and M is not None:
-        C = M / F_L ** 0.25
-    elif C is None:
-        raise ValueError('Either "C" or "M" correlate must be defined in '
-                         'the "CAM16_specification" argument!')
+    References
+    ----------
+    -   :cite:`Li2017`
 
-    # Step 2
-    # Computing temporary magnitude quantity :math:`t`.
-    t = temporary_magnitude_quantity_reverse(C, J, n)
+    Examples
+    --------
+    >>> XYZ = np.array([19.01, 20.00, 21.78])
+    >>> XYZ_w = np.array([95.05, 100.00, 108.88])
+    >>> L_A = 318.31
+    >>> Y_b = 20.0
+    >>> model = CAM16Model(XYZ_w, L_A, Y_b)
+    >>> specification = model.forward(XYZ)
+    >>> specification  # doctest: +ELLIPSIS
+    CAM16_Specification(J=41.7312079..., C=0.1033557..., h=217.0679597..., \
+s=2.3450150..., Q=195.3717089..., M=0.1074367..., H=275.5949861..., \
+HC=array([  0...,   0...,  24.4050138...,  75.5949861...]))
+    >>> model.reverse(specification)  # doctest: +ELLIPSIS
+    array([ 19.01...,  20...  ,  21.78...])
+    """
 
-    # Computing eccentricity factor *e_t*.
-    e_t = eccentricity_factor(h)
+    _SPECIFICATION = CAM16_Specification
 
-    # Computing achromatic response :math:`A` for the stimulus.
-    A = achromatic_response_reverse(A_w, J, surround.c, z)
+    _SHARPENING_MATRIX = M_16
 
-    # Computing *P_1* to *P_3*.
-    P_n = P(surround.N_c, N_cb, e_t, t, A, N_bb)
-    _P_1, P_2, _P_3 = tsplit(P_n)
+    _SHARPENING_MATRIX_INVERSE = M_16_INVERSE
 
-    # Step 3
-    # Computing opponent colour dimensions :math:`a` and :math:`b`.
-    a, b = tsplit(opponent_colour_dimensions_reverse(P_n, h))
+    _POST_ADAPTATION_MATRIX = np.identity(3)
 
-    # Step 4
-    # Computing post-adaptation non linear response compression matrix.
-    RGB_a = post_adaptation_non_linear_response_compression_matrix(P_2, a, b)
+    _POST_ADAPTATION_MATRIX_INVERSE = np.identity(3)
 
-    # Step 5
-    # Applying reverse post-adaptation non linear response compression.
-    RGB_c = post_adaptation_non_linear_response_compression_reverse(RGB_a, F_L)
+    def _degree_of_adaptation(self):
+        """
+        Computes the degree of adaptation :math:`D` for the model viewing
+        conditions, clipped to domain [0, 1].
 
-    # Step 6
-    RGB = RGB_c / D_RGB
+        Returns
+        -------
+        ndarray
+            Degree of adaptation :math:`D`.
+        """
 
-    # Step 7
-    XYZ = dot_vector(M_16_INVERSE, RGB)
+        if self._discount_illuminant:
+            return np.ones(self._L_A.shape, DEFAULT_FLOAT_DTYPE)
 
-    return XYZ
+        return np.clip(degree_of_adaptation(self._surround.F, self._L_A), 0, 1)
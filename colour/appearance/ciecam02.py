@@ -10,6 +10,7 @@ Defines *CIECAM02* colour appearance model objects:
 -   :class:`colour.CIECAM02_Specification`
 -   :func:`colour.XYZ_to_CIECAM02`
 -   :func:`colour.CIECAM02_to_XYZ`
+-   :class:`colour.appearance.CIECAM02Model`
 
 See Also
 --------
@@ -40,11 +41,12 @@ import numpy as np
 from collections import namedtuple
 
 from colour.adaptation import CAT02_CAT
-from colour.appearance.hunt import (HPE_TO_XYZ_MATRIX, XYZ_TO_HPE_MATRIX,
-                                    luminance_level_adaptation_factor)
-from colour.constants import EPSILON
-from colour.utilities import (CaseInsensitiveMapping, as_namedtuple,
-                              as_numeric, dot_matrix, dot_vector, tsplit,
+from colour.appearance.hunt import (
+    HPE_TO_XYZ_MATRIX, HUE_DATA_FOR_HUE_QUADRATURE, XYZ_TO_HPE_MATRIX,
+    hue_composition, hue_quadrature, luminance_level_adaptation_factor)
+from colour.constants import DEFAULT_FLOAT_DTYPE, EPSILON
+from colour.utilities import (CaseInsensitiveMapping, as_float_array,
+                              as_namedtuple, dot_matrix, dot_vector, tsplit,
                               tstack)
 
 __author__ = 'Colour Developers'
@@ -58,10 +60,10 @@ __all__ = [
     'CAT02_INVERSE_CAT', 'CIECAM02_InductionFactors',
     'CIECAM02_VIEWING_CONDITIONS', 'HUE_DATA_FOR_HUE_QUADRATURE',
     'CIECAM02_Specification', 'XYZ_to_CIECAM02', 'CIECAM02_to_XYZ',
-    'chromatic_induction_factors', 'base_exponential_non_linearity',
-    'viewing_condition_dependent_parameters', 'degree_of_adaptation',
-    'full_chromatic_adaptation_forward', 'full_chromatic_adaptation_reverse',
-    'RGB_to_rgb', 'rgb_to_RGB',
+    'CIECAM02Model', 'chromatic_induction_factors',
+    'base_exponential_non_linearity', 'viewing_condition_dependent_parameters',
+    'degree_of_adaptation', 'full_chromatic_adaptation_forward',
+    'full_chromatic_adaptation_reverse', 'RGB_to_rgb', 'rgb_to_RGB',
     'post_adaptation_non_linear_response_compression_forward',
     'post_adaptation_non_linear_response_compression_reverse',
     'opponent_colour_dimensions_forward', 'opponent_colour_dimensions_reverse',
@@ -124,12 +126,6 @@ CIECAM02_VIEWING_CONDITIONS : CaseInsensitiveMapping
     **{'Average', 'Dim', 'Dark'}**
 """
 
-HUE_DATA_FOR_HUE_QUADRATURE = {
-    'h_i': np.array([20.14, 90.00, 164.25, 237.53, 380.14]),
-    'e_i': np.array([0.8, 0.7, 1.0, 1.2, 0.8]),
-    'H_i': np.array([0.0, 100.0, 200.0, 300.0, 400.0])
-}
-
 
 class CIECAM02_Specification(
         namedtuple('CIECAM02_Specification', ('J', 'C', 'h', 's', 'Q', 'M',
@@ -242,70 +238,13 @@ def XYZ_to_CIECAM02(XYZ,
     >>> surround = CIECAM02_VIEWING_CONDITIONS['Average']
     >>> XYZ_to_CIECAM02(XYZ, XYZ_w, L_A, Y_b, surround)  # doctest: +ELLIPSIS
     CIECAM02_Specification(J=41.7310911..., C=0.1047077..., h=219.0484326..., \
-s=2.3603053..., Q=195.3713259..., M=0.1088421..., H=278.0607358..., HC=None)
+s=2.3603053..., Q=195.3713259..., M=0.1088421..., H=278.0607358..., \
+HC=array([  0...,   0...,  21.9392641...,  78.0607358...]))
     """
 
-    _X_w, Y_w, _Z_w = tsplit(XYZ_w)
-    L_A = np.asarray(L_A)
-    Y_b = np.asarray(Y_b)
-
-    n, F_L, N_bb, N_cb, z = tsplit(
-        viewing_condition_dependent_parameters(Y_b, Y_w, L_A))
-
-    # Converting *CIE XYZ* tristimulus values to *CMCCAT2000* transform
-    # sharpened *RGB* values.
-    RGB = dot_vector(CAT02_CAT, XYZ)
-    RGB_w = dot_vector(CAT02_CAT, XYZ_w)
-
-    # Computing degree of adaptation :math:`D`.
-    D = degree_of_adaptation(surround.F, L_A) if not discount_illuminant else 1
-
-    # Computing full chromatic adaptation.
-    RGB_c = full_chromatic_adaptation_forward(RGB, RGB_w, Y_w, D)
-    RGB_wc = full_chromatic_adaptation_forward(RGB_w, RGB_w, Y_w, D)
-
-    # Converting to *Hunt-Pointer-Estevez* colourspace.
-    RGB_p = RGB_to_rgb(RGB_c)
-    RGB_pw = RGB_to_rgb(RGB_wc)
-
-    # Applying forward post-adaptation non linear response compression.
-    RGB_a = post_adaptation_non_linear_response_compression_forward(RGB_p, F_L)
-    RGB_aw = post_adaptation_non_linear_response_compression_forward(
-        RGB_pw, F_L)
-
-    # Converting to preliminary cartesian coordinates.
-    a, b = tsplit(opponent_colour_dimensions_forward(RGB_a))
-
-    # Computing the *hue* angle :math:`h`.
-    h = hue_angle(a, b)
-
-    # Computing hue :math:`h` quadrature :math:`H`.
-    H = hue_quadrature(h)
-    # TODO: Compute hue composition.
-
-    # Computing eccentricity factor *e_t*.
-    e_t = eccentricity_factor(h)
-
-    # Computing achromatic responses for the stimulus and the whitepoint.
-    A = achromatic_response_forward(RGB_a, N_bb)
-    A_w = achromatic_response_forward(RGB_aw, N_bb)
-
-    # Computing the correlate of *Lightness* :math:`J`.
-    J = lightness_correlate(A, A_w, surround.c, z)
-
-    # Computing the correlate of *brightness* :math:`Q`.
-    Q = brightness_correlate(surround.c, J, A_w, F_L)
-
-    # Computing the correlate of *chroma* :math:`C`.
-    C = chroma_correlate(J, n, surround.N_c, N_cb, e_t, a, b, RGB_a)
-
-    # Computing the correlate of *colourfulness* :math:`M`.
-    M = colourfulness_correlate(C, F_L)
-
-    # Computing the correlate of *saturation* :math:`s`.
-    s = saturation_correlate(M, Q)
+    model = CIECAM02Model(XYZ_w, L_A, Y_b, surround, discount_illuminant)
 
-    return CIECAM02_Specification(J, C, h, s, Q, M, H, None)
+    return model.forward(XYZ)
 
 
 def CIECAM02_to_XYZ(CIECAM02_specification,
@@ -379,73 +318,376 @@ def CIECAM02_to_XYZ(CIECAM02_specification,
     array([ 19.01...,  20...  ,  21.78...])
     """
 
-    J, C, h, _s, _Q, M, _H, _HC = as_namedtuple(CIECAM02_specification,
-                                                CIECAM02_Specification)
+    model = CIECAM02Model(XYZ_w, L_A, Y_b, surround, discount_illuminant)
 
-    _X_w, Y_w, _Zw = tsplit(XYZ_w)
+    return model.reverse(CIECAM02_specification)
 
-    n, F_L, N_bb, N_cb, z = tsplit(
-        viewing_condition_dependent_parameters(Y_b, Y_w, L_A))
 
-    if C is None and M is not None:
-        C = M / F_L ** 0.25
-    elif C is None:
-        raise ValueError('Either "C" or "M" correlate must be defined in '
-                         'the "CIECAM02_specification" argument!')
+class CIECAM02Model(object):
+    """
+    Defines a reusable *CIECAM02* colour appearance model for given viewing
+    conditions.
+
+    The terms depending only on the reference white and surround viewing
+    conditions, e.g. the degree of adaptation :math:`D`, the luminance level
+    adaptation factor :math:`F_L` or the achromatic response of the
+    whitepoint :math:`A_w`, are computed once at instantiation. The chromatic
+    adaptation and the conversion to *Hunt-Pointer-Estevez* colourspace are
+    fused into a single matrix so that the forward and reverse
+    implementations perform a single matrix product per stimulus.
+
+    Parameters
+    ----------
+    XYZ_w : array_like
+        *CIE XYZ* tristimulus values of reference white normalised to domain
+        [0, 100].
+    L_A : numeric or array_like
+        Adapting field *luminance* :math:`L_A` in :math:`cd/m^2`, (often taken
+        to be 20% of the luminance of a white object in the scene).
+    Y_b : numeric or array_like
+        Relative luminance of background :math:`Y_b` in :math:`cd/m^2`.
+    surround : CIECAM02_InductionFactors, optional
+        Surround viewing conditions induction factors.
+    discount_illuminant : bool, optional
+        Truth value indicating if the illuminant should be discounted.
 
-    # Converting *CIE XYZ* tristimulus values to *CMCCAT2000* transform
-    # sharpened *RGB* values.
-    RGB_w = dot_vector(CAT02_CAT, XYZ_w)
+    Attributes
+    ----------
+    XYZ_w
+    L_A
+    Y_b
+    surround
+    discount_illuminant
 
-    # Computing degree of adaptation :math:`D`.
-    D = degree_of_adaptation(surround.F, L_A) if not discount_illuminant else 1
+    Methods
+    -------
+    forward
+    reverse
 
-    # Computing full chromatic adaptation.
-    RGB_wc = full_chromatic_adaptation_forward(RGB_w, RGB_w, Y_w, D)
+    References
+    ----------
+    -   :cite:`Fairchild2004c`
+    -   :cite:`Luo2013`
+    -   :cite:`Moroneya`
+    -   :cite:`Wikipediach`
 
-    # Converting to *Hunt-Pointer-Estevez* colourspace.
-    RGB_pw = RGB_to_rgb(RGB_wc)
+    Examples
+    --------
+    >>> XYZ = np.array([19.01, 20.00, 21.78])
+    >>> XYZ_w = np.array([95.05, 100.00, 108.88])
+    >>> L_A = 318.31
+    >>> Y_b = 20.0
+    >>> model = CIECAM02Model(XYZ_w, L_A, Y_b)
+    >>> specification = model.forward(XYZ)
+    >>> specification  # doctest: +ELLIPSIS
+    CIECAM02_Specification(J=41.7310911..., C=0.1047077..., h=219.0484326..., \
+s=2.3603053..., Q=195.3713259..., M=0.1088421..., H=278.0607358..., \
+HC=array([  0...,   0...,  21.9392641...,  78.0607358...]))
+    >>> model.reverse(specification)  # doctest: +ELLIPSIS
+    array([ 19.01...,  20...  ,  21.78...])
+    """
 
-    # Applying post-adaptation non linear response compression.
-    RGB_aw = post_adaptation_non_linear_response_compression_forward(
-        RGB_pw, F_L)
+    _SPECIFICATION = CIECAM02_Specification
+    """
+    Colour appearance model specification class.
+    """
 
-    # Computing achromatic response for the whitepoint.
-    A_w = achromatic_response_forward(RGB_aw, N_bb)
+    _SHARPENING_MATRIX = CAT02_CAT
+    """
+    Matrix converting *CIE XYZ* tristimulus values to the sharpened *RGB*
+    space where the chromatic adaptation is performed.
+    """
 
-    # Computing temporary magnitude quantity :math:`t`.
-    t = temporary_magnitude_quantity_reverse(C, J, n)
+    _SHARPENING_MATRIX_INVERSE = CAT02_INVERSE_CAT
+    """
+    Inverse of the sharpening matrix.
+    """
 
-    # Computing eccentricity factor *e_t*.
-    e_t = eccentricity_factor(h)
+    _POST_ADAPTATION_MATRIX = dot_matrix(XYZ_TO_HPE_MATRIX, CAT02_INVERSE_CAT)
+    """
+    Matrix converting the adapted sharpened *RGB* values to the space where
+    the post-adaptation non linear response compression is applied.
+    """
 
-    # Computing achromatic response :math:`A` for the stimulus.
-    A = achromatic_response_reverse(A_w, J, surround.c, z)
+    _POST_ADAPTATION_MATRIX_INVERSE = dot_matrix(CAT02_CAT, HPE_TO_XYZ_MATRIX)
+    """
+    Inverse of the post-adaptation matrix.
+    """
 
-    # Computing *P_1* to *P_3*.
-    P_n = P(surround.N_c, N_cb, e_t, t, A, N_bb)
-    _P_1, P_2, _P_3 = tsplit(P_n)
+    def __init__(self,
+                 XYZ_w,
+                 L_A,
+                 Y_b,
+                 surround=CIECAM02_VIEWING_CONDITIONS['Average'],
+                 discount_illuminant=False):
+        self._XYZ_w = as_float_array(XYZ_w)
+        self._L_A = as_float_array(L_A)
+        self._Y_b = as_float_array(Y_b)
+        self._surround = surround
+        self._discount_illuminant = discount_illuminant
+
+        _X_w, Y_w, _Z_w = tsplit(self._XYZ_w)
+        c = as_float_array(surround.c)
+
+        n, F_L, N_bb, N_cb, z = tsplit(
+            viewing_condition_dependent_parameters(self._Y_b, Y_w, self._L_A))
+
+        # Computing degree of adaptation :math:`D`.
+        D = self._degree_of_adaptation()
+
+        # Computing the full chromatic adaptation factors and fusing them
+        # with the conversion matrices.
+        RGB_w = dot_vector(self._SHARPENING_MATRIX, self._XYZ_w)
+        D_RGB = (D[..., np.newaxis] * Y_w[..., np.newaxis] / RGB_w + 1 -
+                 D[..., np.newaxis])
+        self._M = dot_matrix(self._POST_ADAPTATION_MATRIX,
+                             D_RGB[..., np.newaxis] * self._SHARPENING_MATRIX)
+        self._M_inverse = dot_matrix(
+            self._SHARPENING_MATRIX_INVERSE / D_RGB[..., np.newaxis, :],
+            self._POST_ADAPTATION_MATRIX_INVERSE)
+
+        # Computing achromatic response for the whitepoint.
+        RGB_aw = post_adaptation_non_linear_response_compression_forward(
+            dot_vector(self._M, self._XYZ_w), F_L)
+        A_w = achromatic_response_forward(RGB_aw, N_bb)
+
+        self._n = n
+        self._F_L = F_L
+        self._N_bb = N_bb
+        self._N_cb = N_cb
+        self._A_w = A_w
+        self._c_z = c * z
+        self._F_L_4 = F_L ** 0.25
+        self._N_c_N_cb = (50000 / 13) * as_float_array(surround.N_c) * N_cb
+        self._n_factor = (1.64 - 0.29 ** n) ** 0.73
+        self._Q_factor = (4 / c) * (A_w + 4) * self._F_L_4
+
+    @property
+    def XYZ_w(self):
+        """
+        Getter property for the *CIE XYZ* tristimulus values of reference
+        white.
 
-    # Computing opponent colour dimensions :math:`a` and :math:`b`.
-    a, b = tsplit(opponent_colour_dimensions_reverse(P_n, h))
+        Returns
+        -------
+        ndarray
+            *CIE XYZ* tristimulus values of reference white.
+        """
 
-    # Computing post-adaptation non linear response compression matrix.
-    RGB_a = post_adaptation_non_linear_response_compression_matrix(P_2, a, b)
+        return self._XYZ_w
 
-    # Applying reverse post-adaptation non linear response compression.
-    RGB_p = post_adaptation_non_linear_response_compression_reverse(RGB_a, F_L)
+    @property
+    def L_A(self):
+        """
+        Getter property for the adapting field *luminance* :math:`L_A`.
 
-    # Converting to *Hunt-Pointer-Estevez* colourspace.
-    RGB_c = rgb_to_RGB(RGB_p)
+        Returns
+        -------
+        ndarray
+            Adapting field *luminance* :math:`L_A`.
+        """
 
-    # Applying reverse full chromatic adaptation.
-    RGB = full_chromatic_adaptation_reverse(RGB_c, RGB_w, Y_w, D)
+        return self._L_A
 
-    # Converting *CMCCAT2000* transform sharpened *RGB* values to *CIE XYZ*
-    # tristimulus values.
-    XYZ = dot_vector(CAT02_INVERSE_CAT, RGB)
+    @property
+    def Y_b(self):
+        """
+        Getter property for the relative luminance of background :math:`Y_b`.
 
-    return XYZ
+        Returns
+        -------
+        ndarray
+            Relative luminance of background :math:`Y_b`.
+        """
+
+        return self._Y_b
+
+    @property
+    def surround(self):
+        """
+        Getter property for the surround viewing conditions induction
+        factors.
+
+        Returns
+        -------
+        namedtuple
+            Surround viewing conditions induction factors.
+        """
+
+        return self._surround
+
+    @property
+    def discount_illuminant(self):
+        """
+        Getter property for the illuminant discounting state.
+
+        Returns
+        -------
+        bool
+            Whether the illuminant is discounted.
+        """
+
+        return self._discount_illuminant
+
+    def _degree_of_adaptation(self):
+        """
+        Computes the degree of adaptation :math:`D` for the model viewing
+        conditions.
+
+        Returns
+        -------
+        ndarray
+            Degree of adaptation :math:`D`.
+        """
+
+        if self._discount_illuminant:
+            return np.ones(self._L_A.shape, DEFAULT_FLOAT_DTYPE)
+
+        return degree_of_adaptation(self._surround.F, self._L_A)
+
+    def forward(self, XYZ):
+        """
+        Computes the colour appearance model correlates from given *CIE XYZ*
+        tristimulus values.
+
+        Parameters
+        ----------
+        XYZ : array_like
+            *CIE XYZ* tristimulus values of test sample / stimulus normalised
+            to domain [0, 100].
+
+        Returns
+        -------
+        CIECAM02_Specification
+            Colour appearance model specification.
+        """
+
+        XYZ = as_float_array(XYZ)
+
+        # Converting *CIE XYZ* tristimulus values to adapted *RGB* values and
+        # applying the forward post-adaptation non linear response
+        # compression in-place.
+        RGB_a = dot_vector(self._M, XYZ)
+        RGB_s = np.sign(RGB_a)
+        np.absolute(RGB_a, out=RGB_a)
+        RGB_a *= self._F_L[..., np.newaxis] / 100
+        np.power(RGB_a, 0.42, out=RGB_a)
+        RGB_s *= 400
+        RGB_s *= RGB_a
+        RGB_a += 27.13
+        RGB_s /= RGB_a
+        RGB_s += 0.1
+        R_a, G_a, B_a = tsplit(RGB_s)
+
+        # Converting to preliminary cartesian coordinates.
+        a = R_a - 12 * G_a / 11 + B_a / 11
+        b = (R_a + G_a - 2 * B_a) / 9
+
+        # Computing the *hue* angle :math:`h`.
+        h = hue_angle(a, b)
+
+        # Computing hue :math:`h` quadrature :math:`H` and composition
+        # :math:`H^C`.
+        H = hue_quadrature(h)
+        HC = hue_composition(H)
+
+        # Computing eccentricity factor *e_t*.
+        e_t = eccentricity_factor(h)
+
+        # Computing achromatic response for the stimulus.
+        A = (2 * R_a + G_a + (1 / 20) * B_a - 0.305) * self._N_bb
+
+        # Computing the correlate of *Lightness* :math:`J`.
+        J = 100 * (A / self._A_w) ** self._c_z
+
+        # Computing the correlate of *brightness* :math:`Q`.
+        J_100 = np.sqrt(J / 100)
+        Q = J_100 * self._Q_factor
+
+        # Computing the correlate of *chroma* :math:`C`.
+        t = (self._N_c_N_cb * e_t * np.hypot(a, b) /
+             (R_a + G_a + 21 * B_a / 20))
+        C = t ** 0.9 * J_100 * self._n_factor
+
+        # Computing the correlate of *colourfulness* :math:`M`.
+        M = C * self._F_L_4
+
+        # Computing the correlate of *saturation* :math:`s`.
+        s = 100 * np.sqrt(M / Q)
+
+        return self._SPECIFICATION(J, C, h, s, Q, M, H, HC)
+
+    def reverse(self, specification):
+        """
+        Converts given colour appearance model specification to *CIE XYZ*
+        tristimulus values.
+
+        Parameters
+        ----------
+        specification : CIECAM02_Specification
+            Colour appearance model specification. Correlate of *Lightness*
+            :math:`J`, correlate of *chroma* :math:`C` or correlate of
+            *colourfulness* :math:`M` and *hue* angle :math:`h` in degrees
+            must be specified, e.g. :math:`JCh` or :math:`JMh`.
+
+        Returns
+        -------
+        ndarray
+            *CIE XYZ* tristimulus values.
+
+        Raises
+        ------
+        ValueError
+            If neither *C* or *M* correlates have been defined in the
+            ``specification`` argument.
+        """
+
+        J, C, h, _s, _Q, M, _H, _HC = as_namedtuple(specification,
+                                                    self._SPECIFICATION)
+
+        if C is None and M is not None:
+            C = as_float_array(M) / self._F_L_4
+        elif C is None:
+            raise ValueError('Either "C" or "M" correlate must be defined in '
+                             'the "specification" argument!')
+
+        # Computing temporary magnitude quantity :math:`t`.
+        t = temporary_magnitude_quantity_reverse(C, J, self._n)
+
+        # Computing eccentricity factor *e_t*.
+        e_t = eccentricity_factor(h)
+
+        # Computing achromatic response :math:`A` for the stimulus.
+        A = self._A_w * (as_float_array(J) / 100) ** (1 / self._c_z)
+
+        # Computing *P_1* to *P_3*.
+        P_n = tstack(
+            (self._N_c_N_cb * e_t / t, A / self._N_bb + 0.305, 21 / 20))
+        _P_1, P_2, _P_3 = tsplit(P_n)
+
+        # Computing opponent colour dimensions :math:`a` and :math:`b`.
+        a, b = tsplit(opponent_colour_dimensions_reverse(P_n, h))
+
+        # Computing post-adaptation non linear response compression matrix.
+        RGB_a = post_adaptation_non_linear_response_compression_matrix(
+            P_2, a, b)
+
+        # Applying reverse post-adaptation non linear response compression
+        # in-place.
+        RGB_a -= 0.1
+        RGB_s = np.sign(RGB_a)
+        np.absolute(RGB_a, out=RGB_a)
+        RGB_p = np.subtract(400, RGB_a)
+        RGB_a *= 27.13
+        RGB_a /= RGB_p
+        np.power(RGB_a, 1 / 0.42, out=RGB_a)
+        RGB_a *= RGB_s
+        RGB_a *= 100 / self._F_L[..., np.newaxis]
+
+        # Converting to *CIE XYZ* tristimulus values.
+        XYZ = dot_vector(self._M_inverse, RGB_a)
+
+        return XYZ
 
 
 def chromatic_induction_factors(n):
@@ -468,7 +710,7 @@ def chromatic_induction_factors(n):
     array([ 1.000304...,  1.000304...])
     """
 
-    n = np.asarray(n)
+    n = as_float_array(n)
 
     N_bb = N_cb = 0.725 * (1 / n) ** 0.2
     N_bbcb = tstack((N_bb, N_cb))
@@ -496,7 +738,7 @@ def base_exponential_non_linearity(n):
     1.9272135...
     """
 
-    n = np.asarray(n)
+    n = as_float_array(n)
 
     z = 1.48 + np.sqrt(n)
 
@@ -528,8 +770,8 @@ def viewing_condition_dependent_parameters(Y_b, Y_w, L_A):
     array([ 0.2...,  1.1675444...,  1.000304...,  1.000304...,  1.9272136...])
     """
 
-    Y_b = np.asarray(Y_b)
-    Y_w = np.asarray(Y_w)
+    Y_b = as_float_array(Y_b)
+    Y_w = as_float_array(Y_w)
 
     n = Y_b / Y_w
 
@@ -564,8 +806,8 @@ def degree_of_adaptation(F, L_A):
     0.9944687...
     """
 
-    F = np.asarray(F)
-    L_A = np.asarray(L_A)
+    F = as_float_array(F)
+    L_A = as_float_array(L_A)
 
     D = F * (1 - (1 / 3.6) * np.exp((-L_A - 42) / 92))
 
@@ -605,10 +847,10 @@ def full_chromatic_adaptation_forward(RGB, RGB_w, Y_w, D):
     array([ 19.9937078...,  20.0039363...,  20.0132638...])
     """
 
-    RGB = np.asarray(RGB)
-    RGB_w = np.asarray(RGB_w)
-    Y_w = np.asarray(Y_w)
-    D = np.asarray(D)
+    RGB = as_float_array(RGB)
+    RGB_w = as_float_array(RGB_w)
+    Y_w = as_float_array(Y_w)
+    D = as_float_array(D)
 
     RGB_c = (((Y_w[..., np.newaxis] * D[..., np.newaxis] / RGB_w) + 1 -
               D[..., np.newaxis]) * RGB)
@@ -648,10 +890,10 @@ def full_chromatic_adaptation_reverse(RGB, RGB_w, Y_w, D):
     array([ 18.985456,  20.707422,  21.747482])
     """
 
-    RGB = np.asarray(RGB)
-    RGB_w = np.asarray(RGB_w)
-    Y_w = np.asarray(Y_w)
-    D = np.asarray(D)
+    RGB = as_float_array(RGB)
+    RGB_w = as_float_array(RGB_w)
+    Y_w = as_float_array(Y_w)
+    D = as_float_array(D)
 
     RGB_c = (RGB / (Y_w[..., np.newaxis] *
                     (D[..., np.newaxis] / RGB_w) + 1 - D[..., np.newaxis]))
@@ -744,8 +986,8 @@ def post_adaptation_non_linear_response_compression_forward(RGB, F_L):
     array([ 7.9463202...,  7.9471152...,  7.9489959...])
     """
 
-    RGB = np.asarray(RGB)
-    F_L = np.asarray(F_L)
+    RGB = as_float_array(RGB)
+    F_L = as_float_array(F_L)
 
     F_L_RGB = (F_L[..., np.newaxis] * np.absolute(RGB) / 100) ** 0.42
     RGB_c = ((400 * np.sign(RGB) * F_L_RGB) / (27.13 + F_L_RGB)) + 0.1
@@ -779,8 +1021,8 @@ def post_adaptation_non_linear_response_compression_reverse(RGB, F_L):
     array([ 19.9969397...,  20.0018612...,  20.0135052...])
     """
 
-    RGB = np.asarray(RGB)
-    F_L = np.asarray(F_L)
+    RGB = as_float_array(RGB)
+    F_L = as_float_array(F_L)
 
     RGB_p = ((np.sign(RGB - 0.1) * (100 / F_L[..., np.newaxis]) *
               ((27.13 * np.abs(RGB - 0.1)) /
@@ -861,8 +1103,8 @@ def opponent_colour_dimensions_reverse(P_n, h):
     P_5 = P_1 / cos_hr
     n = P_2 * (2 + P_3) * (460 / 1403)
 
-    a = np.zeros(hr.shape)
-    b = np.zeros(hr.shape)
+    a = np.zeros(hr.shape, DEFAULT_FLOAT_DTYPE)
+    b = np.zeros(hr.shape, DEFAULT_FLOAT_DTYPE)
 
     b = np.where(
         np.isfinite(P_1) * np.abs(sin_hr) >= np.abs(cos_hr),
@@ -911,60 +1153,14 @@ def hue_angle(a, b):
     219.0484326...
     """
 
-    a = np.asarray(a)
-    b = np.asarray(b)
+    a = as_float_array(a)
+    b = as_float_array(b)
 
     h = np.degrees(np.arctan2(b, a)) % 360
 
     return h
 
 
-def hue_quadrature(h):
-    """
-    Returns the hue quadrature from given hue :math:`h` angle in degrees.
-
-    Parameters
-    ----------
-    h : numeric or array_like
-        Hue :math:`h` angle in degrees.
-
-    Returns
-    -------
-    numeric or ndarray
-        Hue quadrature.
-
-    Examples
-    --------
-    >>> hue_quadrature(219.0484326582719)  # doctest: +ELLIPSIS
-    278.0607358...
-    """
-
-    h = np.asarray(h)
-
-    h_i = HUE_DATA_FOR_HUE_QUADRATURE['h_i']
-    e_i = HUE_DATA_FOR_HUE_QUADRATURE['e_i']
-    H_i = HUE_DATA_FOR_HUE_QUADRATURE['H_i']
-
-    # *np.searchsorted* returns an erroneous index if a *nan* is used as input.
-    h[np.asarray(np.isnan(h))] = 0
-    i = np.asarray(np.searchsorted(h_i, h, side='left') - 1)
-
-    h_ii = h_i[i]
-    e_ii = e_i[i]
-    H_ii = H_i[i]
-    h_ii1 = h_i[i + 1]
-    e_ii1 = e_i[i + 1]
-
-    H = H_ii + ((100 * (h - h_ii) / e_ii) / ((h - h_ii) / e_ii +
-                                             (h_ii1 - h) / e_ii1))
-    H = np.where(h < 20.14, 385.9 + (14.1 * h / 0.856) /
-                 (h / 0.856 + (20.14 - h) / 0.8), H)
-    H = np.where(h >= 237.53, H_ii + ((85.9 * (h - h_ii) / e_ii) /
-                                      ((h - h_ii) / e_ii + (360 - h) / 0.856)),
-                 H)
-    return as_numeric(H)
-
-
 def eccentricity_factor(h):
     """
     Returns the eccentricity factor :math:`e_t` from given hue :math:`h` angle
@@ -986,7 +1182,7 @@ def eccentricity_factor(h):
     1.1740054...
     """
 
-    h = np.asarray(h)
+    h = as_float_array(h)
 
     e_t = 1 / 4 * (np.cos(2 + h * np.pi / 180) + 3.8)
 
@@ -1059,10 +1255,10 @@ def achromatic_response_reverse(A_w, J, c, z):
     23.9394809...
     """
 
-    A_w = np.asarray(A_w)
-    J = np.asarray(J)
-    c = np.asarray(c)
-    z = np.asarray(z)
+    A_w = as_float_array(A_w)
+    J = as_float_array(J)
+    c = as_float_array(c)
+    z = as_float_array(z)
 
     A = A_w * (J / 100) ** (1 / (c * z))
 
@@ -1099,10 +1295,10 @@ def lightness_correlate(A, A_w, c, z):
     41.7310911...
     """
 
-    A = np.asarray(A)
-    A_w = np.asarray(A_w)
-    c = np.asarray(c)
-    z = np.asarray(z)
+    A = as_float_array(A)
+    A_w = as_float_array(A_w)
+    c = as_float_array(c)
+    z = as_float_array(z)
 
     J = 100 * (A / A_w) ** (c * z)
 
@@ -1139,10 +1335,10 @@ def brightness_correlate(c, J, A_w, F_L):
     195.3713259...
     """
 
-    c = np.asarray(c)
-    J = np.asarray(J)
-    A_w = np.asarray(A_w)
-    F_L = np.asarray(F_L)
+    c = as_float_array(c)
+    J = as_float_array(J)
+    A_w = as_float_array(A_w)
+    F_L = as_float_array(F_L)
 
     Q = (4 / c) * np.sqrt(J / 100) * (A_w + 4) * F_L ** 0.25
 
@@ -1187,11 +1383,11 @@ def temporary_magnitude_quantity_forward(N_c, N_cb, e_t, a, b, RGB_a):
     0.1497462...
     """
 
-    N_c = np.asarray(N_c)
-    N_cb = np.asarray(N_cb)
-    e_t = np.asarray(e_t)
-    a = np.asarray(a)
-    b = np.asarray(b)
+    N_c = as_float_array(N_c)
+    N_cb = as_float_array(N_cb)
+    e_t = as_float_array(e_t)
+    a = as_float_array(a)
+    b = as_float_array(b)
     Ra, Ga, Ba = tsplit(RGB_a)
 
     t = (((50000 / 13) * N_c * N_cb) * (e_t * (a ** 2 + b ** 2) ** 0.5) /
@@ -1233,9 +1429,9 @@ def temporary_magnitude_quantity_reverse(C, J, n):
     202.3873619...
    """
 
-    C = np.asarray(C)
+    C = as_float_array(C)
     J = np.maximum(J, EPSILON)
-    n = np.asarray(n)
+    n = as_float_array(n)
 
     t = (C / (np.sqrt(J / 100) * (1.64 - 0.29 ** n) ** 0.73)) ** (1 / 0.9)
 
@@ -1285,8 +1481,8 @@ def chroma_correlate(J, n, N_c, N_cb, e_t, a, b, RGB_a):
     0.1047077...
     """
 
-    J = np.asarray(J)
-    n = np.asarray(n)
+    J = as_float_array(J)
+    n = as_float_array(n)
 
     t = temporary_magnitude_quantity_forward(N_c, N_cb, e_t, a, b, RGB_a)
     C = t ** 0.9 * (J / 100) ** 0.5 * (1.64 - 0.29 ** n) ** 0.73
@@ -1318,8 +1514,8 @@ def colourfulness_correlate(C, F_L):
     0.1088421...
     """
 
-    C = np.asarray(C)
-    F_L = np.asarray(F_L)
+    C = as_float_array(C)
+    F_L = as_float_array(F_L)
 
     M = C * F_L ** 0.25
 
@@ -1350,8 +1546,8 @@ def saturation_correlate(M, Q):
     2.3603053...
     """
 
-    M = np.asarray(M)
-    Q = np.asarray(Q)
+    M = as_float_array(M)
+    Q = as_float_array(Q)
 
     s = 100 * (M / Q) ** 0.5
 
@@ -1394,16 +1590,16 @@ def P(N_c, N_cb, e_t, t, A, N_bb):
     array([  3.0162890...e+04,   2.4237205...e+01,   1.0500000...e+00])
     """
 
-    N_c = np.asarray(N_c)
-    N_cb = np.asarray(N_cb)
-    e_t = np.asarray(e_t)
-    t = np.asarray(t)
-    A = np.asarray(A)
-    N_bb = np.asarray(N_bb)
+    N_c = as_float_array(N_c)
+    N_cb = as_float_array(N_cb)
+    e_t = as_float_array(e_t)
+    t = as_float_array(t)
+    A = as_float_array(A)
+    N_bb = as_float_array(N_bb)
 
     P_1 = ((50000 / 13) * N_c * N_cb * e_t) / t
     P_2 = A / N_bb + 0.305
-    P_3 = np.ones(P_1.shape) * (21 / 20)
+    P_3 = np.ones(P_1.shape, DEFAULT_FLOAT_DTYPE) * (21 / 20)
 
     P_n = tstack((P_1, P_2, P_3))
 
@@ -1438,9 +1634,9 @@ def post_adaptation_non_linear_response_compression_matrix(P_2, a, b):
     array([ 7.9463202...,  7.9471152...,  7.9489959...])
     """
 
-    P_2 = np.asarray(P_2)
-    a = np.asarray(a)
-    b = np.asarray(b)
+    P_2 = as_float_array(P_2)
+    a = as_float_array(a)
+    b = as_float_array(b)
 
     R_a = (460 * P_2 + 451 * a + 288 * b) / 1403
     G_a = (460 * P_2 - 891 * a - 261 * b) / 1403
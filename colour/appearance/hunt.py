@@ -29,8 +29,9 @@ from __future__ import division, unicode_literals
 import numpy as np
 from collections import namedtuple
 
-from colour.utilities import (CaseInsensitiveMapping, dot_vector, tsplit,
-                              tstack, warning)
+from colour.constants import DEFAULT_FLOAT_DTYPE
+from colour.utilities import (CaseInsensitiveMapping, as_float_array,
+                              as_numeric, dot_vector, tsplit, tstack, warning)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -46,7 +47,8 @@ __all__ = [
     'luminance_level_adaptation_factor', 'illuminant_scotopic_luminance',
     'XYZ_to_rgb', 'f_n', 'chromatic_adaptation',
     'adjusted_reference_white_signals', 'achromatic_post_adaptation_signal',
-    'colour_difference_signals', 'hue_angle', 'eccentricity_factor',
+    'colour_difference_signals', 'hue_angle', 'hue_quadrature',
+    'hue_composition', 'eccentricity_factor',
     'low_luminance_tritanopia_factor', 'yellowness_blueness_response',
     'redness_greenness_response', 'overall_chromatic_response',
     'saturation_correlate', 'achromatic_signal', 'brightness_correlate',
@@ -138,8 +140,47 @@ HUNT_VIEWING_CONDITIONS['projected_dark'] = (
 
 HUE_DATA_FOR_HUE_QUADRATURE = {
     'h_s': np.array([20.14, 90.00, 164.25, 237.53]),
-    'e_s': np.array([0.8, 0.7, 1.0, 1.2])
+    'e_s': np.array([0.8, 0.7, 1.0, 1.2]),
+    'h_i': np.array([20.14, 90.00, 164.25, 237.53, 380.14]),
+    'e_i': np.array([0.8, 0.7, 1.0, 1.2, 0.8]),
+    'H_i': np.array([0.0, 100.0, 200.0, 300.0, 400.0])
 }
+"""
+Unique hues data for hue quadrature and eccentricity factor computations.
+
+HUE_DATA_FOR_HUE_QUADRATURE : dict
+    **{'h_s', 'e_s', 'h_i', 'e_i', 'H_i'}**
+"""
+
+_HUE_DATA_FOR_HUE_QUADRATURE_PADDED = {
+    'h_i': np.array([0.00, 20.14, 90.00, 164.25, 237.53, 360.00]),
+    'e_i': np.array([0.856, 0.8, 0.7, 1.0, 1.2, 0.856]),
+    'H_i': np.array([-14.1, 0.0, 100.0, 200.0, 300.0, 385.9])
+}
+"""
+Unique hues data for hue quadrature computation padded with the *Unique Red*
+hue wrapped around at 0 and 360 degrees, the associated hue quadrature values
+are unwrapped so that they increase monotonically.
+
+_HUE_DATA_FOR_HUE_QUADRATURE_PADDED : dict
+    **{'h_i', 'e_i', 'H_i'}**
+"""
+
+_HUE_QUADRATURE_SEGMENTS = np.transpose([
+    _HUE_DATA_FOR_HUE_QUADRATURE_PADDED['h_i'][:-1],
+    _HUE_DATA_FOR_HUE_QUADRATURE_PADDED['e_i'][:-1],
+    _HUE_DATA_FOR_HUE_QUADRATURE_PADDED['H_i'][:-1],
+    _HUE_DATA_FOR_HUE_QUADRATURE_PADDED['h_i'][1:],
+    _HUE_DATA_FOR_HUE_QUADRATURE_PADDED['e_i'][1:],
+    np.diff(_HUE_DATA_FOR_HUE_QUADRATURE_PADDED['H_i']),
+])
+"""
+Hue quadrature segments table, each row stores the :math:`h_i`, :math:`e_i`,
+:math:`H_i`, :math:`h_{i+1}`, :math:`e_{i+1}` and
+:math:`H_{i+1} - H_i` values of a segment.
+
+_HUE_QUADRATURE_SEGMENTS : ndarray
+"""
 
 XYZ_TO_HPE_MATRIX = np.array([
     [0.38971, 0.68898, -0.07868],
@@ -330,7 +371,8 @@ def XYZ_to_Hunt(XYZ,
     >>> XYZ_to_Hunt(XYZ, XYZ_w, XYZ_b, L_A, surround, CCT_w=CCT_w)
     ... # doctest: +ELLIPSIS
     Hunt_Specification(J=30.0462678..., C=0.1210508..., h=269.2737594..., \
-s=0.0199093..., Q=22.2097654..., M=0.1238964..., H=None, HC=None)
+s=0.0199093..., Q=22.2097654..., M=0.1238964..., H=317.1571610..., \
+HC=array([ 17.157161...,   0...,   0...,  82.842839...]))
     """
 
     _X, Y, _Z = tsplit(XYZ)
@@ -408,7 +450,12 @@ s=0.0199093..., Q=22.2097654..., M=0.1238964..., H=None, HC=None)
     # -------------------------------------------------------------------------
     h = hue_angle(C)
     # hue_w = hue_angle(C_w)
-    # TODO: Implement hue quadrature & composition computation.
+
+    # Computing hue :math:`h` quadrature :math:`H`.
+    H = hue_quadrature(h)
+
+    # Computing hue :math:`h` composition :math:`H^C`.
+    HC = hue_composition(H)
 
     # -------------------------------------------------------------------------
     # Computing the correlate of *saturation* :math:`s`.
@@ -456,7 +503,7 @@ s=0.0199093..., Q=22.2097654..., M=0.1238964..., H=None, HC=None)
     # -------------------------------------------------------------------------
     M_94 = colourfulness_correlate(F_L, C_94)
 
-    return Hunt_Specification(J, C_94, h, s, Q, M_94, None, None)
+    return Hunt_Specification(J, C_94, h, s, Q, M_94, H, HC)
 
 
 def luminance_level_adaptation_factor(L_A):
@@ -479,7 +526,7 @@ def luminance_level_adaptation_factor(L_A):
     1.1675444...
     """
 
-    L_A = np.asarray(L_A)
+    L_A = as_float_array(L_A)
 
     k = 1 / (5 * L_A + 1)
     k4 = k ** 4
@@ -511,8 +558,8 @@ def illuminant_scotopic_luminance(L_A, CCT):
     769.9376286...
     """
 
-    L_A = np.asarray(L_A)
-    CCT = np.asarray(CCT)
+    L_A = as_float_array(L_A)
+    CCT = as_float_array(CCT)
 
     CCT = 2.26 * L_A * ((CCT / 4000) - 0.4) ** (1 / 3)
 
@@ -567,7 +614,7 @@ def f_n(x):
     array([ 5.8968592...,  5.8969521...,  5.8975927...])
     """
 
-    x = np.asarray(x)
+    x = as_float_array(x)
 
     x_m = 40 * ((x ** 0.73) / (x ** 0.73 + 2))
 
@@ -630,10 +677,10 @@ def chromatic_adaptation(XYZ,
     array([ 6.8959454...,  6.8959991...,  6.8965708...])
     """
 
-    XYZ_w = np.asarray(XYZ_w)
-    XYZ_b = np.asarray(XYZ_b)
-    L_A = np.asarray(L_A)
-    F_L = np.asarray(F_L)
+    XYZ_w = as_float_array(XYZ_w)
+    XYZ_b = as_float_array(XYZ_b)
+    L_A = as_float_array(L_A)
+    F_L = as_float_array(F_L)
 
     rgb = XYZ_to_rgb(XYZ)
     rgb_w = XYZ_to_rgb(XYZ_w)
@@ -647,14 +694,14 @@ def chromatic_adaptation(XYZ,
         F_rgb = ((1 + (L_A ** (1 / 3)) + h_rgb) / (1 + (L_A ** (1 / 3)) +
                                                    (1 / h_rgb)))
     else:
-        F_rgb = np.ones(h_rgb.shape)
+        F_rgb = np.ones(h_rgb.shape, DEFAULT_FLOAT_DTYPE)
 
     # Computing Helson-Judd effect parameters.
     if helson_judd_effect:
         D_rgb = (f_n((Y_b / Y_w) * F_L * F_rgb[..., 1]) - f_n(
             (Y_b / Y_w) * F_L * F_rgb))
     else:
-        D_rgb = np.zeros(F_rgb.shape)
+        D_rgb = np.zeros(F_rgb.shape, DEFAULT_FLOAT_DTYPE)
 
     # Computing cone bleach factors.
     B_rgb = (10 ** 7) / ((10 ** 7) + 5 * L_A[..., np.newaxis] * (rgb_w / 100))
@@ -708,10 +755,10 @@ def adjusted_reference_white_signals(rgb_p, rgb_b, rgb_w, p):
     array([ 88.0792742...,  91.8569553...,  98.4876543...])
     """
 
-    rgb_p = np.asarray(rgb_p)
-    rgb_b = np.asarray(rgb_b)
-    rgb_w = np.asarray(rgb_w)
-    p = np.asarray(p)
+    rgb_p = as_float_array(rgb_p)
+    rgb_b = as_float_array(rgb_b)
+    rgb_w = as_float_array(rgb_w)
+    p = as_float_array(p)
 
     p_rgb = rgb_p / rgb_b
     rgb_w = (rgb_w * (((1 - p) * p_rgb + (1 + p) / p_rgb) ** 0.5) /
@@ -816,6 +863,84 @@ def hue_angle(C):
     return hue
 
 
+def hue_quadrature(h):
+    """
+    Returns the hue quadrature :math:`H` from given hue :math:`h` angle in
+    degrees.
+
+    Parameters
+    ----------
+    h : numeric or array_like
+        Hue :math:`h` angle in degrees.
+
+    Returns
+    -------
+    numeric or ndarray
+        Hue quadrature :math:`H`.
+
+    Notes
+    -----
+    -   The hue quadrature is computed with a single lookup into the
+        unique hues segments padded with the *Unique Red* hue wrapped around
+        at 0 and 360 degrees, thus the exact *Unique Red* and *Unique Blue*
+        hue angles, i.e. 20.14 and 237.53 degrees, yield the hue quadrature
+        values 0 and 300 respectively.
+
+    Examples
+    --------
+    >>> hue_quadrature(219.0484326582719)  # doctest: +ELLIPSIS
+    278.0607358...
+    """
+
+    h = as_float_array(h) % 360
+
+    i = np.searchsorted(
+        _HUE_DATA_FOR_HUE_QUADRATURE_PADDED['h_i'], h, side='right')
+    i = np.clip(i - 1, 0, len(_HUE_QUADRATURE_SEGMENTS) - 1)
+
+    h_ii, e_ii, H_ii, h_ii1, e_ii1, H_w = tsplit(_HUE_QUADRATURE_SEGMENTS[i])
+
+    h_h_ii = (h - h_ii) / e_ii
+    H = (H_ii + (H_w * h_h_ii) / (h_h_ii + (h_ii1 - h) / e_ii1)) % 400
+
+    return as_numeric(H)
+
+
+def hue_composition(H):
+    """
+    Returns the hue composition :math:`H^C` from given hue quadrature
+    :math:`H`, i.e. the percentages of *Unique Red*, *Unique Yellow*,
+    *Unique Green* and *Unique Blue* hues of the stimulus.
+
+    Parameters
+    ----------
+    H : numeric or array_like
+        Hue quadrature :math:`H`.
+
+    Returns
+    -------
+    ndarray
+        Hue composition :math:`H^C` as *Unique Red*, *Unique Yellow*,
+        *Unique Green* and *Unique Blue* hues percentages.
+
+    Examples
+    --------
+    >>> hue_composition(278.0607358)
+    array([  0.       ,   0.       ,  21.9392642,  78.0607358])
+    """
+
+    H = as_float_array(H) % 400
+
+    i = np.floor(H / 100)[..., np.newaxis]
+    P = H[..., np.newaxis] - 100 * i
+
+    k = np.arange(4)
+    HC = (np.where(k == i, 100 - P, 0) + np.where(k == (i + 1) % 4, P, 0))
+    HC[np.isnan(H)] = np.nan
+
+    return HC
+
+
 def eccentricity_factor(hue):
     """
     Returns eccentricity factor :math:`e_s` from given hue angle :math:`h`
@@ -837,7 +962,7 @@ def eccentricity_factor(hue):
     array(1.1108365...)
     """
 
-    hue = np.asarray(hue)
+    hue = as_float_array(hue)
 
     h_s = HUE_DATA_FOR_HUE_QUADRATURE['h_s']
     e_s = HUE_DATA_FOR_HUE_QUADRATURE['e_s']
@@ -870,7 +995,7 @@ def low_luminance_tritanopia_factor(L_A):
     0.9996859...
     """
 
-    L_A = np.asarray(L_A)
+    L_A = as_float_array(L_A)
 
     F_t = L_A / (L_A + 0.1)
 
@@ -916,10 +1041,10 @@ def yellowness_blueness_response(C, e_s, N_c, N_cb, F_t):
     """
 
     _C_1, C_2, C_3 = tsplit(C)
-    e_s = np.asarray(e_s)
-    N_c = np.asarray(N_c)
-    N_cb = np.asarray(N_cb)
-    F_t = np.asarray(F_t)
+    e_s = as_float_array(e_s)
+    N_c = as_float_array(N_c)
+    N_cb = as_float_array(N_cb)
+    F_t = as_float_array(F_t)
 
     M_yb = (100 * (0.5 * (C_2 - C_3) / 4.5) * (e_s *
                                                (10 / 13) * N_c * N_cb * F_t))
@@ -962,9 +1087,9 @@ def redness_greenness_response(C, e_s, N_c, N_cb):
     """
 
     C_1, C_2, _C_3 = tsplit(C)
-    e_s = np.asarray(e_s)
-    N_c = np.asarray(N_c)
-    N_cb = np.asarray(N_cb)
+    e_s = as_float_array(e_s)
+    N_c = as_float_array(N_c)
+    N_cb = as_float_array(N_cb)
 
     M_rg = 100 * (C_1 - (C_2 / 11)) * (e_s * (10 / 13) * N_c * N_cb)
 
@@ -995,8 +1120,8 @@ def overall_chromatic_response(M_yb, M_rg):
     0.0082378...
     """
 
-    M_yb = np.asarray(M_yb)
-    M_rg = np.asarray(M_rg)
+    M_yb = as_float_array(M_yb)
+    M_rg = as_float_array(M_rg)
 
     M = ((M_yb ** 2) + (M_rg ** 2)) ** 0.5
 
@@ -1028,8 +1153,8 @@ def saturation_correlate(M, rgb_a):
     0.0199093...
     """
 
-    M = np.asarray(M)
-    rgb_a = np.asarray(rgb_a)
+    M = as_float_array(M)
+    rgb_a = as_float_array(rgb_a)
 
     s = 50 * M / np.sum(rgb_a, axis=-1)
 
@@ -1069,11 +1194,11 @@ def achromatic_signal(L_AS, S, S_w, N_bb, A_a):
     15.5068546...
     """
 
-    L_AS = np.asarray(L_AS)
-    S = np.asarray(S)
-    S_w = np.asarray(S_w)
-    N_bb = np.asarray(N_bb)
-    A_a = np.asarray(A_a)
+    L_AS = as_float_array(L_AS)
+    S = as_float_array(S)
+    S_w = as_float_array(S_w)
+    N_bb = as_float_array(N_bb)
+    A_a = as_float_array(A_a)
 
     j = 0.00001 / ((5 * L_AS / 2.26) + 0.00001)
 
@@ -1124,10 +1249,10 @@ def brightness_correlate(A, A_w, M, N_b):
     22.2097654...
     """
 
-    A = np.asarray(A)
-    A_w = np.asarray(A_w)
-    M = np.asarray(M)
-    N_b = np.asarray(N_b)
+    A = as_float_array(A)
+    A_w = as_float_array(A_w)
+    M = as_float_array(M)
+    N_b = as_float_array(N_b)
 
     N_1 = ((7 * A_w) ** 0.5) / (5.33 * N_b ** 0.13)
     N_2 = (7 * A_w * N_b ** 0.362) / 200
@@ -1166,10 +1291,10 @@ def lightness_correlate(Y_b, Y_w, Q, Q_w):
     30.0462678...
     """
 
-    Y_b = np.asarray(Y_b)
-    Y_w = np.asarray(Y_w)
-    Q = np.asarray(Q)
-    Q_w = np.asarray(Q_w)
+    Y_b = as_float_array(Y_b)
+    Y_w = as_float_array(Y_w)
+    Q = as_float_array(Q)
+    Q_w = as_float_array(Q_w)
 
     Z = 1 + (Y_b / Y_w) ** 0.5
     J = 100 * (Q / Q_w) ** Z
@@ -1210,11 +1335,11 @@ def chroma_correlate(s, Y_b, Y_w, Q, Q_w):
     0.1210508...
     """
 
-    s = np.asarray(s)
-    Y_b = np.asarray(Y_b)
-    Y_w = np.asarray(Y_w)
-    Q = np.asarray(Q)
-    Q_w = np.asarray(Q_w)
+    s = as_float_array(s)
+    Y_b = as_float_array(Y_b)
+    Y_w = as_float_array(Y_w)
+    Q = as_float_array(Q)
+    Q_w = as_float_array(Q_w)
 
     C_94 = (2.44 * (s ** 0.69) * ((Q / Q_w) ** (Y_b / Y_w)) * (1.64 - 0.29 **
                                                                (Y_b / Y_w)))
@@ -1246,8 +1371,8 @@ def colourfulness_correlate(F_L, C_94):
     0.1238964...
     """
 
-    F_L = np.asarray(F_L)
-    C_94 = np.asarray(C_94)
+    F_L = as_float_array(F_L)
+    C_94 = as_float_array(C_94)
 
     M_94 = F_L ** 0.15 * C_94
 
@@ -7,10 +7,12 @@ Defines unit tests for :mod:`colour.appearance.cam16` module.
 from __future__ import division, unicode_literals
 
 import numpy as np
+import unittest
 from itertools import permutations
 
-from colour.appearance import (CAM16_InductionFactors, CAM16_Specification,
-                               XYZ_to_CAM16, CAM16_to_XYZ)
+from colour.appearance import (CAM16_InductionFactors,
+                               CAM16_VIEWING_CONDITIONS, CAM16_Specification,
+                               XYZ_to_CAM16, CAM16_to_XYZ, CAM16Model)
 from colour.appearance.tests.common import ColourAppearanceModelTest
 from colour.utilities import as_namedtuple, ignore_numpy_errors, tsplit, tstack
 
@@ -23,7 +25,7 @@ __status__ = 'Production'
 
 __all__ = [
     'TestCAM16ColourAppearanceModelForward',
-    'TestCAM16ColourAppearanceModelReverse'
+    'TestCAM16ColourAppearanceModelReverse', 'TestCAM16Model'
 ]
 
 
@@ -214,3 +216,87 @@ class TestCAM16ColourAppearanceModelReverse(ColourAppearanceModelTest):
             surround = CAM16_InductionFactors(case[0], case[0], case[0])
             CAM16_to_XYZ(
                 CAM16_Specification(J, C, h), XYZ_w, L_A, Y_b, surround)
+
+
+class TestCAM16Model(unittest.TestCase):
+    """
+    Defines :class:`colour.appearance.cam16.CAM16Model` class units tests
+    methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('XYZ_w', 'L_A', 'Y_b', 'surround',
+                               'discount_illuminant')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(CAM16Model))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('forward', 'reverse')
+
+        for method in required_methods:
+            self.assertIn(method, dir(CAM16Model))
+
+    def test_forward(self):
+        """
+        Tests :meth:`colour.appearance.cam16.CAM16Model.forward` method.
+        """
+
+        XYZ_w = np.array([95.05, 100.00, 108.88])
+        model = CAM16Model(XYZ_w, 318.31, 20.0)
+
+        specification = model.forward(np.array([19.01, 20.00, 21.78]))
+        np.testing.assert_almost_equal(
+            np.array(specification[:7]),
+            np.array([
+                41.73120791, 0.10335574, 217.06795977, 2.34501507,
+                195.37170899, 0.10743677, 275.59498615
+            ]),
+            decimal=7)
+
+        XYZ = np.random.RandomState(4).random_sample((256, 3)) * 100
+        specification = model.forward(XYZ)
+        for i in (0, 127, 255):
+            np.testing.assert_almost_equal(np.array(specification[:7])[..., i],
+                                           np.array(model.forward(XYZ[i])[:7]),
+                                           decimal=7)
+
+    def test_reverse(self):
+        """
+        Tests :meth:`colour.appearance.cam16.CAM16Model.reverse` method.
+        """
+
+        XYZ_w = np.array([95.05, 100.00, 108.88])
+        model = CAM16Model(XYZ_w, 318.31, 20.0,
+                           CAM16_VIEWING_CONDITIONS['Dim'])
+
+        XYZ = np.random.RandomState(4).random_sample((256, 3)) * 50 + 25
+        specification = model.forward(XYZ)
+        np.testing.assert_almost_equal(
+            model.reverse(specification), XYZ, decimal=7)
+
+        np.testing.assert_almost_equal(
+            model.reverse(specification._replace(C=None)), XYZ, decimal=7)
+
+    def test_raise_exception_reverse(self):
+        """
+        Tests :meth:`colour.appearance.cam16.CAM16Model.reverse` method raised
+        exception.
+        """
+
+        model = CAM16Model(np.array([95.05, 100.00, 108.88]), 318.31, 20.0)
+
+        self.assertRaises(ValueError, model.reverse,
+                          CAM16_Specification(J=41.73, h=219.04))
+
+
+if __name__ == '__main__':
+    unittest.main()
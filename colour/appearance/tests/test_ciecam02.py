@@ -7,13 +7,15 @@ Defines unit tests for :mod:`colour.appearance.ciecam02` module.
 from __future__ import division, unicode_literals
 
 import numpy as np
+import unittest
 from itertools import permutations
 
-from colour.appearance import (CIECAM02_InductionFactors,
-                               CIECAM02_Specification, XYZ_to_CIECAM02,
-                               CIECAM02_to_XYZ)
+from colour.appearance import (
+    CIECAM02_InductionFactors, CIECAM02_VIEWING_CONDITIONS,
+    CIECAM02_Specification, XYZ_to_CIECAM02, CIECAM02_to_XYZ, CIECAM02Model)
 from colour.appearance.tests.common import ColourAppearanceModelTest
-from colour.utilities import as_namedtuple, ignore_numpy_errors, tsplit, tstack
+from colour.utilities import (as_namedtuple, ignore_numpy_errors,
+                              set_default_float_dtype, tsplit, tstack)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -24,7 +26,7 @@ __status__ = 'Production'
 
 __all__ = [
     'TestCIECAM02ColourAppearanceModelForward',
-    'TestCIECAM02ColourAppearanceModelReverse'
+    'TestCIECAM02ColourAppearanceModelReverse', 'TestCIECAM02Model'
 ]
 
 
@@ -71,6 +73,32 @@ class TestCIECAM02ColourAppearanceModelForward(ColourAppearanceModelTest):
 
         return specification
 
+    def test_float_precision_XYZ_to_CIECAM02(self):
+        """
+        Tests :func:`colour.appearance.ciecam02.XYZ_to_CIECAM02` definition
+        float precision support.
+        """
+
+        XYZ = np.random.RandomState(4).random_sample((256, 3)) * 100
+        XYZ_w = np.array([95.05, 100.00, 108.88])
+        L_A = 318.31
+        Y_b = 20.0
+        specification = XYZ_to_CIECAM02(XYZ, XYZ_w, L_A, Y_b)
+
+        previous_dtype = set_default_float_dtype(np.float32)
+        try:
+            specification_f = XYZ_to_CIECAM02(XYZ.astype(np.float32), XYZ_w,
+                                              L_A, Y_b)
+        finally:
+            set_default_float_dtype(previous_dtype)
+
+        for attribute in ('J', 'C', 'h', 's', 'Q', 'M', 'H'):
+            value = getattr(specification, attribute)
+            value_f = getattr(specification_f, attribute)
+
+            np.testing.assert_equal(value_f.dtype, np.float32)
+            np.testing.assert_allclose(value_f, value, rtol=0.001, atol=0.001)
+
     @ignore_numpy_errors
     def test_nan_XYZ_to_CIECAM02(self):
         """
@@ -212,3 +240,87 @@ class TestCIECAM02ColourAppearanceModelReverse(ColourAppearanceModelTest):
             surround = CIECAM02_InductionFactors(case[0], case[0], case[0])
             CIECAM02_to_XYZ(
                 CIECAM02_Specification(J, C, h), XYZ_w, L_A, Y_b, surround)
+
+
+class TestCIECAM02Model(unittest.TestCase):
+    """
+    Defines :class:`colour.appearance.ciecam02.CIECAM02Model` class units tests
+    methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('XYZ_w', 'L_A', 'Y_b', 'surround',
+                               'discount_illuminant')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(CIECAM02Model))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('forward', 'reverse')
+
+        for method in required_methods:
+            self.assertIn(method, dir(CIECAM02Model))
+
+    def test_forward(self):
+        """
+        Tests :meth:`colour.appearance.ciecam02.CIECAM02Model.forward` method.
+        """
+
+        XYZ_w = np.array([95.05, 100.00, 108.88])
+        model = CIECAM02Model(XYZ_w, 318.31, 20.0)
+
+        specification = model.forward(np.array([19.01, 20.00, 21.78]))
+        np.testing.assert_almost_equal(
+            np.array(specification[:7]),
+            np.array([
+                41.73109113, 0.10470776, 219.04843266, 2.36030537,
+                195.37132597, 0.10884218, 278.06073586
+            ]),
+            decimal=7)
+
+        XYZ = np.random.RandomState(4).random_sample((256, 3)) * 100
+        specification = model.forward(XYZ)
+        for i in (0, 127, 255):
+            np.testing.assert_almost_equal(np.array(specification[:7])[..., i],
+                                           np.array(model.forward(XYZ[i])[:7]),
+                                           decimal=7)
+
+    def test_reverse(self):
+        """
+        Tests :meth:`colour.appearance.ciecam02.CIECAM02Model.reverse` method.
+        """
+
+        XYZ_w = np.array([95.05, 100.00, 108.88])
+        model = CIECAM02Model(XYZ_w, 318.31, 20.0,
+                              CIECAM02_VIEWING_CONDITIONS['Dim'])
+
+        XYZ = np.random.RandomState(4).random_sample((256, 3)) * 50 + 25
+        specification = model.forward(XYZ)
+        np.testing.assert_almost_equal(
+            model.reverse(specification), XYZ, decimal=7)
+
+        np.testing.assert_almost_equal(
+            model.reverse(specification._replace(C=None)), XYZ, decimal=7)
+
+    def test_raise_exception_reverse(self):
+        """
+        Tests :meth:`colour.appearance.ciecam02.CIECAM02Model.reverse` method
+        raised exception.
+        """
+
+        model = CIECAM02Model(np.array([95.05, 100.00, 108.88]), 318.31, 20.0)
+
+        self.assertRaises(ValueError, model.reverse,
+                          CIECAM02_Specification(J=41.73, h=219.04))
+
+
+if __name__ == '__main__':
+    unittest.main()
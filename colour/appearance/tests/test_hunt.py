@@ -7,9 +7,12 @@ Defines unit tests for :mod:`colour.appearance.hunt` module.
 from __future__ import division, unicode_literals
 
 import numpy as np
+import unittest
 from itertools import permutations
 
 from colour.appearance import Hunt_InductionFactors, XYZ_to_Hunt
+from colour.appearance.hunt import (HUE_DATA_FOR_HUE_QUADRATURE,
+                                    hue_composition, hue_quadrature)
 from colour.appearance.tests.common import ColourAppearanceModelTest
 from colour.utilities import ignore_numpy_errors, tstack
 
@@ -20,7 +23,9 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['TestHuntColourAppearanceModel']
+__all__ = [
+    'TestHuntColourAppearanceModel', 'TestHueQuadrature', 'TestHueComposition'
+]
 
 
 class TestHuntColourAppearanceModel(ColourAppearanceModelTest):
@@ -37,7 +42,8 @@ class TestHuntColourAppearanceModel(ColourAppearanceModelTest):
         'h_S': 'h',
         's': 's',
         'Q': 'Q',
-        'M94': 'M'
+        'M94': 'M',
+        'H': 'H'
     }
 
     def output_specification_from_data(self, data):
@@ -87,3 +93,128 @@ class TestHuntColourAppearanceModel(ColourAppearanceModelTest):
             surround = Hunt_InductionFactors(case[0], case[0])
             CCT_w = case[0]
             XYZ_to_Hunt(XYZ, XYZ_w, XYZ_b, L_A, surround, CCT_w=CCT_w)
+
+
+class TestHueQuadrature(unittest.TestCase):
+    """
+    Defines :func:`colour.appearance.hunt.hue_quadrature` definition unit
+    tests methods.
+    """
+
+    def test_hue_quadrature(self):
+        """
+        Tests :func:`colour.appearance.hunt.hue_quadrature` definition.
+        """
+
+        self.assertAlmostEqual(
+            hue_quadrature(219.0484326582719), 278.0607358, places=6)
+
+        self.assertAlmostEqual(hue_quadrature(19.6), 399.5962404, places=7)
+
+        self.assertAlmostEqual(hue_quadrature(177.1), 220.3295979, places=7)
+
+        self.assertAlmostEqual(hue_quadrature(248.9), 305.8442835, places=7)
+
+        self.assertAlmostEqual(hue_quadrature(20.14), 0.0, places=7)
+
+        self.assertAlmostEqual(hue_quadrature(360.0), 385.9, places=7)
+
+        np.testing.assert_almost_equal(
+            hue_quadrature(HUE_DATA_FOR_HUE_QUADRATURE['h_i'][:-1]),
+            HUE_DATA_FOR_HUE_QUADRATURE['H_i'][:-1],
+            decimal=7)
+
+    def test_n_dimensional_hue_quadrature(self):
+        """
+        Tests :func:`colour.appearance.hunt.hue_quadrature` definition
+        n-dimensional arrays support.
+        """
+
+        h = 219.0484326582719
+        H = 278.0607358
+        np.testing.assert_almost_equal(hue_quadrature(h), H, decimal=6)
+
+        h = np.tile(h, 6)
+        H = np.tile(H, 6)
+        np.testing.assert_almost_equal(hue_quadrature(h), H, decimal=6)
+
+        h = np.reshape(h, (2, 3))
+        H = np.reshape(H, (2, 3))
+        np.testing.assert_almost_equal(hue_quadrature(h), H, decimal=6)
+
+        h_c = np.copy(h)
+        hue_quadrature(h)
+        np.testing.assert_equal(h, h_c)
+
+    @ignore_numpy_errors
+    def test_nan_hue_quadrature(self):
+        """
+        Tests :func:`colour.appearance.hunt.hue_quadrature` definition nan
+        support.
+        """
+
+        cases = np.array([-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan])
+        cases_c = np.copy(cases)
+        hue_quadrature(cases)
+        np.testing.assert_equal(cases, cases_c)
+
+
+class TestHueComposition(unittest.TestCase):
+    """
+    Defines :func:`colour.appearance.hunt.hue_composition` definition unit
+    tests methods.
+    """
+
+    def test_hue_composition(self):
+        """
+        Tests :func:`colour.appearance.hunt.hue_composition` definition.
+        """
+
+        np.testing.assert_almost_equal(hue_composition(278.0607358),
+                                       np.array(
+                                           [0.0, 0.0, 21.9392642, 78.0607358]),
+                                       decimal=7)
+
+        np.testing.assert_almost_equal(hue_composition(399.6),
+                                       np.array([99.6, 0.0, 0.0, 0.4]),
+                                       decimal=7)
+
+        np.testing.assert_almost_equal(hue_composition(220.4),
+                                       np.array([0.0, 0.0, 79.6, 20.4]),
+                                       decimal=7)
+
+        np.testing.assert_almost_equal(hue_composition(0.0),
+                                       np.array([100.0, 0.0, 0.0, 0.0]),
+                                       decimal=7)
+
+    def test_n_dimensional_hue_composition(self):
+        """
+        Tests :func:`colour.appearance.hunt.hue_composition` definition
+        n-dimensional arrays support.
+        """
+
+        H = 278.0607358
+        HC = np.array([0.0, 0.0, 21.9392642, 78.0607358])
+        np.testing.assert_almost_equal(hue_composition(H), HC, decimal=7)
+
+        H = np.tile(H, 6)
+        HC = np.tile(HC, (6, 1))
+        np.testing.assert_almost_equal(hue_composition(H), HC, decimal=7)
+
+        H = np.reshape(H, (2, 3))
+        HC = np.reshape(HC, (2, 3, 4))
+        np.testing.assert_almost_equal(hue_composition(H), HC, decimal=7)
+
+    @ignore_numpy_errors
+    def test_nan_hue_composition(self):
+        """
+        Tests :func:`colour.appearance.hunt.hue_composition` definition nan
+        support.
+        """
+
+        cases = np.array([-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan])
+        hue_composition(cases)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,10 +8,10 @@ from . import dataset
 from .machado2009 import (
     anomalous_trichromacy_cmfs_Machado2009,
     anomalous_trichromacy_matrix_Machado2009,
-    cvd_matrix_Machado2009)
+    cvd_matrix_Machado2009, CVD_Simulator_Machado2009)
 
 __all__ = []
 __all__ += dataset.__all__
 __all__ += ['anomalous_trichromacy_cmfs_Machado2009',
             'anomalous_trichromacy_matrix_Machado2009',
-            'cvd_matrix_Machado2009']
+            'cvd_matrix_Machado2009', 'CVD_Simulator_Machado2009']
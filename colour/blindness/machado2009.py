@@ -9,6 +9,7 @@ deficiency:
 -   :func:`colour.anomalous_trichromacy_cmfs_Machado2009`
 -   :func:`colour.anomalous_trichromacy_matrix_Machado2009`
 -   :func:`colour.cvd_matrix_Machado2009`
+-   :class:`colour.CVD_Simulator_Machado2009`
 
 See Also
 --------
@@ -38,8 +39,9 @@ from __future__ import division, unicode_literals
 import numpy as np
 
 from colour.blindness import CVD_MATRICES_MACHADO2010
-from colour.colorimetry import SpectralShape
-from colour.utilities import dot_matrix, dot_vector, tsplit, tstack, warning
+from colour.colorimetry import LMS_CMFS, SpectralShape
+from colour.utilities import (CaseInsensitiveMapping, as_float_array,
+                              dot_matrix, dot_vector, tsplit, tstack, warning)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -51,7 +53,8 @@ __status__ = 'Production'
 __all__ = [
     'LMS_TO_WSYBRG_MATRIX', 'RGB_to_WSYBRG_matrix',
     'anomalous_trichromacy_cmfs_Machado2009',
-    'anomalous_trichromacy_matrix_Machado2009', 'cvd_matrix_Machado2009'
+    'anomalous_trichromacy_matrix_Machado2009', 'cvd_matrix_Machado2009',
+    'CVD_Simulator_Machado2009'
 ]
 
 LMS_TO_WSYBRG_MATRIX = np.array([
@@ -66,6 +69,31 @@ opponent-colour space.
 LMS_TO_WSYBRG_MATRIX : array_like, (3, 3)
 """
 
+_RGB_TO_WSYBRG_MATRIX_CACHE = None
+
+_CVD_MATRICES_MACHADO2010_CACHE = None
+
+
+def _spectral_key(spectral):
+    """
+    Returns a cache key for given multi-spectral power distributions built
+    from their wavelengths and values so that modified multi-spectral power
+    distributions sharing a name are not confused.
+
+    Parameters
+    ----------
+    spectral : MultiSpectralPowerDistribution
+        Multi-spectral power distributions, e.g. *LMS* cone fundamentals
+        colour matching functions or *RGB* display primaries.
+
+    Returns
+    -------
+    tuple
+        Cache key.
+    """
+
+    return spectral.wavelengths.tobytes(), spectral.values.tobytes()
+
 
 def RGB_to_WSYBRG_matrix(cmfs, primaries):
     """
@@ -134,6 +162,44 @@ def RGB_to_WSYBRG_matrix(cmfs, primaries):
     return M_G
 
 
+def _RGB_to_WSYBRG_matrix(cmfs, primaries):
+    """
+    Returns given *LMS* cone fundamentals colour matching functions
+    interpolated at 1 nanometer interval and the matrix transforming from
+    *RGB* colourspace to opponent-colour space for given display primaries and
+    caches them if not existing.
+
+    Parameters
+    ----------
+    cmfs : LMS_ConeFundamentals
+        *LMS* cone fundamentals colour matching functions.
+    primaries : RGB_DisplayPrimaries
+        *RGB* display primaries tri-spectral power distributions.
+
+    Returns
+    -------
+    tuple
+        *LMS* cone fundamentals colour matching functions and matrix
+        transforming from *RGB* colourspace to opponent-colour space.
+    """
+
+    global _RGB_TO_WSYBRG_MATRIX_CACHE
+    if _RGB_TO_WSYBRG_MATRIX_CACHE is None:
+        _RGB_TO_WSYBRG_MATRIX_CACHE = {}
+
+    key = _spectral_key(cmfs) + _spectral_key(primaries)
+    if key in _RGB_TO_WSYBRG_MATRIX_CACHE:
+        return _RGB_TO_WSYBRG_MATRIX_CACHE[key]
+
+    if cmfs.shape.interval != 1:
+        cmfs = cmfs.copy().interpolate(SpectralShape(interval=1))
+
+    value = _RGB_TO_WSYBRG_MATRIX_CACHE[key] = (
+        cmfs, RGB_to_WSYBRG_matrix(cmfs, primaries))
+
+    return value
+
+
 def anomalous_trichromacy_cmfs_Machado2009(cmfs, d_LMS):
     """
     Shifts given *LMS* cone fundamentals colour matching functions with given
@@ -281,16 +347,47 @@ def anomalous_trichromacy_matrix_Machado2009(cmfs, primaries, d_LMS):
            [ 0.0064404...,  0.2592157...,  0.7343437...]])
     """
 
-    if cmfs.shape.interval != 1:
-        cmfs = cmfs.copy().interpolate(SpectralShape(interval=1))
-
-    M_n = RGB_to_WSYBRG_matrix(cmfs, primaries)
+    cmfs, M_n = _RGB_to_WSYBRG_matrix(cmfs, primaries)
     cmfs_a = anomalous_trichromacy_cmfs_Machado2009(cmfs, d_LMS)
     M_a = RGB_to_WSYBRG_matrix(cmfs_a, primaries)
 
     return dot_matrix(np.linalg.inv(M_n), M_a)
 
 
+def _cvd_matrices_Machado2010(deficiency):
+    """
+    Returns the sorted severities and the stacked *Machado et alii (2009)*
+    pre-computed *CVD* matrices for given deficiency and caches them if not
+    existing.
+
+    Parameters
+    ----------
+    deficiency : unicode
+        {'Protanomaly', 'Deuteranomaly', 'Tritanomaly'}
+        Colour blindness / vision deficiency type.
+
+    Returns
+    -------
+    tuple
+        Sorted severities and stacked *CVD* matrices of shape (N, 3, 3).
+    """
+
+    global _CVD_MATRICES_MACHADO2010_CACHE
+    if _CVD_MATRICES_MACHADO2010_CACHE is None:
+        _CVD_MATRICES_MACHADO2010_CACHE = CaseInsensitiveMapping()
+
+    if deficiency in _CVD_MATRICES_MACHADO2010_CACHE:
+        return _CVD_MATRICES_MACHADO2010_CACHE[deficiency]
+
+    matrices = CVD_MATRICES_MACHADO2010[deficiency]
+    samples = np.array(sorted(matrices.keys()))
+
+    value = _CVD_MATRICES_MACHADO2010_CACHE[deficiency] = (
+        samples, np.array([matrices[sample] for sample in samples]))
+
+    return value
+
+
 def cvd_matrix_Machado2009(deficiency, severity):
     """
     Computes *Machado et alii (2009)* *CVD* matrix for given deficiency and
@@ -309,13 +406,14 @@ def cvd_matrix_Machado2009(deficiency, severity):
         - *Tritanomaly* : defective short-wavelength cones (S-cones), an
         alleviated form of blue-yellow color blindness. The complete absence of
         S-cones is called *Tritanopia*.
-    severity : numeric
+    severity : numeric or array_like
         Severity of the colour vision deficiency in domain [0, 1].
 
     Returns
     -------
     ndarray
-        *CVD* matrix.
+        *CVD* matrix, or stacked *CVD* matrices of shape (..., 3, 3) if an
+        array_like of severities is given.
 
     References
     ----------
@@ -330,6 +428,8 @@ def cvd_matrix_Machado2009(deficiency, severity):
     array([[ 0.786987...,  0.269487..., -0.056473...],
            [ 0.043169...,  0.933774...,  0.023058...],
            [-0.004238..., -0.002451...,  1.006689...]])
+    >>> cvd_matrix_Machado2009('Protanomaly', [0.15, 0.5]).shape
+    (2, 3, 3)
     """
 
     if deficiency.lower() == 'tritanomaly':
@@ -341,17 +441,275 @@ def cvd_matrix_Machado2009(deficiency, severity):
             '[5, 59] contrary to the domain [0, 20] used for protanomaly and '
             'deuteranomaly simulation.')
 
-    matrices = CVD_MATRICES_MACHADO2010[deficiency]
-    samples = np.array(sorted(matrices.keys()))
-    index = min(np.searchsorted(samples, severity), len(samples) - 1)
+    samples, matrices = _cvd_matrices_Machado2010(deficiency)
+
+    severity = as_float_array(severity)
+    index = np.minimum(np.searchsorted(samples, severity), len(samples) - 1)
+    index_n = np.minimum(index + 1, len(samples) - 1)
+
+    a, b = samples[index], samples[index_n]
+    m1, m2 = matrices[index], matrices[index_n]
+
+    # The 1.0 severity CVD matrix is returned directly.
+    d = np.where(a == b, 0, (severity - a) / np.where(a == b, 1, b - a))
+
+    return m1 + d[..., np.newaxis, np.newaxis] * (m2 - m1)
+
+
+class CVD_Simulator_Machado2009(object):
+    """
+    Defines a *Machado et alii (2009)* colour vision deficiency simulator
+    for images and image sequences.
+
+    The *CVD* matrices are computed once at instantiation for given
+    deficiency and severities and cached per deficiency, severity and display
+    primaries. Each frame is then decoded, transformed by all the *CVD*
+    matrices with a single matrix product and encoded in one pass.
+
+    Parameters
+    ----------
+    deficiency : unicode
+        {'Protanomaly', 'Deuteranomaly', 'Tritanomaly'}
+        Colour blindness / vision deficiency type.
+    severity : numeric or array_like
+        Severity of the colour vision deficiency in domain [0, 1], an
+        array_like of severities renders a severity sweep at once.
+    colourspace : RGB_Colourspace, optional
+        *RGB* colourspace whose decoding and encoding colour component
+        transfer functions are applied to the frames, if not given the frames
+        are expected to be linear.
+    primaries : RGB_DisplayPrimaries, optional
+        *RGB* display primaries tri-spectral power distributions, if given the
+        *CVD* matrices are computed with
+        :func:`colour.anomalous_trichromacy_matrix_Machado2009` definition
+        instead of interpolating the pre-computed matrices dataset.
+    cmfs : LMS_ConeFundamentals, optional
+        *LMS* cone fundamentals colour matching functions used with given
+        display primaries.
+
+    Attributes
+    ----------
+    deficiency
+    severity
+    colourspace
+    matrices
+
+    Methods
+    -------
+    simulate
+
+    Notes
+    -----
+    -   With given display primaries, the severity is converted to a
+        :math:`\Delta_{LMS}` shift amount in domain [0, 20] nanometers of
+        the deficient cones.
+
+    References
+    ----------
+    -   :cite:`Colblindorb`
+    -   :cite:`Colblindora`
+    -   :cite:`Colblindorc`
+    -   :cite:`Machado2009`
+
+    Examples
+    --------
+    >>> from colour.models import sRGB_COLOURSPACE
+    >>> RGB = np.array([[0.45675795, 0.30986982, 0.24861924],
+    ...                 [0.20000000, 0.60000000, 0.20000000]])
+    >>> simulator = CVD_Simulator_Machado2009(
+    ...     'Protanomaly', [0.5, 1.0], sRGB_COLOURSPACE)
+    >>> simulator.simulate(RGB)  # doctest: +ELLIPSIS
+    array([[[ 0.3914151...,  0.3238554...,  0.2450402...],
+            [ 0.5138497...,  0.560785 ...,  0.1838968...]],
+    <BLANKLINE>
+           [[ 0.3472532...,  0.3258003...,  0.2439671...],
+            [ 0.6126869...,  0.5444773...,  0.1489673...]]])
+    """
+
+    def __init__(self,
+                 deficiency,
+                 severity,
+                 colourspace=None,
+                 primaries=None,
+                 cmfs=LMS_CMFS[
+                     'Stockman & Sharpe 2 Degree Cone Fundamentals']):
+        self._deficiency = deficiency
+        self._severity = as_float_array(severity)
+        self._colourspace = colourspace
+
+        if primaries is None:
+            self._matrices = cvd_matrix_Machado2009(deficiency,
+                                                    self._severity)
+        else:
+            self._matrices = np.reshape([
+                _cvd_matrix_Machado2009(deficiency, severity, cmfs, primaries)
+                for severity in np.ravel(self._severity)
+            ], self._severity.shape + (3, 3))
+
+    @property
+    def deficiency(self):
+        """
+        Getter property for the colour vision deficiency type.
+
+        Returns
+        -------
+        unicode
+            Colour vision deficiency type.
+        """
+
+        return self._deficiency
+
+    @property
+    def severity(self):
+        """
+        Getter property for the colour vision deficiency severity.
+
+        Returns
+        -------
+        ndarray
+            Colour vision deficiency severity.
+        """
+
+        return self._severity
+
+    @property
+    def colourspace(self):
+        """
+        Getter property for the *RGB* colourspace.
+
+        Returns
+        -------
+        RGB_Colourspace
+            *RGB* colourspace.
+        """
+
+        return self._colourspace
+
+    @property
+    def matrices(self):
+        """
+        Getter property for the *CVD* matrices.
+
+        Returns
+        -------
+        ndarray
+            *CVD* matrices of shape (..., 3, 3).
+        """
+
+        return self._matrices
+
+    def simulate(self, RGB, out=None, chunk_size=None):
+        """
+        Simulates the colour vision deficiency on given *RGB* colourspace
+        array.
+
+        Parameters
+        ----------
+        RGB : array_like
+            *RGB* colourspace array, e.g. an image or an image sequence.
+        out : ndarray, optional
+            Array in which to place the simulated *RGB* colourspace array, it
+            must have the appropriate shape.
+        chunk_size : int, optional
+            Count of *RGB* colourspace array values to process at once,
+            bounding the temporary memory used for large images.
+
+        Returns
+        -------
+        ndarray
+            Simulated *RGB* colourspace array, the severities axes are
+            prepended for a severity sweep, e.g. for 5 severities and a
+            512x384 *RGB* image, the output shape will be (5, 384, 512, 3).
+
+        Raises
+        ------
+        ValueError
+            If the chunk size is lower than 1.
+        """
+
+        RGB = as_float_array(RGB)
+        M = np.swapaxes(self._matrices, -1, -2)
+        sweep = M.shape[:-2]
+
+        if out is None:
+            out = np.empty(sweep + RGB.shape)
+
+        RGB_f = np.reshape(RGB, (-1, 3))
+        out_f = np.reshape(out, sweep + (-1, 3))
+
+        decoding_cctf = encoding_cctf = None
+        if self._colourspace is not None:
+            decoding_cctf = self._colourspace.decoding_cctf
+            encoding_cctf = self._colourspace.encoding_cctf
+
+        if chunk_size is None:
+            chunk_size = max(RGB_f.shape[0], 1)
+
+        if chunk_size < 1:
+            raise ValueError(
+                '"{0}" chunk size must be greater than or equal to 1!'.format(
+                    chunk_size))
+
+        for i in range(0, RGB_f.shape[0], chunk_size):
+            RGB_c = RGB_f[i:i + chunk_size]
+
+            if decoding_cctf is not None:
+                RGB_c = decoding_cctf(RGB_c)
+
+            RGB_c = np.matmul(RGB_c, M)
+
+            if encoding_cctf is not None:
+                RGB_c = encoding_cctf(RGB_c)
+
+            out_f[..., i:i + chunk_size, :] = RGB_c
+
+        if not np.shares_memory(out_f, out):
+            out[...] = np.reshape(out_f, out.shape)
+
+        return out
+
+
+_CVD_SIMULATOR_MATRICES_CACHE = None
+
+
+def _cvd_matrix_Machado2009(deficiency, severity, cmfs, primaries):
+    """
+    Computes *Machado et alii (2009)* *CVD* matrix for given deficiency,
+    severity, *LMS* cone fundamentals colour matching functions and display
+    primaries and caches it if not existing.
+
+    Parameters
+    ----------
+    deficiency : unicode
+        {'Protanomaly', 'Deuteranomaly', 'Tritanomaly'}
+        Colour blindness / vision deficiency type.
+    severity : numeric
+        Severity of the colour vision deficiency in domain [0, 1].
+    cmfs : LMS_ConeFundamentals
+        *LMS* cone fundamentals colour matching functions.
+    primaries : RGB_DisplayPrimaries
+        *RGB* display primaries tri-spectral power distributions.
+
+    Returns
+    -------
+    ndarray
+        *CVD* matrix.
+    """
+
+    global _CVD_SIMULATOR_MATRICES_CACHE
+    if _CVD_SIMULATOR_MATRICES_CACHE is None:
+        _CVD_SIMULATOR_MATRICES_CACHE = {}
+
+    key = ((deficiency.lower(), float(severity)) + _spectral_key(cmfs) +
+           _spectral_key(primaries))
+    if key in _CVD_SIMULATOR_MATRICES_CACHE:
+        return _CVD_SIMULATOR_MATRICES_CACHE[key]
 
-    a = samples[index]
-    b = samples[min(index + 1, len(samples) - 1)]
+    d_LMS = np.zeros(3)
+    d_LMS[['protanomaly', 'deuteranomaly',
+           'tritanomaly'].index(deficiency.lower())] = severity * 20
 
-    m1, m2 = matrices[a], matrices[b]
+    M = _CVD_SIMULATOR_MATRICES_CACHE[key] = (
+        anomalous_trichromacy_matrix_Machado2009(cmfs, primaries, d_LMS))
 
-    if a == b:
-        # 1.0 severity CVD matrix, returning directly.
-        return m1
-    else:
-        return m1 + (severity - a) * ((m2 - m1) / (b - a))
+    return M
@@ -11,9 +11,11 @@ import unittest
 from colour.blindness import (CVD_MATRICES_MACHADO2010,
                               cvd_matrix_Machado2009,
                               anomalous_trichromacy_cmfs_Machado2009,
-                              anomalous_trichromacy_matrix_Machado2009)
+                              anomalous_trichromacy_matrix_Machado2009,
+                              CVD_Simulator_Machado2009)
 from colour.characterisation import DISPLAYS_RGB_PRIMARIES
 from colour.colorimetry import LMS_CMFS
+from colour.models import sRGB_COLOURSPACE
 from colour.utilities import ignore_numpy_errors
 
 __author__ = 'Colour Developers'
@@ -25,7 +27,8 @@ __status__ = 'Production'
 
 __all__ = [
     'TestAnomalousTrichromacyCmfsMachado2009',
-    'TestAnomalousTrichromacyMatrixMachado2009', 'TestCvdMatrixMachado2009'
+    'TestAnomalousTrichromacyMatrixMachado2009', 'TestCvdMatrixMachado2009',
+    'TestCVD_Simulator_Machado2009'
 ]
 
 
@@ -206,6 +209,146 @@ class TestCvdMatrixMachado2009(unittest.TestCase):
         for case in [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]:
             cvd_matrix_Machado2009('Tritanomaly', case)
 
+    def test_n_dimensional_cvd_matrix_Machado2009(self):
+        """
+        Tests :func:`colour.blindness.machado2009.cvd_matrix_Machado2009`
+        definition n-dimensional arrays support.
+        """
+
+        severity = np.linspace(0, 1, 12)
+        M = cvd_matrix_Machado2009('Deuteranomaly', severity)
+        self.assertTupleEqual(M.shape, (12, 3, 3))
+        for i, value in enumerate(severity):
+            np.testing.assert_almost_equal(
+                M[i], cvd_matrix_Machado2009('Deuteranomaly', value),
+                decimal=7)
+
+        np.testing.assert_almost_equal(
+            cvd_matrix_Machado2009('Deuteranomaly',
+                                   np.reshape(severity, (3, 4))),
+            np.reshape(M, (3, 4, 3, 3)),
+            decimal=7)
+
+
+class TestCVD_Simulator_Machado2009(unittest.TestCase):
+    """
+    Defines :class:`colour.blindness.machado2009.CVD_Simulator_Machado2009`
+    class unit tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('deficiency', 'severity', 'colourspace',
+                               'matrices')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(CVD_Simulator_Machado2009))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('simulate', )
+
+        for method in required_methods:
+            self.assertIn(method, dir(CVD_Simulator_Machado2009))
+
+    def test_matrices(self):
+        """
+        Tests :attr:`colour.blindness.machado2009.CVD_Simulator_Machado2009.\
+matrices` attribute.
+        """
+
+        np.testing.assert_almost_equal(
+            CVD_Simulator_Machado2009('Protanomaly', 0.15).matrices,
+            cvd_matrix_Machado2009('Protanomaly', 0.15),
+            decimal=7)
+
+        cmfs = LMS_CMFS.get('Smith & Pokorny 1975 Normal Trichromats')
+        primaries = DISPLAYS_RGB_PRIMARIES['Typical CRT Brainard 1997']
+        np.testing.assert_almost_equal(
+            CVD_Simulator_Machado2009(
+                'Deuteranomaly', [0.5, 1.0], primaries=primaries,
+                cmfs=cmfs).matrices,
+            np.array([
+                anomalous_trichromacy_matrix_Machado2009(
+                    cmfs, primaries, np.array([0, 10, 0])),
+                anomalous_trichromacy_matrix_Machado2009(
+                    cmfs, primaries, np.array([0, 20, 0]))
+            ]),
+            decimal=7)
+
+        primaries_m = primaries.copy()
+        primaries_m.values = primaries_m.values * np.array([1.0, 0.8, 1.0])
+        self.assertEqual(primaries_m.name, primaries.name)
+        np.testing.assert_almost_equal(
+            CVD_Simulator_Machado2009(
+                'Deuteranomaly', 0.5, primaries=primaries_m,
+                cmfs=cmfs).matrices,
+            anomalous_trichromacy_matrix_Machado2009(
+                cmfs, primaries_m, np.array([0, 10, 0])),
+            decimal=7)
+        self.assertFalse(
+            np.allclose(
+                CVD_Simulator_Machado2009(
+                    'Deuteranomaly', 0.5, primaries=primaries_m,
+                    cmfs=cmfs).matrices,
+                CVD_Simulator_Machado2009(
+                    'Deuteranomaly', 0.5, primaries=primaries,
+                    cmfs=cmfs).matrices))
+
+    def test_simulate(self):
+        """
+        Tests :meth:`colour.blindness.machado2009.CVD_Simulator_Machado2009.\
+simulate` method.
+        """
+
+        RGB = np.random.random((4, 5, 3))
+
+        simulator = CVD_Simulator_Machado2009('Protanomaly', 0.5)
+        np.testing.assert_almost_equal(
+            simulator.simulate(RGB),
+            np.einsum('ij,...j->...i', simulator.matrices, RGB),
+            decimal=7)
+
+        simulator = CVD_Simulator_Machado2009('Protanomaly', [0.25, 0.5, 1],
+                                              sRGB_COLOURSPACE)
+        RGB_s = simulator.simulate(RGB)
+        self.assertTupleEqual(RGB_s.shape, (3, 4, 5, 3))
+        for i in range(3):
+            np.testing.assert_almost_equal(
+                RGB_s[i],
+                sRGB_COLOURSPACE.encoding_cctf(
+                    np.einsum('ij,...j->...i', simulator.matrices[i],
+                              sRGB_COLOURSPACE.decoding_cctf(RGB))),
+                decimal=7)
+
+        np.testing.assert_almost_equal(
+            simulator.simulate(RGB, chunk_size=7), RGB_s, decimal=7)
+
+        out = np.zeros((3, 4, 5, 3))
+        self.assertIs(simulator.simulate(RGB, out=out), out)
+        np.testing.assert_almost_equal(out, RGB_s, decimal=7)
+
+        out = np.zeros((3, 5, 4, 3)).transpose(0, 2, 1, 3)
+        simulator.simulate(RGB, out=out, chunk_size=6)
+        np.testing.assert_almost_equal(out, RGB_s, decimal=7)
+
+    def test_raise_exception_simulate(self):
+        """
+        Tests :meth:`colour.blindness.machado2009.CVD_Simulator_Machado2009.\
+simulate` method raised exception.
+        """
+
+        simulator = CVD_Simulator_Machado2009('Protanomaly', 0.5)
+        RGB = np.random.random((4, 3))
+        self.assertRaises(ValueError, simulator.simulate, RGB, chunk_size=0)
+        self.assertRaises(ValueError, simulator.simulate, RGB, chunk_size=-1)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -5,7 +5,8 @@ from __future__ import absolute_import
 from .spectrum import (SpectralShape, SpectralPowerDistribution,
                        MultiSpectralPowerDistribution, DEFAULT_SPECTRAL_SHAPE,
                        constant_spd, zeros_spd, ones_spd)
-from .blackbody import (blackbody_spd, blackbody_spectral_radiance, planck_law)
+from .blackbody import (blackbody_spd, blackbody_msa, blackbody_spds,
+                        blackbody_spectral_radiance, planck_law)
 from .cmfs import (LMS_ConeFundamentals, RGB_ColourMatchingFunctions,
                    XYZ_ColourMatchingFunctions)
 from .dataset import *  # noqa
@@ -24,7 +25,7 @@ from .tristimulus import (
 from .correction import BANDPASS_CORRECTION_METHODS
 from .correction import bandpass_correction
 from .correction import bandpass_correction_Stearns1988
-from .illuminants import (D_illuminant_relative_spd,
+from .illuminants import (D_illuminant_relative_spd, D_illuminant_relative_msa,
                           CIE_standard_illuminant_A_function)
 from .lefs import (mesopic_luminous_efficiency_function,
                    mesopic_weighting_function)
@@ -60,7 +61,10 @@ __all__ = [
     'MultiSpectralPowerDistribution', 'DEFAULT_SPECTRAL_SHAPE', 'constant_spd',
     'zeros_spd', 'ones_spd'
 ]
-__all__ += ['blackbody_spd', 'blackbody_spectral_radiance', 'planck_law']
+__all__ += [
+    'blackbody_spd', 'blackbody_msa', 'blackbody_spds',
+    'blackbody_spectral_radiance', 'planck_law'
+]
 __all__ += [
     'LMS_ConeFundamentals', 'RGB_ColourMatchingFunctions',
     'XYZ_ColourMatchingFunctions'
@@ -80,7 +84,10 @@ __all__ += [
 __all__ += ['BANDPASS_CORRECTION_METHODS']
 __all__ += ['bandpass_correction']
 __all__ += ['bandpass_correction_Stearns1988']
-__all__ += ['D_illuminant_relative_spd', 'CIE_standard_illuminant_A_function']
+__all__ += [
+    'D_illuminant_relative_spd', 'D_illuminant_relative_msa',
+    'CIE_standard_illuminant_A_function'
+]
 __all__ += [
     'mesopic_luminous_efficiency_function', 'mesopic_weighting_function'
 ]
@@ -24,7 +24,9 @@ from __future__ import division, unicode_literals
 import numpy as np
 
 from colour.colorimetry import (DEFAULT_SPECTRAL_SHAPE,
+                                MultiSpectralPowerDistribution,
                                 SpectralPowerDistribution)
+from colour.utilities import as_float_array
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -35,7 +37,7 @@ __status__ = 'Production'
 
 __all__ = [
     'C1', 'C2', 'N', 'planck_law', 'blackbody_spectral_radiance',
-    'blackbody_spd'
+    'blackbody_spd', 'blackbody_msa', 'blackbody_spds'
 ]
 
 C1 = 3.741771e-16  # 2 * math.pi * PLANCK_CONSTANT * LIGHT_SPEED ** 2
@@ -627,3 +629,129 @@ def blackbody_spd(temperature, shape=DEFAULT_SPECTRAL_SHAPE, c1=C1, c2=C2,
             zip(wavelengths,
                 planck_law(wavelengths * 1e-9, temperature, c1, c2, n))),
         name='{0}K Blackbody'.format(temperature))
+
+
+def blackbody_msa(temperatures,
+                  shape=DEFAULT_SPECTRAL_SHAPE,
+                  c1=C1,
+                  c2=C2,
+                  n=N):
+    """
+    Returns the multi-spectral array of the planckian radiators for given
+    temperatures :math:`T[K]` using a single broadcast
+    :func:`colour.colorimetry.planck_law` definition evaluation.
+
+    Parameters
+    ----------
+    temperatures : numeric or array_like
+        Temperatures :math:`T[K]` in kelvin degrees.
+    shape : SpectralShape, optional
+        Spectral shape used to sample the planckian radiators.
+    c1 : numeric, optional
+        The official value of :math:`c1` is provided by the Committee on Data
+        for Science and Technology (CODATA) and is
+        :math:`c1=3,741771x10.16\ W/m_2` *(Mohr and Taylor, 2000)*.
+    c2 : numeric, optional
+        Since :math:`T` is measured on the International Temperature Scale,
+        the value of :math:`c2` used in colorimetry should follow that adopted
+        in the current International Temperature Scale (ITS-90)
+        *(Preston-Thomas, 1990; Mielenz et aI., 1991)*, namely
+        :math:`c2=1,4388x10.2\ m/K`.
+    n : numeric, optional
+        Medium index of refraction. For dry air at 15C and 101 325 Pa,
+        containing 0,03 percent by volume of carbon dioxide, it is
+        approximately 1,00028 throughout the visible region although
+        *CIE 15:2004* recommends using :math:`n=1`.
+
+    Returns
+    -------
+    ndarray
+        Planckian radiators multi-spectral array of shape
+        ``temperatures.shape + (W, )`` with *W* the count of wavelengths of
+        given spectral shape.
+
+    Examples
+    --------
+    >>> from colour import SpectralShape
+    >>> blackbody_msa([5000, 6500], SpectralShape(400, 700, 50))
+    array([[  8.74257133e+12,   1.07999660e+13,   1.21060645e+13,
+              1.27119372e+13,   1.27613938e+13,   1.24144153e+13,
+              1.18111794e+13],
+           [  4.61347021e+13,   4.75079420e+13,   4.60938550e+13,
+              4.30602736e+13,   3.92599722e+13,   3.52415424e+13,
+              3.13254539e+13]])
+    """
+
+    wavelengths = shape.range()
+
+    return planck_law(wavelengths * 1e-9,
+                      as_float_array(temperatures)[..., np.newaxis], c1, c2, n)
+
+
+def blackbody_spds(temperatures,
+                   shape=DEFAULT_SPECTRAL_SHAPE,
+                   c1=C1,
+                   c2=C2,
+                   n=N):
+    """
+    Returns the multi-spectral power distribution of the planckian radiators
+    for given temperatures :math:`T[K]`.
+
+    Parameters
+    ----------
+    temperatures : array_like
+        Temperatures :math:`T[K]` in kelvin degrees.
+    shape : SpectralShape, optional
+        Spectral shape used to create the multi-spectral power distribution of
+        the planckian radiators.
+    c1 : numeric, optional
+        The official value of :math:`c1` is provided by the Committee on Data
+        for Science and Technology (CODATA) and is
+        :math:`c1=3,741771x10.16\ W/m_2` *(Mohr and Taylor, 2000)*.
+    c2 : numeric, optional
+        Since :math:`T` is measured on the International Temperature Scale,
+        the value of :math:`c2` used in colorimetry should follow that adopted
+        in the current International Temperature Scale (ITS-90)
+        *(Preston-Thomas, 1990; Mielenz et aI., 1991)*, namely
+        :math:`c2=1,4388x10.2\ m/K`.
+    n : numeric, optional
+        Medium index of refraction. For dry air at 15C and 101 325 Pa,
+        containing 0,03 percent by volume of carbon dioxide, it is
+        approximately 1,00028 throughout the visible region although
+        *CIE 15:2004* recommends using :math:`n=1`.
+
+    Returns
+    -------
+    MultiSpectralPowerDistribution
+        Blackbody multi-spectral power distribution, the labels are the
+        given temperatures.
+
+    Notes
+    -----
+    -   The values are computed with the
+        :func:`colour.colorimetry.blackbody_msa` definition, which should be
+        preferred when the spectral power distributions are not required, e.g.
+        for a large count of temperatures.
+
+    Examples
+    --------
+    >>> from colour import SpectralShape
+    >>> spds = blackbody_spds([5000, 6500], SpectralShape(400, 700, 50))
+    >>> spds.labels
+    ['5000K Blackbody', '6500K Blackbody']
+    >>> spds.values
+    array([[  8.74257133e+12,   4.61347021e+13],
+           [  1.07999660e+13,   4.75079420e+13],
+           [  1.21060645e+13,   4.60938550e+13],
+           [  1.27119372e+13,   4.30602736e+13],
+           [  1.27613938e+13,   3.92599722e+13],
+           [  1.24144153e+13,   3.52415424e+13],
+           [  1.18111794e+13,   3.13254539e+13]])
+    """
+
+    temperatures = np.ravel(temperatures)
+
+    return MultiSpectralPowerDistribution(
+        np.transpose(blackbody_msa(temperatures, shape, c1, c2, n)),
+        shape.range(),
+        labels=['{0}K Blackbody'.format(T) for T in temperatures])
@@ -31,7 +31,7 @@ whitepaper_howtocalculateluminositywavelengthandpurity.pdf
 from __future__ import division, unicode_literals
 
 import numpy as np
-import scipy.spatial.distance
+from scipy.spatial import cKDTree
 
 from colour.algebra import (euclidean_distance, extend_line_segment,
                             intersect_line_segments)
@@ -51,6 +51,205 @@ __all__ = [
 ]
 
 
+_SPECTRAL_LOCUS_INDEX_CACHE = None
+
+
+def _spectral_locus_index(xy_s, xy_n):
+    """
+    Returns the angular index of given closed spectral locus segments around
+    given achromatic stimulus, i.e. the sorted polar angles bounding the
+    angular intervals and, for each interval, the indexes of the segments
+    spanning it.
+
+    Parameters
+    ----------
+    xy_s : array_like
+        Closed spectral locus *xy* chromaticity coordinates.
+    xy_n : array_like
+        Achromatic stimulus *xy* chromaticity coordinates.
+
+    Returns
+    -------
+    tuple
+        Intervals bounding angles, intervals offsets into the segments indexes
+        and the segments indexes spanning the intervals, or *None* if the
+        achromatic stimulus is not finite.
+    """
+
+    global _SPECTRAL_LOCUS_INDEX_CACHE
+
+    if not np.all(np.isfinite(xy_n)):
+        return None
+
+    if _SPECTRAL_LOCUS_INDEX_CACHE is None:
+        _SPECTRAL_LOCUS_INDEX_CACHE = {}
+
+    key = (xy_s.tobytes(), np.asarray(xy_n, np.float_).tobytes())
+    index = _SPECTRAL_LOCUS_INDEX_CACHE.get(key)
+    if index is not None:
+        return index
+
+    theta = np.arctan2(xy_s[..., 1] - xy_n[1], xy_s[..., 0] - xy_n[0])
+
+    # Segment "i" joins vertices "i" and "i - 1", its angular span is the
+    # shortest arc between their polar angles.
+    theta_a, theta_b = theta, np.roll(theta, 1)
+    width = (theta_b - theta_a + np.pi) % (2 * np.pi) - np.pi
+    start = np.where(width < 0, theta_a + width, theta_a)
+    start = (start + np.pi) % (2 * np.pi) - np.pi
+    end = start + np.abs(width)
+
+    bounds = np.unique(
+        np.hstack([start, (end + np.pi) % (2 * np.pi) - np.pi, -np.pi,
+                   np.pi]))
+    middle = (bounds[:-1] + bounds[1:]) / 2
+
+    offset = (middle[:, np.newaxis] - start[np.newaxis, :]) % (2 * np.pi)
+    spanning = offset <= np.abs(width)[np.newaxis, :]
+
+    offsets = np.hstack([0, np.cumsum(np.sum(spanning, axis=-1))])
+    segments = np.where(spanning)[1]
+
+    if len(_SPECTRAL_LOCUS_INDEX_CACHE) >= 64:
+        _SPECTRAL_LOCUS_INDEX_CACHE.clear()
+
+    index = _SPECTRAL_LOCUS_INDEX_CACHE[key] = (bounds, offsets, segments)
+
+    return index
+
+
+def _intersect_spectral_locus(xy_n, xy_e, l_s, index):
+    """
+    Returns the intersection of given line segments starting at given
+    achromatic stimulus with given closed spectral locus segments, using
+    given angular index to only test the segments spanning the line segments
+    polar angles.
+
+    The intersections are computed as with
+    :func:`colour.algebra.intersect_line_segments` definition, the first
+    intersecting segment is retained.
+
+    Parameters
+    ----------
+    xy_n : array_like
+        Achromatic stimulus *xy* chromaticity coordinates of shape (N, 2).
+    xy_e : array_like
+        Line segments end *xy* chromaticity coordinates of shape (N, 2).
+    l_s : array_like
+        Closed spectral locus segments of shape (M, 4).
+    index : tuple
+        Angular index of the spectral locus around the achromatic stimulus.
+
+    Returns
+    -------
+    ndarray
+        Intersections *xy* chromaticity coordinates, *nan* if none.
+    """
+
+    xy_wl = np.full(xy_n.shape, np.nan)
+    if index is None or not xy_n.shape[0]:
+        return xy_wl
+
+    bounds, offsets, segments = index
+    intervals = offsets.size - 1
+
+    phi = np.arctan2(xy_e[..., 1] - xy_n[..., 1], xy_e[..., 0] - xy_n[..., 0])
+    i = np.clip(
+        np.searchsorted(bounds, phi, side='right') - 1, 0, intervals - 1)
+
+    # The candidate segments of the neighbouring intervals are included to
+    # account for the polar angles precision.
+    rows, candidates = [], []
+    for offset in (-1, 0, 1):
+        j = (i + offset) % intervals
+        count = offsets[j + 1] - offsets[j]
+        start = np.cumsum(count) - count
+        rows.append(np.repeat(np.arange(i.size), count))
+        candidates.append(segments[np.repeat(offsets[j] - start, count) +
+                                   np.arange(np.sum(count))])
+    rows, candidates = np.hstack(rows), np.hstack(candidates)
+
+    x_1, y_1 = xy_n[rows, 0], xy_n[rows, 1]
+    x_2, y_2 = xy_e[rows, 0], xy_e[rows, 1]
+    x_3, y_3, x_4, y_4 = [l_s[candidates, j] for j in range(4)]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x_4_x_3 = x_4 - x_3
+        y_1_y_3 = y_1 - y_3
+        y_4_y_3 = y_4 - y_3
+        x_1_x_3 = x_1 - x_3
+        x_2_x_1 = x_2 - x_1
+        y_2_y_1 = y_2 - y_1
+
+        numerator_a = x_4_x_3 * y_1_y_3 - y_4_y_3 * x_1_x_3
+        numerator_b = x_2_x_1 * y_1_y_3 - y_2_y_1 * x_1_x_3
+        denominator = y_4_y_3 * x_2_x_1 - x_4_x_3 * y_2_y_1
+
+        u_a = numerator_a / denominator
+        u_b = numerator_b / denominator
+
+        intersect = np.logical_and.reduce((u_a >= 0, u_a <= 1, u_b >= 0,
+                                           u_b <= 1))
+
+    rows, candidates = rows[intersect], candidates[intersect]
+    order = np.lexsort((candidates, rows))
+    rows, first = np.unique(rows[order], return_index=True)
+    pairs = np.where(intersect)[0][order[first]]
+
+    xy_wl[rows, 0] = x_1[pairs] + x_2_x_1[pairs] * u_a[pairs]
+    xy_wl[rows, 1] = y_1[pairs] + y_2_y_1[pairs] * u_a[pairs]
+
+    return xy_wl
+
+
+_SPECTRAL_LOCUS_TREE_CACHE = None
+
+
+def _closest_spectral_locus_vertex(xy_wl, xy_s):
+    """
+    Returns the index of the closest spectral locus vertex to given *xy*
+    chromaticity coordinates, the first one in case of equidistant vertices.
+
+    Parameters
+    ----------
+    xy_wl : array_like
+        *xy* chromaticity coordinates of shape (N, 2).
+    xy_s : array_like
+        Closed spectral locus *xy* chromaticity coordinates.
+
+    Returns
+    -------
+    ndarray
+        Closest spectral locus vertex indexes.
+    """
+
+    global _SPECTRAL_LOCUS_TREE_CACHE
+
+    key = xy_s.tobytes()
+    if (_SPECTRAL_LOCUS_TREE_CACHE is None or
+            _SPECTRAL_LOCUS_TREE_CACHE[0] != key):
+        # Duplicate vertices are discarded so that the *KD-tree* candidates
+        # are distinct, the first occurrence index is retained.
+        _xy_s_u, first = np.unique(xy_s, axis=0, return_index=True)
+        first = np.sort(first)
+        _SPECTRAL_LOCUS_TREE_CACHE = (key, cKDTree(xy_s[first]), first)
+
+    _key, tree, first = _SPECTRAL_LOCUS_TREE_CACHE
+
+    k = min(4, first.size)
+    _distances, candidates = tree.query(xy_wl, k=k)
+    candidates = np.sort(np.reshape(candidates, (-1, k)), axis=-1)
+    candidates = first[candidates]
+
+    # The distances are computed again as with
+    # :func:`scipy.spatial.distance.cdist` definition.
+    xy_c = xy_s[candidates]
+    d = np.sqrt((xy_wl[:, np.newaxis, 0] - xy_c[..., 0]) ** 2 +
+                (xy_wl[:, np.newaxis, 1] - xy_c[..., 1]) ** 2)
+
+    return candidates[np.arange(candidates.shape[0]), np.argmin(d, axis=-1)]
+
+
 def closest_spectral_locus_wavelength(xy, xy_n, xy_s, reverse=False):
     """
     Returns the coordinates and closest spectral locus wavelength index to the
@@ -100,17 +299,28 @@ def closest_spectral_locus_wavelength(xy, xy_n, xy_s, reverse=False):
     # Closing horse-shoe shape to handle line of purples intersections.
     xy_s = np.vstack((xy_s, xy_s[0, :]))
 
-    xy_wl = intersect_line_segments(
-        np.concatenate((xy_n, xy_e), -1),
-        np.hstack((xy_s, np.roll(xy_s, 1, axis=0)))).xy
-    xy_wl = xy_wl[~np.isnan(xy_wl).any(axis=-1)]
-    if not len(xy_wl):
+    l_s = np.hstack((xy_s, np.roll(xy_s, 1, axis=0)))
+
+    xy_n_f = np.reshape(xy_n, (-1, 2))
+    xy_e_f = np.reshape(xy_e, (-1, 2))
+
+    xy_wl = np.full(xy_n_f.shape, np.nan)
+    xy_n_u, xy_n_i = np.unique(xy_n_f, axis=0, return_inverse=True)
+    xy_n_i = np.ravel(xy_n_i)
+    for i, xy_n_g in enumerate(xy_n_u):
+        mask = xy_n_i == i
+        xy_wl[mask] = _intersect_spectral_locus(xy_n_f[mask], xy_e_f[mask],
+                                                l_s,
+                                                _spectral_locus_index(
+                                                    xy_s, xy_n_g))
+
+    if np.any(np.isnan(xy_wl)):
         raise ValueError(
             'No closest spectral locus wavelength index and coordinates found '
             'for "{0}" colour stimulus and "{1}" achromatic stimulus "xy" '
             'chromaticity coordinates!'.format(xy, xy_n))
 
-    i_wl = np.argmin(scipy.spatial.distance.cdist(xy_wl, xy_s), axis=-1)
+    i_wl = _closest_spectral_locus_vertex(xy_wl, xy_s)
 
     i_wl = np.reshape(i_wl, xy.shape[0:-1])
     xy_wl = np.reshape(xy_wl, xy.shape)
@@ -353,7 +563,7 @@ def colorimetric_purity(xy,
     xy = np.asarray(xy)
 
     _wl, xy_wl, _xy_cwl = dominant_wavelength(xy, xy_n, cmfs)
-    P_e = excitation_purity(xy, xy_n, cmfs)
+    P_e = euclidean_distance(xy_n, xy) / euclidean_distance(xy_n, xy_wl)
 
     P_c = P_e * xy_wl[..., 1] / xy[..., 1]
 
@@ -6,6 +6,7 @@ Illuminants
 Defines *CIE* illuminants computation related objects:
 
 -   :func:`colour.D_illuminant_relative_spd`
+-   :func:`colour.colorimetry.D_illuminant_relative_msa`
 -   :func:`colour.CIE_standard_illuminant_A_function`
 
 See Also
@@ -31,7 +32,7 @@ from __future__ import division, unicode_literals
 import numpy as np
 
 from colour.colorimetry import D_ILLUMINANTS_S_SPDS, SpectralPowerDistribution
-from colour.utilities import tsplit
+from colour.utilities import as_float_array, tsplit, tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -40,7 +41,81 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['D_illuminant_relative_spd', 'CIE_standard_illuminant_A_function']
+__all__ = [
+    'D_illuminant_relative_spd', 'D_illuminant_relative_msa',
+    'CIE_standard_illuminant_A_function'
+]
+
+_D_ILLUMINANTS_S_VALUES_CACHE = None
+
+
+def _D_illuminant_M1_M2(xy, M1_M2_rounding=True):
+    """
+    Returns the :math:`M1` and :math:`M2` coefficients of the
+    *CIE Standard Illuminant D Series* characteristic vectors for given *xy*
+    chromaticity coordinates.
+
+    Parameters
+    ----------
+    xy : array_like
+        *xy* chromaticity coordinates.
+    M1_M2_rounding : bool, optional
+        Whether to round :math:`M1` and :math:`M2` variables to 3 decimal
+        places in order to yield the internationally agreed values.
+
+    Returns
+    -------
+    tuple
+        :math:`M1` and :math:`M2` coefficients.
+    """
+
+    x, y = tsplit(xy)
+
+    M = 0.0241 + 0.2562 * x - 0.7341 * y
+    M1 = (-1.3515 - 1.7703 * x + 5.9114 * y) / M
+    M2 = (0.0300 - 31.4424 * x + 30.0717 * y) / M
+
+    if M1_M2_rounding:
+        M1 = np.around(M1, 3)
+        M2 = np.around(M2, 3)
+
+    return M1, M2
+
+
+def _D_illuminants_S_values(shape=None):
+    """
+    Returns the *CIE Standard Illuminant D Series* characteristic vectors
+    :math:`S_0`, :math:`S_1` and :math:`S_2` values aligned to given spectral
+    shape.
+
+    Parameters
+    ----------
+    shape : SpectralShape, optional
+        Spectral shape to align the characteristic vectors to, their own
+        spectral shape is used if not given.
+
+    Returns
+    -------
+    tuple
+        Wavelengths and characteristic vectors values of shape (3, W).
+    """
+
+    global _D_ILLUMINANTS_S_VALUES_CACHE
+    if _D_ILLUMINANTS_S_VALUES_CACHE is None:
+        _D_ILLUMINANTS_S_VALUES_CACHE = {}
+
+    key = str(shape)
+    if key in _D_ILLUMINANTS_S_VALUES_CACHE:
+        return _D_ILLUMINANTS_S_VALUES_CACHE[key]
+
+    S = [D_ILLUMINANTS_S_SPDS[name] for name in ('S0', 'S1', 'S2')]
+    if shape is not None:
+        S = [S_i.copy().align(shape) for S_i in S]
+
+    value = _D_ILLUMINANTS_S_VALUES_CACHE[key] = (
+        S[0].wavelengths, np.array([S_i.values for S_i in S]))
+
+    return value
 
 
 def D_illuminant_relative_spd(xy, M1_M2_rounding=True):
@@ -197,15 +272,7 @@ def D_illuminant_relative_spd(xy, M1_M2_rounding=True):
                               extrapolator_args={...})
     """
 
-    x, y = tsplit(xy)
-
-    M = 0.0241 + 0.2562 * x - 0.7341 * y
-    M1 = (-1.3515 - 1.7703 * x + 5.9114 * y) / M
-    M2 = (0.0300 - 31.4424 * x + 30.0717 * y) / M
-
-    if M1_M2_rounding:
-        M1 = np.around(M1, 3)
-        M2 = np.around(M2, 3)
+    M1, M2 = _D_illuminant_M1_M2(xy, M1_M2_rounding)
 
     S0 = D_ILLUMINANTS_S_SPDS['S0']
     S1 = D_ILLUMINANTS_S_SPDS['S1']
@@ -217,6 +284,70 @@ def D_illuminant_relative_spd(xy, M1_M2_rounding=True):
         distribution, S0.wavelengths, name='CIE Standard Illuminant D Series')
 
 
+def D_illuminant_relative_msa(xy, shape=None, M1_M2_rounding=True):
+    """
+    Returns the relative spectral power distributions values of the
+    *CIE Standard Illuminant D Series* of given *xy* chromaticity coordinates
+    array as a multi-spectral array.
+
+    The multi-spectral array is computed with a single product between the
+    :math:`(1, M1, M2)` coefficients array and the characteristic vectors
+    :math:`S_0`, :math:`S_1` and :math:`S_2`, thus the cost per illuminant is
+    independent of the spectral power distribution machinery.
+
+    Parameters
+    ----------
+    xy : array_like
+        *xy* chromaticity coordinates.
+    shape : SpectralShape, optional
+        Spectral shape the characteristic vectors are aligned to, their own
+        spectral shape, i.e. [300, 830, 5], is used if not given.
+    M1_M2_rounding : bool, optional
+        Whether to round :math:`M1` and :math:`M2` variables to 3 decimal
+        places in order to yield the internationally agreed values.
+
+    Returns
+    -------
+    ndarray
+        *CIE Standard Illuminant D Series* relative spectral power
+        distributions values of shape ``xy.shape[:-1] + (W, )``.
+
+    Notes
+    -----
+    -   The correlated colour temperatures can be converted to *xy*
+        chromaticity coordinates with the vectorised
+        :func:`colour.temperature.CCT_to_xy_CIE_D` definition.
+    -   The aligned characteristic vectors are cached per spectral shape.
+
+    References
+    ----------
+    -   :cite:`CIETC1-482004`
+    -   :cite:`Wyszecki2000z`
+
+    Examples
+    --------
+    >>> from colour.temperature import CCT_to_xy_CIE_D
+    >>> from colour.colorimetry import SpectralShape
+    >>> CCT = np.array([5000, 6500, 7500]) * 1.4388 / 1.4380
+    >>> xy = CCT_to_xy_CIE_D(CCT)
+    >>> msa = D_illuminant_relative_msa(xy, SpectralShape(400, 700, 50))
+    >>> msa.shape
+    (3, 7)
+    >>> msa[:, :4]
+    array([[  49.3081,   87.2472,   95.7237,  102.317 ],
+           [  82.7549,  117.0076,  109.3545,  104.0462],
+           [ 101.929 ,  133.0095,  116.589 ,  104.9035]])
+    """
+
+    xy = as_float_array(xy)
+
+    _wavelengths, S = _D_illuminants_S_values(shape)
+
+    M1, M2 = _D_illuminant_M1_M2(xy, M1_M2_rounding)
+
+    return np.dot(tstack((np.ones(M1.shape), M1, M2)), S)
+
+
 def CIE_standard_illuminant_A_function(wl):
     """
     *CIE Standard Illuminant A* is intended to represent typical, domestic,
@@ -64,7 +64,7 @@ import numpy as np
 from colour.biochemistry import reaction_rate_MichealisMenten
 from colour.constants import CIE_E, CIE_K
 from colour.utilities import (CaseInsensitiveMapping, as_numeric,
-                              filter_kwargs, warning)
+                              cache_signature, filter_kwargs, warning)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -302,13 +302,13 @@ def lightness_Fairchild2011(Y, epsilon=0.474, method='hdr-CIELAB'):
     return L_hdr
 
 
-LIGHTNESS_METHODS = CaseInsensitiveMapping({
+LIGHTNESS_METHODS = cache_signature(CaseInsensitiveMapping({
     'Glasser 1958': lightness_Glasser1958,
     'Wyszecki 1963': lightness_Wyszecki1963,
     'CIE 1976': lightness_CIE1976,
     'Fairchild 2010': lightness_Fairchild2010,
     'Fairchild 2011': lightness_Fairchild2011
-})
+}))
 LIGHTNESS_METHODS.__doc__ = """
 Supported *Lightness* computations methods.
 
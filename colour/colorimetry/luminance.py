@@ -63,7 +63,8 @@ import numpy as np
 
 from colour.biochemistry import substrate_concentration_MichealisMenten
 from colour.constants import CIE_E, CIE_K
-from colour.utilities import CaseInsensitiveMapping, as_numeric, filter_kwargs
+from colour.utilities import (CaseInsensitiveMapping, as_numeric,
+                              cache_signature, filter_kwargs)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -301,13 +302,13 @@ def luminance_Fairchild2011(L_hdr, epsilon=0.474, method='hdr-CIELAB'):
     return Y
 
 
-LUMINANCE_METHODS = CaseInsensitiveMapping({
+LUMINANCE_METHODS = cache_signature(CaseInsensitiveMapping({
     'Newhall 1943': luminance_Newhall1943,
     'ASTM D1535-08': luminance_ASTMD153508,
     'CIE 1976': luminance_CIE1976,
     'Fairchild 2010': luminance_Fairchild2010,
     'Fairchild 2011': luminance_Fairchild2011
-})
+}))
 LUMINANCE_METHODS.__doc__ = """
 Supported *luminance* computations methods.
 
@@ -409,14 +409,15 @@ class SpectralShape(object):
 
         return not (self == shape)
 
-    def range(self, dtype=DEFAULT_FLOAT_DTYPE):
+    def range(self, dtype=None):
         """
         Returns an iterable range for the spectral shape.
 
         Parameters
         ----------
-        dtype : type
-            Data type used to generate the range.
+        dtype : type, optional
+            Data type used to generate the range, default to the type defined
+            by :attr:`colour.constants.DEFAULT_FLOAT_DTYPE` attribute.
 
         Returns
         -------
@@ -450,7 +451,10 @@ class SpectralShape(object):
             raise RuntimeError(('One of the spectral shape "start", "end" or '
                                 '"interval" attributes is not defined!'))
 
-        if self._range is None:
+        if dtype is None:
+            dtype = DEFAULT_FLOAT_DTYPE
+
+        if self._range is None or self._range.dtype != dtype:
             samples = round(
                 (self._interval + self._end - self._start) / self._interval)
             range_, current_interval = np.linspace(
@@ -2400,7 +2404,7 @@ DEFAULT_SPECTRAL_SHAPE : SpectralShape
 """
 
 
-def constant_spd(k, shape=DEFAULT_SPECTRAL_SHAPE, dtype=DEFAULT_FLOAT_DTYPE):
+def constant_spd(k, shape=DEFAULT_SPECTRAL_SHAPE, dtype=None):
     """
     Returns a spectral power distribution of given spectral shape filled with
     constant :math:`k` values.
@@ -2411,8 +2415,10 @@ def constant_spd(k, shape=DEFAULT_SPECTRAL_SHAPE, dtype=DEFAULT_FLOAT_DTYPE):
         Constant :math:`k` to fill the spectral power distribution with.
     shape : SpectralShape, optional
         Spectral shape used to create the spectral power distribution.
-    dtype : type
-        Data type used for the spectral power distribution.
+    dtype : type, optional
+        Data type used for the spectral power distribution, default to the
+        type defined by :attr:`colour.constants.DEFAULT_FLOAT_DTYPE`
+        attribute.
 
     Returns
     -------
@@ -2433,6 +2439,9 @@ def constant_spd(k, shape=DEFAULT_SPECTRAL_SHAPE, dtype=DEFAULT_FLOAT_DTYPE):
     100.0
     """
 
+    if dtype is None:
+        dtype = DEFAULT_FLOAT_DTYPE
+
     wavelengths = shape.range(dtype)
     values = np.full(len(wavelengths), k, dtype)
 
@@ -9,7 +9,8 @@ import numpy as np
 import unittest
 from itertools import permutations
 
-from colour.colorimetry import (SpectralShape, planck_law, blackbody_spd)
+from colour.colorimetry import (SpectralShape, planck_law, blackbody_spd,
+                                blackbody_msa, blackbody_spds)
 from colour.utilities import ignore_numpy_errors
 
 __author__ = 'Colour Developers'
@@ -21,7 +22,7 @@ __status__ = 'Production'
 
 __all__ = [
     'PLANCK_LAW_DATA', 'BLACKBODY_SPD_DATA', 'TestPlanckLaw',
-    'TestBlackbodySpd'
+    'TestBlackbodySpd', 'TestBlackbodyMsa', 'TestBlackbodySpds'
 ]
 
 PLANCK_LAW_DATA = {
@@ -4581,5 +4582,76 @@ class TestBlackbodySpd(unittest.TestCase):
             atol=0.0000001)
 
 
+class TestBlackbodyMsa(unittest.TestCase):
+    """
+    Defines
+    :func:`colour.colorimetry.blackbody.blackbody_msa`
+    definition unit tests methods.
+    """
+
+    def test_blackbody_msa(self):
+        """
+        Tests
+        :func:`colour.colorimetry.blackbody.blackbody_msa`
+        definition.
+        """
+
+        shape = SpectralShape(360, 830, 1)
+        temperatures = np.array([1667, 5000, 6500, 25000])
+        msa = blackbody_msa(temperatures, shape)
+
+        self.assertTupleEqual(msa.shape, (4, 471))
+        for i, temperature in enumerate(temperatures):
+            np.testing.assert_equal(msa[i],
+                                    blackbody_spd(temperature, shape).values)
+
+        np.testing.assert_allclose(
+            blackbody_msa(5000, shape),
+            BLACKBODY_SPD_DATA,
+            rtol=0.0000001,
+            atol=0.0000001)
+
+    def test_n_dimensional_blackbody_msa(self):
+        """
+        Tests
+        :func:`colour.colorimetry.blackbody.blackbody_msa`
+        definition n-dimensional arrays support.
+        """
+
+        shape = SpectralShape(400, 700, 10)
+        temperatures = np.array([1667, 5000, 6500, 25000, 3000, 4000])
+        msa = blackbody_msa(temperatures, shape)
+
+        np.testing.assert_equal(
+            blackbody_msa(np.reshape(temperatures, (2, 3)), shape),
+            np.reshape(msa, (2, 3, 31)))
+
+
+class TestBlackbodySpds(unittest.TestCase):
+    """
+    Defines
+    :func:`colour.colorimetry.blackbody.blackbody_spds`
+    definition unit tests methods.
+    """
+
+    def test_blackbody_spds(self):
+        """
+        Tests
+        :func:`colour.colorimetry.blackbody.blackbody_spds`
+        definition.
+        """
+
+        shape = SpectralShape(400, 700, 10)
+        spds = blackbody_spds([2000, 5000, 6500], shape)
+
+        self.assertEqual(spds.shape, shape)
+        self.assertListEqual(
+            spds.labels,
+            ['2000K Blackbody', '5000K Blackbody', '6500K Blackbody'])
+        for i, temperature in enumerate([2000, 5000, 6500]):
+            np.testing.assert_equal(spds.values[:, i],
+                                    blackbody_spd(temperature, shape).values)
+
+
 if __name__ == '__main__':
     unittest.main()
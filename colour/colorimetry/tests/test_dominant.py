@@ -6,9 +6,12 @@ Defines unit tests for :mod:`colour.colorimetry.dominant` module.
 from __future__ import division, unicode_literals
 
 import numpy as np
+import scipy.spatial.distance
 import unittest
 from itertools import permutations
 
+from colour.algebra import extend_line_segment, intersect_line_segments
+
 from colour.colorimetry import (CMFS, ILLUMINANTS, dominant_wavelength,
                                 complementary_wavelength, excitation_purity,
                                 colorimetric_purity)
@@ -96,6 +99,36 @@ closest_spectral_locus_wavelength` definition n-dimensional arrays support.
         np.testing.assert_almost_equal(i_wl, i_wl_r, decimal=7)
         np.testing.assert_almost_equal(xy_wl, xy_wl_r)
 
+    def test_batch_closest_spectral_locus_wavelength(self):
+        """
+        Tests :func:`colour.colorimetry.dominant.\
+closest_spectral_locus_wavelength` definition batch computations against all
+        the spectral locus segments.
+        """
+
+        xy = np.random.RandomState(4).uniform([0.1, 0.1], [0.6, 0.7], (200, 2))
+        xy_n = np.where(
+            np.arange(200)[:, np.newaxis] % 2, D65,
+            ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['A'])
+
+        for reverse in (False, True):
+            i_wl, xy_wl = closest_spectral_locus_wavelength(
+                xy, xy_n, self._xy_s, reverse)
+
+            xy_s = np.vstack([self._xy_s, self._xy_s[0]])
+            for i in range(xy.shape[0]):
+                xy_e = (extend_line_segment(xy[i], xy_n[i]) if reverse else
+                        extend_line_segment(xy_n[i], xy[i]))
+                xy_wl_r = intersect_line_segments(
+                    np.hstack([xy_n[i], xy_e]),
+                    np.hstack([xy_s, np.roll(xy_s, 1, axis=0)])).xy
+                xy_wl_r = xy_wl_r[~np.isnan(xy_wl_r).any(axis=-1)]
+
+                np.testing.assert_equal(xy_wl[i], xy_wl_r[0])
+                self.assertEqual(
+                    i_wl[i],
+                    np.argmin(scipy.spatial.distance.cdist(xy_wl_r, xy_s)))
+
     @ignore_numpy_errors
     def test_nan_closest_spectral_locus_wavelength(self):
         """
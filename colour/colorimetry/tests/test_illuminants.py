@@ -9,8 +9,9 @@ import numpy as np
 import unittest
 
 from colour.colorimetry import (D_illuminant_relative_spd,
+                                D_illuminant_relative_msa,
                                 CIE_standard_illuminant_A_function,
-                                ILLUMINANTS_SPDS)
+                                ILLUMINANTS_SPDS, SpectralShape)
 from colour.temperature import CCT_to_xy_CIE_D
 
 __author__ = 'Colour Developers'
@@ -21,7 +22,7 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
 __all__ = [
-    'A_DATA', 'TestD_illuminantRelativeSpd',
+    'A_DATA', 'TestD_illuminantRelativeSpd', 'TestD_illuminantRelativeMsa',
     'TestCIEStandardIlluminantAFunction'
 ]
 
@@ -153,6 +154,58 @@ class TestD_illuminantRelativeSpd(unittest.TestCase):
                 atol=tolerance)
 
 
+class TestD_illuminantRelativeMsa(unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.illuminants.D_illuminant_relative_msa`
+    definition unit tests methods.
+    """
+
+    def test_D_illuminant_relative_msa(self):
+        """
+        Tests :func:`colour.colorimetry.illuminants.D_illuminant_relative_msa`
+        definition.
+        """
+
+        CCT = np.linspace(4000, 25000, 12) * 1.4388 / 1.4380
+        xy = CCT_to_xy_CIE_D(CCT)
+
+        msa = D_illuminant_relative_msa(xy)
+        self.assertTupleEqual(msa.shape, (12, 107))
+        for i in range(12):
+            np.testing.assert_almost_equal(
+                msa[i], D_illuminant_relative_spd(xy[i]).values, decimal=7)
+
+        shape = SpectralShape(360, 780, 1)
+        msa = D_illuminant_relative_msa(xy, shape)
+        self.assertTupleEqual(msa.shape, (12, 421))
+        for i in range(12):
+            np.testing.assert_almost_equal(
+                msa[i],
+                D_illuminant_relative_spd(xy[i]).align(shape).values,
+                decimal=7)
+
+        np.testing.assert_almost_equal(
+            D_illuminant_relative_msa(xy, M1_M2_rounding=False)[3],
+            D_illuminant_relative_spd(xy[3], M1_M2_rounding=False).values,
+            decimal=7)
+
+    def test_n_dimensional_D_illuminant_relative_msa(self):
+        """
+        Tests :func:`colour.colorimetry.illuminants.D_illuminant_relative_msa`
+        definition n-dimensional arrays support.
+        """
+
+        xy = CCT_to_xy_CIE_D(np.linspace(4000, 25000, 6))
+        msa = D_illuminant_relative_msa(xy)
+
+        np.testing.assert_almost_equal(
+            D_illuminant_relative_msa(xy[0]), msa[0], decimal=7)
+        np.testing.assert_almost_equal(
+            D_illuminant_relative_msa(np.reshape(xy, (2, 3, 2))),
+            np.reshape(msa, (2, 3, 107)),
+            decimal=7)
+
+
 class TestCIEStandardIlluminantAFunction(unittest.TestCase):
     """
     Defines :func:`colour.colorimetry.illuminants.\
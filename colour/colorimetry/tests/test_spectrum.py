@@ -1327,6 +1327,11 @@ class TestSpectralShape(unittest.TestCase):
             [wavelength for wavelength in SpectralShape(0, 10, 0.1)],
             np.arange(0, 10 + 0.1, 0.1))
 
+        shape = SpectralShape(0, 10, 0.1)
+        self.assertEqual(shape.range().dtype, np.float64)
+        self.assertEqual(shape.range(np.float32).dtype, np.float32)
+        self.assertEqual(shape.range().dtype, np.float64)
+
 
 class TestSpectralPowerDistribution(unittest.TestCase):
     """
@@ -1709,6 +1714,9 @@ class TestConstantSpd(unittest.TestCase):
 
         self.assertAlmostEqual(spd[780], np.pi, places=7)
 
+        self.assertEqual(
+            constant_spd(np.pi, dtype=np.float32).values.dtype, np.float32)
+
 
 class TestZerosSpd(unittest.TestCase):
     """
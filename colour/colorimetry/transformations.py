@@ -42,7 +42,7 @@ from __future__ import division, unicode_literals
 import numpy as np
 
 from colour.colorimetry import LMS_CMFS, RGB_CMFS, PHOTOPIC_LEFS
-from colour.utilities import dot_vector, tstack
+from colour.utilities import dot_vector, tsplit, tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -113,7 +113,7 @@ def RGB_2_degree_cmfs_to_XYZ_2_degree_cmfs(wavelength):
     xyz = dot_vector(M1, rgb)
     xyz /= dot_vector(M2, rgb)
 
-    x, y, z = xyz[..., 0], xyz[..., 1], xyz[..., 2]
+    x, y, z = tsplit(xyz)
 
     V = PHOTOPIC_LEFS['CIE 1924 Photopic Standard Observer'].copy()
     V.align(cmfs.shape)
@@ -37,8 +37,8 @@ import numpy as np
 from colour.algebra import lagrange_coefficients
 from colour.colorimetry import (DEFAULT_SPECTRAL_SHAPE, SpectralShape,
                                 STANDARD_OBSERVERS_CMFS, ones_spd)
-from colour.utilities import (CaseInsensitiveMapping, filter_kwargs, tsplit,
-                              warning)
+from colour.utilities import (CaseInsensitiveMapping, cache_signature,
+                              filter_kwargs, tsplit, warning)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -702,10 +702,10 @@ _TRISTIMULUS_WEIGHTING_FACTORS_CACHE` attribute. Their identifier key is
     return XYZ
 
 
-SPECTRAL_TO_XYZ_METHODS = CaseInsensitiveMapping({
+SPECTRAL_TO_XYZ_METHODS = cache_signature(CaseInsensitiveMapping({
     'ASTM E308-15': spectral_to_XYZ_ASTME30815,
     'Integration': spectral_to_XYZ_integration
-})
+}))
 SPECTRAL_TO_XYZ_METHODS.__doc__ = """
 Supported spectral power distribution to *CIE XYZ* tristimulus values
 conversion methods
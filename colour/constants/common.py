@@ -8,9 +8,11 @@ Defines common constants objects that don't belong to any specific category.
 
 from __future__ import division, unicode_literals
 
+import os
 import numpy as np
 
 from colour.utilities.documentation import DocstringFloat
+from colour.utilities.verbose import warning
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -46,9 +48,51 @@ computations.
 EPSILON : numeric
 """
 
-DEFAULT_FLOAT_DTYPE = np.float_
+
+def _default_float_dtype():
+    """
+    Returns the default floating point number dtype defined by the
+    *COLOUR_SCIENCE__FLOAT_PRECISION* environment variable.
+
+    Returns
+    -------
+    type
+        Default floating point number dtype, :class:`np.float64` if the
+        environment variable is not defined or does not define a floating
+        point number dtype.
+
+    Examples
+    --------
+    >>> _default_float_dtype()  # doctest: +SKIP
+    <class 'numpy.float64'>
+    """
+
+    precision = os.environ.get('COLOUR_SCIENCE__FLOAT_PRECISION')
+    if precision is None:
+        return np.float64
+
+    try:
+        dtype = np.dtype(precision).type
+    except TypeError:
+        dtype = None
+
+    if dtype is None or not np.issubdtype(dtype, np.floating):
+        warning(('"COLOUR_SCIENCE__FLOAT_PRECISION" environment variable '
+                 '"{0}" value is not a floating point number dtype, '
+                 '"float64" will be used instead!').format(precision))
+
+        return np.float64
+
+    return dtype
+
+
+DEFAULT_FLOAT_DTYPE = _default_float_dtype()
 """
 Default floating point number dtype.
 
+The dtype can be set with the *COLOUR_SCIENCE__FLOAT_PRECISION* environment
+variable, e.g. *float32* or *float64*, or at runtime with the
+:func:`colour.utilities.set_default_float_dtype` definition.
+
 DEFAULT_FLOAT_DTYPE : type
 """
@@ -1096,7 +1096,7 @@ dict_like
     def multi_signal_unpack_data(data=None,
                                  domain=None,
                                  labels=None,
-                                 dtype=DEFAULT_FLOAT_DTYPE,
+                                 dtype=None,
                                  signal_type=Signal,
                                  **kwargs):
         """
@@ -1115,7 +1115,8 @@ dict_like, optional
             :attr:`colour.continuous.Signal.domain` attribute.
         dtype : type, optional
             **{np.float16, np.float32, np.float64, np.float128}**,
-            Floating point data type.
+            Floating point data type, default to the type defined by
+            :attr:`colour.constants.DEFAULT_FLOAT_DTYPE` attribute.
         signal_type : type, optional
             A :class:`colour.continuous.Signal` sub-class type.
 
@@ -1274,6 +1275,9 @@ dict_like, optional
          [ 1000.   120.]]
         """
 
+        if dtype is None:
+            dtype = DEFAULT_FLOAT_DTYPE
+
         assert dtype in np.sctypes['float'], (
             '"dtype" must be one of the following types: {0}'.format(
                 np.sctypes['float']))
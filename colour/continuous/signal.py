@@ -1012,7 +1012,7 @@ class Signal(AbstractContinuousFunction):
             return copy
 
     @staticmethod
-    def signal_unpack_data(data=None, domain=None, dtype=DEFAULT_FLOAT_DTYPE):
+    def signal_unpack_data(data=None, domain=None, dtype=None):
         """
         Unpack given data for continuous signal instantiation.
 
@@ -1027,7 +1027,8 @@ class Signal(AbstractContinuousFunction):
             :attr:`colour.continuous.Signal.domain` attribute.
         dtype : type, optional
             **{np.float16, np.float32, np.float64, np.float128}**,
-            Floating point data type.
+            Floating point data type, default to the type defined by
+            :attr:`colour.constants.DEFAULT_FLOAT_DTYPE` attribute.
 
         Returns
         -------
@@ -1086,6 +1087,9 @@ class Signal(AbstractContinuousFunction):
         [  10.   20.   30.   40.   50.   60.   70.   80.   90.  100.]
         """
 
+        if dtype is None:
+            dtype = DEFAULT_FLOAT_DTYPE
+
         assert dtype in np.sctypes['float'], (
             '"dtype" must be one of the following types: {0}'.format(
                 np.sctypes['float']))
@@ -47,7 +47,8 @@ from colour.corresponding import (
     BRENEMAN_EXPERIMENTS, BRENEMAN_EXPERIMENTS_PRIMARIES_CHROMATICITIES)
 from colour.models import (Luv_to_uv, Luv_uv_to_xy, XYZ_to_Luv, XYZ_to_xy,
                            xy_to_XYZ)
-from colour.utilities import CaseInsensitiveMapping, filter_kwargs
+from colour.utilities import (CaseInsensitiveMapping, cache_signature,
+                              filter_kwargs)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -340,12 +341,14 @@ def corresponding_chromaticities_prediction_VonKries(experiment=1,
     return tuple(prediction)
 
 
-CORRESPONDING_CHROMATICITIES_PREDICTION_MODELS = CaseInsensitiveMapping({
-    'CIE 1994': corresponding_chromaticities_prediction_CIE1994,
-    'CMCCAT2000': corresponding_chromaticities_prediction_CMCCAT2000,
-    'Fairchild 1990': corresponding_chromaticities_prediction_Fairchild1990,
-    'Von Kries': corresponding_chromaticities_prediction_VonKries
-})
+CORRESPONDING_CHROMATICITIES_PREDICTION_MODELS = cache_signature(
+    CaseInsensitiveMapping({
+        'CIE 1994': corresponding_chromaticities_prediction_CIE1994,
+        'CMCCAT2000': corresponding_chromaticities_prediction_CMCCAT2000,
+        'Fairchild 1990':
+        corresponding_chromaticities_prediction_Fairchild1990,
+        'Von Kries': corresponding_chromaticities_prediction_VonKries
+    }))
 CORRESPONDING_CHROMATICITIES_PREDICTION_MODELS.__doc__ = """
 Aggregated corresponding chromaticities prediction models.
 
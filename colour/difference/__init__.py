@@ -33,13 +33,16 @@ Melgosa_CIEDE2000_Workshop-July4.pdf
 
 from __future__ import absolute_import
 
-from colour.utilities import CaseInsensitiveMapping, filter_kwargs
+from colour.utilities import (CaseInsensitiveMapping, cache_signature,
+                              filter_kwargs)
 
 from .cam02_ucs import (delta_E_CAM02LCD, delta_E_CAM02SCD, delta_E_CAM02UCS)
 from .cam16_ucs import (delta_E_CAM16LCD, delta_E_CAM16SCD, delta_E_CAM16UCS)
 from .delta_e import (delta_E_CIE1976, delta_E_CIE1994, delta_E_CIE2000,
                       delta_E_CMC)
 from .din99 import delta_E_DIN99
+from .pairwise import delta_E_pairwise
+from .nearest import NearestColourIndex
 
 __all__ = ['delta_E_CAM02LCD', 'delta_E_CAM02SCD', 'delta_E_CAM02UCS']
 __all__ += ['delta_E_CAM16LCD', 'delta_E_CAM16SCD', 'delta_E_CAM16UCS']
@@ -47,8 +50,10 @@ __all__ += [
     'delta_E_CIE1976', 'delta_E_CIE1994', 'delta_E_CIE2000', 'delta_E_CMC'
 ]
 __all__ += ['delta_E_DIN99']
+__all__ += ['delta_E_pairwise']
+__all__ += ['NearestColourIndex']
 
-DELTA_E_METHODS = CaseInsensitiveMapping({
+DELTA_E_METHODS = cache_signature(CaseInsensitiveMapping({
     'CIE 1976': delta_E_CIE1976,
     'CIE 1994': delta_E_CIE1994,
     'CIE 2000': delta_E_CIE2000,
@@ -60,7 +65,7 @@ DELTA_E_METHODS = CaseInsensitiveMapping({
     'CAM16-SCD': delta_E_CAM16SCD,
     'CAM16-UCS': delta_E_CAM16UCS,
     'DIN99': delta_E_DIN99,
-})
+}))
 DELTA_E_METHODS.__doc__ = """
 Supported :math:`\Delta E_{ab}` computations methods.
 
@@ -55,6 +55,31 @@ __all__ = [
 ]
 
 
+def _Lab_terms(Lab):
+    """
+    Returns the terms of given *CIE L\*a\*b\** colourspace array that only
+    depend on the array itself, i.e. :math:`L^*`, :math:`a^*`, :math:`b^*`
+    and the chroma :math:`C^*`.
+
+    Those terms are computed once per colour by the pairwise colour
+    differences definitions.
+
+    Parameters
+    ----------
+    Lab : array_like
+        *CIE L\*a\*b\** colourspace array.
+
+    Returns
+    -------
+    tuple
+        *CIE L\*a\*b\** colourspace array terms.
+    """
+
+    L, a, b = tsplit(Lab)
+
+    return L, a, b, np.hypot(a, b)
+
+
 def delta_E_CIE1976(Lab_1, Lab_2):
     """
     Returns the difference :math:`\Delta E_{76}` between two given
@@ -131,17 +156,41 @@ def delta_E_CIE1994(Lab_1, Lab_2, textiles=False):
     88.3355530...
     """
 
+    return _delta_E_CIE1994(
+        _Lab_terms(Lab_1), _Lab_terms(Lab_2), textiles=textiles)
+
+
+def _delta_E_CIE1994(terms_1, terms_2, textiles=False):
+    """
+    Returns the difference :math:`\Delta E_{94}` between two given
+    *CIE L\*a\*b\** colourspace arrays terms using *CIE 1994*
+    recommendation.
+
+    Parameters
+    ----------
+    terms_1 : tuple
+        *CIE L\*a\*b\** colourspace array 1 terms as returned by
+        :func:`colour.difference.delta_e._Lab_terms` definition.
+    terms_2 : tuple
+        *CIE L\*a\*b\** colourspace array 2 terms as returned by
+        :func:`colour.difference.delta_e._Lab_terms` definition.
+    textiles : bool, optional
+        Textiles application specific parametric factors.
+
+    Returns
+    -------
+    numeric or ndarray
+        Colour difference :math:`\Delta E_{94}`.
+    """
+
     k_1 = 0.048 if textiles else 0.045
     k_2 = 0.014 if textiles else 0.015
     k_L = 2 if textiles else 1
     k_C = 1
     k_H = 1
 
-    L_1, a_1, b_1 = tsplit(Lab_1)
-    L_2, a_2, b_2 = tsplit(Lab_2)
-
-    C_1 = np.hypot(a_1, b_1)
-    C_2 = np.hypot(a_2, b_2)
+    L_1, a_1, b_1, C_1 = terms_1
+    L_2, a_2, b_2, C_2 = terms_2
 
     s_L = 1
     s_C = 1 + k_1 * C_1
@@ -222,18 +271,42 @@ def delta_E_CIE2000(Lab_1, Lab_2, textiles=False):
     95.7920535...
     """
 
+    return _delta_E_CIE2000(
+        _Lab_terms(Lab_1), _Lab_terms(Lab_2), textiles=textiles)
+
+
+def _delta_E_CIE2000(terms_1, terms_2, textiles=False):
+    """
+    Returns the difference :math:`\Delta E_{00}` between two given
+    *CIE L\*a\*b\** colourspace arrays terms using *CIE 2000*
+    recommendation.
+
+    Parameters
+    ----------
+    terms_1 : tuple
+        *CIE L\*a\*b\** colourspace array 1 terms as returned by
+        :func:`colour.difference.delta_e._Lab_terms` definition.
+    terms_2 : tuple
+        *CIE L\*a\*b\** colourspace array 2 terms as returned by
+        :func:`colour.difference.delta_e._Lab_terms` definition.
+    textiles : bool, optional
+        Textiles application specific parametric factors.
+
+    Returns
+    -------
+    numeric or ndarray
+        Colour difference :math:`\Delta E_{00}`.
+    """
+
     k_L = 2 if textiles else 1
     k_C = 1
     k_H = 1
 
-    L_1, a_1, b_1 = tsplit(Lab_1)
-    L_2, a_2, b_2 = tsplit(Lab_2)
+    L_1, a_1, b_1, c_1 = terms_1
+    L_2, a_2, b_2, c_2 = terms_2
 
     l_bar_prime = 0.5 * (L_1 + L_2)
 
-    c_1 = np.hypot(a_1, b_1)
-    c_2 = np.hypot(a_2, b_2)
-
     c_bar = 0.5 * (c_1 + c_2)
     c_bar7 = np.power(c_bar, 7)
 
@@ -326,11 +399,37 @@ def delta_E_CMC(Lab_1, Lab_2, l=2, c=1):  # noqa
     172.7047712...
     """
 
-    L_1, a_1, b_1 = tsplit(Lab_1)
-    L_2, a_2, b_2 = tsplit(Lab_2)
+    return _delta_E_CMC(_Lab_terms(Lab_1), _Lab_terms(Lab_2), l=l, c=c)
+
+
+def _delta_E_CMC(terms_1, terms_2, l=2, c=1):  # noqa
+    """
+    Returns the difference :math:`\Delta E_{CMC}` between two given
+    *CIE L\*a\*b\** colourspace arrays terms using
+    *Colour Measurement Committee* recommendation.
+
+    Parameters
+    ----------
+    terms_1 : tuple
+        *CIE L\*a\*b\** colourspace array 1 terms as returned by
+        :func:`colour.difference.delta_e._Lab_terms` definition.
+    terms_2 : tuple
+        *CIE L\*a\*b\** colourspace array 2 terms as returned by
+        :func:`colour.difference.delta_e._Lab_terms` definition.
+    l : numeric, optional
+        Lightness weighting factor.
+    c : numeric, optional
+        Chroma weighting factor.
+
+    Returns
+    -------
+    numeric or ndarray
+        Colour difference :math:`\Delta E_{CMC}`.
+    """
+
+    L_1, a_1, b_1, c_1 = terms_1
+    L_2, a_2, b_2, c_2 = terms_2
 
-    c_1 = np.hypot(a_1, b_1)
-    c_2 = np.hypot(a_2, b_2)
     s_l = np.where(L_1 < 16, 0.511, (0.040975 * L_1) / (1 + 0.01765 * L_1))
     s_c = 0.0638 * c_1 / (1 + 0.0131 * c_1) + 0.638
     h_1 = np.degrees(np.arctan2(b_1, a_1)) % 360
@@ -0,0 +1,375 @@
+# -*- coding: utf-8 -*-
+"""
+Nearest Colour Search
+=====================
+
+Defines the nearest colour search objects:
+
+-   :class:`colour.difference.NearestColourIndex`
+"""
+
+from __future__ import division, unicode_literals
+
+import json
+import numpy as np
+from scipy.spatial import cKDTree
+from six import text_type
+
+from colour.utilities import as_float_array, filter_kwargs
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['NearestColourIndex']
+
+
+class NearestColourIndex(object):
+    """
+    Defines an index of a colour library, e.g. a colour rendition chart or a
+    paint library, for nearest colour search under a colour difference
+    :math:`\Delta E_{ab}` metric.
+
+    The library colours are stored in a *KD-tree* built in their colourspace,
+    e.g. *CIE L\*a\*b\**, *CAM02-UCS* or *CAM16-UCS*. A query retrieves the
+    nearest candidates in the *Euclidean* sense from the *KD-tree* and ranks
+    them exactly with given colour difference method, thus the cost of a
+    query is logarithmic in the library size instead of linear.
+
+    Parameters
+    ----------
+    colours : array_like
+        Library colours in the colourspace of the colour difference method,
+        i.e. *CIE L\*a\*b\** or :math:`J'a'b'` colourspace array.
+    names : array_like, optional
+        Library colours names.
+    method : unicode, optional
+        **{'CIE 2000', 'CIE 1976', 'CIE 1994', 'CMC', 'CAM02-LCD', 'CAM02-SCD',
+        'CAM02-UCS', 'CAM16-LCD', 'CAM16-SCD', 'CAM16-UCS', 'DIN99'}**
+        Colour difference method used to rank the candidates.
+    candidates : int, optional
+        Count of *KD-tree* candidates ranked per requested neighbour.
+
+    Other Parameters
+    ----------------
+    \**kwargs : dict, optional
+        Keywords arguments for the colour difference method, see
+        :func:`colour.delta_E` definition.
+
+    Attributes
+    ----------
+    colours
+    names
+    method
+    candidates
+
+    Methods
+    -------
+    query
+    query_radius
+    read
+    write
+
+    Notes
+    -----
+    -   The *KD-tree* candidates are the nearest colours for the *CIE 1976*
+        metric, the results are exact for the *Euclidean* metrics and
+        approximate otherwise: a colour being nearer for the ranking method
+        than all the candidates would be missed. Increasing ``candidates``
+        reduces that probability.
+
+    Examples
+    --------
+    >>> from colour import COLOURCHECKERS, xyY_to_XYZ, XYZ_to_Lab
+    >>> name, data, illuminant = COLOURCHECKERS['ColorChecker 2005']
+    >>> Lab = XYZ_to_Lab(xyY_to_XYZ(list(data.values())), illuminant)
+    >>> index = NearestColourIndex(Lab, data.keys())
+    >>> d_E, i = index.query(np.array([[40.0, 12.0, 14.0],
+    ...                                [50.0, -30.0, 20.0]]))
+    >>> d_E  # doctest: +ELLIPSIS
+    array([ 2.1805952...,  7.2466217...])
+    >>> [index.names[j] for j in i]
+    ['dark skin', 'green']
+    """
+
+    def __init__(self,
+                 colours,
+                 names=None,
+                 method='CIE 2000',
+                 candidates=16,
+                 **kwargs):
+        self._colours = np.reshape(as_float_array(colours), (-1, 3))
+        self._names = None if names is None else list(names)
+        self._method = method
+        self._candidates = candidates
+        self._kwargs = kwargs
+
+        self._tree = cKDTree(self._colours)
+
+    @property
+    def colours(self):
+        """
+        Getter property for the library colours.
+
+        Returns
+        -------
+        ndarray
+            Library colours.
+        """
+
+        return self._colours
+
+    @property
+    def names(self):
+        """
+        Getter property for the library colours names.
+
+        Returns
+        -------
+        list
+            Library colours names.
+        """
+
+        return self._names
+
+    @property
+    def method(self):
+        """
+        Getter property for the colour difference method.
+
+        Returns
+        -------
+        unicode
+            Colour difference method.
+        """
+
+        return self._method
+
+    @property
+    def candidates(self):
+        """
+        Getter property for the count of *KD-tree* candidates ranked per
+        requested neighbour.
+
+        Returns
+        -------
+        int
+            Count of *KD-tree* candidates.
+        """
+
+        return self._candidates
+
+    def _delta_E(self, a, b):
+        """
+        Returns the difference :math:`\Delta E_{ab}` between given arrays
+        using the index colour difference method.
+
+        Parameters
+        ----------
+        a : array_like
+            *CIE L\*a\*b\** or :math:`J'a'b'` colourspace array :math:`a`.
+        b : array_like
+            *CIE L\*a\*b\** or :math:`J'a'b'` colourspace array :math:`b`.
+
+        Returns
+        -------
+        ndarray
+            Colour difference :math:`\Delta E_{ab}`.
+        """
+
+        from colour.difference import DELTA_E_METHODS
+
+        function = DELTA_E_METHODS[self._method]
+
+        return function(a, b, **filter_kwargs(function, **self._kwargs))
+
+    def query(self, colours, k=1):
+        """
+        Returns the ``k`` nearest library colours of given colours.
+
+        Parameters
+        ----------
+        colours : array_like
+            Colours to search the nearest library colours of.
+        k : int, optional
+            Count of nearest library colours to return.
+
+        Returns
+        -------
+        tuple
+            Colour differences :math:`\Delta E_{ab}` and indexes of the
+            nearest library colours sorted by increasing colour difference,
+            of shape ``colours.shape[:-1] + (k, )`` or ``colours.shape[:-1]``
+            if ``k`` is 1.
+        """
+
+        colours = as_float_array(colours)
+        colours_f = np.reshape(colours, (-1, 3))
+
+        n = self._colours.shape[0]
+        k = min(k, n)
+
+        _distances, index = self._tree.query(
+            colours_f, k=min(max(k * self._candidates, k), n))
+        index = np.reshape(index, (colours_f.shape[0], -1))
+
+        d_E = self._delta_E(colours_f[:, np.newaxis, :],
+                            self._colours[index])
+
+        rank = np.argsort(d_E, axis=-1, kind='mergesort')[:, :k]
+        rows = np.arange(colours_f.shape[0])[:, np.newaxis]
+        d_E, index = d_E[rows, rank], index[rows, rank]
+
+        shape = colours.shape[:-1] + ((k, ) if k != 1 else ())
+
+        return np.reshape(d_E, shape), np.reshape(index, shape)
+
+    def query_radius(self, colours, radius, radius_factor=5):
+        """
+        Returns the library colours within given colour difference radius of
+        given colours.
+
+        Parameters
+        ----------
+        colours : array_like
+            Colours to search the library colours within the radius of.
+        radius : numeric
+            Colour difference :math:`\Delta E_{ab}` radius.
+        radius_factor : numeric, optional
+            Factor of the radius in which the *KD-tree* candidates are
+            searched, it accounts for the colour difference method being
+            smaller than the *Euclidean* distance, e.g. *CIE 2000* for
+            saturated colours. If *None*, all the library colours are
+            candidates and the query is exact.
+
+        Returns
+        -------
+        list
+            Colour differences :math:`\Delta E_{ab}` and indexes of the
+            library colours within the radius sorted by increasing colour
+            difference, as a tuple of arrays for each given colour.
+
+        Notes
+        -----
+        -   The query is approximate for the non *Euclidean* colour difference
+            methods: the candidates are the library colours within the
+            ``radius * radius_factor`` *CIE 1976* distance, and there is no
+            finite factor bounding the ratio of the *Euclidean* distance to
+            the *CIE 2000*, *CIE 1994* or *CMC* colour differences, e.g. it
+            exceeds 5 for about 1% of the *CIE L\*a\*b\** colour pairs with
+            high chroma. Increasing ``radius_factor`` increases the recall at
+            the cost of ranking more candidates, ``radius_factor=None``
+            ranks the whole library and is exact.
+        """
+
+        colours_f = np.reshape(as_float_array(colours), (-1, 3))
+        m, n = colours_f.shape[0], self._colours.shape[0]
+
+        if radius_factor is None:
+            counts = np.full(m, n, dtype=np.int_)
+            index = np.tile(np.arange(n, dtype=np.int_), m)
+        else:
+            candidates = self._tree.query_ball_point(colours_f,
+                                                     radius * radius_factor)
+            counts = np.array([len(i) for i in candidates], dtype=np.int_)
+            index = np.fromiter(
+                (j for i in candidates for j in i),
+                dtype=np.int_,
+                count=np.sum(counts))
+
+        rows = np.repeat(np.arange(m), counts)
+        d_E = np.reshape(
+            self._delta_E(colours_f[rows], self._colours[index]), index.shape)
+
+        within = d_E <= radius
+        rows, d_E, index = rows[within], d_E[within], index[within]
+
+        rank = np.lexsort((d_E, rows))
+        d_E, index = d_E[rank], index[rank]
+
+        splits = np.cumsum(np.bincount(rows, minlength=m))[:-1]
+
+        return list(zip(np.split(d_E, splits), np.split(index, splits)))
+
+    @classmethod
+    def read(cls, path):
+        """
+        Reads an index from given *.npz* file.
+
+        Parameters
+        ----------
+        path : unicode
+            Index file path.
+
+        Returns
+        -------
+        NearestColourIndex
+            Read index.
+
+        Notes
+        -----
+        -   The *KD-tree* is rebuilt from the library colours.
+        """
+
+        with np.load(path) as data:
+            names = ([text_type(name) for name in data['names']]
+                     if 'names' in data else None)
+            kwargs = json.loads(text_type(data['kwargs']))
+
+            return cls(data['colours'], names,
+                       text_type(data['method']), int(data['candidates']),
+                       **kwargs)
+
+    def write(self, path):
+        """
+        Writes the index to given *.npz* file.
+
+        Parameters
+        ----------
+        path : unicode
+            Index file path.
+
+        Returns
+        -------
+        bool
+            Definition success.
+
+        Raises
+        ------
+        ValueError
+            If the colour difference method keywords arguments cannot be
+            serialised.
+
+        Notes
+        -----
+        -   The library colours names are written as *unicode* and are not
+            written if undefined.
+        -   The colour difference method keywords arguments are written as
+            *JSON*, thus they must be *JSON* serialisable, e.g. *bool* or
+            *numeric*.
+        """
+
+        try:
+            kwargs = json.dumps(self._kwargs, sort_keys=True)
+        except TypeError:
+            raise ValueError(
+                '"{0}" colour difference method keywords arguments cannot be '
+                'serialised!'.format(self._kwargs))
+
+        data = {
+            'colours': self._colours,
+            'method': np.array(self._method, dtype=np.unicode_),
+            'candidates': np.array(self._candidates),
+            'kwargs': np.array(kwargs, dtype=np.unicode_)
+        }
+        if self._names is not None:
+            data['names'] = np.array(
+                [text_type(name) for name in self._names], dtype=np.unicode_)
+
+        with open(path, 'wb') as file_:
+            np.savez(file_, **data)
+
+        return True
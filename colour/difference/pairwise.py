@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""
+Pairwise Colour Difference
+==========================
+
+Defines the pairwise colour difference computation objects:
+
+-   :func:`colour.difference.delta_E_pairwise`
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+from multiprocessing.pool import ThreadPool
+
+from colour.utilities import (CaseInsensitiveMapping, as_float_array,
+                              cache_signature, filter_kwargs)
+
+from .delta_e import (_Lab_terms, _delta_E_CIE1994, _delta_E_CIE2000,
+                      _delta_E_CMC)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['delta_E_pairwise']
+
+_PAIRWISE_DELTA_E_KERNELS = cache_signature(CaseInsensitiveMapping({
+    'CIE 1994': _delta_E_CIE1994,
+    'CIE 2000': _delta_E_CIE2000,
+    'CMC': _delta_E_CMC,
+}))
+_PAIRWISE_DELTA_E_KERNELS['cie1994'] = _PAIRWISE_DELTA_E_KERNELS['CIE 1994']
+_PAIRWISE_DELTA_E_KERNELS['cie2000'] = _PAIRWISE_DELTA_E_KERNELS['CIE 2000']
+
+_PAIRWISE_TEMPORARIES_COUNT = 64
+"""
+Upper bound of the count of temporary arrays allocated per tile by the colour
+difference computations, used to convert the memory budget into a tile size.
+
+_PAIRWISE_TEMPORARIES_COUNT : int
+"""
+
+
+def delta_E_pairwise(a,
+                     b=None,
+                     method='CIE 2000',
+                     memory_budget=2 ** 27,
+                     threads=None,
+                     **kwargs):
+    """
+    Returns the pairwise differences :math:`\Delta E_{ab}` between all the
+    colours of two given *CIE L\*a\*b\** or :math:`J'a'b'` colourspace arrays
+    using given method, i.e. a distance matrix.
+
+    The distance matrix is computed by tiles whose temporary arrays fit in
+    given memory budget. The terms depending only on a single colour, e.g.
+    the chroma :math:`C^*` for *CIE 1994*, *CIE 2000* and *CMC* methods, are
+    computed once for each array instead of once per pair or per tile.
+
+    Parameters
+    ----------
+    a : array_like
+        *CIE L\*a\*b\** or :math:`J'a'b'` colourspace array :math:`a`, the
+        reference colours for the non symmetrical methods.
+    b : array_like, optional
+        *CIE L\*a\*b\** or :math:`J'a'b'` colourspace array :math:`b`, default
+        to array :math:`a`.
+    method : unicode, optional
+        **{'CIE 2000', 'CIE 1976', 'CIE 1994', 'CMC', 'CAM02-LCD', 'CAM02-SCD',
+        'CAM02-UCS', 'CAM16-LCD', 'CAM16-SCD', 'CAM16-UCS', 'DIN99'}**
+        Computation method.
+    memory_budget : int, optional
+        Approximate memory in bytes the temporary arrays of a tile can use.
+    threads : int, optional
+        Threads count used to compute the tiles, default to *1*, i.e. no
+        :class:`multiprocessing.pool.ThreadPool` class instance is created.
+
+    Other Parameters
+    ----------------
+    \**kwargs : dict, optional
+        Keywords arguments for the colour difference computation method, see
+        :func:`colour.delta_E` definition.
+
+    Returns
+    -------
+    ndarray
+        Distance matrix of shape ``a.shape[:-1] + b.shape[:-1]``.
+
+    Examples
+    --------
+    >>> a = np.array([[100.00000000, 21.57210357, 272.22819350],
+    ...               [50.00000000, 10.00000000, -20.00000000]])
+    >>> b = np.array([[100.00000000, 426.67945353, 72.39590835],
+    ...               [50.00000000, 10.00000000, -20.00000000],
+    ...               [50.00000000, 426.67945353, 72.39590835]])
+    >>> delta_E_pairwise(a, b)  # doctest: +ELLIPSIS
+    array([[  94.0356490...,   65.3923156...,  100.8779470...],
+           [  55.7320866...,    0.        ,   42.0999829...]])
+    >>> delta_E_pairwise(a, b, method='CIE 1976')  # doctest: +ELLIPSIS
+    array([[ 451.7133019...,  296.7005740...,  454.4721192...],
+           [ 429.7194094...,    0.        ,  426.8006219...]])
+    """
+
+    from colour.difference import DELTA_E_METHODS
+
+    a = as_float_array(a)
+    b = a if b is None else as_float_array(b)
+
+    a_f = np.reshape(a, (-1, 3))
+    b_f = np.reshape(b, (-1, 3))
+    rows, columns = a_f.shape[0], b_f.shape[0]
+
+    kernel = _PAIRWISE_DELTA_E_KERNELS.get(method)
+    if kernel is not None:
+        kwargs = filter_kwargs(kernel, **kwargs)
+        terms_a = [x[..., np.newaxis] for x in _Lab_terms(a_f)]
+        terms_b = [x[np.newaxis, ...] for x in _Lab_terms(b_f)]
+
+        def tile_delta_E(r, c):
+            """
+            Computes the colour differences of given tile.
+            """
+
+            return kernel(
+                tuple(x[r] for x in terms_a), tuple(x[:, c] for x in terms_b),
+                **kwargs)
+    else:
+        function = DELTA_E_METHODS[method]
+        kwargs = filter_kwargs(function, **kwargs)
+
+        def tile_delta_E(r, c):
+            """
+            Computes the colour differences of given tile.
+            """
+
+            return function(a_f[r, np.newaxis, :], b_f[np.newaxis, c, :],
+                            **kwargs)
+
+    elements = max(memory_budget // (8 * _PAIRWISE_TEMPORARIES_COUNT), 1)
+    if columns <= elements:
+        tile_rows = max(elements // max(columns, 1), 1)
+        tile_columns = max(columns, 1)
+    else:
+        tile_rows, tile_columns = 1, elements
+
+    tiles = [(slice(i, i + tile_rows), slice(j, j + tile_columns))
+             for i in range(0, rows, tile_rows)
+             for j in range(0, columns, tile_columns)]
+
+    d_E = np.empty((rows, columns))
+
+    def compute_tile(tile):
+        """
+        Computes the colour differences of given tile in place.
+        """
+
+        d_E[tile] = tile_delta_E(*tile)
+
+    if threads is None or threads == 1:
+        for tile in tiles:
+            compute_tile(tile)
+    else:
+        pool = ThreadPool(processes=threads)
+        try:
+            pool.map(compute_tile, tiles)
+        finally:
+            pool.close()
+            pool.join()
+
+    return np.reshape(d_E, a.shape[:-1] + b.shape[:-1])
@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.difference.nearest` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import os
+import shutil
+import tempfile
+import unittest
+
+from colour.difference import (DELTA_E_METHODS, NearestColourIndex,
+                               delta_E_pairwise)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['TestNearestColourIndex']
+
+
+class TestNearestColourIndex(unittest.TestCase):
+    """
+    Defines :class:`colour.difference.nearest.NearestColourIndex` class unit
+    tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+        state = np.random.RandomState(4)
+
+        self._colours = state.uniform([0, -80, -80], [100, 80, 80], (200, 3))
+        self._queries = state.uniform([0, -80, -80], [100, 80, 80], (50, 3))
+        self._names = ['Colour {0}'.format(i) for i in range(200)]
+
+        self._index = NearestColourIndex(self._colours, self._names)
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('colours', 'names', 'method', 'candidates')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(NearestColourIndex))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('query', 'query_radius', 'read', 'write')
+
+        for method in required_methods:
+            self.assertIn(method, dir(NearestColourIndex))
+
+    def test_query(self):
+        """
+        Tests :meth:`colour.difference.nearest.NearestColourIndex.query`
+        method.
+        """
+
+        for method in ('CIE 2000', 'CIE 1976', 'CMC', 'CAM02-UCS'):
+            index = NearestColourIndex(self._colours, method=method)
+            d_E_e = np.sort(
+                delta_E_pairwise(self._queries, self._colours, method),
+                axis=-1)
+
+            d_E, i = index.query(self._queries, k=3)
+            np.testing.assert_almost_equal(d_E, d_E_e[:, :3], decimal=7)
+            np.testing.assert_almost_equal(
+                DELTA_E_METHODS[method](self._queries[:, np.newaxis],
+                                        self._colours[i]),
+                d_E,
+                decimal=7)
+
+            d_E, i = index.query(self._queries)
+            self.assertTupleEqual(d_E.shape, (50, ))
+            np.testing.assert_almost_equal(d_E, d_E_e[:, 0], decimal=7)
+
+        d_E, i = self._index.query(self._colours[7])
+        self.assertEqual(d_E, 0)
+        self.assertEqual(self._index.names[i], 'Colour 7')
+
+    def test_n_dimensional_query(self):
+        """
+        Tests :meth:`colour.difference.nearest.NearestColourIndex.query`
+        method n-dimensional arrays support.
+        """
+
+        d_E, i = self._index.query(self._queries, k=2)
+
+        d_E_n, i_n = self._index.query(
+            np.reshape(self._queries, (5, 10, 3)), k=2)
+        np.testing.assert_almost_equal(
+            d_E_n, np.reshape(d_E, (5, 10, 2)), decimal=7)
+        np.testing.assert_equal(i_n, np.reshape(i, (5, 10, 2)))
+
+    def test_query_radius(self):
+        """
+        Tests
+        :meth:`colour.difference.nearest.NearestColourIndex.query_radius`
+        method.
+        """
+
+        d_E_e = delta_E_pairwise(self._queries, self._colours)
+
+        for (d_E, i), d_E_q in zip(
+                self._index.query_radius(self._queries, 15), d_E_e):
+            np.testing.assert_equal(
+                np.sort(i), np.where(d_E_q <= 15)[0])
+            np.testing.assert_almost_equal(d_E, np.sort(d_E_q[i]), decimal=7)
+
+    def test_recall_query_radius(self):
+        """
+        Tests
+        :meth:`colour.difference.nearest.NearestColourIndex.query_radius`
+        method recall against brute force colour differences.
+        """
+
+        d_E_e = delta_E_pairwise(self._queries, self._colours)
+        within_e = d_E_e <= 20
+
+        recalls = []
+        for radius_factor in (1, 2, 3, 5, None):
+            neighbours = self._index.query_radius(self._queries, 20,
+                                                  radius_factor)
+            self.assertEqual(len(neighbours), len(self._queries))
+
+            found = 0
+            for (d_E, i), d_E_q, within_q in zip(neighbours, d_E_e,
+                                                 within_e):
+                self.assertTrue(np.all(within_q[i]))
+                np.testing.assert_almost_equal(d_E, d_E_q[i], decimal=7)
+                np.testing.assert_equal(d_E, np.sort(d_E))
+                found += len(i)
+
+            recalls.append(found / np.sum(within_e))
+
+        self.assertLess(recalls[0], 1)
+        np.testing.assert_equal(np.diff(recalls) >= 0, True)
+        self.assertEqual(recalls[-1], 1)
+
+        for (d_E, i), d_E_q in zip(
+                self._index.query_radius(self._queries, 20, None), d_E_e):
+            np.testing.assert_equal(np.sort(i), np.where(d_E_q <= 20)[0])
+
+        self.assertListEqual(
+            [len(i) for _d_E, i in self._index.query_radius(
+                self._queries, 0)], [0] * len(self._queries))
+
+    def test_read_write(self):
+        """
+        Tests :meth:`colour.difference.nearest.NearestColourIndex.read` and
+        :meth:`colour.difference.nearest.NearestColourIndex.write` methods.
+        """
+
+        path = os.path.join(self._temporary_directory, 'index.npz')
+        self.assertTrue(self._index.write(path))
+
+        index = NearestColourIndex.read(path)
+        self.assertListEqual(index.names, self._names)
+        for name in index.names:
+            self.assertIs(type(name), type(self._names[0]))
+        self.assertEqual(index.method, self._index.method)
+        self.assertEqual(index.candidates, self._index.candidates)
+        np.testing.assert_equal(index.colours, self._colours)
+        np.testing.assert_equal(
+            index.query(self._queries), self._index.query(self._queries))
+
+        index = NearestColourIndex(self._colours)
+        self.assertTrue(index.write(path))
+        index = NearestColourIndex.read(path)
+        self.assertIsNone(index.names)
+        np.testing.assert_equal(index.colours, self._colours)
+
+        index = NearestColourIndex(
+            self._colours, method='CIE 1994', textiles=True)
+        self.assertTrue(index.write(path))
+        np.testing.assert_equal(
+            NearestColourIndex.read(path).query(self._queries, k=4),
+            index.query(self._queries, k=4))
+        self.assertFalse(
+            np.allclose(
+                NearestColourIndex(self._colours, method='CIE 1994').query(
+                    self._queries, k=4)[0],
+                index.query(self._queries, k=4)[0]))
+
+    def test_raise_exception_write(self):
+        """
+        Tests :meth:`colour.difference.nearest.NearestColourIndex.write`
+        method raised exception.
+        """
+
+        path = os.path.join(self._temporary_directory, 'index.npz')
+        index = NearestColourIndex(self._colours, textiles=object())
+        self.assertRaises(ValueError, index.write, path)
+
+
+if __name__ == '__main__':
+    unittest.main()
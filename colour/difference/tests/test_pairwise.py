@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.difference.pairwise` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+
+from colour.difference import DELTA_E_METHODS, delta_E_pairwise
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['TestDelta_E_pairwise']
+
+
+class TestDelta_E_pairwise(unittest.TestCase):
+    """
+    Defines :func:`colour.difference.pairwise.delta_E_pairwise` definition
+    unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        state = np.random.RandomState(4)
+
+        self._a = state.uniform([0, -100, -100], [100, 100, 100], (24, 3))
+        self._b = state.uniform([0, -100, -100], [100, 100, 100], (37, 3))
+
+    def test_delta_E_pairwise(self):
+        """
+        Tests :func:`colour.difference.pairwise.delta_E_pairwise` definition.
+        """
+
+        for method in ('CIE 1976', 'CIE 1994', 'CIE 2000', 'CMC', 'DIN99',
+                       'CAM02-UCS', 'CAM16-LCD'):
+            np.testing.assert_almost_equal(
+                delta_E_pairwise(self._a, self._b, method),
+                DELTA_E_METHODS[method](self._a[:, np.newaxis],
+                                        self._b[np.newaxis]),
+                decimal=7)
+
+        np.testing.assert_almost_equal(
+            delta_E_pairwise(self._a, self._b, 'CIE 2000', textiles=True),
+            DELTA_E_METHODS['CIE 2000'](
+                self._a[:, np.newaxis], self._b[np.newaxis], textiles=True),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            delta_E_pairwise(self._a, self._b, 'CMC', l=1),
+            DELTA_E_METHODS['CMC'](
+                self._a[:, np.newaxis], self._b[np.newaxis], l=1),
+            decimal=7)
+
+        d_E = delta_E_pairwise(self._a)
+        self.assertTupleEqual(d_E.shape, (24, 24))
+        np.testing.assert_almost_equal(np.diag(d_E), np.zeros(24), decimal=7)
+
+    def test_tiling_delta_E_pairwise(self):
+        """
+        Tests :func:`colour.difference.pairwise.delta_E_pairwise` definition
+        tiling and threading.
+        """
+
+        d_E = delta_E_pairwise(self._a, self._b)
+
+        for memory_budget in (1, 8 * 64 * 10, 8 * 64 * 100):
+            np.testing.assert_equal(
+                delta_E_pairwise(
+                    self._a, self._b, memory_budget=memory_budget), d_E)
+
+        np.testing.assert_equal(
+            delta_E_pairwise(
+                self._a, self._b, memory_budget=8 * 64 * 10, threads=3), d_E)
+
+    def test_n_dimensional_delta_E_pairwise(self):
+        """
+        Tests :func:`colour.difference.pairwise.delta_E_pairwise` definition
+        n-dimensional arrays support.
+        """
+
+        d_E = delta_E_pairwise(self._a, self._b)
+
+        np.testing.assert_almost_equal(
+            delta_E_pairwise(
+                np.reshape(self._a, (4, 6, 3)), self._b),
+            np.reshape(d_E, (4, 6, 37)),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            delta_E_pairwise(self._a[0], self._b), d_E[0], decimal=7)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,16 +2,27 @@
 
 from __future__ import absolute_import
 
-from .ies_tm2714 import IES_TM2714_Spd
+from .ies_tm2714 import (IES_TM2714_Spd,
+                         read_multi_spd_from_ies_tm2714_directory)
 from .image import ImageAttribute_Specification, read_image, write_image
-from .tabular import (read_spectral_data_from_csv_file,
-                      read_spds_from_csv_file, write_spds_to_csv_file)
-from .xrite import read_spds_from_xrite_file
+from .tabular import (
+    iterate_spectral_array_from_csv_file, read_spectral_array_from_csv_file,
+    read_spectral_data_from_csv_file, read_spds_from_csv_file,
+    read_multi_spd_from_csv_file, write_spds_to_csv_file,
+    write_multi_spd_to_csv_file)
+from .xrite import (XRite_Row, iterate_xrite_file,
+                    read_spectral_data_from_xrite_file,
+                    read_spds_from_xrite_file)
 
-__all__ = ['IES_TM2714_Spd']
+__all__ = ['IES_TM2714_Spd', 'read_multi_spd_from_ies_tm2714_directory']
 __all__ += ['ImageAttribute_Specification', 'read_image', 'write_image']
 __all__ += [
-    'read_spectral_data_from_csv_file', 'read_spds_from_csv_file',
-    'write_spds_to_csv_file'
+    'iterate_spectral_array_from_csv_file',
+    'read_spectral_array_from_csv_file', 'read_spectral_data_from_csv_file',
+    'read_spds_from_csv_file', 'read_multi_spd_from_csv_file',
+    'write_spds_to_csv_file', 'write_multi_spd_to_csv_file'
+]
+__all__ += [
+    'XRite_Row', 'iterate_xrite_file', 'read_spectral_data_from_xrite_file',
+    'read_spds_from_xrite_file'
 ]
-__all__ += ['read_spds_from_xrite_file']
@@ -15,13 +15,16 @@ References
 
 from __future__ import division, unicode_literals
 
+import multiprocessing
+import numpy as np
 import os
-import re
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
+from multiprocessing.pool import ThreadPool
 from xml.etree import ElementTree
 from xml.dom import minidom
 
-from colour.colorimetry import SpectralPowerDistribution
+from colour.colorimetry import (MultiSpectralPowerDistribution,
+                                SpectralPowerDistribution)
 from colour.constants import DEFAULT_FLOAT_DTYPE
 from colour.utilities import Structure, is_numeric, is_string, tstack
 
@@ -34,7 +37,8 @@ __status__ = 'Production'
 
 __all__ = [
     'IES_TM2714_VERSION', 'IES_TM2714_NAMESPACE',
-    'IES_TM2714_ElementSpecification', 'IES_TM2714_Header', 'IES_TM2714_Spd'
+    'IES_TM2714_ElementSpecification', 'IES_TM2714_Header', 'IES_TM2714_Spd',
+    'read_multi_spd_from_ies_tm2714_directory'
 ]
 
 IES_TM2714_VERSION = '1.0'
@@ -950,36 +954,15 @@ class IES_TM2714_Spd(SpectralPowerDistribution):
         0.0339999...
         """
 
-        formatter = './{{{0}}}{1}/{{{0}}}{2}'
-
-        tree = ElementTree.parse(self._path)
-        root = tree.getroot()
-
-        namespace = re.match('{(.*)}', root.tag).group(1)
-
         self.name = os.path.splitext(os.path.basename(self._path))[0]
 
-        iterator = root.iter
+        wavelengths, values, metadata = _parse_IES_TM2714_file(self._path)
 
         for header_element in (self.header, self):
-            mapping = header_element.mapping
-            for specification in mapping.elements:
-                element = root.find(
-                    formatter.format(namespace, mapping.element,
-                                     specification.element))
-                if element is not None:
+            for specification in header_element.mapping.elements:
+                if specification.attribute in metadata:
                     setattr(header_element, specification.attribute,
-                            specification.read_conversion(element.text))
-
-        # Reading spectral data.
-        wavelengths = []
-        values = []
-        for spectral_data in iterator(
-                '{{{0}}}{1}'.format(namespace, self.mapping.data.element)):
-            wavelengths.append(
-                DEFAULT_FLOAT_DTYPE(spectral_data.attrib[
-                    self.mapping.data.attribute]))
-            values.append(DEFAULT_FLOAT_DTYPE(spectral_data.text))
+                            metadata[specification.attribute])
 
         self.wavelengths = wavelengths
         self.values = values
@@ -1046,3 +1029,194 @@ class IES_TM2714_Spd(SpectralPowerDistribution):
             file.write(xml)
 
         return True
+
+
+_IES_TM2714_SPECIFICATIONS_CACHE = None
+
+
+def _IES_TM2714_specifications():
+    """
+    Returns the *IES TM-27-14* header and spectral description elements
+    specifications keyed by their parent and own element names.
+
+    Returns
+    -------
+    dict
+        *IES TM-27-14* elements specifications.
+    """
+
+    global _IES_TM2714_SPECIFICATIONS_CACHE
+
+    if _IES_TM2714_SPECIFICATIONS_CACHE is None:
+        _IES_TM2714_SPECIFICATIONS_CACHE = OrderedDict(
+            ((mapping.element, specification.element), specification)
+            for mapping in (IES_TM2714_Header().mapping,
+                            IES_TM2714_Spd().mapping)
+            for specification in mapping.elements)
+
+    return _IES_TM2714_SPECIFICATIONS_CACHE
+
+
+def _parse_IES_TM2714_file(path):
+    """
+    Parses given *IES TM-27-14* spectral data XML file incrementally.
+
+    The file is parsed with :func:`xml.etree.ElementTree.iterparse`
+    definition, the spectral data elements are discarded once read and their
+    wavelengths and values converted to arrays at once.
+
+    Parameters
+    ----------
+    path : unicode
+        Spectral data XML file path.
+
+    Returns
+    -------
+    tuple
+        Wavelengths, values and *OrderedDict* of the header and spectral
+        description attributes defined by the file.
+    """
+
+    specifications = _IES_TM2714_specifications()
+    data = IES_TM2714_ElementSpecification('SpectralData', 'wavelength')
+
+    metadata, wavelengths, values = OrderedDict(), [], []
+    elements = []
+    for event, element in ElementTree.iterparse(path, ('start', 'end')):
+        tag = element.tag.rsplit('}', 1)[-1]
+
+        if event == 'start':
+            elements.append(tag)
+            continue
+
+        elements.pop()
+
+        if tag == data.element:
+            wavelengths.append(element.attrib[data.attribute])
+            values.append(element.text)
+            element.clear()
+        elif elements:
+            specification = specifications.get((elements[-1], tag))
+            if specification is not None:
+                metadata[specification.attribute] = (
+                    specification.read_conversion(element.text))
+
+    return (np.array(wavelengths, dtype=DEFAULT_FLOAT_DTYPE),
+            np.array(values, dtype=DEFAULT_FLOAT_DTYPE), metadata)
+
+
+def read_multi_spd_from_ies_tm2714_directory(directory,
+                                             extension='.spdx',
+                                             shape=None,
+                                             processes=None,
+                                             threads=None):
+    """
+    Reads the *IES TM-27-14* spectral data XML files of given directory into a
+    :class:`colour.MultiSpectralPowerDistribution` class instance labeled
+    after the files names and collects their header metadata into a
+    structured array.
+
+    Parameters
+    ----------
+    directory : unicode
+        Directory containing the spectral data XML files.
+    extension : unicode, optional
+        Spectral data XML files extension.
+    shape : SpectralShape, optional
+        Spectral shape the spectral power distributions are aligned to,
+        required if the files wavelengths differ.
+    processes : int, optional
+        Processes count used to parse the files, default to *1*, i.e. no
+        :class:`multiprocessing.Pool` class instance is created.
+    threads : int, optional
+        Threads count used to parse the files if no processes count is given,
+        default to *1*, i.e. no :class:`multiprocessing.pool.ThreadPool` class
+        instance is created.
+
+    Returns
+    -------
+    tuple
+        Multi-spectral power distribution and metadata structured array of
+        shape (N, ) with a *path* field and a field per
+        :class:`colour.io.IES_TM2714_Header` and
+        :class:`colour.IES_TM2714_Spd` class attributes, *None* if undefined
+        in the file.
+
+    Raises
+    ------
+    RuntimeError
+        If the directory does not contain any spectral data XML file or if
+        the files wavelengths differ and no spectral shape is given.
+
+    Examples
+    --------
+    >>> from os.path import dirname, join
+    >>> directory = join(dirname(__file__), 'tests', 'resources')
+    >>> multi_spd, metadata = read_multi_spd_from_ies_tm2714_directory(
+    ...     directory)
+    >>> multi_spd.labels
+    ['Fluorescent']
+    >>> metadata['description'][0]
+    'Rare earth fluorescent lamp'
+    >>> multi_spd[501.7]
+    array([ 0.095])
+    """
+
+    paths = sorted(
+        os.path.join(directory, filename) for filename in os.listdir(directory)
+        if filename.lower().endswith(extension.lower()))
+
+    if not paths:
+        raise RuntimeError(
+            ('"{0}" directory does not contain any "IES TM-27-14" spectral '
+             'data XML file with "{1}" extension!').format(
+                 directory, extension))
+
+    if processes is not None and processes != 1:
+        pool = multiprocessing.Pool(processes=processes)
+    elif threads is not None and threads != 1:
+        pool = ThreadPool(processes=threads)
+    else:
+        pool = None
+
+    if pool is None:
+        results = [_parse_IES_TM2714_file(path) for path in paths]
+    else:
+        try:
+            results = pool.map(_parse_IES_TM2714_file, paths)
+        finally:
+            pool.close()
+            pool.join()
+
+    if shape is None:
+        wavelengths = results[0][0]
+        if not all(
+                np.array_equal(result[0], wavelengths) for result in results):
+            raise RuntimeError(
+                ('Cannot read "IES TM-27-14" spectral data XML files with '
+                 'different wavelengths without a spectral shape!'))
+
+        values = np.column_stack([result[1] for result in results])
+    else:
+        wavelengths = shape.range()
+        values = np.column_stack([
+            SpectralPowerDistribution(result[1], result[0]).align(shape).values
+            for result in results
+        ])
+
+    labels = [os.path.splitext(os.path.basename(path))[0] for path in paths]
+
+    attributes = [
+        specification.attribute
+        for specification in _IES_TM2714_specifications().values()
+    ]
+    metadata = np.empty(
+        len(paths),
+        dtype=[(str(attribute), object)
+               for attribute in ['path'] + attributes])
+    for i, (path, result) in enumerate(zip(paths, results)):
+        metadata[i] = tuple(
+            [path] + [result[2].get(attribute) for attribute in attributes])
+
+    return (MultiSpectralPowerDistribution(
+        values, wavelengths, labels=labels), metadata)
@@ -5,17 +5,25 @@ CSV Tabular Data Input / Output
 
 Defines various input / output objects for *CSV* tabular data files:
 
+-   :func:`colour.iterate_spectral_array_from_csv_file`
+-   :func:`colour.read_spectral_array_from_csv_file`
 -   :func:`colour.read_spectral_data_from_csv_file`
 -   :func:`colour.read_spds_from_csv_file`
+-   :func:`colour.read_multi_spd_from_csv_file`
 -   :func:`colour.write_spds_to_csv_file`
+-   :func:`colour.write_multi_spd_to_csv_file`
 """
 
 from __future__ import division, unicode_literals
 
 from collections import OrderedDict
 import csv
+import numpy as np
+import warnings
+from itertools import islice
 
-from colour.colorimetry import SpectralPowerDistribution
+from colour.colorimetry import (MultiSpectralPowerDistribution,
+                                SpectralPowerDistribution)
 from colour.constants import DEFAULT_FLOAT_DTYPE
 
 __author__ = 'Colour Developers'
@@ -26,10 +34,209 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
 __all__ = [
-    'read_spectral_data_from_csv_file', 'read_spds_from_csv_file',
-    'write_spds_to_csv_file'
+    'CSV_CHUNK_SIZE', 'iterate_spectral_array_from_csv_file',
+    'read_spectral_array_from_csv_file', 'read_spectral_data_from_csv_file',
+    'read_spds_from_csv_file', 'read_multi_spd_from_csv_file',
+    'write_spds_to_csv_file', 'write_multi_spd_to_csv_file'
 ]
 
+CSV_CHUNK_SIZE = 65536
+"""
+Default count of rows read or written at once by the *CSV* tabular data
+bulk input / output objects.
+
+CSV_CHUNK_SIZE : int
+"""
+
+
+def _parse_csv_lines(lines, delimiter, columns, default):
+    """
+    Parses given *CSV* file lines into an array.
+
+    The lines are parsed at once by :func:`numpy.fromstring` definition, if
+    a line has a different count of values than the columns or missing or
+    non-numeric values, the lines are parsed again one by one.
+
+    Parameters
+    ----------
+    lines : list
+        *CSV* file lines.
+    delimiter : unicode
+        *CSV* file content delimiter.
+    columns : int
+        Count of columns.
+    default : numeric
+        Default value for fields row with missing value.
+
+    Returns
+    -------
+    ndarray
+        Array of shape (len(lines), columns).
+    """
+
+    # The bulk parsing only checks the total count of values, the lines with
+    # a different count of values, which could cancel each other, must be
+    # parsed one by one to keep the columns aligned.
+    if all(line.count(delimiter) == columns - 1 for line in lines):
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                values = np.fromstring(
+                    delimiter.join(lines),
+                    dtype=DEFAULT_FLOAT_DTYPE,
+                    sep=delimiter)
+        except ValueError:
+            values = np.array([])
+
+        if values.size == len(lines) * columns:
+            return np.reshape(values, (len(lines), columns))
+
+    values = np.full((len(lines), columns), default, dtype=DEFAULT_FLOAT_DTYPE)
+    for i, line in enumerate(lines):
+        for j, token in enumerate(line.split(delimiter)[:columns]):
+            try:
+                values[i, j] = DEFAULT_FLOAT_DTYPE(token)
+            except ValueError:
+                pass
+
+    return values
+
+
+def iterate_spectral_array_from_csv_file(path,
+                                         delimiter=',',
+                                         fields=None,
+                                         default=0,
+                                         chunk_size=CSV_CHUNK_SIZE):
+    """
+    Lazily reads the spectral data from given *CSV* file by chunks of rows,
+    allowing to process files larger than the available memory.
+
+    Parameters
+    ----------
+    path : unicode
+        Absolute *CSV* file path.
+    delimiter : unicode, optional
+        *CSV* file content delimiter.
+    fields : array_like, optional
+        *CSV* file spectral data fields names. If no value is provided the
+        first line of the file will be used as spectral data fields names.
+    default : numeric, optional
+        Default value for fields row with missing value.
+    chunk_size : int, optional
+        Count of rows per chunk.
+
+    Returns
+    -------
+    generator
+        Wavelengths of shape (R, ), values of shape (R, N) and spectral data
+        fields names of each chunk of :math:`R` rows.
+
+    Raises
+    ------
+    RuntimeError
+        If the *CSV* spectral data file doesn't define the appropriate fields.
+
+    Examples
+    --------
+    >>> import os
+    >>> csv_file = os.path.join(os.path.dirname(__file__), 'tests',
+    ...                         'resources', 'colorchecker_n_ohta.csv')
+    >>> for wavelengths, values, fields in (
+    ...         iterate_spectral_array_from_csv_file(csv_file, chunk_size=32)):
+    ...     print(wavelengths[0], values.shape)
+    380.0 (32, 24)
+    540.0 (32, 24)
+    700.0 (17, 24)
+    """
+
+    with open(path) as csv_file:
+        if fields is None:
+            for line in csv_file:
+                if line.strip():
+                    fields = next(
+                        csv.reader([line.strip()], delimiter=str(delimiter)))
+                    break
+
+        fields = list(fields) if fields is not None else []
+        if len(fields) <= 1:
+            raise RuntimeError(('A "CSV" spectral data file should define '
+                                'the following fields: '
+                                '("wavelength", "field 1", ..., "field n")!'))
+
+        while True:
+            lines = [
+                line.strip() for line in islice(csv_file, chunk_size)
+            ]
+            if not lines:
+                break
+
+            lines = [line for line in lines if line]
+            if lines:
+                values = _parse_csv_lines(lines, delimiter, len(fields),
+                                          default)
+
+                yield values[:, 0], values[:, 1:], fields[1:]
+
+
+def read_spectral_array_from_csv_file(path,
+                                      delimiter=',',
+                                      fields=None,
+                                      default=0,
+                                      chunk_size=CSV_CHUNK_SIZE):
+    """
+    Reads the spectral data from given *CSV* file and returns it as an array.
+
+    Parameters
+    ----------
+    path : unicode
+        Absolute *CSV* file path.
+    delimiter : unicode, optional
+        *CSV* file content delimiter.
+    fields : array_like, optional
+        *CSV* file spectral data fields names. If no value is provided the
+        first line of the file will be used as spectral data fields names.
+    default : numeric, optional
+        Default value for fields row with missing value.
+    chunk_size : int, optional
+        Count of rows parsed at once.
+
+    Returns
+    -------
+    tuple
+        Wavelengths of shape (W, ), values of shape (W, N) and spectral data
+        fields names.
+
+    Raises
+    ------
+    RuntimeError
+        If the *CSV* spectral data file doesn't define the appropriate fields.
+
+    Examples
+    --------
+    >>> import os
+    >>> csv_file = os.path.join(os.path.dirname(__file__), 'tests',
+    ...                         'resources', 'colorchecker_n_ohta.csv')
+    >>> wavelengths, values, fields = read_spectral_array_from_csv_file(
+    ...     csv_file)
+    >>> values.shape
+    (81, 24)
+    >>> values[0, :4]
+    array([ 0.048,  0.103,  0.113,  0.048])
+    """
+
+    chunks = list(
+        iterate_spectral_array_from_csv_file(path, delimiter, fields, default,
+                                             chunk_size))
+
+    if not chunks:
+        return np.array([]), np.empty((0, 0)), []
+
+    if len(chunks) == 1:
+        return chunks[0]
+
+    return (np.concatenate([chunk[0] for chunk in chunks]),
+            np.concatenate([chunk[1] for chunk in chunks]), chunks[0][2])
+
 
 def read_spectral_data_from_csv_file(path,
                                      delimiter=',',
@@ -115,27 +322,11 @@ def read_spectral_data_from_csv_file(path,
      '24']
     """
 
-    with open(path, 'rU') as csv_file:
-        reader = csv.DictReader(
-            csv_file, delimiter=str(delimiter), fieldnames=fields)
-        if len(reader.fieldnames) == 1:
-            raise RuntimeError(('A "CSV" spectral data file should define '
-                                'the following fields: '
-                                '("wavelength", "field 1", ..., "field n")!'))
-
-        wavelength = reader.fieldnames[0]
-        fields = reader.fieldnames[1:]
+    wavelengths, values, fields = read_spectral_array_from_csv_file(
+        path, delimiter, fields, default)
 
-        data = OrderedDict(zip(fields, ({} for _ in range(len(fields)))))
-        for line in reader:
-            for field in fields:
-                try:
-                    value = DEFAULT_FLOAT_DTYPE(line[field])
-                except ValueError:
-                    value = default
-
-                data[field][DEFAULT_FLOAT_DTYPE(line[wavelength])] = value
-        return data
+    return OrderedDict((field, dict(zip(wavelengths, values[:, i])))
+                       for i, field in enumerate(fields))
 
 
 def read_spds_from_csv_file(path, delimiter=',', fields=None, default=0):
@@ -259,13 +450,109 @@ def read_spds_from_csv_file(path, delimiter=',', fields=None, default=0):
                               extrapolator_args={...})
     """
 
-    data = read_spectral_data_from_csv_file(path, delimiter, fields, default)
+    wavelengths, values, fields = read_spectral_array_from_csv_file(
+        path, delimiter, fields, default)
+
+    indexes = np.argsort(wavelengths, kind='mergesort')
+    wavelengths, values = wavelengths[indexes], values[indexes]
 
-    spds = OrderedDict(((key, SpectralPowerDistribution(value, name=key))
-                        for key, value in data.items()))
+    spds = OrderedDict(
+        ((field, SpectralPowerDistribution(
+            values[:, i], wavelengths, name=field))
+         for i, field in enumerate(fields)))
     return spds
 
 
+def read_multi_spd_from_csv_file(path,
+                                 delimiter=',',
+                                 fields=None,
+                                 default=0,
+                                 chunk_size=CSV_CHUNK_SIZE):
+    """
+    Reads the spectral data from given *CSV* file and return its content as a
+    :class:`colour.MultiSpectralPowerDistribution` class instance.
+
+    Parameters
+    ----------
+    path : unicode
+        Absolute *CSV* file path.
+    delimiter : unicode, optional
+        *CSV* file content delimiter.
+    fields : array_like, optional
+        *CSV* file spectral data fields names. If no value is provided the
+        first line of the file will be used for as spectral data fields names.
+    default : numeric
+        Default value for fields row with missing value.
+    chunk_size : int, optional
+        Count of rows parsed at once.
+
+    Returns
+    -------
+    MultiSpectralPowerDistribution
+        Multi-spectral power distribution of given *CSV* file.
+
+    Examples
+    --------
+    >>> import os
+    >>> csv_file = os.path.join(os.path.dirname(__file__), 'tests',
+    ...                         'resources', 'colorchecker_n_ohta.csv')
+    >>> multi_spd = read_multi_spd_from_csv_file(csv_file)
+    >>> multi_spd.labels[:4]
+    ['1', '2', '3', '4']
+    >>> multi_spd[380][:4]
+    array([ 0.048,  0.103,  0.113,  0.048])
+    """
+
+    wavelengths, values, fields = read_spectral_array_from_csv_file(
+        path, delimiter, fields, default, chunk_size)
+
+    indexes = np.argsort(wavelengths, kind='mergesort')
+
+    return MultiSpectralPowerDistribution(
+        values[indexes], wavelengths[indexes], labels=fields)
+
+
+def _write_spectral_array_to_csv_file(wavelengths, values, fields, path,
+                                      delimiter, chunk_size):
+    """
+    Writes given spectral data array to given *CSV* file by chunks of rows.
+
+    Parameters
+    ----------
+    wavelengths : array_like
+        Wavelengths of shape (W, ).
+    values : array_like
+        Values of shape (W, N).
+    fields : array_like
+        Spectral data fields names.
+    path : unicode
+        Absolute *CSV* file path.
+    delimiter : unicode
+        *CSV* file content delimiter.
+    chunk_size : int
+        Count of rows written at once.
+
+    Returns
+    -------
+    bool
+        Definition success.
+    """
+
+    data = np.column_stack([wavelengths, values])
+
+    with open(path, 'w') as csv_file:
+        writer = csv.writer(
+            csv_file, delimiter=str(delimiter), lineterminator='\n')
+        writer.writerow(['wavelength'] + list(fields))
+
+        for i in range(0, data.shape[0], chunk_size):
+            csv_file.write(''.join(
+                delimiter.join(map(repr, row)) + '\n'
+                for row in data[i:i + chunk_size].tolist()))
+
+    return True
+
+
 def write_spds_to_csv_file(spds, path, delimiter=',', fields=None):
     """
     Writes the given spectral power distributions to given *CSV* file.
@@ -301,20 +588,42 @@ def write_spds_to_csv_file(spds, path, delimiter=',', fields=None):
                                 'with different shapes to "CSV" file!'))
 
     wavelengths = tuple(spds.values())[0].wavelengths
-    with open(path, 'w') as csv_file:
-        fields = list(fields) if fields is not None else sorted(spds.keys())
-        writer = csv.DictWriter(
-            csv_file,
-            delimiter=str(delimiter),
-            fieldnames=['wavelength'] + fields,
-            lineterminator='\n')
-        # Python 2.7.x / 3.4.x only.
-        # writer.writeheader()
-        writer.writerow(dict((name, name) for name in writer.fieldnames))
-        for wavelength in wavelengths:
-            row = {'wavelength': wavelength}
-            row.update(
-                dict((field, spds[field][wavelength]) for field in fields))
-            writer.writerow(row)
+    fields = list(fields) if fields is not None else sorted(spds.keys())
+
+    return _write_spectral_array_to_csv_file(
+        wavelengths,
+        np.column_stack([
+            spds[field].values
+            if np.array_equal(spds[field].wavelengths, wavelengths) else
+            spds[field][wavelengths] for field in fields
+        ]),
+        fields, path, delimiter, CSV_CHUNK_SIZE)
+
+
+def write_multi_spd_to_csv_file(multi_spd,
+                                path,
+                                delimiter=',',
+                                chunk_size=CSV_CHUNK_SIZE):
+    """
+    Writes the given multi-spectral power distribution to given *CSV* file.
 
-    return True
+    Parameters
+    ----------
+    multi_spd : MultiSpectralPowerDistribution
+        Multi-spectral power distribution to write.
+    path : unicode
+        Absolute *CSV* file path.
+    delimiter : unicode, optional
+        *CSV* file content delimiter.
+    chunk_size : int, optional
+        Count of rows written at once.
+
+    Returns
+    -------
+    bool
+        Definition success.
+    """
+
+    return _write_spectral_array_to_csv_file(
+        multi_spd.wavelengths, multi_spd.values, multi_spd.labels, path,
+        delimiter, chunk_size)
@@ -11,8 +11,9 @@ import shutil
 import unittest
 import tempfile
 
-from colour.colorimetry import SpectralPowerDistribution
-from colour.io.ies_tm2714 import IES_TM2714_Header, IES_TM2714_Spd
+from colour.colorimetry import SpectralPowerDistribution, SpectralShape
+from colour.io.ies_tm2714 import (IES_TM2714_Header, IES_TM2714_Spd,
+                                  read_multi_spd_from_ies_tm2714_directory)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -24,7 +25,8 @@ __status__ = 'Production'
 __all__ = [
     'RESOURCES_DIRECTORY', 'FLUORESCENT_FILE_HEADER',
     'FLUORESCENT_FILE_SPECTRAL_DESCRIPTION', 'FLUORESCENT_FILE_SPECTRAL_DATA',
-    'TestIES_TM2714_Header', 'TestIES_TM2714_Spd'
+    'TestIES_TM2714_Header', 'TestIES_TM2714_Spd',
+    'TestReadMultiSpdFromIES_TM2714Directory'
 ]
 
 RESOURCES_DIRECTORY = os.path.join(os.path.dirname(__file__), 'resources')
@@ -249,5 +251,114 @@ class TestIES_TM2714_Spd(unittest.TestCase):
         self.assertEquals(spd_r, spd_t)
 
 
+class TestReadMultiSpdFromIES_TM2714Directory(unittest.TestCase):
+    """
+    Defines
+    :func:`colour.io.ies_tm2714.read_multi_spd_from_ies_tm2714_directory`
+    definition units tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+        for name in ('Fluorescent_1', 'Fluorescent_2', 'Fluorescent_3'):
+            shutil.copyfile(
+                os.path.join(RESOURCES_DIRECTORY, 'Fluorescent.spdx'),
+                os.path.join(self._temporary_directory,
+                             '{0}.spdx'.format(name)))
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_read_multi_spd_from_ies_tm2714_directory(self):
+        """
+        Tests
+        :func:`colour.io.ies_tm2714.read_multi_spd_from_ies_tm2714_directory`
+        definition.
+        """
+
+        spd = IES_TM2714_Spd(
+            os.path.join(RESOURCES_DIRECTORY, 'Fluorescent.spdx'))
+        spd.read()
+
+        multi_spd, metadata = read_multi_spd_from_ies_tm2714_directory(
+            self._temporary_directory)
+
+        self.assertListEqual(
+            multi_spd.labels,
+            ['Fluorescent_1', 'Fluorescent_2', 'Fluorescent_3'])
+        np.testing.assert_array_equal(multi_spd.wavelengths, spd.wavelengths)
+        np.testing.assert_array_equal(multi_spd.values,
+                                      np.tile(spd.values[:, np.newaxis],
+                                              (1, 3)))
+
+        self.assertEqual(metadata.shape, (3, ))
+        self.assertEqual(metadata['path'][1],
+                         os.path.join(self._temporary_directory,
+                                      'Fluorescent_2.spdx'))
+        for test, read in ((FLUORESCENT_FILE_HEADER, spd.header),
+                           (FLUORESCENT_FILE_SPECTRAL_DESCRIPTION, spd)):
+            for key, value in test.items():
+                for specification in read.mapping.elements:
+                    if key == specification.element:
+                        self.assertEqual(
+                            metadata[specification.attribute][2], value)
+        self.assertIsNone(metadata['reflection_geometry'][0])
+
+        for kwargs in ({'processes': 2}, {'threads': 2}):
+            multi_spd_p, metadata_p = (
+                read_multi_spd_from_ies_tm2714_directory(
+                    self._temporary_directory, **kwargs))
+            np.testing.assert_array_equal(multi_spd_p.values,
+                                          multi_spd.values)
+            self.assertListEqual(metadata_p.tolist(), metadata.tolist())
+
+    def test_raise_exception_read_multi_spd_from_ies_tm2714_directory(self):
+        """
+        Tests
+        :func:`colour.io.ies_tm2714.read_multi_spd_from_ies_tm2714_directory`
+        definition raised exception and spectral shape alignment.
+        """
+
+        spd = IES_TM2714_Spd(
+            os.path.join(RESOURCES_DIRECTORY, 'Fluorescent.spdx'))
+        spd.read()
+        spd.path = os.path.join(self._temporary_directory,
+                                'Fluorescent_4.spdx')
+        spd.wavelengths = spd.wavelengths + 1
+        spd.write()
+
+        self.assertRaises(RuntimeError,
+                          read_multi_spd_from_ies_tm2714_directory,
+                          self._temporary_directory)
+
+        shape = SpectralShape(420, 700, 10)
+        multi_spd, _metadata = read_multi_spd_from_ies_tm2714_directory(
+            self._temporary_directory, shape=shape)
+        np.testing.assert_array_equal(multi_spd.wavelengths, shape.range())
+        np.testing.assert_almost_equal(
+            multi_spd.values[:, 3],
+            spd.copy().align(shape).values,
+            decimal=7)
+
+        self.assertRaises(RuntimeError,
+                          read_multi_spd_from_ies_tm2714_directory,
+                          self._temporary_directory,
+                          extension='.xml')
+
+        directory = os.path.join(self._temporary_directory, 'empty')
+        os.mkdir(directory)
+        self.assertRaises(RuntimeError,
+                          read_multi_spd_from_ies_tm2714_directory, directory)
+
+
 if __name__ == '__main__':
     unittest.main()
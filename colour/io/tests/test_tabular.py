@@ -12,9 +12,13 @@ import unittest
 import tempfile
 from six import PY2, text_type
 
-from colour.colorimetry import SpectralPowerDistribution
-from colour.io import (read_spectral_data_from_csv_file,
-                       read_spds_from_csv_file, write_spds_to_csv_file)
+from colour.colorimetry import (MultiSpectralPowerDistribution,
+                                SpectralPowerDistribution)
+from colour.io import (
+    iterate_spectral_array_from_csv_file, read_multi_spd_from_csv_file,
+    read_spectral_array_from_csv_file, read_spectral_data_from_csv_file,
+    read_spds_from_csv_file, write_multi_spd_to_csv_file,
+    write_spds_to_csv_file)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -25,8 +29,10 @@ __status__ = 'Production'
 
 __all__ = [
     'RESOURCES_DIRECTORY', 'COLOURCHECKER_N_OHTA_1',
-    'TestReadSpectralDataFromCsvFile', 'TestReadSpdsFromCsvFile',
-    'TestWriteSpdsToCsvFile'
+    'TestIterateSpectralArrayFromCsvFile',
+    'TestReadSpectralArrayFromCsvFile', 'TestReadSpectralDataFromCsvFile',
+    'TestReadSpdsFromCsvFile', 'TestReadMultiSpdFromCsvFile',
+    'TestWriteSpdsToCsvFile', 'TestWriteMultiSpdToCsvFile'
 ]
 
 RESOURCES_DIRECTORY = os.path.join(os.path.dirname(__file__), 'resources')
@@ -116,6 +122,100 @@ COLOURCHECKER_N_OHTA_1 = {
 }
 
 
+class TestIterateSpectralArrayFromCsvFile(unittest.TestCase):
+    """
+    Defines :func:`colour.io.tabular.iterate_spectral_array_from_csv_file`
+    definition units tests methods.
+    """
+
+    def test_iterate_spectral_array_from_csv_file(self):
+        """
+        Tests :func:`colour.io.tabular.iterate_spectral_array_from_csv_file`
+        definition.
+        """
+
+        colour_checker_n_ohta = os.path.join(RESOURCES_DIRECTORY,
+                                             'colorchecker_n_ohta.csv')
+        chunks = list(
+            iterate_spectral_array_from_csv_file(
+                colour_checker_n_ohta, chunk_size=20))
+        self.assertListEqual([chunk[1].shape for chunk in chunks],
+                             [(20, 24)] * 4 + [(1, 24)])
+
+        wavelengths, values, fields = read_spectral_array_from_csv_file(
+            colour_checker_n_ohta)
+        np.testing.assert_equal(
+            np.concatenate([chunk[0] for chunk in chunks]), wavelengths)
+        np.testing.assert_equal(
+            np.concatenate([chunk[1] for chunk in chunks]), values)
+        for chunk in chunks:
+            self.assertListEqual(chunk[2], fields)
+
+        self.assertRaises(RuntimeError, lambda: list(
+            iterate_spectral_array_from_csv_file(
+                colour_checker_n_ohta, fields=['wavelength'])))
+
+
+class TestReadSpectralArrayFromCsvFile(unittest.TestCase):
+    """
+    Defines :func:`colour.io.tabular.read_spectral_array_from_csv_file`
+    definition units tests methods.
+    """
+
+    def test_read_spectral_array_from_csv_file(self):
+        """
+        Tests :func:`colour.io.tabular.read_spectral_array_from_csv_file`
+        definition.
+        """
+
+        colour_checker_n_ohta = os.path.join(RESOURCES_DIRECTORY,
+                                             'colorchecker_n_ohta.csv')
+        wavelengths, values, fields = read_spectral_array_from_csv_file(
+            colour_checker_n_ohta)
+        self.assertListEqual(fields, [text_type(x) for x in range(1, 25)])
+        np.testing.assert_equal(wavelengths,
+                                sorted(COLOURCHECKER_N_OHTA_1.keys()))
+        np.testing.assert_equal(values[:, 0], [
+            COLOURCHECKER_N_OHTA_1[wavelength]
+            for wavelength in sorted(COLOURCHECKER_N_OHTA_1.keys())
+        ])
+
+        np.testing.assert_equal(
+            read_spectral_array_from_csv_file(
+                colour_checker_n_ohta, chunk_size=7)[1], values)
+
+        linss2_10e_5 = os.path.join(RESOURCES_DIRECTORY, 'linss2_10e_5.csv')
+        wavelengths, values, fields = read_spectral_array_from_csv_file(
+            linss2_10e_5,
+            fields=['wavelength', 'l_bar', 'm_bar', 's_bar'],
+            default=-1)
+        self.assertListEqual(fields, ['l_bar', 'm_bar', 's_bar'])
+        self.assertEqual(wavelengths[-1], 830)
+        np.testing.assert_equal(values[-1], [9.74306E-07, 9.53411E-08, -1])
+        np.testing.assert_equal(values[0],
+                                [4.15003E-04, 3.68349E-04, 9.54729E-03])
+
+    def test_ragged_read_spectral_array_from_csv_file(self):
+        """
+        Tests :func:`colour.io.tabular.read_spectral_array_from_csv_file`
+        definition with rows having a different count of values.
+        """
+
+        temporary_directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(temporary_directory, 'ragged.csv')
+            with open(path, 'w') as csv_file:
+                csv_file.write('wavelength,a,b\n380,1,2\n390,3\n400,5,6,7\n')
+
+            wavelengths, values, fields = read_spectral_array_from_csv_file(
+                path, default=-1)
+            self.assertListEqual(fields, ['a', 'b'])
+            np.testing.assert_equal(wavelengths, [380, 390, 400])
+            np.testing.assert_equal(values, [[1, 2], [3, -1], [5, 6]])
+        finally:
+            shutil.rmtree(temporary_directory)
+
+
 class TestReadSpectralDataFromCsvFile(unittest.TestCase):
     """
     Defines :func:`colour.io.tabular.read_spectral_data_from_csv_file`
@@ -170,6 +270,30 @@ class TestReadSpdsFromCsvFile(unittest.TestCase):
                              COLOURCHECKER_N_OHTA_1, name='1'))
 
 
+class TestReadMultiSpdFromCsvFile(unittest.TestCase):
+    """
+    Defines :func:`colour.io.tabular.read_multi_spd_from_csv_file` definition
+    units tests methods.
+    """
+
+    def test_read_multi_spd_from_csv_file(self):
+        """
+        Tests :func:`colour.io.tabular.read_multi_spd_from_csv_file`
+        definition.
+        """
+
+        colour_checker_n_ohta = os.path.join(RESOURCES_DIRECTORY,
+                                             'colorchecker_n_ohta.csv')
+        multi_spd = read_multi_spd_from_csv_file(colour_checker_n_ohta)
+        self.assertIsInstance(multi_spd, MultiSpectralPowerDistribution)
+
+        spds = read_spds_from_csv_file(colour_checker_n_ohta)
+        self.assertListEqual(multi_spd.labels, list(spds.keys()))
+        np.testing.assert_equal(
+            multi_spd.values,
+            np.column_stack([spd.values for spd in spds.values()]))
+
+
 class TestWriteSpdsToCsvFile(unittest.TestCase):
     """
     Defines :func:`colour.io.tabular.write_spds_to_csv_file` definition units
@@ -220,5 +344,48 @@ class TestWriteSpdsToCsvFile(unittest.TestCase):
         self.assertEqual(len(spds_test), 1)
 
 
+class TestWriteMultiSpdToCsvFile(unittest.TestCase):
+    """
+    Defines :func:`colour.io.tabular.write_multi_spd_to_csv_file` definition
+    units tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_write_multi_spd_to_csv_file(self):
+        """
+        Tests :func:`colour.io.tabular.write_multi_spd_to_csv_file`
+        definition.
+        """
+
+        colour_checker_n_ohta = os.path.join(RESOURCES_DIRECTORY,
+                                             'colorchecker_n_ohta.csv')
+        multi_spd = read_multi_spd_from_csv_file(colour_checker_n_ohta)
+        colour_checker_n_ohta_test = os.path.join(self._temporary_directory,
+                                                  'colorchecker_n_ohta.csv')
+        self.assertTrue(
+            write_multi_spd_to_csv_file(
+                multi_spd, colour_checker_n_ohta_test, chunk_size=16))
+
+        multi_spd_test = read_multi_spd_from_csv_file(
+            colour_checker_n_ohta_test)
+        self.assertListEqual(multi_spd_test.labels, multi_spd.labels)
+        np.testing.assert_equal(multi_spd_test.wavelengths,
+                                multi_spd.wavelengths)
+        np.testing.assert_equal(multi_spd_test.values, multi_spd.values)
+
+
 if __name__ == '__main__':
     unittest.main()
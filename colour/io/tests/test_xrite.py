@@ -5,11 +5,15 @@ Defines unit tests for :mod:`colour.io.xrite` module.
 
 from __future__ import division, unicode_literals
 
+import numpy as np
 import os
+import shutil
+import tempfile
 import unittest
 
 from colour.colorimetry import SpectralPowerDistribution
-from colour.io import read_spds_from_xrite_file
+from colour.io import (iterate_xrite_file, read_spectral_data_from_xrite_file,
+                       read_spds_from_xrite_file)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -19,7 +23,10 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
 __all__ = [
-    'RESOURCES_DIRECTORY', 'COLOURCHECKER_XRITE_1', 'TestReadSpdsFromXRiteFile'
+    'RESOURCES_DIRECTORY', 'COLOURCHECKER_XRITE_1', 'CGATS_FILE',
+    'CGATS_FILE_IDENTIFIERS',
+    'TestIterateXRiteFile', 'TestReadSpectralDataFromXRiteFile',
+    'TestReadSpdsFromXRiteFile'
 ]
 
 RESOURCES_DIRECTORY = os.path.join(os.path.dirname(__file__), 'resources')
@@ -64,6 +71,151 @@ COLOURCHECKER_XRITE_1 = {
 }
 
 
+CGATS_FILE = """CGATS.17
+ORIGINATOR	"Colour Developers"
+NUMBER_OF_FIELDS	8
+BEGIN_DATA_FORMAT
+SAMPLE_ID	SAMPLE_NAME	LAB_L	LAB_A
+LAB_B	SPECTRAL_NM400	SPECTRAL_NM500	SPECTRAL_NM600
+END_DATA_FORMAT
+BEGIN_DATA
+1	"Patch A"	50.0	10.0	-10.0	0.1	0.2	0.3
+2	"Patch B"	60.0	-5.0	5.0	0.4	0.5	0.6
+3	"Patch C"	70.0	0.0	0.0	0.7	0.8	0.9
+END_DATA
+"""
+
+CGATS_FILE_IDENTIFIERS = """CGATS.17
+NUMBER_OF_FIELDS	9
+BEGIN_DATA_FORMAT
+SAMPLE_ID	SAMPLE_NAME	RGB_R
+SPECTRAL_NM400	SPECTRAL_NM450	SPECTRAL_NM500
+SPECTRAL_NM550	SPECTRAL_NM600	SPECTRAL_NM650
+END_DATA_FORMAT
+BEGIN_DATA
+001	001	0.5	0.1	0.1	0.1	0.1	0.1	0.1
+002	002	1.0	0.2	0.2	0.2	0.2	0.2	0.2
+010	1e3	1.5	0.3	0.3	0.3	0.3	0.3	0.3
+END_DATA
+"""
+
+
+class TestIterateXRiteFile(unittest.TestCase):
+    """
+    Defines :func:`colour.io.xrite.iterate_xrite_file` definition units tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_iterate_xrite_file(self):
+        """
+        Tests :func:`colour.io.xrite.iterate_xrite_file` definition.
+        """
+
+        colour_checker_xrite = os.path.join(RESOURCES_DIRECTORY,
+                                            'xrite_digital_colour_checker.txt')
+        rows = list(iterate_xrite_file(colour_checker_xrite))
+        self.assertEqual(len(rows), 10)
+        self.assertListEqual(
+            list(rows[0].fields.keys()),
+            ['SampleID', 'SAMPLE_NAME', 'RGB_R', 'RGB_G', 'RGB_B'])
+        self.assertEqual(rows[0].fields['SAMPLE_NAME'], 'X1')
+        np.testing.assert_equal(rows[0].wavelengths,
+                                sorted(COLOURCHECKER_XRITE_1.keys()))
+        np.testing.assert_equal(rows[0].values, [
+            COLOURCHECKER_XRITE_1[wavelength]
+            for wavelength in sorted(COLOURCHECKER_XRITE_1.keys())
+        ])
+
+        path = os.path.join(self._temporary_directory, 'cgats.txt')
+        with open(path, 'w') as cgats_file:
+            cgats_file.write(CGATS_FILE)
+
+        rows = list(iterate_xrite_file(path))
+        self.assertEqual(rows[1].fields['SAMPLE_NAME'], 'Patch B')
+        self.assertEqual(rows[1].fields['LAB_B'], '5.0')
+        np.testing.assert_equal(rows[1].wavelengths, [400, 500, 600])
+        np.testing.assert_equal(rows[1].values, [0.4, 0.5, 0.6])
+
+
+class TestReadSpectralDataFromXRiteFile(unittest.TestCase):
+    """
+    Defines :func:`colour.io.xrite.read_spectral_data_from_xrite_file`
+    definition units tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_read_spectral_data_from_xrite_file(self):
+        """
+        Tests :func:`colour.io.xrite.read_spectral_data_from_xrite_file`
+        definition.
+        """
+
+        colour_checker_xrite = os.path.join(RESOURCES_DIRECTORY,
+                                            'xrite_digital_colour_checker.txt')
+        wavelengths, values, fields = read_spectral_data_from_xrite_file(
+            colour_checker_xrite)
+
+        self.assertTupleEqual(values.shape, (10, 36))
+        np.testing.assert_equal(wavelengths,
+                                sorted(COLOURCHECKER_XRITE_1.keys()))
+        np.testing.assert_equal(values[0], [
+            COLOURCHECKER_XRITE_1[wavelength]
+            for wavelength in sorted(COLOURCHECKER_XRITE_1.keys())
+        ])
+        for i, row in enumerate(iterate_xrite_file(colour_checker_xrite)):
+            np.testing.assert_equal(values[i], row.values)
+
+        self.assertEqual(fields['SAMPLE_NAME'][9], 'X10')
+        np.testing.assert_equal(fields['SampleID'],
+                                [str(i) for i in range(1, 11)])
+
+        path = os.path.join(self._temporary_directory, 'cgats.txt')
+        with open(path, 'w') as cgats_file:
+            cgats_file.write(CGATS_FILE)
+
+        wavelengths, values, fields = read_spectral_data_from_xrite_file(path)
+        np.testing.assert_equal(wavelengths, [400, 500, 600])
+        np.testing.assert_equal(
+            values, [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6], [0.7, 0.8, 0.9]])
+        self.assertTupleEqual(
+            fields.dtype.names,
+            ('SAMPLE_ID', 'SAMPLE_NAME', 'LAB_L', 'LAB_A', 'LAB_B'))
+        np.testing.assert_equal(fields['SAMPLE_ID'], ['1', '2', '3'])
+        np.testing.assert_equal(fields['SAMPLE_NAME'],
+                                ['Patch A', 'Patch B', 'Patch C'])
+        np.testing.assert_equal(
+            np.column_stack([fields['LAB_L'], fields['LAB_A'],
+                             fields['LAB_B']]),
+            [[50, 10, -10], [60, -5, 5], [70, 0, 0]])
+
+
 class TestReadSpdsFromXRiteFile(unittest.TestCase):
     """
     Defines :func:`colour.io.xrite.read_spds_from_xrite_file` definition units
@@ -85,6 +237,31 @@ class TestReadSpdsFromXRiteFile(unittest.TestCase):
                          SpectralPowerDistribution(
                              COLOURCHECKER_XRITE_1, name='X1'))
 
+    def test_identifiers_read_spds_from_xrite_file(self):
+        """
+        Tests :func:`colour.io.xrite.read_spds_from_xrite_file` definition
+        identifiers fields handling.
+        """
+
+        temporary_directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(temporary_directory, 'cgats.txt')
+            with open(path, 'w') as cgats_file:
+                cgats_file.write(CGATS_FILE_IDENTIFIERS)
+
+            spds = read_spds_from_xrite_file(path)
+            self.assertListEqual(list(spds.keys()), ['001', '002', '1e3'])
+            self.assertEqual(spds['001'].name, '001')
+            np.testing.assert_equal(spds['1e3'].values, np.full(6, 0.3))
+
+            _wavelengths, _values, fields = (
+                read_spectral_data_from_xrite_file(path))
+            np.testing.assert_equal(fields['SAMPLE_ID'],
+                                    ['001', '002', '010'])
+            np.testing.assert_equal(fields['RGB_R'], [0.5, 1.0, 1.5])
+        finally:
+            shutil.rmtree(temporary_directory)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -3,16 +3,20 @@
 X-Rite Data Input
 =================
 
-Defines input object for *X-Rite* spectral data files:
+Defines input objects for *X-Rite* and *CGATS* spectral data files:
 
+-   :func:`colour.iterate_xrite_file`
+-   :func:`colour.read_spectral_data_from_xrite_file`
 -   :func:`colour.read_spds_from_xrite_file`
 """
 
 from __future__ import division, unicode_literals
 
 import codecs
+import numpy as np
 import re
-from collections import OrderedDict
+from collections import OrderedDict, namedtuple
+from six import text_type
 
 from colour.colorimetry import SpectralPowerDistribution
 from colour.constants import DEFAULT_FLOAT_DTYPE
@@ -24,10 +28,285 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['XRITE_FILE_ENCODING', 'read_spds_from_xrite_file']
+__all__ = [
+    'XRITE_FILE_ENCODING', 'XRITE_SPECTRAL_FIELD_PATTERN',
+    'XRITE_NUMERIC_FIELD_PATTERN', 'XRite_Row',
+    'iterate_xrite_file', 'read_spectral_data_from_xrite_file',
+    'read_spds_from_xrite_file'
+]
 
 XRITE_FILE_ENCODING = 'utf-8'
 
+XRITE_SPECTRAL_FIELD_PATTERN = re.compile(
+    '^(?:nm|SPECTRAL_NM|SPECTRAL_|SPEC_)(\\d+)$', re.IGNORECASE)
+"""
+Pattern matching the spectral data fields names of *X-Rite* and *CGATS*
+files, e.g. *nm380*, *SPECTRAL_NM380* or *SPECTRAL_380*, and capturing their
+wavelength.
+
+XRITE_SPECTRAL_FIELD_PATTERN : RegexObject
+"""
+
+XRITE_NUMERIC_FIELD_PATTERN = re.compile(
+    '^(?:CMYK|CMY|RGB|XYZ|XYY|LAB|LCH|LUV|D|DE|STDEV|MEAN)_', re.IGNORECASE)
+"""
+Pattern matching the non-spectral numeric fields names of *X-Rite* and
+*CGATS* files, e.g. *RGB_R*, *XYZ_X* or *LAB_L*, the other fields, e.g.
+*SAMPLE_ID* or *SAMPLE_NAME*, are identifiers.
+
+XRITE_NUMERIC_FIELD_PATTERN : RegexObject
+"""
+
+
+class XRite_Row(
+        namedtuple('XRite_Row', ('fields', 'wavelengths', 'values'))):
+    """
+    Defines a data row of an *X-Rite* file.
+
+    Parameters
+    ----------
+    fields : OrderedDict
+        Non-spectral fields of the row, e.g. *SAMPLE_ID*, *SAMPLE_NAME*,
+        *LAB_L*, *XYZ_X*, as *unicode* values.
+    wavelengths : ndarray
+        Wavelengths of the spectral data, shared by all the rows.
+    values : ndarray
+        Spectral data of the row.
+    """
+
+
+def _tokenize_xrite_line(line):
+    """
+    Splits given *X-Rite* file line into tokens, quoted tokens can contain
+    whitespaces.
+
+    Parameters
+    ----------
+    line : unicode
+        *X-Rite* file line.
+
+    Returns
+    -------
+    list
+        Tokens.
+    """
+
+    if '"' not in line:
+        return line.split()
+
+    return [
+        token.strip('"') for token in re.findall('"[^"]*"|\\S+', line)
+    ]
+
+
+def _xrite_data(xrite_file):
+    """
+    Parses the header of given *X-Rite* file object up to the data section.
+
+    Parameters
+    ----------
+    xrite_file : file
+        *X-Rite* file object.
+
+    Returns
+    -------
+    tuple
+        Fields names, sets count or *None* if undefined and a generator
+        lazily yielding the tokens of the data section rows.
+    """
+
+    fields, sets = [], None
+    is_data_format = False
+    for line in xrite_file:
+        line = line.strip()
+
+        if line == 'BEGIN_DATA':
+            break
+
+        if line == 'BEGIN_DATA_FORMAT':
+            is_data_format = True
+        elif line == 'END_DATA_FORMAT':
+            is_data_format = False
+        elif is_data_format:
+            fields.extend(_tokenize_xrite_line(line))
+        elif line.startswith('NUMBER_OF_SETS'):
+            sets = int(_tokenize_xrite_line(line)[1])
+
+    def rows():
+        """
+        Yields the tokens of the data section rows.
+        """
+
+        for line in xrite_file:
+            line = line.strip()
+
+            if line == 'END_DATA':
+                break
+
+            if line:
+                yield _tokenize_xrite_line(line)
+
+    return fields, sets, rows()
+
+
+def _xrite_spectral_fields(fields):
+    """
+    Returns the spectral and non-spectral fields indexes of given *X-Rite*
+    file fields names.
+
+    Parameters
+    ----------
+    fields : list
+        *X-Rite* file fields names.
+
+    Returns
+    -------
+    tuple
+        Wavelengths of the spectral fields, spectral fields indexes and
+        non-spectral fields indexes.
+    """
+
+    wavelengths, spectral, non_spectral = [], [], []
+    for i, field in enumerate(fields):
+        match = XRITE_SPECTRAL_FIELD_PATTERN.match(field)
+        if match:
+            wavelengths.append(DEFAULT_FLOAT_DTYPE(match.group(1)))
+            spectral.append(i)
+        else:
+            non_spectral.append(i)
+
+    return (np.array(wavelengths, dtype=DEFAULT_FLOAT_DTYPE),
+            np.array(spectral, dtype=np.int_),
+            np.array(non_spectral, dtype=np.int_))
+
+
+def iterate_xrite_file(path):
+    """
+    Lazily iterates over the data rows of given *X-Rite* or *CGATS* file.
+
+    The file is read line by line, thus its size is not limited by the
+    available memory.
+
+    Parameters
+    ----------
+    path : unicode
+        Absolute *X-Rite* file path.
+
+    Returns
+    -------
+    generator
+        :class:`colour.io.XRite_Row` class instances of the data rows.
+
+    Examples
+    --------
+    >>> import os
+    >>> xrite_file = os.path.join(os.path.dirname(__file__), 'tests',
+    ...                           'resources',
+    ...                           'xrite_digital_colour_checker.txt')
+    >>> row = next(iterate_xrite_file(xrite_file))
+    >>> row.fields['SAMPLE_NAME']
+    'X1'
+    >>> row.wavelengths[:4]
+    array([ 380.,  390.,  400.,  410.])
+    >>> row.values[:4]
+    array([ 0.0069,  0.0069,  0.0068,  0.0068])
+    """
+
+    with codecs.open(path, encoding=XRITE_FILE_ENCODING) as xrite_file:
+        fields, _sets, rows = _xrite_data(xrite_file)
+        wavelengths, spectral, non_spectral = _xrite_spectral_fields(fields)
+
+        names = [fields[i] for i in non_spectral]
+        for tokens in rows:
+            yield XRite_Row(
+                OrderedDict(zip(names, [tokens[i] for i in non_spectral])),
+                wavelengths,
+                np.array(
+                    [tokens[i] for i in spectral], dtype=DEFAULT_FLOAT_DTYPE))
+
+
+def read_spectral_data_from_xrite_file(path):
+    """
+    Reads the spectral data from given *X-Rite* or *CGATS* file and returns it
+    as an array along its non-spectral fields as a structured array.
+
+    The file is read line by line and the spectral data stored into a single
+    array pre-allocated using the *NUMBER_OF_SETS* keyword if defined.
+
+    Parameters
+    ----------
+    path : unicode
+        Absolute *X-Rite* file path.
+
+    Returns
+    -------
+    tuple
+        Wavelengths of shape (W, ), spectral data of shape (N, W) and
+        non-spectral fields, e.g. *SAMPLE_ID*, *SAMPLE_NAME*, *LAB_L*,
+        *XYZ_X*, as a structured array of shape (N, ) whose fields matching
+        the :attr:`colour.io.xrite.XRITE_NUMERIC_FIELD_PATTERN` attribute are
+        floating point if all their values are numeric, *unicode* otherwise.
+
+    Examples
+    --------
+    >>> import os
+    >>> xrite_file = os.path.join(os.path.dirname(__file__), 'tests',
+    ...                           'resources',
+    ...                           'xrite_digital_colour_checker.txt')
+    >>> wavelengths, values, fields = read_spectral_data_from_xrite_file(
+    ...     xrite_file)
+    >>> values.shape
+    (10, 36)
+    >>> fields.dtype.names
+    ('SampleID', 'SAMPLE_NAME', 'RGB_R', 'RGB_G', 'RGB_B')
+    >>> fields['RGB_R'][:3]
+    array([ 109.97,  110.33,  110.51])
+    """
+
+    with codecs.open(path, encoding=XRITE_FILE_ENCODING) as xrite_file:
+        fields, sets, rows = _xrite_data(xrite_file)
+        wavelengths, spectral, non_spectral = _xrite_spectral_fields(fields)
+
+        values = np.empty(
+            (sets if sets is not None else 1024, len(spectral)),
+            dtype=DEFAULT_FLOAT_DTYPE)
+        columns = [[] for _ in non_spectral]
+
+        count = 0
+        for tokens in rows:
+            if count == values.shape[0]:
+                values = np.resize(values, (2 * count, len(spectral)))
+
+            values[count] = [tokens[i] for i in spectral]
+            for column, i in zip(columns, non_spectral):
+                column.append(tokens[i])
+
+            count += 1
+
+    values = values[:count]
+
+    arrays = []
+    for column, i in zip(columns, non_spectral):
+        # Identifiers fields, e.g. *SAMPLE_ID*, are kept as *unicode* so that
+        # their leading zeros are preserved.
+        if XRITE_NUMERIC_FIELD_PATTERN.match(fields[i]):
+            try:
+                arrays.append(np.array(column, dtype=DEFAULT_FLOAT_DTYPE))
+                continue
+            except ValueError:
+                pass
+
+        arrays.append(np.array(column, dtype=np.unicode_))
+
+    records = np.empty(
+        count,
+        dtype=[(str(fields[i]), array.dtype)
+               for i, array in zip(non_spectral, arrays)])
+    for name, array in zip(records.dtype.names, arrays):
+        records[name] = array
+
+    return wavelengths, values, records
+
 
 def read_spds_from_xrite_file(path):
     """
@@ -47,7 +326,11 @@ def read_spds_from_xrite_file(path):
 
     Notes
     -----
-    -   This parser is minimalistic and absolutely not bullet proof.
+    -   The :class:`colour.SpectralPowerDistribution` classes are named and
+        keyed after the *SAMPLE_NAME* field if defined, the second field
+        otherwise.
+    -   Large files are better read with
+        :func:`colour.read_spectral_data_from_xrite_file` definition.
 
     Examples
     --------
@@ -61,37 +344,15 @@ def read_spds_from_xrite_file(path):
     ['X1', 'X2', 'X3', 'X4', 'X5', 'X6', 'X7', 'X8', 'X9', 'X10']
     """
 
-    with codecs.open(path, encoding=XRITE_FILE_ENCODING) as xrite_file:
-        lines = xrite_file.read().strip().split('\n')
-
-        xrite_spds = OrderedDict()
-        is_spectral_data_format, is_spectral_data = False, False
-        for line in lines:
-            line = line.strip()
-
-            if line == 'END_DATA_FORMAT':
-                is_spectral_data_format = False
-
-            if line == 'END_DATA':
-                is_spectral_data = False
-
-            if is_spectral_data_format:
-                wavelengths = [
-                    DEFAULT_FLOAT_DTYPE(x)
-                    for x in re.findall('nm(\d+)', line)
-                ]
-                index = len(wavelengths)
-
-            if is_spectral_data:
-                tokens = line.split()
-                values = [DEFAULT_FLOAT_DTYPE(x) for x in tokens[-index:]]
-                xrite_spds[tokens[1]] = (SpectralPowerDistribution(
-                    dict(zip(wavelengths, values)), name=tokens[1]))
+    wavelengths, values, fields = read_spectral_data_from_xrite_file(path)
 
-            if line == 'BEGIN_DATA_FORMAT':
-                is_spectral_data_format = True
+    names = fields['SAMPLE_NAME' if 'SAMPLE_NAME' in fields.dtype.names else
+                   fields.dtype.names[1]]
 
-            if line == 'BEGIN_DATA':
-                is_spectral_data = True
+    xrite_spds = OrderedDict()
+    for name, row in zip(names, values):
+        name = text_type(name)
+        xrite_spds[name] = SpectralPowerDistribution(
+            row, wavelengths, name=name)
 
-        return xrite_spds
+    return xrite_spds
@@ -31,7 +31,7 @@ from colour.algebra import cartesian_to_polar, polar_to_cartesian
 from colour.colorimetry import ILLUMINANTS
 from colour.constants import CIE_E, CIE_K
 from colour.models import xy_to_xyY, xyY_to_XYZ
-from colour.utilities import tsplit, tstack
+from colour.utilities import as_float_array, tsplit, tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -45,7 +45,8 @@ __all__ = ['XYZ_to_Lab', 'Lab_to_XYZ', 'Lab_to_LCHab', 'LCHab_to_Lab']
 
 def XYZ_to_Lab(
         XYZ,
-        illuminant=ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D50']):
+        illuminant=ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D50'],
+        out=None):
     """
     Converts from *CIE XYZ* tristimulus values to *CIE L\*a\*b\** colourspace.
 
@@ -56,6 +57,10 @@ def XYZ_to_Lab(
     illuminant : array_like, optional
         Reference *illuminant* *xy* chromaticity coordinates or *CIE xyY*
         colourspace array.
+    out : ndarray, optional
+        Array in which to place the *CIE L\*a\*b\** colourspace array, it
+        must have the appropriate shape and can be ``XYZ`` for in-place
+        computation.
 
     Returns
     -------
@@ -80,28 +85,37 @@ def XYZ_to_Lab(
     array([ 37.9856291..., -23.6290768...,  -4.4174661...])
     """
 
-    XYZ = np.asarray(XYZ)
-    XYZ_r = xyY_to_XYZ(xy_to_xyY(illuminant))
+    XYZ = as_float_array(XYZ)
+    XYZ_r = as_float_array(xyY_to_XYZ(xy_to_xyY(illuminant)))
 
-    XYZ_f = XYZ / XYZ_r
+    # The computations are performed in-place in the output array, only the
+    # linear segment values and a single channel are temporarily copied.
+    XYZ_f = np.divide(XYZ, XYZ_r, out=out)
 
-    XYZ_f = np.where(XYZ_f > CIE_E,
-                     np.power(XYZ_f, 1 / 3), (CIE_K * XYZ_f + 16) / 116)
+    is_linear = XYZ_f <= CIE_E
+    XYZ_f_l = (CIE_K * XYZ_f[is_linear] + 16) / 116
+    np.power(XYZ_f, 1 / 3, out=XYZ_f)
+    XYZ_f[is_linear] = XYZ_f_l
 
-    X_f, Y_f, Z_f = tsplit(XYZ_f)
+    X_f, Y_f, Z_f = XYZ_f[..., 0], XYZ_f[..., 1], XYZ_f[..., 2]
 
-    L = 116 * Y_f - 16
-    a = 500 * (X_f - Y_f)
-    b = 200 * (Y_f - Z_f)
+    b = np.subtract(Y_f, Z_f, out=Z_f)
+    b *= 200
+    a = np.subtract(X_f, Y_f, out=np.copy(X_f))
+    a *= 500
+    L = Y_f
+    L *= 116
+    L -= 16
 
-    Lab = tstack((L, a, b))
+    Lab = tstack((L, a, b), out=XYZ_f)
 
     return Lab
 
 
 def Lab_to_XYZ(
         Lab,
-        illuminant=ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D50']):
+        illuminant=ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D50'],
+        out=None):
     """
     Converts from *CIE L\*a\*b\** colourspace to *CIE XYZ* tristimulus values.
 
@@ -112,6 +126,10 @@ def Lab_to_XYZ(
     illuminant : array_like, optional
         Reference *illuminant* *xy* chromaticity coordinates or *CIE xyY*
         colourspace array.
+    out : ndarray, optional
+        Array in which to place the *CIE XYZ* tristimulus values, it must
+        have the appropriate shape and can be ``Lab`` for in-place
+        computation.
 
     Returns
     -------
@@ -136,18 +154,29 @@ def Lab_to_XYZ(
     array([ 0.0704953...,  0.1008    ,  0.0955831...])
     """
 
-    L, a, b = tsplit(Lab)
+    Lab = as_float_array(Lab)
     XYZ_r = xyY_to_XYZ(xy_to_xyY(illuminant))
 
-    f_y = (L + 16) / 116
-    f_x = a / 500 + f_y
-    f_z = f_y - b / 200
+    if out is None:
+        out = np.empty(np.broadcast(Lab, XYZ_r).shape, Lab.dtype)
 
-    x_r = np.where(f_x ** 3 > CIE_E, f_x ** 3, (116 * f_x - 16) / CIE_K)
-    y_r = np.where(L > CIE_K * CIE_E, ((L + 16) / 116) ** 3, L / CIE_K)
-    z_r = np.where(f_z ** 3 > CIE_E, f_z ** 3, (116 * f_z - 16) / CIE_K)
+    L, a, b = tsplit(Lab)
 
-    XYZ = tstack((x_r, y_r, z_r)) * XYZ_r
+    # The computations are performed in-place in the output array, only the
+    # linear segment values and a single channel are temporarily copied.
+    f_y = (L + 16) / 116
+    f_x = np.divide(a, 500, out=out[..., 0])
+    f_x += f_y
+    f_z = np.divide(b, -200, out=out[..., 2])
+    f_z += f_y
+    out[..., 1] = f_y
+
+    is_linear = out <= CIE_E ** (1 / 3)
+    XYZ_l = (116 * out[is_linear] - 16) / CIE_K
+    XYZ = np.power(out, 3, out=out)
+    XYZ[is_linear] = XYZ_l
+
+    XYZ *= XYZ_r
 
     return XYZ
 
@@ -34,7 +34,7 @@ import numpy as np
 
 from colour.colorimetry import ILLUMINANTS
 from colour.constants import DEFAULT_FLOAT_DTYPE
-from colour.utilities import tsplit, tstack
+from colour.utilities import as_float_array, tsplit, tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -85,11 +85,11 @@ def XYZ_to_xyY(
     array([ 0.2641477...,  0.3777000...,  0.1008    ])
     """
 
-    XYZ = np.asarray(XYZ)
+    XYZ = as_float_array(XYZ)
     X, Y, Z = tsplit(XYZ)
-    xy_w = np.asarray(illuminant)
+    xy_w = as_float_array(illuminant)
 
-    XYZ_n = np.zeros(XYZ.shape)
+    XYZ_n = np.zeros(XYZ.shape, DEFAULT_FLOAT_DTYPE)
     XYZ_n[..., 0:2] = xy_w
 
     xyY = np.where(
@@ -187,7 +187,7 @@ def xy_to_xyY(xy, Y=1):
     array([   0.2641477...,    0.3777000...,  100.        ])
     """
 
-    xy = np.asarray(xy)
+    xy = as_float_array(xy)
 
     shape = xy.shape
     # Assuming ``xy`` is actually a *CIE xyY* colourspace array argument and
@@ -239,7 +239,7 @@ def xyY_to_xy(xyY):
     array([ 0.2641477...,  0.3777000...])
     """
 
-    xyY = np.asarray(xyY)
+    xyY = as_float_array(xyY)
 
     shape = xyY.shape
     # Assuming ``xyY`` is actually a *xy* chromaticity coordinates argument and
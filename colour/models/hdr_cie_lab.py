@@ -34,7 +34,7 @@ from colour.colorimetry import (
     ILLUMINANTS, lightness_Fairchild2010, lightness_Fairchild2011,
     luminance_Fairchild2010, luminance_Fairchild2011)
 from colour.models import xy_to_xyY, xyY_to_XYZ
-from colour.utilities import tsplit, tstack
+from colour.utilities import as_float_array, tsplit, tstack
 from colour.utilities.documentation import DocstringTuple
 
 __author__ = 'Colour Developers'
@@ -94,8 +94,8 @@ def exponent_hdr_CIELab(Y_s, Y_abs, method='Fairchild 2011'):
     1.8360198...
     """
 
-    Y_s = np.asarray(Y_s)
-    Y_abs = np.asarray(Y_abs)
+    Y_s = as_float_array(Y_s)
+    Y_abs = as_float_array(Y_abs)
 
     method_l = method.lower()
     assert method.lower() in [
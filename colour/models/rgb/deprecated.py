@@ -285,7 +285,7 @@ def HSL_to_RGB(HSL):
         Converts *hue* value to *RGB* colourspace.
         """
 
-        vH = np.asarray(vH)
+        vH = np.array(vH)
 
         vH[np.asarray(vH < 0)] += 1
         vH[np.asarray(vH > 1)] -= 1
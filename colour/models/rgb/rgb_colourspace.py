@@ -36,7 +36,7 @@ import numpy as np
 from colour.models import (xy_to_XYZ, xy_to_xyY, xyY_to_XYZ)
 from colour.models.rgb import normalised_primary_matrix
 from colour.adaptation import chromatic_adaptation_matrix_VonKries
-from colour.utilities import dot_matrix, dot_vector, is_string
+from colour.utilities import as_float_array, dot_matrix, dot_vector, is_string
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -330,7 +330,7 @@ class RGB_Colourspace(object):
             assert isinstance(value, (tuple, list, np.ndarray, np.matrix)), (
                 '"{0}" attribute: "{1}" is not a "tuple", "list", "ndarray" '
                 'or "matrix" instance!'.format('whitepoint', value))
-            value = np.asarray(value)
+            value = as_float_array(value)
         self._whitepoint = value
 
         self._derive_transformation_matrices()
@@ -396,7 +396,7 @@ class RGB_Colourspace(object):
         """
 
         if value is not None:
-            value = np.asarray(value)
+            value = as_float_array(value)
         self._RGB_to_XYZ_matrix = value
 
     @property
@@ -430,7 +430,7 @@ class RGB_Colourspace(object):
         """
 
         if value is not None:
-            value = np.asarray(value)
+            value = as_float_array(value)
         self._XYZ_to_RGB_matrix = value
 
     @property
@@ -761,7 +761,8 @@ def XYZ_to_RGB(XYZ,
                illuminant_RGB,
                XYZ_to_RGB_matrix,
                chromatic_adaptation_transform='CAT02',
-               encoding_cctf=None):
+               encoding_cctf=None,
+               out=None):
     """
     Converts from *CIE XYZ* tristimulus values to *RGB* colourspace array.
 
@@ -785,6 +786,9 @@ def XYZ_to_RGB(XYZ,
     encoding_cctf : object, optional
         Encoding colour component transfer function (Encoding CCTF) or
         opto-electronic transfer function (OETF / OECF).
+    out : ndarray, optional
+        Array in which to place the *RGB* colourspace array, it must have the
+        appropriate shape and can be ``XYZ`` for in-place computation.
 
     Returns
     -------
@@ -821,12 +825,13 @@ def XYZ_to_RGB(XYZ,
         xyY_to_XYZ(xy_to_xyY(illuminant_RGB)),
         transform=chromatic_adaptation_transform)
 
-    XYZ_a = dot_vector(M, XYZ)
-
-    RGB = dot_vector(XYZ_to_RGB_matrix, XYZ_a)
+    RGB = dot_vector(dot_matrix(XYZ_to_RGB_matrix, M), XYZ, out=out)
 
     if encoding_cctf is not None:
-        RGB = encoding_cctf(RGB)
+        if out is None:
+            RGB = encoding_cctf(RGB)
+        else:
+            RGB[...] = encoding_cctf(RGB)
 
     return RGB
 
@@ -836,7 +841,8 @@ def RGB_to_XYZ(RGB,
                illuminant_XYZ,
                RGB_to_XYZ_matrix,
                chromatic_adaptation_transform='CAT02',
-               decoding_cctf=None):
+               decoding_cctf=None,
+               out=None):
     """
     Converts given *RGB* colourspace array to *CIE XYZ* tristimulus values.
 
@@ -860,6 +866,10 @@ def RGB_to_XYZ(RGB,
     decoding_cctf : object, optional
         Decoding colour component transfer function (Decoding CCTF) or
         electro-optical transfer function (EOTF / EOCF).
+    out : ndarray, optional
+        Array in which to place the *CIE XYZ* tristimulus values, it must
+        have the appropriate shape and can be ``RGB`` for in-place
+        computation.
 
     Returns
     -------
@@ -899,9 +909,7 @@ def RGB_to_XYZ(RGB,
         xyY_to_XYZ(xy_to_xyY(illuminant_XYZ)),
         transform=chromatic_adaptation_transform)
 
-    XYZ = dot_vector(RGB_to_XYZ_matrix, RGB)
-
-    XYZ_a = dot_vector(M, XYZ)
+    XYZ_a = dot_vector(dot_matrix(M, RGB_to_XYZ_matrix), RGB, out=out)
 
     return XYZ_a
 
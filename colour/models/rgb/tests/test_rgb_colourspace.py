@@ -18,7 +18,7 @@ from colour.models import (RGB_COLOURSPACES, RGB_Colourspace, XYZ_to_RGB,
                            RGB_to_XYZ, RGB_to_RGB_matrix, RGB_to_RGB,
                            normalised_primary_matrix, oetf_sRGB,
                            oetf_reverse_sRGB)
-from colour.utilities import ignore_numpy_errors
+from colour.utilities import ignore_numpy_errors, set_default_float_dtype
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -393,6 +393,56 @@ class TestXYZ_to_RGB(unittest.TestCase):
         np.testing.assert_almost_equal(
             XYZ_to_RGB(XYZ, W_R, W_T, M), RGB, decimal=7)
 
+    def test_out_XYZ_to_RGB(self):
+        """
+        Tests :func:`colour.models.rgb.rgb_colourspace.XYZ_to_RGB` definition
+        ``out`` argument support.
+        """
+
+        XYZ = np.tile(np.array([0.07049534, 0.10080000, 0.09558313]), (6, 1))
+        W_R = np.array([0.34570, 0.35850])
+        W_T = np.array([0.31270, 0.32900])
+        M = np.array([
+            [3.24062548, -1.53720797, -0.49862860],
+            [-0.96893071, 1.87575606, 0.04151752],
+            [0.05571012, -0.20402105, 1.05699594],
+        ])
+        RGB = XYZ_to_RGB(XYZ, W_R, W_T, M, 'Bradford', oetf_sRGB)
+
+        out = np.zeros(XYZ.shape)
+        self.assertIs(
+            XYZ_to_RGB(XYZ, W_R, W_T, M, 'Bradford', oetf_sRGB, out=out), out)
+        np.testing.assert_almost_equal(out, RGB, decimal=7)
+
+        self.assertIs(
+            XYZ_to_RGB(XYZ, W_R, W_T, M, 'Bradford', oetf_sRGB, out=XYZ), XYZ)
+        np.testing.assert_almost_equal(XYZ, RGB, decimal=7)
+
+    def test_float_precision_XYZ_to_RGB(self):
+        """
+        Tests :func:`colour.models.rgb.rgb_colourspace.XYZ_to_RGB` definition
+        float precision support.
+        """
+
+        XYZ = np.random.RandomState(4).random_sample((256, 3))
+        W_R = np.array([0.34570, 0.35850])
+        W_T = np.array([0.31270, 0.32900])
+        M = np.array([
+            [3.24062548, -1.53720797, -0.49862860],
+            [-0.96893071, 1.87575606, 0.04151752],
+            [0.05571012, -0.20402105, 1.05699594],
+        ])
+        RGB = XYZ_to_RGB(XYZ, W_R, W_T, M, 'Bradford')
+
+        previous_dtype = set_default_float_dtype(np.float32)
+        try:
+            RGB_f = XYZ_to_RGB(XYZ.astype(np.float32), W_R, W_T, M, 'Bradford')
+        finally:
+            set_default_float_dtype(previous_dtype)
+
+        self.assertEqual(RGB_f.dtype, np.float32)
+        np.testing.assert_allclose(RGB_f, RGB, rtol=0.00001, atol=0.00001)
+
     @ignore_numpy_errors
     def test_nan_XYZ_to_RGB(self):
         """
@@ -499,6 +549,29 @@ class TestRGB_to_XYZ(unittest.TestCase):
         np.testing.assert_almost_equal(
             RGB_to_XYZ(RGB, W_R, W_T, M), XYZ, decimal=7)
 
+    def test_out_RGB_to_XYZ(self):
+        """
+        Tests :func:`colour.models.rgb.rgb_colourspace.RGB_to_XYZ` definition
+        ``out`` argument support.
+        """
+
+        RGB = np.tile(np.array([0.01103742, 0.12734226, 0.11632971]), (6, 1))
+        W_R = np.array([0.31270, 0.32900])
+        W_T = np.array([0.34570, 0.35850])
+        M = np.array([
+            [0.41240000, 0.35760000, 0.18050000],
+            [0.21260000, 0.71520000, 0.07220000],
+            [0.01930000, 0.11920000, 0.95050000],
+        ])
+        XYZ = RGB_to_XYZ(RGB, W_R, W_T, M, 'Bradford')
+
+        out = np.zeros(RGB.shape)
+        self.assertIs(RGB_to_XYZ(RGB, W_R, W_T, M, 'Bradford', out=out), out)
+        np.testing.assert_almost_equal(out, XYZ, decimal=7)
+
+        self.assertIs(RGB_to_XYZ(RGB, W_R, W_T, M, 'Bradford', out=RGB), RGB)
+        np.testing.assert_almost_equal(RGB, XYZ, decimal=7)
+
     @ignore_numpy_errors
     def test_nan_RGB_to_XYZ(self):
         """
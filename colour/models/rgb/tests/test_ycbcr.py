@@ -98,6 +98,38 @@ class TestRGB_to_YCbCr(unittest.TestCase):
         YCbCr = np.reshape(YCbCr, (4, 4, 4, 3))
         np.testing.assert_almost_equal(RGB_to_YCbCr(RGB), YCbCr)
 
+    def test_out_RGB_to_YCbCr(self):
+        """
+        Tests :func:`colour.models.rgb.ycbcr.RGB_to_YCbCr` definition ``out``
+        argument support.
+        """
+
+        RGB = np.tile(np.array([0.75, 0.5, 0.25]), (6, 1))
+        YCbCr = RGB_to_YCbCr(RGB)
+
+        out = np.zeros(RGB.shape)
+        self.assertIs(RGB_to_YCbCr(RGB, out=out), out)
+        np.testing.assert_almost_equal(out, YCbCr, decimal=7)
+
+        self.assertIs(RGB_to_YCbCr(RGB, out=RGB), RGB)
+        np.testing.assert_almost_equal(RGB, YCbCr, decimal=7)
+
+        RGB = np.tile(np.array([0.75, 0.5, 0.25]), (6, 1))
+        YCbCr = RGB_to_YCbCr(RGB, out_int=True)
+        out = np.zeros(RGB.shape, dtype=np.uint16)
+        self.assertIs(RGB_to_YCbCr(RGB, out_int=True, out=out), out)
+        np.testing.assert_equal(out, YCbCr)
+
+    def test_raise_exception_RGB_to_YCbCr(self):
+        """
+        Tests :func:`colour.models.rgb.ycbcr.RGB_to_YCbCr` definition raised
+        exception.
+        """
+
+        RGB = np.tile(np.array([0.75, 0.5, 0.25]), (6, 1))
+        self.assertRaises(
+            ValueError, RGB_to_YCbCr, RGB, out_int=True, out=np.copy(RGB))
+
     @ignore_numpy_errors
     def test_nan_RGB_to_YCbCr(self):
         """
@@ -2,7 +2,8 @@
 
 from __future__ import absolute_import
 
-from colour.utilities import CaseInsensitiveMapping, filter_kwargs
+from colour.utilities import (CaseInsensitiveMapping, cache_signature,
+                              filter_kwargs)
 
 from .common import CV_range, legal_to_full, full_to_legal
 from .aces import (log_encoding_ACESproxy, log_decoding_ACESproxy,
@@ -96,7 +97,7 @@ __all__ += [
 __all__ += ['oetf_sRGB', 'oetf_reverse_sRGB']
 __all__ += ['log_encoding_ViperLog', 'log_decoding_ViperLog']
 
-LOG_ENCODING_CURVES = CaseInsensitiveMapping({
+LOG_ENCODING_CURVES = cache_signature(CaseInsensitiveMapping({
     'ACEScc': log_encoding_ACEScc,
     'ACEScct': log_encoding_ACEScct,
     'ACESproxy': log_encoding_ACESproxy,
@@ -118,7 +119,7 @@ LOG_ENCODING_CURVES = CaseInsensitiveMapping({
     'S-Log3': log_encoding_SLog3,
     'V-Log': log_encoding_VLog,
     'ViperLog': log_encoding_ViperLog
-})
+}))
 LOG_ENCODING_CURVES.__doc__ = """
 Supported *log* encoding curves.
 
@@ -226,7 +227,7 @@ def log_encoding_curve(value, curve='Cineon', **kwargs):
     return function(value, **filter_kwargs(function, **kwargs))
 
 
-LOG_DECODING_CURVES = CaseInsensitiveMapping({
+LOG_DECODING_CURVES = cache_signature(CaseInsensitiveMapping({
     'ACEScc': log_decoding_ACEScc,
     'ACEScct': log_decoding_ACEScct,
     'ACESproxy': log_decoding_ACESproxy,
@@ -248,7 +249,7 @@ LOG_DECODING_CURVES = CaseInsensitiveMapping({
     'S-Log3': log_decoding_SLog3,
     'V-Log': log_decoding_VLog,
     'ViperLog': log_decoding_ViperLog
-})
+}))
 LOG_DECODING_CURVES.__doc__ = """
 Supported *log* decoding curves.
 
@@ -361,7 +362,7 @@ def log_decoding_curve(value, curve='Cineon', **kwargs):
 __all__ += ['LOG_ENCODING_CURVES', 'LOG_DECODING_CURVES']
 __all__ += ['log_encoding_curve', 'log_decoding_curve']
 
-OETFS = CaseInsensitiveMapping({
+OETFS = cache_signature(CaseInsensitiveMapping({
     'ARIB STD-B67': oetf_ARIBSTDB67,
     'DCDM': oetf_DCDM,
     'DICOM GSDF': oetf_DICOMGSDF,
@@ -376,7 +377,7 @@ OETFS = CaseInsensitiveMapping({
     'SMPTE 240M': oetf_SMPTE240M,
     'ST 2084': oetf_ST2084,
     'sRGB': oetf_sRGB
-})
+}))
 OETFS.__doc__ = """
 Supported opto-electrical transfer functions (OETFs / OECFs).
 
@@ -447,14 +448,14 @@ def oetf(value, function='sRGB', **kwargs):
     return function(value, **filter_kwargs(function, **kwargs))
 
 
-OETFS_REVERSE = CaseInsensitiveMapping({
+OETFS_REVERSE = cache_signature(CaseInsensitiveMapping({
     'ARIB STD-B67': oetf_reverse_ARIBSTDB67,
     'ITU-R BT.2100 HLD': oetf_reverse_BT2100_HLG,
     'ITU-R BT.2100 PQ': oetf_reverse_BT2100_PQ,
     'ITU-R BT.601': oetf_reverse_BT601,
     'ITU-R BT.709': oetf_reverse_BT709,
     'sRGB': oetf_reverse_sRGB
-})
+}))
 OETFS_REVERSE.__doc__ = """
 Supported reverse opto-electrical transfer functions (OETFs / OECFs).
 
@@ -504,7 +505,7 @@ def oetf_reverse(value, function='sRGB', **kwargs):
     return function(value, **filter_kwargs(function, **kwargs))
 
 
-EOTFS = CaseInsensitiveMapping({
+EOTFS = cache_signature(CaseInsensitiveMapping({
     'DCDM': eotf_DCDM,
     'DICOM GSDF': eotf_DICOMGSDF,
     'ITU-R BT.1886': eotf_BT1886,
@@ -516,7 +517,7 @@ EOTFS = CaseInsensitiveMapping({
     'ROMM RGB': eotf_ROMMRGB,
     'SMPTE 240M': eotf_SMPTE240M,
     'ST 2084': eotf_ST2084,
-})
+}))
 EOTFS.__doc__ = """
 Supported electro-optical transfer functions (EOTFs / EOCFs).
 
@@ -594,11 +595,11 @@ def eotf(value, function='ITU-R BT.1886', **kwargs):
     return function(value, **filter_kwargs(function, **kwargs))
 
 
-EOTFS_REVERSE = CaseInsensitiveMapping({
+EOTFS_REVERSE = cache_signature(CaseInsensitiveMapping({
     'ITU-R BT.1886': eotf_reverse_BT1886,
     'ITU-R BT.2100 HLG': eotf_reverse_BT2100_HLG,
     'ITU-R BT.2100 PQ': eotf_reverse_BT2100_PQ,
-})
+}))
 EOTFS_REVERSE.__doc__ = """
 Supported reverse electro-optical transfer functions (EOTFs / EOCFs).
 
@@ -658,10 +659,10 @@ def eotf_reverse(value, function='ITU-R BT.1886', **kwargs):
 __all__ += ['OETFS', 'OETFS_REVERSE', 'EOTFS', 'EOTFS_REVERSE']
 __all__ += ['oetf', 'oetf_reverse', 'eotf', 'eotf_reverse']
 
-OOTFS = CaseInsensitiveMapping({
+OOTFS = cache_signature(CaseInsensitiveMapping({
     'ITU-R BT.2100 HLG': ootf_BT2100_HLG,
     'ITU-R BT.2100 PQ': ootf_BT2100_PQ,
-})
+}))
 OOTFS.__doc__ = """
 Supported opto-optical transfer functions (OOTFs / OOCFs).
 
@@ -701,10 +702,10 @@ def ootf(value, function='ITU-R BT.2100 PQ', **kwargs):
     return function(value, **filter_kwargs(function, **kwargs))
 
 
-OOTFS_REVERSE = CaseInsensitiveMapping({
+OOTFS_REVERSE = cache_signature(CaseInsensitiveMapping({
     'ITU-R BT.2100 HLG': ootf_reverse_BT2100_HLG,
     'ITU-R BT.2100 PQ': ootf_reverse_BT2100_PQ,
-})
+}))
 OOTFS_REVERSE.__doc__ = """
 Supported reverse opto-optical transfer functions (OOTFs / OOCFs).
 
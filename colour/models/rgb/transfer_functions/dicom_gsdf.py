@@ -35,7 +35,7 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 
-from colour.utilities import Structure, as_numeric
+from colour.utilities import Structure, as_float_array, as_numeric
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -103,7 +103,7 @@ def oetf_DICOMGSDF(L, out_int=False):
     512
     """
 
-    L = np.asarray(L)
+    L = as_float_array(L)
 
     L_lg = np.log10(L)
 
@@ -156,7 +156,7 @@ def eotf_DICOMGSDF(J, in_int=False):
     130.0652840...
     """
 
-    J = np.asarray(J)
+    J = as_float_array(J)
 
     if not in_int:
         J = J * 1023
@@ -35,8 +35,7 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 
-from colour.constants import DEFAULT_FLOAT_DTYPE
-from colour.utilities import as_numeric
+from colour.utilities import as_float_array, as_numeric
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -85,7 +84,7 @@ def oetf_ROMMRGB(X, bit_depth=8, out_int=False):
     98
     """
 
-    X = np.asarray(X)
+    X = as_float_array(X)
 
     I_max = 2 ** bit_depth - 1
 
@@ -132,7 +131,7 @@ def eotf_ROMMRGB(X_p, bit_depth=8, in_int=False):
     0.1...
     """
 
-    X_p = np.asarray(X_p, dtype=DEFAULT_FLOAT_DTYPE)
+    X_p = as_float_array(X_p)
 
     I_max = 2 ** bit_depth - 1
 
@@ -188,7 +187,7 @@ def oetf_RIMMRGB(X, bit_depth=8, out_int=False, E_clip=2.0):
     74
     """
 
-    X = np.asarray(X)
+    X = as_float_array(X)
 
     I_max = 2 ** bit_depth - 1
 
@@ -240,7 +239,7 @@ def eotf_RIMMRGB(X_p, bit_depth=8, in_int=False, E_clip=2.0):
     0.1...
     """
 
-    X_p = np.asarray(X_p, dtype=DEFAULT_FLOAT_DTYPE)
+    X_p = as_float_array(X_p)
 
     I_max = 2 ** bit_depth - 1
 
@@ -298,7 +297,7 @@ def log_encoding_ERIMMRGB(X,
     105
     """
 
-    X = np.asarray(X)
+    X = as_float_array(X)
 
     I_max = 2 ** bit_depth - 1
 
@@ -356,7 +355,7 @@ def log_decoding_ERIMMRGB(X_p,
     0.1...
     """
 
-    X_p = np.asarray(X_p, dtype=DEFAULT_FLOAT_DTYPE)
+    X_p = as_float_array(X_p)
 
     I_max = 2 ** bit_depth - 1
 
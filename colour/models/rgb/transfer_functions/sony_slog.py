@@ -33,7 +33,7 @@ TechnicalSummary_for_S-Gamut3Cine_S-Gamut3_S-Log3_V1_00.pdf
 from __future__ import division, unicode_literals
 
 import numpy as np
-from colour.utilities import as_numeric
+from colour.utilities import as_float_array, as_numeric
 from colour.models.rgb.transfer_functions import full_to_legal, legal_to_full
 
 __author__ = 'Colour Developers'
@@ -86,7 +86,7 @@ def log_encoding_SLog(x, bit_depth=10, out_legal=True, in_reflection=True):
     0.3708204...
     """
 
-    x = np.asarray(x)
+    x = as_float_array(x)
 
     if in_reflection:
         x = x / 0.9
@@ -139,7 +139,7 @@ def log_decoding_SLog(y, bit_depth=10, in_legal=True, out_reflection=True):
     0.1...
     """
 
-    y = np.asarray(y)
+    y = as_float_array(y)
 
     x = legal_to_full(y, bit_depth) if in_legal else y
 
@@ -274,7 +274,7 @@ def log_encoding_SLog3(x, bit_depth=10, out_legal=True, in_reflection=True):
     0.3995079...
     """
 
-    x = np.asarray(x)
+    x = as_float_array(x)
 
     if not in_reflection:
         x = x * 0.9
@@ -327,7 +327,7 @@ def log_decoding_SLog3(y, bit_depth=10, in_legal=True, out_reflection=True):
     0.1...
     """
 
-    y = np.asarray(y)
+    y = as_float_array(y)
 
     y = y if in_legal else full_to_legal(y, bit_depth)
 
@@ -34,7 +34,7 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 
-from colour.utilities import as_numeric
+from colour.utilities import as_float_array, as_numeric
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -46,7 +46,7 @@ __status__ = 'Production'
 __all__ = ['oetf_sRGB', 'oetf_reverse_sRGB']
 
 
-def oetf_sRGB(L):
+def oetf_sRGB(L, out=None):
     """
     Defines the *sRGB* colourspace opto-electronic transfer function
     (OETF / OECF).
@@ -55,6 +55,9 @@ def oetf_sRGB(L):
     ----------
     L : numeric or array_like
         *Luminance* :math:`L` of the image.
+    out : ndarray, optional
+        Array in which to place the electrical signal :math:`V`, it must have
+        the appropriate shape and can be ``L`` for in-place computation.
 
     Returns
     -------
@@ -72,10 +75,17 @@ def oetf_sRGB(L):
     0.4613561...
     """
 
-    L = np.asarray(L)
+    L = as_float_array(L)
 
-    return as_numeric(
-        np.where(L <= 0.0031308, L * 12.92, 1.055 * (L ** (1 / 2.4)) - 0.055))
+    is_linear = L <= 0.0031308
+    V_l = L[is_linear] * 12.92
+
+    V = np.asarray(np.power(L, 1 / 2.4, out=out))
+    V *= 1.055
+    V -= 0.055
+    V[is_linear] = V_l
+
+    return as_numeric(V) if out is None else out
 
 
 def oetf_reverse_sRGB(V):
@@ -104,7 +114,7 @@ def oetf_reverse_sRGB(V):
     0.1...
     """
 
-    V = np.asarray(V)
+    V = as_float_array(V)
 
     return as_numeric(
         np.where(V <= oetf_sRGB(0.0031308), V / 12.92, ((V + 0.055) / 1.055) **
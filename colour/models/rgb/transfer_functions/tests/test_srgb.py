@@ -62,6 +62,22 @@ oetf_sRGB` definition n-dimensional arrays support.
         V = np.reshape(V, (2, 3, 1))
         np.testing.assert_almost_equal(oetf_sRGB(L), V, decimal=7)
 
+    def test_out_oetf_sRGB(self):
+        """
+        Tests :func:`colour.models.rgb.transfer_functions.srgb.oetf_sRGB`
+        definition ``out`` argument support.
+        """
+
+        L = np.array([0.0, 0.001, 0.18, 1.0])
+        V = oetf_sRGB(L)
+
+        out = np.zeros(L.shape)
+        self.assertIs(oetf_sRGB(L, out=out), out)
+        np.testing.assert_almost_equal(out, V, decimal=7)
+
+        self.assertIs(oetf_sRGB(L, out=L), L)
+        np.testing.assert_almost_equal(L, V, decimal=7)
+
     @ignore_numpy_errors
     def test_nan_oetf_sRGB(self):
         """
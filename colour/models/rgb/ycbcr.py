@@ -56,7 +56,8 @@ import numpy as np
 from colour.constants import DEFAULT_FLOAT_DTYPE
 from colour.models.rgb.transfer_functions import (CV_range, oetf_BT2020,
                                                   eotf_BT2020)
-from colour.utilities import CaseInsensitiveMapping, tsplit, tstack
+from colour.utilities import (CaseInsensitiveMapping, as_float_array, tsplit,
+                              tstack)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -149,6 +150,7 @@ def RGB_to_YCbCr(RGB,
                  out_bits=8,
                  out_legal=True,
                  out_int=False,
+                 out=None,
                  **kwargs):
     """
     Converts an array of *R'G'B'* values to the corresponding *Y'CbCr* colour
@@ -181,6 +183,12 @@ def RGB_to_YCbCr(RGB,
     out_int : bool, optional
         Whether to return values as ``out_bits`` integer code values. Default
         is *False*.
+    out : ndarray, optional
+        Array in which to place the *Y'CbCr* colour encoding values, it must
+        have the appropriate shape. It must be a floating point array that can
+        be ``RGB`` for in-place computation, or an integer array if
+        ``out_int`` is *True*, in which case the values are computed in a
+        temporary floating point array and rounded into it.
 
     Other Parameters
     ----------------
@@ -200,6 +208,11 @@ def RGB_to_YCbCr(RGB,
     ndarray
         *Y'CbCr* colour encoding array of integer or float values.
 
+    Raises
+    ------
+    ValueError
+        If ``out_int`` is *True* and ``out`` is not an integer array.
+
     Warning
     -------
     For *Recommendation ITU-R BT.2020*, :func:`colour.RGB_to_YCbCr` definition
@@ -272,7 +285,18 @@ def RGB_to_YCbCr(RGB,
     array([ 36, 136, 175])
     """
 
-    RGB = np.asarray(RGB)
+    if out_int and out is not None:
+        if not np.issubdtype(out.dtype, np.integer):
+            raise ValueError(
+                '"out" array must be an integer array when "out_int" is '
+                'True, "{0}" dtype was given!'.format(out.dtype))
+
+        out[...] = RGB_to_YCbCr(RGB, K, in_bits, in_legal, in_int, out_bits,
+                                out_legal, out_int, **kwargs)
+
+        return out
+
+    RGB = as_float_array(RGB)
     Kr, Kb = K
     RGB_min, RGB_max = kwargs.get('in_range',
                                   CV_range(in_bits, in_legal, in_int))
@@ -280,13 +304,19 @@ def RGB_to_YCbCr(RGB,
                                             YCbCr_ranges(
                                                 out_bits, out_legal, out_int))
 
-    RGB_float = RGB.astype(DEFAULT_FLOAT_DTYPE) - RGB_min
+    # The computations are performed in-place in the output array, only the
+    # luma channel is temporarily allocated.
+    RGB_float = np.subtract(RGB, RGB_min, out=out)
     RGB_float *= 1 / (RGB_max - RGB_min)
-    R, G, B = tsplit(RGB_float)
-
-    Y = Kr * R + (1 - Kr - Kb) * G + Kb * B
-    Cb = 0.5 * (B - Y) / (1 - Kb)
-    Cr = 0.5 * (R - Y) / (1 - Kr)
+    R, G, B = RGB_float[..., 0], RGB_float[..., 1], RGB_float[..., 2]
+
+    Y = Kr * R
+    Y += (1 - Kr - Kb) * G
+    Y += Kb * B
+    Cb = np.subtract(B, Y, out=B)
+    Cb *= 0.5 / (1 - Kb)
+    Cr = np.subtract(R, Y, out=R)
+    Cr *= 0.5 / (1 - Kr)
     Y *= Y_max - Y_min
     Y += Y_min
     Cb *= C_max - C_min
@@ -294,8 +324,13 @@ def RGB_to_YCbCr(RGB,
     Cb += (C_max + C_min) / 2
     Cr += (C_max + C_min) / 2
 
-    YCbCr = tstack((Y, Cb, Cr))
-    YCbCr = np.round(YCbCr).astype(np.int_) if out_int else YCbCr
+    G[...] = Cb
+    B[...] = Cr
+    R[...] = Y
+    YCbCr = RGB_float
+
+    if out_int:
+        YCbCr = np.round(YCbCr).astype(np.int_)
 
     return YCbCr
 
@@ -380,8 +415,8 @@ def YCbCr_to_RGB(YCbCr,
     array([ 0.5,  0.5,  0.5])
     """
 
-    YCbCr = np.asarray(YCbCr)
-    Y, Cb, Cr = tsplit(YCbCr.astype(DEFAULT_FLOAT_DTYPE))
+    YCbCr = as_float_array(YCbCr)
+    Y, Cb, Cr = tsplit(YCbCr)
     Kr, Kb = K
     Y_min, Y_max, C_min, C_max = kwargs.get('in_range',
                                             YCbCr_ranges(
@@ -389,9 +424,9 @@ def YCbCr_to_RGB(YCbCr,
     RGB_min, RGB_max = kwargs.get('out_range',
                                   CV_range(out_bits, out_legal, out_int))
 
-    Y -= Y_min
-    Cb -= (C_max + C_min) / 2
-    Cr -= (C_max + C_min) / 2
+    Y = Y - Y_min
+    Cb = Cb - (C_max + C_min) / 2
+    Cr = Cr - (C_max + C_min) / 2
     Y *= 1 / (Y_max - Y_min)
     Cb *= 1 / (C_max - C_min)
     Cr *= 1 / (C_max - C_min)
@@ -467,7 +502,7 @@ def RGB_to_YcCbcCrc(RGB,
     array([422, 512, 512])
     """
 
-    RGB = np.asarray(RGB)
+    RGB = as_float_array(RGB)
     R, G, B = tsplit(RGB)
     Y_min, Y_max, C_min, C_max = kwargs.get('out_range',
                                             YCbCr_ranges(
@@ -552,15 +587,15 @@ def YcCbcCrc_to_RGB(YcCbcCrc,
     array([ 0.1800903...,  0.1800903...,  0.1800903...])
     """
 
-    YcCbcCrc = np.asarray(YcCbcCrc)
-    Yc, Cbc, Crc = tsplit(YcCbcCrc.astype(DEFAULT_FLOAT_DTYPE))
+    YcCbcCrc = as_float_array(YcCbcCrc)
+    Yc, Cbc, Crc = tsplit(YcCbcCrc)
     Y_min, Y_max, C_min, C_max = kwargs.get('in_range',
                                             YCbCr_ranges(
                                                 in_bits, in_legal, in_int))
 
-    Yc -= Y_min
-    Cbc -= (C_max + C_min) / 2
-    Crc -= (C_max + C_min) / 2
+    Yc = Yc - Y_min
+    Cbc = Cbc - (C_max + C_min) / 2
+    Crc = Crc - (C_max + C_min) / 2
     Yc *= 1 / (Y_max - Y_min)
     Cbc *= 1 / (C_max - C_min)
     Crc *= 1 / (C_max - C_min)
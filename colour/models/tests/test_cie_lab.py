@@ -10,7 +10,7 @@ import unittest
 from itertools import permutations
 
 from colour.models import XYZ_to_Lab, Lab_to_XYZ, Lab_to_LCHab, LCHab_to_Lab
-from colour.utilities import ignore_numpy_errors
+from colour.utilities import ignore_numpy_errors, set_default_float_dtype
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -105,6 +105,40 @@ class TestXYZ_to_Lab(unittest.TestCase):
         np.testing.assert_almost_equal(
             XYZ_to_Lab(XYZ, illuminant), Lab, decimal=7)
 
+    def test_out_XYZ_to_Lab(self):
+        """
+        Tests :func:`colour.models.cie_lab.XYZ_to_Lab` definition ``out``
+        argument support.
+        """
+
+        XYZ = np.tile(np.array([0.07049534, 0.10080000, 0.09558313]), (6, 1))
+        Lab = XYZ_to_Lab(XYZ)
+
+        out = np.zeros(XYZ.shape)
+        self.assertIs(XYZ_to_Lab(XYZ, out=out), out)
+        np.testing.assert_almost_equal(out, Lab, decimal=7)
+
+        self.assertIs(XYZ_to_Lab(XYZ, out=XYZ), XYZ)
+        np.testing.assert_almost_equal(XYZ, Lab, decimal=7)
+
+    def test_float_precision_XYZ_to_Lab(self):
+        """
+        Tests :func:`colour.models.cie_lab.XYZ_to_Lab` definition float
+        precision support.
+        """
+
+        XYZ = np.random.RandomState(4).random_sample((256, 3))
+        Lab = XYZ_to_Lab(XYZ)
+
+        previous_dtype = set_default_float_dtype(np.float32)
+        try:
+            Lab_f = XYZ_to_Lab(XYZ.astype(np.float32))
+        finally:
+            set_default_float_dtype(previous_dtype)
+
+        self.assertEqual(Lab_f.dtype, np.float32)
+        np.testing.assert_allclose(Lab_f, Lab, rtol=0.0001, atol=0.0001)
+
     @ignore_numpy_errors
     def test_nan_XYZ_to_Lab(self):
         """
@@ -200,6 +234,23 @@ class TestLab_to_XYZ(unittest.TestCase):
         np.testing.assert_almost_equal(
             Lab_to_XYZ(Lab, illuminant), XYZ, decimal=7)
 
+    def test_out_Lab_to_XYZ(self):
+        """
+        Tests :func:`colour.models.cie_lab.Lab_to_XYZ` definition ``out``
+        argument support.
+        """
+
+        Lab = np.tile(np.array([37.98562910, -23.62907688, -4.41746615]),
+                      (6, 1))
+        XYZ = Lab_to_XYZ(Lab)
+
+        out = np.zeros(Lab.shape)
+        self.assertIs(Lab_to_XYZ(Lab, out=out), out)
+        np.testing.assert_almost_equal(out, XYZ, decimal=7)
+
+        self.assertIs(Lab_to_XYZ(Lab, out=Lab), Lab)
+        np.testing.assert_almost_equal(Lab, XYZ, decimal=7)
+
     @ignore_numpy_errors
     def test_nan_Lab_to_XYZ(self):
         """
@@ -19,6 +19,7 @@ from .common import (
     label_rectangles, equal_axes3d, get_RGB_colourspace, get_cmfs,
     get_illuminant, single_colour_swatch_plot, multi_colour_swatch_plot,
     image_plot)
+from .batch import PlotSpecification, batch_render
 from .blindness import cvd_simulation_Machado2009_plot
 from .colorimetry import (
     single_spd_plot, multi_spd_plot, single_cmfs_plot, multi_cmfs_plot,
@@ -68,6 +69,7 @@ __all__ += [
     'get_cmfs', 'get_illuminant', 'single_colour_swatch_plot',
     'multi_colour_swatch_plot', 'image_plot'
 ]
+__all__ += ['PlotSpecification', 'batch_render']
 __all__ += ['cvd_simulation_Machado2009_plot']
 __all__ += [
     'single_spd_plot', 'multi_spd_plot', 'single_cmfs_plot', 'multi_cmfs_plot',
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""
+Batch Plotting
+==============
+
+Defines the batch plotting objects:
+
+-   :class:`colour.plotting.PlotSpecification`
+-   :func:`colour.plotting.batch_render`
+"""
+
+from __future__ import division
+
+import matplotlib
+import matplotlib.pyplot
+from collections import namedtuple
+from multiprocessing import Pool
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['PlotSpecification', 'batch_render']
+
+
+class PlotSpecification(
+        namedtuple('PlotSpecification',
+                   ('function', 'args', 'filename', 'kwargs'))):
+    """
+    Defines a data structure for a plot specification rendered by the
+    :func:`colour.plotting.batch_render` definition.
+
+    Parameters
+    ----------
+    function : callable
+        Plotting definition, e.g.
+        :func:`colour.plotting.chromaticity_diagram_plot_CIE1931`, it must be
+        defined at the module level so that it can be pickled.
+    args : array_like, optional
+        Plotting definition positional arguments.
+    filename : unicode, optional
+        Figure will be saved using given ``filename`` argument, the format is
+        deduced from its extension.
+    kwargs : dict, optional
+        Plotting definition keyword arguments.
+    """
+
+    def __new__(cls, function, args=None, filename=None, kwargs=None):
+        """
+        Returns a new instance of the
+        :class:`colour.plotting.PlotSpecification` class.
+        """
+
+        return super(PlotSpecification, cls).__new__(
+            cls, function, tuple(args) if args is not None else (), filename,
+            dict(kwargs) if kwargs is not None else {})
+
+
+def _batch_render_initialiser():
+    """
+    Initialises a :func:`colour.plotting.batch_render` definition worker
+    process with the headless *Agg* backend.
+    """
+
+    matplotlib.pyplot.switch_backend('agg')
+
+
+def _render_specification(specification):
+    """
+    Renders given plot specification and saves the figure.
+
+    Parameters
+    ----------
+    specification : PlotSpecification
+        Plot specification to render.
+
+    Returns
+    -------
+    unicode
+        Saved figure filename.
+    """
+
+    function, args, filename, kwargs = specification
+
+    figures = set(matplotlib.pyplot.get_fignums())
+
+    settings = dict(kwargs)
+    settings.update({'standalone': False, 'filename': None})
+
+    matplotlib.pyplot.figure()
+    try:
+        figure = function(*args, **settings)
+        if figure is None:
+            figure = matplotlib.pyplot.gcf()
+
+        figure.savefig(filename)
+    finally:
+        for figure in set(matplotlib.pyplot.get_fignums()) - figures:
+            matplotlib.pyplot.close(figure)
+
+    return filename
+
+
+def batch_render(specifications, processes=None, chunksize=1):
+    """
+    Renders given plot specifications and saves their figures, the plots are
+    rendered with the headless *Agg* backend across a pool of worker
+    processes.
+
+    Parameters
+    ----------
+    specifications : array_like
+        :class:`colour.plotting.PlotSpecification` class instances or tuples
+        of (``function``, ``args``, ``filename``, ``kwargs``) arguments, the
+        ``kwargs`` argument being optional.
+    processes : int, optional
+        Worker processes count, default to the count of *CPU*, if *1*, the
+        plots are rendered in the current process and no
+        :class:`multiprocessing.Pool` class instance is created.
+    chunksize : int, optional
+        Count of plot specifications sent at once to a worker process.
+
+    Returns
+    -------
+    list
+        Saved figures filenames.
+
+    Raises
+    ------
+    ValueError
+        If a plot specification has no filename.
+
+    Notes
+    -----
+    -   The plotting definitions draw on the *pyplot* current figure which is
+        global to a process: each worker process renders a single plot
+        specification at a time on a new figure that is saved with the
+        :meth:`matplotlib.figure.Figure.savefig` method and closed
+        afterwards, thus the plots do not share any figure state.
+    -   The worker processes are reused for all the plot specifications, the
+        data cached by *Colour* definitions, e.g. the
+        *Chromaticity Diagram* colours rasters or the *Planckian Locus*
+        chromaticity coordinates, are computed once per worker process.
+    -   The plotting definitions ``standalone`` and ``filename`` keyword
+        arguments are ignored.
+
+    Examples
+    --------
+    >>> import os
+    >>> import tempfile
+    >>> from colour.plotting import ColourSwatch, single_colour_swatch_plot
+    >>> directory = tempfile.mkdtemp()
+    >>> specifications = [
+    ...     (single_colour_swatch_plot, (ColourSwatch(RGB=RGB), ),
+    ...      os.path.join(directory, '{0}.png'.format(i)))
+    ...     for i, RGB in enumerate([(0.2, 0.4, 0.6), (0.6, 0.4, 0.2)])]
+    >>> [os.path.basename(filename)
+    ...  for filename in batch_render(specifications, processes=1)]
+    ['0.png', '1.png']
+    """
+
+    specifications = [
+        specification if isinstance(specification, PlotSpecification) else
+        PlotSpecification(*specification) for specification in specifications
+    ]
+
+    for specification in specifications:
+        if specification.filename is None:
+            raise ValueError(
+                '"{0}" plot specification has no filename!'.format(
+                    specification))
+
+    if processes == 1:
+        return [
+            _render_specification(specification)
+            for specification in specifications
+        ]
+
+    pool = Pool(processes=processes, initializer=_batch_render_initialiser)
+    try:
+        filenames = pool.map(
+            _render_specification, specifications, chunksize=chunksize)
+    finally:
+        pool.close()
+        pool.join()
+
+    return filenames
@@ -17,6 +17,7 @@ from __future__ import division
 
 import bisect
 import numpy as np
+import os
 import pylab
 from matplotlib.collections import LineCollection
 from matplotlib.patches import Polygon
@@ -28,8 +29,8 @@ from colour.models import (Luv_to_uv, Luv_uv_to_xy, UCS_to_uv, UCS_uv_to_xy,
 from colour.plotting import (
     DEFAULT_FIGURE_WIDTH, DEFAULT_PLOTTING_COLOURSPACE,
     XYZ_to_plotting_colourspace, canvas, get_cmfs, render)
-from colour.utilities import (is_string, normalise_maximum, suppress_warnings,
-                              tstack)
+from colour.utilities import (as_float_array, is_string, normalise_maximum,
+                              suppress_warnings, tstack)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -39,7 +40,8 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
 __all__ = [
-    'spectral_locus_plot', 'chromaticity_diagram_colours_plot',
+    'CHROMATICITY_DIAGRAM_RASTERS_CACHE_SIZE', 'spectral_locus_plot',
+    'chromaticity_diagram_raster', 'chromaticity_diagram_colours_plot',
     'chromaticity_diagram_plot', 'chromaticity_diagram_plot_CIE1931',
     'chromaticity_diagram_plot_CIE1960UCS',
     'chromaticity_diagram_plot_CIE1976UCS', 'spds_chromaticity_diagram_plot',
@@ -48,6 +50,16 @@ __all__ = [
     'spds_chromaticity_diagram_plot_CIE1976UCS'
 ]
 
+CHROMATICITY_DIAGRAM_RASTERS_CACHE_SIZE = 64
+"""
+Maximum count of *Chromaticity Diagram* colours rasters cached by
+:func:`colour.plotting.diagrams.chromaticity_diagram_raster` definition.
+
+CHROMATICITY_DIAGRAM_RASTERS_CACHE_SIZE : int
+"""
+
+_CHROMATICITY_DIAGRAM_RASTERS_CACHE = None
+
 
 def spectral_locus_plot(cmfs='CIE 1931 2 Degree Standard Observer',
                         spectral_locus_colours='black',
@@ -197,10 +209,121 @@ def spectral_locus_plot(cmfs='CIE 1931 2 Degree Standard Observer',
     return render(**kwargs)
 
 
+def chromaticity_diagram_raster(samples=256,
+                                cmfs='CIE 1931 2 Degree Standard Observer',
+                                method='CIE 1931',
+                                cache_directory=None):
+    """
+    Returns the *Chromaticity Diagram* colours raster according to given
+    method, i.e. the *Chromaticity Diagram* background colours in the
+    :attr:`colour.plotting.DEFAULT_PLOTTING_COLOURSPACE` colourspace.
+
+    The rasters are cached per method, standard observer colour matching
+    functions, samples count and plotting colourspace, and optionally
+    persisted as *PNG* image files in given directory so that they are reused
+    across sessions.
+
+    Parameters
+    ----------
+    samples : numeric, optional
+        Samples count on one axis.
+    cmfs : unicode, optional
+        Standard observer colour matching functions used for
+        *Chromaticity Diagram* bounds.
+    method : unicode, optional
+        **{'CIE 1931', 'CIE 1960 UCS', 'CIE 1976 UCS'}**,
+        *Chromaticity Diagram* method.
+    cache_directory : unicode, optional
+        Directory the rasters are read from and written to as *PNG* image
+        files, the rasters are only cached in memory if not given.
+
+    Returns
+    -------
+    ndarray
+        *Chromaticity Diagram* colours raster of shape
+        (``samples``, ``samples``, 3), the first row being the top of the
+        diagram.
+
+    Notes
+    -----
+    -   The raster values are clipped in domain [0, 1] and the undefined
+        values, e.g. on the abscissa axis, are set to zero.
+    -   The rasters read from the *PNG* image files are quantised with an
+        8-bit depth.
+
+    Examples
+    --------
+    >>> chromaticity_diagram_raster(64).shape
+    (64, 64, 3)
+    """
+
+    from colour.plotting.common import (DEFAULT_PLOTTING_COLOURSPACE as
+                                        plotting_colourspace)
+
+    global _CHROMATICITY_DIAGRAM_RASTERS_CACHE
+    if _CHROMATICITY_DIAGRAM_RASTERS_CACHE is None:
+        _CHROMATICITY_DIAGRAM_RASTERS_CACHE = {}
+
+    cmfs = get_cmfs(cmfs)
+    method = method.upper()
+
+    key = (method, cmfs.name, samples, plotting_colourspace.name)
+    path = None
+    if cache_directory is not None:
+        path = os.path.join(cache_directory, '{0}.png'.format(
+            ' - '.join([str(x) for x in key])))
+
+    RGB = _CHROMATICITY_DIAGRAM_RASTERS_CACHE.get(key)
+    if RGB is not None:
+        if path is not None and not os.path.exists(path):
+            pylab.imsave(path, RGB)
+
+        return RGB
+
+    if path is not None and os.path.exists(path):
+        RGB = as_float_array(pylab.imread(path)[..., 0:3])
+    else:
+        ii, jj = np.meshgrid(
+            np.linspace(0, 1, samples), np.linspace(1, 0, samples))
+        ij = tstack((ii, jj))
+
+        with suppress_warnings(False):
+            if method == 'CIE 1931':
+                XYZ = xy_to_XYZ(ij)
+            elif method == 'CIE 1960 UCS':
+                XYZ = xy_to_XYZ(UCS_uv_to_xy(ij))
+            elif method == 'CIE 1976 UCS':
+                XYZ = xy_to_XYZ(Luv_uv_to_xy(ij))
+            else:
+                raise ValueError(
+                    'Invalid method: "{0}", must be one of '
+                    '{{\'CIE 1931\', \'CIE 1960 UCS\', '
+                    '\'CIE 1976 UCS\'}}'.format(method))
+
+            RGB = normalise_maximum(
+                XYZ_to_plotting_colourspace(
+                    XYZ, plotting_colourspace.whitepoint),
+                axis=-1)
+
+        RGB = np.clip(np.nan_to_num(RGB), 0, 1)
+
+        if path is not None:
+            pylab.imsave(path, RGB)
+
+    if (len(_CHROMATICITY_DIAGRAM_RASTERS_CACHE) >=
+            CHROMATICITY_DIAGRAM_RASTERS_CACHE_SIZE):
+        _CHROMATICITY_DIAGRAM_RASTERS_CACHE.clear()
+
+    _CHROMATICITY_DIAGRAM_RASTERS_CACHE[key] = RGB
+
+    return RGB
+
+
 def chromaticity_diagram_colours_plot(
         samples=256,
         cmfs='CIE 1931 2 Degree Standard Observer',
         method='CIE 1931',
+        cache_directory=None,
         **kwargs):
     """
     Plots the *Chromaticity Diagram* colours according to given method.
@@ -215,6 +338,10 @@ def chromaticity_diagram_colours_plot(
     method : unicode, optional
         **{'CIE 1931', 'CIE 1960 UCS', 'CIE 1976 UCS'}**,
         *Chromaticity Diagram* method.
+    cache_directory : unicode, optional
+        Directory the *Chromaticity Diagram* colours rasters are persisted
+        in, see :func:`colour.plotting.diagrams.chromaticity_diagram_raster`
+        definition.
 
     Other Parameters
     ----------------
@@ -227,6 +354,12 @@ def chromaticity_diagram_colours_plot(
     Figure
         Current figure or None.
 
+    Notes
+    -----
+    -   The *Chromaticity Diagram* colours raster is cached, thus only the
+        first call for given method, colour matching functions, samples
+        count and plotting colourspace computes it.
+
     Examples
     --------
     >>> chromaticity_diagram_colours_plot()  # doctest: +SKIP
@@ -241,34 +374,21 @@ def chromaticity_diagram_colours_plot(
 
     axes = canvas(**settings).gca()
 
+    RGB = chromaticity_diagram_raster(samples, cmfs, method, cache_directory)
+
     cmfs = get_cmfs(cmfs)
 
     illuminant = DEFAULT_PLOTTING_COLOURSPACE.whitepoint
 
-    ii, jj = np.meshgrid(
-        np.linspace(0, 1, samples), np.linspace(1, 0, samples))
-    ij = tstack((ii, jj))
-
     with suppress_warnings(False):
         method = method.upper()
         if method == 'CIE 1931':
-            XYZ = xy_to_XYZ(ij)
             spectral_locus = XYZ_to_xy(cmfs.values, illuminant)
         elif method == 'CIE 1960 UCS':
-            XYZ = xy_to_XYZ(UCS_uv_to_xy(ij))
             spectral_locus = UCS_to_uv(XYZ_to_UCS(cmfs.values))
         elif method == 'CIE 1976 UCS':
-            XYZ = xy_to_XYZ(Luv_uv_to_xy(ij))
             spectral_locus = Luv_to_uv(
                 XYZ_to_Luv(cmfs.values, illuminant), illuminant)
-        else:
-            raise ValueError(
-                'Invalid method: "{0}", must be one of '
-                '{\'CIE 1931\', \'CIE 1960 UCS\', \'CIE 1976 UCS\'}'.format(
-                    method))
-
-        RGB = normalise_maximum(
-            XYZ_to_plotting_colourspace(XYZ, illuminant), axis=-1)
 
     polygon = Polygon(spectral_locus, facecolor='none', edgecolor='none')
     axes.add_patch(polygon)
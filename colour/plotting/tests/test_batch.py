@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.plotting.batch` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import matplotlib.pyplot
+import os
+import shutil
+import tempfile
+import unittest
+
+from colour.plotting import (ColourSwatch, PlotSpecification, batch_render,
+                             single_colour_swatch_plot)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['TestBatchRender']
+
+
+class TestBatchRender(unittest.TestCase):
+    """
+    Defines :func:`colour.plotting.batch.batch_render` definition unit tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+        self._specifications = [
+            PlotSpecification(
+                single_colour_swatch_plot, (ColourSwatch(RGB=RGB), ),
+                os.path.join(self._temporary_directory, '{0}.png'.format(i)),
+                {'figure_size': (2, 2)})
+            for i, RGB in enumerate([(0.2, 0.4, 0.6), (0.6, 0.4, 0.2),
+                                     (0.4, 0.6, 0.2)])
+        ]
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_batch_render(self):
+        """
+        Tests :func:`colour.plotting.batch.batch_render` definition.
+        """
+
+        figures = matplotlib.pyplot.get_fignums()
+
+        filenames = batch_render(self._specifications, processes=1)
+        self.assertListEqual(
+            filenames, [x.filename for x in self._specifications])
+        for filename in filenames:
+            self.assertGreater(os.path.getsize(filename), 0)
+
+        self.assertListEqual(matplotlib.pyplot.get_fignums(), figures)
+
+        for filename in filenames:
+            os.remove(filename)
+
+        filenames = batch_render(
+            [tuple(x) for x in self._specifications], processes=2)
+        self.assertListEqual(
+            filenames, [x.filename for x in self._specifications])
+        for filename in filenames:
+            self.assertGreater(os.path.getsize(filename), 0)
+
+    def test_raise_exception_batch_render(self):
+        """
+        Tests :func:`colour.plotting.batch.batch_render` definition raised
+        exception.
+        """
+
+        self.assertRaises(ValueError, batch_render,
+                          [(single_colour_swatch_plot, (ColourSwatch(), ))])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.plotting.diagrams` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import os
+import shutil
+import tempfile
+import unittest
+
+from colour.plotting import diagrams
+from colour.plotting.diagrams import chromaticity_diagram_raster
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['TestChromaticityDiagramRaster']
+
+
+class TestChromaticityDiagramRaster(unittest.TestCase):
+    """
+    Defines :func:`colour.plotting.diagrams.chromaticity_diagram_raster`
+    definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_chromaticity_diagram_raster(self):
+        """
+        Tests :func:`colour.plotting.diagrams.chromaticity_diagram_raster`
+        definition.
+        """
+
+        for method in ('CIE 1931', 'CIE 1960 UCS', 'CIE 1976 UCS'):
+            RGB = chromaticity_diagram_raster(32, method=method)
+            self.assertTupleEqual(RGB.shape, (32, 32, 3))
+            self.assertTrue(np.all(np.isfinite(RGB)))
+            self.assertTrue(np.all((RGB >= 0) & (RGB <= 1)))
+
+            self.assertIs(chromaticity_diagram_raster(32, method=method), RGB)
+
+        self.assertIs(
+            chromaticity_diagram_raster(32, method='cie 1931'),
+            chromaticity_diagram_raster(32, method='CIE 1931'))
+
+        self.assertRaises(
+            ValueError, chromaticity_diagram_raster, 32, method='Undefined')
+
+    def test_cache_directory_chromaticity_diagram_raster(self):
+        """
+        Tests :func:`colour.plotting.diagrams.chromaticity_diagram_raster`
+        definition persistence in a cache directory.
+        """
+
+        RGB = chromaticity_diagram_raster(
+            24, cache_directory=self._temporary_directory)
+
+        paths = os.listdir(self._temporary_directory)
+        self.assertEqual(len(paths), 1)
+        self.assertTrue(paths[0].endswith('.png'))
+
+        diagrams._CHROMATICITY_DIAGRAM_RASTERS_CACHE.clear()
+
+        np.testing.assert_allclose(
+            chromaticity_diagram_raster(
+                24, cache_directory=self._temporary_directory),
+            RGB,
+            atol=1 / 255)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.plotting.volume` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+
+from colour.plotting.volume import RGB_density_voxels
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['TestRGB_density_voxels']
+
+
+class TestRGB_density_voxels(unittest.TestCase):
+    """
+    Defines :func:`colour.plotting.volume.RGB_density_voxels` definition unit
+    tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._RGB = np.random.RandomState(4).random_sample((64, 48, 3))
+
+    def test_RGB_density_voxels(self):
+        """
+        Tests :func:`colour.plotting.volume.RGB_density_voxels` definition.
+        """
+
+        RGB = np.array([[0.1, 0.2, 0.3], [0.1, 0.2, 0.3], [0.3, 0.2, 0.1]])
+        points, RGB_v, counts = RGB_density_voxels(
+            RGB, 'sRGB', 'CIE Lab', voxel_size=1)
+
+        np.testing.assert_almost_equal(
+            points,
+            np.array([[-5.5, -17.5, 50.5], [4.5, 22.5, 53.5]]),
+            decimal=7)
+        np.testing.assert_almost_equal(RGB_v, RGB[1:], decimal=7)
+        np.testing.assert_almost_equal(
+            counts, np.array([2, 1]), decimal=7)
+
+        points, RGB_v, counts = RGB_density_voxels(
+            self._RGB, 'sRGB', 'CIE xyY', voxel_size=0.05)
+        self.assertEqual(np.sum(counts), 64 * 48)
+        np.testing.assert_almost_equal(
+            np.sum(RGB_v * counts[..., np.newaxis], axis=0),
+            np.sum(np.reshape(self._RGB, (-1, 3)), axis=0),
+            decimal=7)
+
+        points, RGB_v, counts = RGB_density_voxels(
+            np.full((4, 3), np.nan), 'sRGB', 'CIE xyY')
+        self.assertTupleEqual(points.shape, (0, 3))
+        self.assertTupleEqual(counts.shape, (0, ))
+
+    def test_chunks_RGB_density_voxels(self):
+        """
+        Tests :func:`colour.plotting.volume.RGB_density_voxels` definition
+        streaming accumulation across chunks.
+        """
+
+        points, RGB_v, counts = RGB_density_voxels(
+            self._RGB, 'sRGB', 'CIE Lab', voxel_size=(5, 5, 2))
+
+        for chunk_size in (1, 100, 1000):
+            points_c, RGB_c, counts_c = RGB_density_voxels(
+                (self._RGB[i:i + 16] for i in range(0, 64, 16)),
+                'sRGB',
+                'CIE Lab',
+                voxel_size=(5, 5, 2),
+                chunk_size=chunk_size)
+
+            np.testing.assert_almost_equal(points_c, points, decimal=7)
+            np.testing.assert_almost_equal(RGB_c, RGB_v, decimal=7)
+            np.testing.assert_equal(counts_c, counts)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -22,7 +22,7 @@ from colour.models.common import (COLOURSPACE_MODELS_LABELS,
                                   XYZ_to_colourspace_model)
 from colour.plotting import (DEFAULT_PLOTTING_COLOURSPACE, cube,
                              get_RGB_colourspace, get_cmfs, grid, render)
-from colour.utilities import Structure, tsplit, tstack
+from colour.utilities import Structure, as_float_array, tsplit, tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -33,9 +33,17 @@ __status__ = 'Production'
 
 __all__ = [
     'common_colourspace_model_axis_reorder', 'nadir_grid', 'RGB_identity_cube',
-    'RGB_colourspaces_gamuts_plot', 'RGB_scatter_plot'
+    'RGB_density_voxels', 'RGB_colourspaces_gamuts_plot', 'RGB_scatter_plot'
 ]
 
+_VOXELS_INDEX_BITS = 21
+"""
+Bits count used to encode each axis voxel index into a single integer voxel
+key by the :func:`colour.plotting.volume.RGB_density_voxels` definition.
+
+_VOXELS_INDEX_BITS : int
+"""
+
 
 def common_colourspace_model_axis_reorder(a, model=None):
     """
@@ -396,6 +404,139 @@ def RGB_identity_cube(plane=None,
     return quads, RGB
 
 
+def RGB_density_voxels(RGB,
+                       colourspace,
+                       reference_colourspace='CIE xyY',
+                       voxel_size=None,
+                       chunk_size=2 ** 18):
+    """
+    Bins given *RGB* colourspace array into a 3-D histogram of the reference
+    colourspace and returns its occupied voxels.
+
+    The *RGB* colourspace array is converted and accumulated by chunks, thus
+    the memory used is bounded by the chunk size and the occupied voxels
+    count instead of the *RGB* colourspace array size.
+
+    Parameters
+    ----------
+    RGB : array_like or iterable
+        *RGB* colourspace array or iterable of *RGB* colourspace arrays, e.g.
+        the tiles of an image being read, accumulated in the same histogram.
+    colourspace : unicode
+        *RGB* colourspace of the *RGB* array.
+    reference_colourspace : unicode, optional
+        **{'CIE XYZ', 'CIE xyY', 'CIE Lab', 'CIE Luv', 'CIE UCS', 'CIE UVW',
+        'IPT', 'Hunter Lab', 'Hunter Rdab'}**,
+        Reference colourspace for colour conversion.
+    voxel_size : numeric or array_like, optional
+        Voxel size in the reference colourspace, for each axis of the
+        volume plotting axis order if array_like, default to 1 / 64 of the
+        largest extent of the first chunk.
+    chunk_size : int, optional
+        Count of *RGB* colourspace array values converted at once.
+
+    Returns
+    -------
+    tuple
+        Occupied voxels centres in the reference colourspace in the volume
+        plotting axis order, average *RGB* colourspace array values and
+        values count of the occupied voxels.
+
+    Notes
+    -----
+    -   The non finite reference colourspace values, e.g. resulting from
+        *NaN* *RGB* colourspace array values, are not accumulated.
+    -   The voxels indexes are clipped in domain
+        [-1048576, 1048575].
+
+    Examples
+    --------
+    >>> RGB = np.array([[0.1, 0.2, 0.3],
+    ...                 [0.1, 0.2, 0.3],
+    ...                 [0.3, 0.2, 0.1]])
+    >>> points, RGB_v, weights = RGB_density_voxels(
+    ...     RGB, 'sRGB', 'CIE Lab', voxel_size=1)
+    >>> points
+    array([[ -5.5, -17.5,  50.5],
+           [  4.5,  22.5,  53.5]])
+    >>> RGB_v
+    array([[ 0.1,  0.2,  0.3],
+           [ 0.3,  0.2,  0.1]])
+    >>> weights
+    array([ 2.,  1.])
+    """
+
+    colourspace = get_RGB_colourspace(colourspace)
+
+    if isinstance(RGB, np.ndarray) or not hasattr(RGB, '__iter__'):
+        RGB = (RGB, )
+
+    b = _VOXELS_INDEX_BITS
+    offset = 2 ** (b - 1)
+
+    keys, sums, counts = [], [], []
+    for RGB_c in RGB:
+        RGB_c = np.reshape(as_float_array(RGB_c), (-1, 3))
+
+        for i in range(0, RGB_c.shape[0], chunk_size):
+            RGB_s = RGB_c[i:i + chunk_size]
+
+            XYZ = RGB_to_XYZ(RGB_s, colourspace.whitepoint,
+                             colourspace.whitepoint,
+                             colourspace.RGB_to_XYZ_matrix)
+
+            points = common_colourspace_model_axis_reorder(
+                XYZ_to_colourspace_model(XYZ, colourspace.whitepoint,
+                                         reference_colourspace),
+                reference_colourspace)
+
+            finite = np.all(np.isfinite(points), axis=-1)
+            points, RGB_s = points[finite], RGB_s[finite]
+
+            if voxel_size is None:
+                extent = (np.max(np.ptp(points, axis=0))
+                          if points.shape[0] else 0)
+                voxel_size = extent / 64 if extent > 0 else 1
+
+            index = np.clip(
+                np.floor(points / voxel_size), -offset, offset - 1).astype(
+                    np.int64) + offset
+            i, j, k = tsplit(index, np.int64)
+            key = (i << 2 * b) | (j << b) | k
+
+            key, inverse = np.unique(key, return_inverse=True)
+            keys.append(key)
+            sums.append(
+                tstack([
+                    np.bincount(inverse, RGB_s[..., j], key.size)
+                    for j in range(3)
+                ]))
+            counts.append(np.bincount(inverse, minlength=key.size))
+
+    if keys:
+        key, inverse = np.unique(np.concatenate(keys), return_inverse=True)
+        RGB_s = np.concatenate(sums)
+        sums = tstack([
+            np.bincount(inverse, RGB_s[..., j], key.size) for j in range(3)
+        ])
+        counts = np.bincount(
+            inverse, np.concatenate(counts).astype(DEFAULT_FLOAT_DTYPE),
+            key.size)
+    else:
+        key = np.zeros(0, np.int64)
+        sums, counts = np.zeros((0, 3)), np.zeros(0)
+
+    mask = 2 ** b - 1
+    index = tstack([(key >> 2 * b) & mask, (key >> b) & mask,
+                    key & mask]) - offset
+    if voxel_size is None:
+        voxel_size = 1
+
+    points = (index + 0.5) * as_float_array(voxel_size)
+
+    return points, sums / counts[..., np.newaxis], counts
+
+
 def RGB_colourspaces_gamuts_plot(colourspaces=None,
                                  reference_colourspace='CIE xyY',
                                  segments=8,
@@ -585,10 +726,18 @@ def RGB_scatter_plot(RGB,
                      spectral_locus_colour=None,
                      points_size=12,
                      cmfs='CIE 1931 2 Degree Standard Observer',
+                     density=False,
+                     voxel_size=None,
+                     chunk_size=2 ** 18,
                      **kwargs):
     """
     Plots given *RGB* colourspace array in a scatter plot.
 
+    In density mode, the *RGB* colourspace array is binned into a 3-D
+    histogram of the reference colourspace and a single scatter point is
+    plotted per occupied voxel, making the plot of large arrays, e.g. the
+    pixels of a high resolution image, tractable.
+
     Parameters
     ----------
     RGB : array_like
@@ -612,9 +761,18 @@ def RGB_scatter_plot(RGB,
     spectral_locus_colour : array_like, optional
         Spectral locus line colour.
     points_size : numeric, optional
-        Scatter points size.
+        Scatter points size, maximum scatter points size in density mode.
     cmfs : unicode, optional
         Standard observer colour matching functions used for spectral locus.
+    density : bool, optional
+        Whether to plot the occupied voxels of the *RGB* colourspace array
+        3-D histogram instead of every *RGB* colourspace array value.
+    voxel_size : numeric or array_like, optional
+        {:func:`colour.plotting.volume.RGB_density_voxels`},
+        Voxel size in the reference colourspace.
+    chunk_size : int, optional
+        {:func:`colour.plotting.volume.RGB_density_voxels`},
+        Count of *RGB* colourspace array values converted at once.
 
     Other Parameters
     ----------------
@@ -627,10 +785,20 @@ def RGB_scatter_plot(RGB,
     Figure
         Current figure or None.
 
+    Notes
+    -----
+    -   In density mode, the ``RGB`` argument can be an iterable of *RGB*
+        colourspace arrays, e.g. the tiles of an image being read, the
+        scatter points are coloured with the average *RGB* colourspace array
+        value of their voxel and their area is proportional to the logarithm
+        of their voxel values count.
+
     Examples
     --------
     >>> RGB = np.random.random((128, 128, 3))
     >>> RGB_scatter_plot(RGB, 'ITU-R BT.709')  # doctest: +SKIP
+    >>> RGB_scatter_plot(  # doctest: +SKIP
+    ...     RGB, 'ITU-R BT.709', 'CIE Lab', density=True, voxel_size=2)
 
     .. image:: ../_static/Plotting_RGB_Scatter_Plot.png
         :align: center
@@ -663,12 +831,21 @@ def RGB_scatter_plot(RGB,
         cmfs=cmfs,
         **settings)
 
-    XYZ = RGB_to_XYZ(RGB, colourspace.whitepoint, colourspace.whitepoint,
-                     colourspace.RGB_to_XYZ_matrix)
+    if density:
+        points, RGB, counts = RGB_density_voxels(
+            RGB, colourspace.name, reference_colourspace, voxel_size,
+            chunk_size)
+        RGB = np.clip(RGB, 0, 1)
+        points_size = (points_size * np.log1p(counts) /
+                       np.log1p(np.max(counts)) if counts.size else 0)
+    else:
+        XYZ = RGB_to_XYZ(RGB, colourspace.whitepoint, colourspace.whitepoint,
+                         colourspace.RGB_to_XYZ_matrix)
 
-    points = common_colourspace_model_axis_reorder(
-        XYZ_to_colourspace_model(XYZ, colourspace.whitepoint,
-                                 reference_colourspace), reference_colourspace)
+        points = common_colourspace_model_axis_reorder(
+            XYZ_to_colourspace_model(XYZ, colourspace.whitepoint,
+                                     reference_colourspace),
+            reference_colourspace)
 
     axes = matplotlib.pyplot.gca()
     axes.scatter(
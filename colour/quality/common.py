@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+"""
+Colour Quality Common Utilities
+===============================
+
+Defines the common objects used by the batched *Colour Rendering Index* (CRI)
+and *Colour Quality Scale* (CQS) computations:
+
+-   :func:`colour.quality.common.spds_to_array`
+-   :func:`colour.quality.common.reference_illuminants`
+-   :func:`colour.quality.common.samples_tristimulus_values`
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+
+from colour.colorimetry import (ASTME30815_PRACTISE_SHAPE,
+                                MultiSpectralPowerDistribution,
+                                D_illuminant_relative_msa, blackbody_msa)
+from colour.temperature import CCT_to_xy_CIE_D
+from colour.utilities import as_float_array
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'spds_to_array', 'reference_illuminants', 'samples_tristimulus_values'
+]
+
+
+def spds_to_array(spds, shape=ASTME30815_PRACTISE_SHAPE):
+    """
+    Converts given spectral power distributions to an array of values aligned
+    to given spectral shape.
+
+    Parameters
+    ----------
+    spds : array_like or MultiSpectralPowerDistribution or list
+        Spectral power distributions, either a
+        :class:`colour.MultiSpectralPowerDistribution` class instance, a list
+        of :class:`colour.SpectralPowerDistribution` class instances or an
+        array_like of values already sampled at given spectral shape with the
+        wavelengths in the last axis.
+    shape : SpectralShape, optional
+        Spectral shape to align the spectral power distributions to.
+
+    Returns
+    -------
+    tuple
+        Spectral power distributions names and values array of shape (N, W),
+        the names are *None* if given spectral power distributions are an
+        array_like.
+
+    Raises
+    ------
+    ValueError
+        If given array_like last axis does not match the spectral shape.
+
+    Examples
+    --------
+    >>> from colour import ILLUMINANTS_SPDS
+    >>> names, values = spds_to_array(
+    ...     [ILLUMINANTS_SPDS['F2'], ILLUMINANTS_SPDS['F7']])
+    >>> names
+    ['F2', 'F7']
+    >>> values.shape
+    (2, 421)
+    """
+
+    if isinstance(spds, MultiSpectralPowerDistribution):
+        if spds.shape != shape:
+            spds = spds.copy().align(shape)
+
+        return list(spds.labels), np.transpose(spds.values)
+
+    if isinstance(spds, (list, tuple)) and all(
+            hasattr(spd, 'shape') and hasattr(spd, 'name') for spd in spds):
+        return ([spd.name for spd in spds],
+                np.array([(spd if spd.shape == shape else
+                           spd.copy().align(shape)).values for spd in spds]))
+
+    values = as_float_array(spds)
+    if values.shape[-1] != len(shape.range()):
+        raise ValueError(
+            'Spectral power distributions values last axis must have "{0}" '
+            'samples, as defined by "{1}" spectral shape!'.format(
+                len(shape.range()), shape))
+
+    return None, np.reshape(values, (-1, values.shape[-1]))
+
+
+def reference_illuminants(CCT, shape=ASTME30815_PRACTISE_SHAPE):
+    """
+    Returns the reference illuminants values for given correlated colour
+    temperatures: the planckian radiator below 5000K and the *CIE Illuminant
+    D Series* at and above 5000K.
+
+    Parameters
+    ----------
+    CCT : array_like
+        Correlated colour temperatures :math:`T_{cp}`.
+    shape : SpectralShape, optional
+        Spectral shape of the reference illuminants.
+
+    Returns
+    -------
+    ndarray
+        Reference illuminants values of shape (N, W).
+
+    Notes
+    -----
+    -   The planckian radiators and the *CIE Illuminant D Series* are
+        respectively computed with single
+        :func:`colour.colorimetry.blackbody_msa` and
+        :func:`colour.colorimetry.D_illuminant_relative_msa` definitions
+        evaluations.
+
+    Examples
+    --------
+    >>> reference_illuminants(np.array([2800, 6500])).shape
+    (2, 421)
+    """
+
+    CCT = np.ravel(CCT)
+    wavelengths = shape.range()
+
+    S_r = np.empty((CCT.shape[0], len(wavelengths)))
+
+    blackbody = CCT < 5000
+    S_r[blackbody] = blackbody_msa(CCT[blackbody], shape)
+    S_r[~blackbody] = D_illuminant_relative_msa(
+        CCT_to_xy_CIE_D(CCT[~blackbody]), shape)
+
+    return S_r
+
+
+def samples_tristimulus_values(S, R, cmfs):
+    """
+    Returns the *CIE XYZ* tristimulus values of given samples reflectances
+    under given illuminants using a single tensor contraction.
+
+    Parameters
+    ----------
+    S : array_like
+        Illuminants values of shape (N, W).
+    R : array_like
+        Samples reflectances values of shape (M, W).
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions sampled at the same
+        wavelengths than the illuminants and samples.
+
+    Returns
+    -------
+    ndarray
+        *CIE XYZ* tristimulus values of shape (N, M, 3).
+
+    Notes
+    -----
+    -   Output *CIE XYZ* tristimulus values are normalised so that the perfect
+        reflecting diffuser under each illuminant has luminance :math:`Y`
+        equal to 100, as with
+        :func:`colour.colorimetry.spectral_to_XYZ_integration` definition.
+
+    Examples
+    --------
+    >>> from colour import ILLUMINANTS_SPDS, STANDARD_OBSERVERS_CMFS
+    >>> cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']
+    >>> cmfs = cmfs.copy().trim(ASTME30815_PRACTISE_SHAPE)
+    >>> S = ILLUMINANTS_SPDS['D65'].copy().align(cmfs.shape).values
+    >>> samples_tristimulus_values(
+    ...     S[np.newaxis], np.ones((1, len(S))), cmfs)  # doctest: +ELLIPSIS
+    array([[[  95.0465322...,  100.        ,  108.8970685...]]])
+    """
+
+    S = as_float_array(S)
+    R = as_float_array(R)
+
+    x_bar = cmfs.values
+
+    RC = R[..., np.newaxis] * x_bar
+    XYZ = np.dot(S, np.reshape(np.transpose(RC, (1, 0, 2)), (S.shape[-1], -1)))
+    XYZ = np.reshape(XYZ, (S.shape[0], R.shape[0], 3))
+
+    XYZ *= (100 / np.dot(S, x_bar[..., 1]))[..., np.newaxis, np.newaxis]
+
+    return XYZ
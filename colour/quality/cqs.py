@@ -7,6 +7,7 @@ Defines *Colour Quality Scale* (CQS) computation objects:
 
 -   :class:`colour.quality.CQS_Specification`
 -   :func:`colour.colour_quality_scale`
+-   :func:`colour.multi_spd_colour_quality_scale`
 
 See Also
 --------
@@ -32,12 +33,14 @@ from colour.algebra import euclidean_distance
 from colour.colorimetry import (
     ASTME30815_PRACTISE_SHAPE, D_illuminant_relative_spd, ILLUMINANTS,
     STANDARD_OBSERVERS_CMFS, blackbody_spd, spectral_to_XYZ)
+from colour.quality.common import (reference_illuminants, spds_to_array,
+                                   samples_tristimulus_values)
 from colour.quality.dataset.vs import VS_INDEXES_TO_NAMES, VS_SPDS
 from colour.models import (Lab_to_LCHab, UCS_to_uv, XYZ_to_Lab, XYZ_to_UCS,
                            XYZ_to_xy, xy_to_XYZ)
 from colour.temperature import CCT_to_xy_CIE_D, uv_to_CCT_Ohno2013
 from colour.adaptation import chromatic_adaptation_VonKries
-from colour.utilities import tsplit
+from colour.utilities import tsplit, tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -48,13 +51,23 @@ __status__ = 'Production'
 
 __all__ = [
     'D65_GAMUT_AREA', 'VS_ColorimetryData', 'VS_ColourQualityScaleData',
-    'CQS_Specification', 'colour_quality_scale', 'gamut_area',
-    'vs_colorimetry_data', 'CCT_factor', 'scale_conversion', 'delta_E_RMS',
-    'colour_quality_scales'
+    'CQS_Specification', 'colour_quality_scale',
+    'multi_spd_colour_quality_scale', 'gamut_area', 'vs_colorimetry_data',
+    'CCT_factor', 'scale_conversion', 'delta_E_RMS', 'colour_quality_scales'
 ]
 
 D65_GAMUT_AREA = 8210
 
+_VS_SPDS_VALUES_CACHE = None
+"""
+Cache of the *VS test colour samples* spectral power distributions values
+aligned to :attr:`colour.colorimetry.ASTME30815_PRACTISE_SHAPE` attribute,
+populated on first use by :func:`colour.quality.cqs._vs_spds_values`
+definition.
+
+_VS_SPDS_VALUES_CACHE : ndarray
+"""
+
 
 class VS_ColorimetryData(
         namedtuple('VS_ColorimetryData', ('name', 'XYZ', 'Lab', 'C'))):
@@ -200,6 +213,143 @@ def colour_quality_scale(spd_test, additional_data=False):
         return Q_a
 
 
+def _vs_spds_values():
+    """
+    Returns the *VS test colour samples* spectral power distributions values
+    aligned to :attr:`colour.colorimetry.ASTME30815_PRACTISE_SHAPE` attribute
+    and caches them if not existing.
+
+    Returns
+    -------
+    ndarray
+        *VS test colour samples* spectral power distributions values.
+    """
+
+    global _VS_SPDS_VALUES_CACHE
+    if _VS_SPDS_VALUES_CACHE is None:
+        _VS_SPDS_VALUES_CACHE = np.array([
+            VS_SPDS[name].copy().align(ASTME30815_PRACTISE_SHAPE).values
+            for _index, name in sorted(VS_INDEXES_TO_NAMES.items())
+        ])
+
+    return _VS_SPDS_VALUES_CACHE
+
+
+def multi_spd_colour_quality_scale(spds_test, additional_data=False):
+    """
+    Returns the *Colour Quality Scale* (CQS) of given spectral power
+    distributions.
+
+    The *VS test colour samples* are aligned once and the tristimulus values of
+    all the samples under all the test and reference illuminants are computed
+    with a single tensor contraction.
+
+    Parameters
+    ----------
+    spds_test : array_like or MultiSpectralPowerDistribution or list
+        Test spectral power distributions, either a
+        :class:`colour.MultiSpectralPowerDistribution` class instance, a list
+        of :class:`colour.SpectralPowerDistribution` class instances or an
+        array_like of values sampled at
+        :attr:`colour.colorimetry.ASTME30815_PRACTISE_SHAPE` attribute
+        wavelengths in the last axis.
+    additional_data : bool, optional
+        Output additional data.
+
+    Returns
+    -------
+    ndarray or CQS_Specification
+        Color quality scale :math:`Q_a` of each test spectral power
+        distribution. If ``additional_data`` is *True*, the
+        :class:`colour.quality.CQS_Specification` class instance
+        :attr:`colour.quality.CQS_Specification.Q_as` attribute is an array
+        of shape (N, 15) of the *VS test colour samples* colour quality scales
+        and :attr:`colour.quality.CQS_Specification.colorimetry_data`
+        attribute stores the test and reference *VS test colour samples*
+        *CIE L\*a\*b\** colourspace values.
+
+    Notes
+    -----
+    -   The correlated colour temperature of each test spectral power
+        distribution is computed with
+        :func:`colour.temperature.uv_to_CCT_Ohno2013` definition, one
+        spectral power distribution at a time.
+
+    References
+    ----------
+    -   :cite:`Davis2010a`
+    -   :cite:`Ohno2008a`
+
+    Examples
+    --------
+    >>> from colour import ILLUMINANTS_SPDS
+    >>> spds = [ILLUMINANTS_SPDS['F2'], ILLUMINANTS_SPDS['F7']]
+    >>> multi_spd_colour_quality_scale(spds)  # doctest: +ELLIPSIS
+    array([ 64.6863391...,  90.8980564...])
+    """
+
+    cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'].copy(
+    ).trim(ASTME30815_PRACTISE_SHAPE)
+
+    shape = cmfs.shape
+    names, S_t = spds_to_array(spds_test, shape)
+    R = np.vstack([np.ones(S_t.shape[-1]), _vs_spds_values()])
+
+    XYZ_t = samples_tristimulus_values(S_t, R, cmfs) / 100
+    uv = UCS_to_uv(XYZ_to_UCS(XYZ_t[:, 0]))
+    CCT = np.array([uv_to_CCT_Ohno2013(uv_i)[0] for uv_i in uv])
+
+    S_r = reference_illuminants(CCT, shape)
+    XYZ_r = samples_tristimulus_values(S_r, R, cmfs) / 100
+
+    XYZ_w_t, XYZ_vs_t = XYZ_t[:, 0:1], XYZ_t[:, 1:]
+    XYZ_w_r, XYZ_vs_r = XYZ_r[:, 0:1], XYZ_r[:, 1:]
+    xy_w_r = XYZ_to_xy(XYZ_w_r)
+
+    XYZ_vs_t = chromatic_adaptation_VonKries(XYZ_vs_t,
+                                             XYZ_w_t,
+                                             XYZ_w_r,
+                                             transform='CMCCAT2000')
+
+    Lab_t = XYZ_to_Lab(XYZ_vs_t, illuminant=xy_w_r)
+    Lab_r = XYZ_to_Lab(XYZ_vs_r, illuminant=xy_w_r)
+    _L_t, C_t, _Hab_t = tsplit(Lab_to_LCHab(Lab_t))
+    _L_r, C_r, _Hab_r = tsplit(Lab_to_LCHab(Lab_r))
+
+    xy_w = ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D65']
+    XYZ_vs_r_D65 = chromatic_adaptation_VonKries(
+        XYZ_vs_r, XYZ_w_r, xy_to_XYZ(xy_w), transform='CMCCAT2000')
+    Lab_r_D65 = XYZ_to_Lab(XYZ_vs_r_D65, illuminant=xy_w)
+    CCT_f = np.minimum(gamut_area(Lab_r_D65) / D65_GAMUT_AREA, 1)
+
+    D_C_ab = C_t - C_r
+    D_E_ab = np.linalg.norm(Lab_t - Lab_r, axis=-1)
+    D_Ep_ab = np.where(D_C_ab > 0, np.sqrt(D_E_ab ** 2 - D_C_ab ** 2), D_E_ab)
+
+    Q_as = scale_conversion(D_Ep_ab, CCT_f[..., np.newaxis])
+
+    D_E_RMS = np.sqrt(np.average(D_E_ab ** 2, axis=-1))
+    D_Ep_RMS = np.sqrt(np.average(D_Ep_ab ** 2, axis=-1))
+
+    Q_a = scale_conversion(D_Ep_RMS, CCT_f)
+    Q_f = scale_conversion(D_E_RMS, CCT_f, 2.928)
+
+    p_delta_C = np.average(np.maximum(D_C_ab, 0), axis=-1)
+    Q_p = 100 - 3.6 * (D_Ep_RMS - p_delta_C)
+
+    G_t = gamut_area(Lab_t)
+    G_r = gamut_area(Lab_r)
+
+    Q_g = G_t / D65_GAMUT_AREA * 100
+    Q_d = G_t / G_r * CCT_f * 100
+
+    if additional_data:
+        return CQS_Specification(names, Q_a, Q_f, Q_p, Q_g, Q_d, Q_as,
+                                 (Lab_t, Lab_r))
+    else:
+        return Q_a
+
+
 def gamut_area(Lab):
     """
     Returns the gamut area :math:`G` covered by given *CIE L\*a\*b\** matrices.
@@ -207,11 +357,12 @@ def gamut_area(Lab):
     Parameters
     ----------
     Lab : array_like
-        *CIE L\*a\*b\** colourspace matrices.
+        *CIE L\*a\*b\** colourspace matrices, the samples are expected to
+        be in the penultimate axis.
 
     Returns
     -------
-    numeric
+    numeric or ndarray
         Gamut area :math:`G`.
 
     Examples
@@ -238,18 +389,18 @@ def gamut_area(Lab):
     """
 
     Lab = np.asarray(Lab)
-    Lab_s = np.roll(np.copy(Lab), -3)
+    Lab_s = np.roll(Lab, -1, axis=-2)
 
     _L, a, b = tsplit(Lab)
     _L_s, a_s, b_s = tsplit(Lab_s)
 
     A = np.linalg.norm(Lab[..., 1:3], axis=-1)
     B = np.linalg.norm(Lab_s[..., 1:3], axis=-1)
-    C = np.linalg.norm(np.dstack((a_s - a, b_s - b)), axis=-1)
+    C = np.linalg.norm(tstack((a_s - a, b_s - b)), axis=-1)
     t = (A + B + C) / 2
     S = np.sqrt(t * (t - A) * (t - B) * (t - C))
 
-    return np.sum(S)
+    return np.sum(S, axis=-1)
 
 
 def vs_colorimetry_data(spd_test,
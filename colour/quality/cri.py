@@ -7,6 +7,7 @@ Defines *Colour Rendering Index* (CRI) computation objects:
 
 -   :class:`colour.quality.CRI_Specification`
 -   :func:`colour.colour_rendering_index`
+-   :func:`colour.multi_spd_colour_rendering_index`
 
 See Also
 --------
@@ -30,9 +31,12 @@ from colour.algebra import euclidean_distance
 from colour.colorimetry import (
     ASTME30815_PRACTISE_SHAPE, D_illuminant_relative_spd,
     STANDARD_OBSERVERS_CMFS, blackbody_spd, spectral_to_XYZ)
+from colour.quality.common import (reference_illuminants, spds_to_array,
+                                   samples_tristimulus_values)
 from colour.quality.dataset.tcs import TCS_INDEXES_TO_NAMES, TCS_SPDS
 from colour.models import UCS_to_uv, XYZ_to_UCS, XYZ_to_xyY
 from colour.temperature import CCT_to_xy_CIE_D, uv_to_CCT_Robertson1968
+from colour.utilities import tsplit
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -43,10 +47,19 @@ __status__ = 'Production'
 
 __all__ = [
     'TCS_ColorimetryData', 'TCS_ColourQualityScaleData', 'CRI_Specification',
-    'colour_rendering_index', 'tcs_colorimetry_data',
-    'colour_rendering_indexes'
+    'colour_rendering_index', 'multi_spd_colour_rendering_index',
+    'tcs_colorimetry_data', 'colour_rendering_indexes'
 ]
 
+_TCS_SPDS_VALUES_CACHE = None
+"""
+Cache of the *test colour samples* spectral power distributions values aligned
+to :attr:`colour.colorimetry.ASTME30815_PRACTISE_SHAPE` attribute, populated
+on first use by :func:`colour.quality.cri._tcs_spds_values` definition.
+
+_TCS_SPDS_VALUES_CACHE : ndarray
+"""
+
 
 class TCS_ColorimetryData(
         namedtuple('TCS_ColorimetryData', ('name', 'XYZ', 'uv', 'UVW'))):
@@ -153,6 +166,136 @@ def colour_rendering_index(spd_test, additional_data=False):
         return Q_a
 
 
+def _tcs_spds_values():
+    """
+    Returns the *test colour samples* spectral power distributions values
+    aligned to :attr:`colour.colorimetry.ASTME30815_PRACTISE_SHAPE` attribute
+    and caches them if not existing.
+
+    Returns
+    -------
+    ndarray
+        *Test colour samples* spectral power distributions values.
+    """
+
+    global _TCS_SPDS_VALUES_CACHE
+    if _TCS_SPDS_VALUES_CACHE is None:
+        _TCS_SPDS_VALUES_CACHE = np.array([
+            TCS_SPDS[name].copy().align(ASTME30815_PRACTISE_SHAPE).values
+            for _index, name in sorted(TCS_INDEXES_TO_NAMES.items())
+        ])
+
+    return _TCS_SPDS_VALUES_CACHE
+
+
+def multi_spd_colour_rendering_index(spds_test, additional_data=False):
+    """
+    Returns the *Colour Rendering Index* (CRI) :math:`Q_a` of given spectral
+    power distributions.
+
+    The *test colour samples* are aligned once and the tristimulus values of
+    all the samples under all the test and reference illuminants are computed
+    with a single tensor contraction.
+
+    Parameters
+    ----------
+    spds_test : array_like or MultiSpectralPowerDistribution or list
+        Test spectral power distributions, either a
+        :class:`colour.MultiSpectralPowerDistribution` class instance, a list
+        of :class:`colour.SpectralPowerDistribution` class instances or an
+        array_like of values sampled at
+        :attr:`colour.colorimetry.ASTME30815_PRACTISE_SHAPE` attribute
+        wavelengths in the last axis.
+    additional_data : bool, optional
+        Output additional data.
+
+    Returns
+    -------
+    ndarray or CRI_Specification
+        *Colour Rendering Index* (CRI) :math:`Q_a` of each test spectral power
+        distribution. If ``additional_data`` is *True*, the
+        :class:`colour.quality.CRI_Specification` class instance
+        :attr:`colour.quality.CRI_Specification.Q_as` attribute is an array
+        of shape (N, 14) of the *test colour samples* rendering indexes and
+        :attr:`colour.quality.CRI_Specification.colorimetry_data` attribute
+        stores the test and reference *test colour samples* :math:`UVW`
+        values.
+
+    References
+    ----------
+    -   :cite:`Ohno2008a`
+
+    Examples
+    --------
+    >>> from colour import ILLUMINANTS_SPDS
+    >>> spds = [ILLUMINANTS_SPDS['F2'], ILLUMINANTS_SPDS['F7']]
+    >>> multi_spd_colour_rendering_index(spds)  # doctest: +ELLIPSIS
+    array([ 64.1515202...,  90.1808558...])
+    """
+
+    cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'].copy(
+    ).trim(ASTME30815_PRACTISE_SHAPE)
+
+    shape = cmfs.shape
+    names, S_t = spds_to_array(spds_test, shape)
+    R = np.vstack([np.ones(S_t.shape[-1]), _tcs_spds_values()])
+
+    XYZ_t = samples_tristimulus_values(S_t, R, cmfs)
+    uv_t = UCS_to_uv(XYZ_to_UCS(XYZ_t))
+    CCT, _D_uv = tsplit(uv_to_CCT_Robertson1968(uv_t[:, 0]))
+
+    S_r = reference_illuminants(CCT, shape)
+    XYZ_r = samples_tristimulus_values(S_r, R, cmfs)
+    uv_r = UCS_to_uv(XYZ_to_UCS(XYZ_r))
+
+    def c(u, v):
+        """
+        Computes the :math:`c` term.
+        """
+
+        return (4 - u - 10 * v) / v
+
+    def d(u, v):
+        """
+        Computes the :math:`d` term.
+        """
+
+        return (1.708 * v + 0.404 - 1.481 * u) / v
+
+    u_t, v_t = tsplit(uv_t[:, 0:1])
+    u_r, v_r = tsplit(uv_r[:, 0:1])
+    u_tcs, v_tcs = tsplit(uv_t[:, 1:])
+
+    c_t, d_t = c(u_t, v_t), d(u_t, v_t)
+    c_r, d_r = c(u_r, v_r), d(u_r, v_r)
+    tcs_c, tcs_d = c(u_tcs, v_tcs), d(u_tcs, v_tcs)
+    u_tcs = ((10.872 + 0.404 * c_r / c_t * tcs_c - 4 * d_r / d_t * tcs_d) /
+             (16.518 + 1.481 * c_r / c_t * tcs_c - d_r / d_t * tcs_d))
+    v_tcs = 5.52 / (16.518 + 1.481 * c_r / c_t * tcs_c - d_r / d_t * tcs_d)
+
+    def UVW(Y, u, v):
+        """
+        Computes the *test colour samples* :math:`UVW` values.
+        """
+
+        W = 25 * Y ** (1 / 3) - 17
+
+        return np.array([13 * W * (u - u_r), 13 * W * (v - v_r), W])
+
+    UVW_t = UVW(XYZ_t[:, 1:, 1], u_tcs, v_tcs)
+    UVW_r = UVW(XYZ_r[:, 1:, 1], uv_r[:, 1:, 0], uv_r[:, 1:, 1])
+
+    Q_as = 100 - 4.6 * np.linalg.norm(UVW_r - UVW_t, axis=0)
+    Q_a = np.average(Q_as[:, 0:8], axis=-1)
+
+    if additional_data:
+        return CRI_Specification(
+            names, Q_a, Q_as,
+            (np.moveaxis(UVW_t, 0, -1), np.moveaxis(UVW_r, 0, -1)))
+    else:
+        return Q_a
+
+
 def tcs_colorimetry_data(spd_t,
                          spd_r,
                          spds_tcs,
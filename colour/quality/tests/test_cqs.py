@@ -5,9 +5,12 @@ Defines unit tests for :mod:`colour.quality.cqs` module.
 
 from __future__ import division, unicode_literals
 
+import numpy as np
 import unittest
 
-from colour.quality import colour_quality_scale
+from colour.quality import (colour_quality_scale,
+                            multi_spd_colour_quality_scale)
+from colour.quality.cqs import gamut_area
 from colour.colorimetry import (ILLUMINANTS_SPDS,
                                 LIGHT_SOURCES_SPDS)
 
@@ -18,7 +21,9 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['TestColourQualityScale']
+__all__ = [
+    'TestColourQualityScale', 'TestMultiSpdColourQualityScale', 'TestGamutArea'
+]
 
 
 class TestColourQualityScale(unittest.TestCase):
@@ -67,5 +72,85 @@ class TestColourQualityScale(unittest.TestCase):
             places=7)
 
 
+class TestMultiSpdColourQualityScale(unittest.TestCase):
+    """
+    Defines :func:`colour.quality.cqs.multi_spd_colour_quality_scale`
+    definition unit tests methods.
+    """
+    def test_multi_spd_colour_quality_scale(self):
+        """
+        Tests :func:`colour.quality.cqs.multi_spd_colour_quality_scale`
+        definition.
+        """
+
+        spds = [
+            ILLUMINANTS_SPDS['F1'], ILLUMINANTS_SPDS['F2'],
+            LIGHT_SOURCES_SPDS['Neodimium Incandescent'],
+            LIGHT_SOURCES_SPDS['H38HT-100 (Mercury)']
+        ]
+
+        np.testing.assert_almost_equal(
+            multi_spd_colour_quality_scale(spds),
+            np.array([
+                75.332008182589348, 64.686339173112856, 87.655035241231985,
+                22.860610106043985
+            ]),
+            decimal=7)
+
+    def test_additional_data_multi_spd_colour_quality_scale(self):
+        """
+        Tests :func:`colour.quality.cqs.multi_spd_colour_quality_scale`
+        definition additional data.
+        """
+
+        spds = [ILLUMINANTS_SPDS['F2'], LIGHT_SOURCES_SPDS['Luxeon WW 2880']]
+        specification = multi_spd_colour_quality_scale(spds, True)
+
+        self.assertTupleEqual(specification.Q_as.shape, (2, 15))
+
+        for i, spd in enumerate(spds):
+            reference = colour_quality_scale(spd, True)
+            np.testing.assert_almost_equal(
+                np.array(specification[1:6])[..., i],
+                np.array(reference[1:6]),
+                decimal=7)
+            np.testing.assert_almost_equal(
+                specification.Q_as[i],
+                np.array([
+                    value.Q_a for _key, value in sorted(reference.Q_as.items())
+                ]),
+                decimal=7)
+
+
+class TestGamutArea(unittest.TestCase):
+    """
+    Defines :func:`colour.quality.cqs.gamut_area` definition unit tests
+    methods.
+    """
+    def test_n_dimensional_gamut_area(self):
+        """
+        Tests :func:`colour.quality.cqs.gamut_area` definition n-dimensional
+        arrays support.
+        """
+
+        Lab = np.array([
+            [39.94996006, 34.59018231, -19.86046321],
+            [36.60576301, 7.06742454, -43.21461177],
+            [56.50196523, -29.54655550, -20.50177194],
+            [56.20776870, -53.68997662, 20.21134410],
+            [82.85370708, -3.98679065, 75.43320144],
+            [61.26281449, 40.87950839, 44.97606172],
+        ])
+        G = gamut_area(Lab)
+
+        Lab = np.tile(Lab, (6, 1, 1))
+        G = np.tile(G, 6)
+        np.testing.assert_almost_equal(gamut_area(Lab), G, decimal=7)
+
+        Lab = np.reshape(Lab, (2, 3, 6, 3))
+        G = np.reshape(G, (2, 3))
+        np.testing.assert_almost_equal(gamut_area(Lab), G, decimal=7)
+
+
 if __name__ == '__main__':
     unittest.main()
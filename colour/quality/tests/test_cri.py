@@ -5,10 +5,13 @@ Defines unit tests for :mod:`colour.quality.cri` module.
 
 from __future__ import division, unicode_literals
 
+import numpy as np
 import unittest
 
-from colour.quality import colour_rendering_index
-from colour.colorimetry import (ILLUMINANTS_SPDS,
+from colour.quality import (colour_rendering_index,
+                            multi_spd_colour_rendering_index)
+from colour.colorimetry import (ASTME30815_PRACTISE_SHAPE, ILLUMINANTS_SPDS,
+                                MultiSpectralPowerDistribution,
                                 SpectralPowerDistribution)
 
 __author__ = 'Colour Developers'
@@ -18,7 +21,7 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['TestColourRenderingIndex']
+__all__ = ['TestColourRenderingIndex', 'TestMultiSpdColourRenderingIndex']
 
 SAMPLE_SPD_DATA = {
     380: 0.00588346,
@@ -132,5 +135,77 @@ class TestColourRenderingIndex(unittest.TestCase):
             places=7)
 
 
+class TestMultiSpdColourRenderingIndex(unittest.TestCase):
+    """
+    Defines :func:`colour.quality.cri.multi_spd_colour_rendering_index`
+    definition unit tests methods.
+    """
+    def test_multi_spd_colour_rendering_index(self):
+        """
+        Tests :func:`colour.quality.cri.multi_spd_colour_rendering_index`
+        definition.
+        """
+
+        spds = [
+            ILLUMINANTS_SPDS['F2'], ILLUMINANTS_SPDS['A'],
+            ILLUMINANTS_SPDS['D65'],
+            SpectralPowerDistribution(SAMPLE_SPD_DATA)
+        ]
+
+        np.testing.assert_almost_equal(
+            multi_spd_colour_rendering_index(spds),
+            np.array([colour_rendering_index(spd) for spd in spds]),
+            decimal=7)
+
+        values = np.array(
+            [spd.copy().align(ASTME30815_PRACTISE_SHAPE).values
+             for spd in spds])  # yapf: disable
+        np.testing.assert_almost_equal(
+            multi_spd_colour_rendering_index(values),
+            multi_spd_colour_rendering_index(spds),
+            decimal=7)
+
+        multi_spd = MultiSpectralPowerDistribution(
+            np.transpose(values[:2]),
+            ASTME30815_PRACTISE_SHAPE.range(),
+            labels=['F2', 'A'])
+        np.testing.assert_almost_equal(
+            multi_spd_colour_rendering_index(multi_spd),
+            multi_spd_colour_rendering_index(spds[:2]),
+            decimal=7)
+
+        self.assertRaises(ValueError, multi_spd_colour_rendering_index,
+                          values[..., 1:])
+
+    def test_additional_data_multi_spd_colour_rendering_index(self):
+        """
+        Tests :func:`colour.quality.cri.multi_spd_colour_rendering_index`
+        definition additional data.
+        """
+
+        spds = [ILLUMINANTS_SPDS['F2'], ILLUMINANTS_SPDS['FL3.15']]
+        specification = multi_spd_colour_rendering_index(spds, True)
+
+        self.assertListEqual(specification.name, ['F2', 'FL3.15'])
+        self.assertTupleEqual(specification.Q_as.shape, (2, 14))
+
+        for i, spd in enumerate(spds):
+            reference = colour_rendering_index(spd, True)
+            np.testing.assert_almost_equal(
+                specification.Q_as[i],
+                np.array([
+                    value.Q_a for _key, value in sorted(reference.Q_as.items())
+                ]),
+                decimal=7)
+            np.testing.assert_almost_equal(
+                specification.colorimetry_data[0][i],
+                np.array([data.UVW for data in reference.colorimetry_data[0]]),
+                decimal=7)
+            np.testing.assert_almost_equal(
+                specification.colorimetry_data[1][i],
+                np.array([data.UVW for data in reference.colorimetry_data[1]]),
+                decimal=7)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -2,6 +2,9 @@
 """
 References
 ----------
+-   :cite:`Jakob2019Spectral` : Jakob, W., & Hanika, J. (2019). A
+    Low-Dimensional Function Space for Efficient Spectral Upsampling.
+    Computer Graphics Forum, 38(2), 147-155. doi:10.1111/cgf.13626
 -   :cite:`Meng2015c` : Meng, J., Simon, F., Hanika, J., & Dachsbacher, C.
     (2015). Physically Meaningful Rendering using Tristimulus Colours. Computer
     Graphics Forum, 34(4), 31-40. doi:10.1111/cgf.12676
@@ -14,22 +17,36 @@ from __future__ import absolute_import
 
 import numpy as np
 
-from colour.utilities import CaseInsensitiveMapping, filter_kwargs
+from colour.utilities import (CaseInsensitiveMapping, cache_signature,
+                              filter_kwargs)
 
 from .dataset import *  # noqa
 from . import dataset
-from .meng2015 import XYZ_to_spectral_Meng2015
-from .smits1999 import RGB_to_spectral_Smits1999
+from .meng2015 import XYZ_to_spectral_Meng2015, XYZ_to_msa_Meng2015
+from .smits1999 import RGB_to_msa_Smits1999, RGB_to_spectral_Smits1999
+from .jakob2019 import (JAKOB2019_SPECTRAL_SHAPE, JAKOB2019_DAMPING,
+                        JAKOB2019_COEFFICIENTS_BOUND, JAKOB2019_TOLERANCE,
+                        COLOURSPACE_LUT3D_JAKOB2019_CACHE_SIZE,
+                        coefficients_to_msa_Jakob2019,
+                        RGB_to_coefficients_Jakob2019, LUT3D_Jakob2019,
+                        colourspace_LUT3D_Jakob2019)
 
 __all__ = []
 __all__ += dataset.__all__
-__all__ += ['XYZ_to_spectral_Meng2015']
-__all__ += ['RGB_to_spectral_Smits1999']
-
-REFLECTANCE_RECOVERY_METHODS = CaseInsensitiveMapping({
+__all__ += ['XYZ_to_spectral_Meng2015', 'XYZ_to_msa_Meng2015']
+__all__ += ['RGB_to_msa_Smits1999', 'RGB_to_spectral_Smits1999']
+__all__ += [
+    'JAKOB2019_SPECTRAL_SHAPE', 'JAKOB2019_DAMPING',
+    'JAKOB2019_COEFFICIENTS_BOUND', 'JAKOB2019_TOLERANCE',
+    'COLOURSPACE_LUT3D_JAKOB2019_CACHE_SIZE', 'coefficients_to_msa_Jakob2019',
+    'RGB_to_coefficients_Jakob2019', 'LUT3D_Jakob2019',
+    'colourspace_LUT3D_Jakob2019'
+]
+
+REFLECTANCE_RECOVERY_METHODS = cache_signature(CaseInsensitiveMapping({
     'Meng 2015': XYZ_to_spectral_Meng2015,
     'Smits 1999': RGB_to_spectral_Smits1999,
-})
+}))
 REFLECTANCE_RECOVERY_METHODS.__doc__ = """
 Supported reflectance recovery methods.
 
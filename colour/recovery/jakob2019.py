@@ -0,0 +1,826 @@
+# -*- coding: utf-8 -*-
+"""
+Jakob and Hanika (2019) - Spectral Upsampling
+=============================================
+
+Defines objects for reflectance recovery using a precomputed lookup table
+of *Jakob and Hanika (2019)* spectral model coefficients:
+
+-   :func:`colour.recovery.coefficients_to_msa_Jakob2019`
+-   :func:`colour.recovery.RGB_to_coefficients_Jakob2019`
+-   :class:`colour.recovery.LUT3D_Jakob2019`
+-   :func:`colour.recovery.colourspace_LUT3D_Jakob2019`
+
+References
+----------
+-   :cite:`Jakob2019Spectral` : Jakob, W., & Hanika, J. (2019). A
+    Low-Dimensional Function Space for Efficient Spectral Upsampling.
+    Computer Graphics Forum, 38(2), 147-155. doi:10.1111/cgf.13626
+"""
+
+from __future__ import division, unicode_literals
+
+import hashlib
+import numpy as np
+import os
+import re
+
+from colour.colorimetry import (
+    ILLUMINANTS_SPDS, STANDARD_OBSERVERS_CMFS, D_illuminant_relative_spd,
+    SpectralPowerDistribution, SpectralShape)
+from colour.constants import EPSILON
+from colour.utilities import as_float_array, warning
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'JAKOB2019_SPECTRAL_SHAPE', 'JAKOB2019_DAMPING',
+    'JAKOB2019_COEFFICIENTS_BOUND', 'JAKOB2019_TOLERANCE',
+    'COLOURSPACE_LUT3D_JAKOB2019_CACHE_SIZE', 'coefficients_to_msa_Jakob2019',
+    'RGB_to_coefficients_Jakob2019', 'LUT3D_Jakob2019',
+    'colourspace_LUT3D_Jakob2019'
+]
+
+JAKOB2019_SPECTRAL_SHAPE = SpectralShape(360, 780, 5)
+"""
+*Jakob and Hanika (2019)* method default spectral shape.
+
+JAKOB2019_SPECTRAL_SHAPE : SpectralShape
+"""
+
+JAKOB2019_DAMPING = 1e-3
+"""
+*Jakob and Hanika (2019)* method *Levenberg-Marquardt* iteration initial
+damping factor.
+
+JAKOB2019_DAMPING : numeric
+"""
+
+JAKOB2019_COEFFICIENTS_BOUND = 1e4
+"""
+*Jakob and Hanika (2019)* method spectral model coefficients absolute bound,
+the coefficients of the values outside of the spectral model gamut would
+otherwise diverge.
+
+JAKOB2019_COEFFICIENTS_BOUND : numeric
+"""
+
+JAKOB2019_TOLERANCE = 1e-3
+"""
+*Jakob and Hanika (2019)* method residual tolerance above which the *RGB*
+colourspace array values are reported as not reproduced.
+
+JAKOB2019_TOLERANCE : numeric
+"""
+
+COLOURSPACE_LUT3D_JAKOB2019_CACHE_SIZE = 16
+"""
+Maximum count of lookup tables cached in memory by
+:func:`colour.recovery.colourspace_LUT3D_Jakob2019` definition.
+
+COLOURSPACE_LUT3D_JAKOB2019_CACHE_SIZE : int
+"""
+
+_COLOURSPACE_LUT3D_JAKOB2019_CACHE = None
+
+
+def _polynomial_basis(shape):
+    """
+    Returns the quadratic polynomial basis of given spectral shape normalised
+    wavelengths as an array of shape (W, 3).
+
+    Parameters
+    ----------
+    shape : SpectralShape
+        Spectral shape.
+
+    Returns
+    -------
+    ndarray
+        Quadratic polynomial basis.
+    """
+
+    wavelengths = shape.range()
+    x = (wavelengths - shape.start) / (shape.end - shape.start)
+
+    return np.transpose([x ** 2, x, np.ones(x.shape)])
+
+
+def _sigmoid(x):
+    """
+    Returns the *Jakob and Hanika (2019)* method sigmoid of given array.
+
+    Parameters
+    ----------
+    x : array_like
+        Array to compute the sigmoid of.
+
+    Returns
+    -------
+    ndarray
+        Sigmoid.
+    """
+
+    return 0.5 + x / (2 * np.sqrt(1 + x ** 2))
+
+
+def coefficients_to_msa_Jakob2019(coefficients,
+                                  shape=JAKOB2019_SPECTRAL_SHAPE):
+    """
+    Evaluates the *Jakob and Hanika (2019)* spectral model with given
+    coefficients, i.e. the sigmoid of a quadratic polynomial of the
+    wavelengths.
+
+    Parameters
+    ----------
+    coefficients : array_like
+        Spectral model coefficients, with the polynomial coefficients in the
+        last axis in decreasing powers order.
+    shape : SpectralShape, optional
+        Spectral shape the spectral model is evaluated at.
+
+    Returns
+    -------
+    ndarray
+        Multi-spectral array :math:`msa` with the wavelengths in the last
+        axis.
+
+    Notes
+    -----
+    -   The polynomial is evaluated on the wavelengths normalised to domain
+        [0, 1] over the spectral shape range for numerical conditioning,
+        thus the coefficients are specific to the spectral shape boundaries.
+
+    References
+    ----------
+    -   :cite:`Jakob2019Spectral`
+
+    Examples
+    --------
+    >>> coefficients = np.array([0, 0, 0])
+    >>> coefficients_to_msa_Jakob2019(
+    ...     coefficients, SpectralShape(400, 700, 100))
+    array([ 0.5,  0.5,  0.5,  0.5])
+    """
+
+    coefficients = as_float_array(coefficients)
+
+    return _sigmoid(np.dot(coefficients, np.transpose(
+        _polynomial_basis(shape))))
+
+
+def RGB_to_coefficients_Jakob2019(
+        RGB,
+        colourspace,
+        cmfs=STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'],
+        illuminant=None,
+        shape=JAKOB2019_SPECTRAL_SHAPE,
+        steps=8,
+        iterations=8,
+        tolerance=JAKOB2019_TOLERANCE):
+    """
+    Computes the *Jakob and Hanika (2019)* spectral model coefficients of
+    given *RGB* colourspace array.
+
+    The coefficients are solved for all the *RGB* colourspace array values at
+    once with a batched *Levenberg-Marquardt* iteration. Convergence for the
+    saturated values is achieved by continuation: the targets are moved in
+    ``steps`` from the mid grey, whose coefficients are null, to the given
+    *RGB* colourspace array, each step being warm started from the previous
+    one.
+
+    Parameters
+    ----------
+    RGB : array_like
+        Linear *RGB* colourspace array to compute the coefficients of.
+    colourspace : RGB_Colourspace
+        *RGB* colourspace of given array.
+    cmfs : XYZ_ColourMatchingFunctions, optional
+        Standard observer colour matching functions.
+    illuminant : SpectralPowerDistribution, optional
+        Illuminant spectral power distribution, default to the *RGB*
+        colourspace illuminant if existing in
+        :attr:`colour.ILLUMINANTS_SPDS` attribute or to the *CIE Illuminant D
+        Series* of the *RGB* colourspace whitepoint.
+    shape : SpectralShape, optional
+        Spectral shape the spectral model is evaluated at.
+    steps : int, optional
+        Continuation steps count.
+    iterations : int, optional
+        *Levenberg-Marquardt* iterations count per continuation step.
+    tolerance : numeric, optional
+        Residual tolerance above which a warning is issued for the *RGB*
+        colourspace array values that could not be reproduced.
+
+    Returns
+    -------
+    ndarray
+        Spectral model coefficients.
+
+    Raises
+    ------
+    RuntimeError
+        If the coefficients do not converge to finite values.
+
+    Notes
+    -----
+    -   The *RGB* colourspace array is converted to *CIE XYZ* tristimulus
+        values without chromatic adaptation, the illuminant is expected to
+        match the *RGB* colourspace whitepoint.
+    -   The black and white values have infinite coefficients and are only
+        approximated.
+    -   The *RGB* colourspace array values outside of the spectral model
+        gamut, e.g. the primaries of wide gamut colourspaces such as
+        *ITU-R BT.2020* or *ProPhoto RGB*, cannot be reproduced: the
+        coefficients minimising the residual are returned and a warning is
+        issued.
+
+    References
+    ----------
+    -   :cite:`Jakob2019Spectral`
+
+    Examples
+    --------
+    >>> from colour.models import sRGB_COLOURSPACE
+    >>> RGB = np.array([0.45293517, 0.31732158, 0.26414773])
+    >>> RGB_to_coefficients_Jakob2019(
+    ...     RGB, sRGB_COLOURSPACE)  # doctest: +ELLIPSIS
+    array([ 1.7395266..., -0.5469552..., -0.4798602...])
+    """
+
+    RGB = as_float_array(RGB)
+
+    A = _RGB_operator(colourspace, cmfs, illuminant, shape)
+    P = _polynomial_basis(shape)
+    # Jacobian operator, "AP[w, 3 * k + j]" is "A[k, w] * P[w, j]".
+    AP = np.reshape(A[..., np.newaxis] * P, (3, -1, 3))
+    AP = np.reshape(np.transpose(AP, (1, 0, 2)), (P.shape[0], 9))
+
+    RGB_f = np.reshape(RGB, (-1, 3))
+    grey = np.dot(A, np.full(P.shape[0], 0.5))
+
+    def residual(coefficients, target):
+        """
+        Returns the residual and the squared residual norm of given
+        coefficients.
+        """
+
+        r = np.dot(
+            _sigmoid(np.dot(coefficients, np.transpose(P))),
+            np.transpose(A)) - target
+
+        return r, np.sum(r ** 2, axis=-1)
+
+    identity = np.identity(3)
+    coefficients = np.zeros(RGB_f.shape)
+    damping = np.full(RGB_f.shape[0], JAKOB2019_DAMPING)
+    for t in np.linspace(0, 1, steps + 1)[1:]:
+        target = grey + (RGB_f - grey) * t
+        r, E = residual(coefficients, target)
+        for _i in range(iterations):
+            x = np.dot(coefficients, np.transpose(P))
+            J = np.reshape(
+                np.dot(1 / (2 * (1 + x ** 2) ** 1.5), AP), (-1, 3, 3))
+            J_T = np.swapaxes(J, -1, -2)
+            JTJ = np.matmul(J_T, J)
+
+            # Levenberg-Marquardt step: the damped normal equations are
+            # always well conditioned, even for the saturated values whose
+            # Jacobian vanishes or the targets outside of the spectral model
+            # gamut, e.g. the wide gamut colourspaces primaries.
+            D = (damping[..., np.newaxis, np.newaxis] * JTJ * identity +
+                 EPSILON ** 2 * identity)
+            delta = np.linalg.solve(
+                JTJ + D, np.matmul(J_T, r[..., np.newaxis]))[..., 0]
+
+            coefficients_n = np.clip(coefficients - delta,
+                                     -JAKOB2019_COEFFICIENTS_BOUND,
+                                     JAKOB2019_COEFFICIENTS_BOUND)
+            r_n, E_n = residual(coefficients_n, target)
+
+            accepted = E_n < E
+            coefficients[accepted] = coefficients_n[accepted]
+            r[accepted], E[accepted] = r_n[accepted], E_n[accepted]
+            damping = np.clip(
+                np.where(accepted, damping / 3, damping * 3), 1e-6, 1e6)
+
+    if not np.all(np.isfinite(coefficients)):
+        raise RuntimeError(
+            '"Jakob and Hanika (2019)" spectral model coefficients did not '
+            'converge to finite values!')
+
+    unresolved = np.sqrt(E) > tolerance
+    if np.any(unresolved):
+        warning(('{0} "RGB" colourspace array values could not be reproduced '
+                 'within "{1}" tolerance by the "Jakob and Hanika (2019)" '
+                 'spectral model and are approximated, they are either '
+                 'outside of its gamut or require more iterations!').format(
+                     np.count_nonzero(unresolved), tolerance))
+
+    return np.reshape(coefficients, RGB.shape)
+
+
+def _RGB_operator(colourspace, cmfs, illuminant, shape):
+    """
+    Returns the matrix of shape (3, W) converting spectral values to given
+    *RGB* colourspace array under given illuminant.
+
+    Parameters
+    ----------
+    colourspace : RGB_Colourspace
+        *RGB* colourspace.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminant : SpectralPowerDistribution
+        Illuminant spectral power distribution.
+    shape : SpectralShape
+        Spectral shape.
+
+    Returns
+    -------
+    ndarray
+        Spectral values to *RGB* colourspace array matrix.
+    """
+
+    if illuminant is None:
+        if colourspace.illuminant in ILLUMINANTS_SPDS:
+            illuminant = ILLUMINANTS_SPDS[colourspace.illuminant]
+        else:
+            illuminant = D_illuminant_relative_spd(colourspace.whitepoint)
+
+    cmfs = cmfs.copy().align(shape)
+    illuminant = illuminant.copy().align(shape)
+
+    W = np.transpose(cmfs.values * illuminant.values[..., np.newaxis])
+    W /= np.sum(W[1])
+
+    return np.dot(colourspace.XYZ_to_RGB_matrix, W)
+
+
+class LUT3D_Jakob2019(object):
+    """
+    Defines a 3D lookup table mapping a regular grid of linear *RGB*
+    colourspace array values in domain [0, 1] to *Jakob and Hanika (2019)*
+    spectral model coefficients.
+
+    The table is generated offline once with
+    :meth:`colour.recovery.LUT3D_Jakob2019.generate` method, the reflectance
+    recovery at runtime is then a trilinear interpolation of the coefficients
+    followed by the evaluation of the spectral model.
+
+    Parameters
+    ----------
+    coefficients : array_like, optional
+        Spectral model coefficients table of shape (size, size, size, 3).
+    shape : SpectralShape, optional
+        Spectral shape the spectral model is evaluated at.
+    name : unicode, optional
+        Lookup table name.
+
+    Attributes
+    ----------
+    coefficients
+    shape
+    name
+    size
+
+    Methods
+    -------
+    generate
+    RGB_to_coefficients
+    RGB_to_msa
+    RGB_to_spectral
+    read
+    write
+
+    References
+    ----------
+    -   :cite:`Jakob2019Spectral`
+
+    Examples
+    --------
+    >>> from colour.models import sRGB_COLOURSPACE
+    >>> LUT = LUT3D_Jakob2019().generate(sRGB_COLOURSPACE, size=5)
+    >>> LUT.size
+    5
+    >>> RGB = np.array([0.45293517, 0.31732158, 0.26414773])
+    >>> LUT.RGB_to_coefficients(RGB)  # doctest: +ELLIPSIS
+    array([ 2.0161546..., -0.7677115..., -0.4600274...])
+    """
+
+    def __init__(self,
+                 coefficients=None,
+                 shape=JAKOB2019_SPECTRAL_SHAPE,
+                 name=None):
+        self._coefficients = None
+        self.coefficients = coefficients
+        self._shape = None
+        self.shape = shape
+        self._name = None
+        self.name = name
+
+    @property
+    def coefficients(self):
+        """
+        Getter and setter property for the spectral model coefficients table.
+
+        Parameters
+        ----------
+        value : array_like
+            Value to set the spectral model coefficients table with.
+
+        Returns
+        -------
+        ndarray
+            Spectral model coefficients table.
+        """
+
+        return self._coefficients
+
+    @coefficients.setter
+    def coefficients(self, value):
+        """
+        Setter for the **self.coefficients** property.
+        """
+
+        if value is not None:
+            value = as_float_array(value)
+
+            assert (value.ndim == 4 and value.shape[0] == value.shape[1] ==
+                    value.shape[2] and value.shape[3] == 3), (
+                        '"{0}" attribute: shape must be "(size, size, size, '
+                        '3)"!'.format('coefficients'))
+
+        self._coefficients = value
+
+    @property
+    def shape(self):
+        """
+        Getter and setter property for the spectral shape.
+
+        Parameters
+        ----------
+        value : SpectralShape
+            Value to set the spectral shape with.
+
+        Returns
+        -------
+        SpectralShape
+            Spectral shape.
+        """
+
+        return self._shape
+
+    @shape.setter
+    def shape(self, value):
+        """
+        Setter for the **self.shape** property.
+        """
+
+        self._shape = value
+
+    @property
+    def name(self):
+        """
+        Getter and setter property for the name.
+
+        Parameters
+        ----------
+        value : unicode
+            Value to set the name with.
+
+        Returns
+        -------
+        unicode
+            Name.
+        """
+
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        """
+        Setter for the **self.name** property.
+        """
+
+        self._name = value
+
+    @property
+    def size(self):
+        """
+        Getter property for the lookup table size, i.e. the samples count on
+        each axis.
+
+        Returns
+        -------
+        int
+            Lookup table size.
+        """
+
+        if self._coefficients is None:
+            return None
+
+        return self._coefficients.shape[0]
+
+    def generate(self,
+                 colourspace,
+                 cmfs=STANDARD_OBSERVERS_CMFS[
+                     'CIE 1931 2 Degree Standard Observer'],
+                 illuminant=None,
+                 size=33,
+                 **kwargs):
+        """
+        Generates the lookup table for given *RGB* colourspace.
+
+        Parameters
+        ----------
+        colourspace : RGB_Colourspace
+            *RGB* colourspace to generate the lookup table for.
+        cmfs : XYZ_ColourMatchingFunctions, optional
+            Standard observer colour matching functions.
+        illuminant : SpectralPowerDistribution, optional
+            Illuminant spectral power distribution.
+        size : int, optional
+            Lookup table samples count on each axis.
+
+        Other Parameters
+        ----------------
+        \\**kwargs : dict, optional
+            Keywords arguments for
+            :func:`colour.recovery.RGB_to_coefficients_Jakob2019` definition.
+
+        Returns
+        -------
+        LUT3D_Jakob2019
+            Generated lookup table.
+        """
+
+        samples = np.linspace(0, 1, size)
+        RGB = np.stack(np.meshgrid(samples, samples, samples, indexing='ij'),
+                       axis=-1)
+
+        self.coefficients = RGB_to_coefficients_Jakob2019(
+            RGB, colourspace, cmfs, illuminant, self._shape, **kwargs)
+        self.name = colourspace.name
+
+        return self
+
+    def RGB_to_coefficients(self, RGB):
+        """
+        Returns the spectral model coefficients of given *RGB* colourspace
+        array by trilinear interpolation of the lookup table.
+
+        Parameters
+        ----------
+        RGB : array_like
+            Linear *RGB* colourspace array, clipped to domain [0, 1].
+
+        Returns
+        -------
+        ndarray
+            Spectral model coefficients.
+        """
+
+        RGB = as_float_array(RGB)
+        size = self.size
+
+        RGB_f = np.clip(np.reshape(RGB, (-1, 3)), 0, 1) * (size - 1)
+        i = np.minimum(RGB_f.astype(np.int_), size - 2)
+        f = RGB_f - i
+        f = [(1 - f[..., j:j + 1], f[..., j:j + 1]) for j in range(3)]
+
+        # Flat indexes of the lower corners of the cells in the flattened
+        # lookup table, the other corners are at constant offsets.
+        index = i[..., 0] * size ** 2 + i[..., 1] * size + i[..., 2]
+        table = np.reshape(self._coefficients, (-1, 3))
+
+        coefficients = np.zeros(RGB_f.shape)
+        for R_c, G_c, B_c in np.ndindex(2, 2, 2):
+            coefficients += (f[0][R_c] * f[1][G_c] * f[2][B_c]) * np.take(
+                table,
+                index + (R_c * size ** 2 + G_c * size + B_c),
+                axis=0)
+
+        return np.reshape(coefficients, RGB.shape)
+
+    def RGB_to_msa(self, RGB):
+        """
+        Recovers the multi-spectral array :math:`msa` of given *RGB*
+        colourspace array.
+
+        Parameters
+        ----------
+        RGB : array_like
+            Linear *RGB* colourspace array, clipped to domain [0, 1].
+
+        Returns
+        -------
+        ndarray
+            Multi-spectral array :math:`msa` with the wavelengths in the last
+            axis.
+        """
+
+        return coefficients_to_msa_Jakob2019(
+            self.RGB_to_coefficients(RGB), self._shape)
+
+    def RGB_to_spectral(self, RGB):
+        """
+        Recovers the spectral power distribution of given *RGB* colourspace
+        array.
+
+        Parameters
+        ----------
+        RGB : array_like, (3,)
+            Linear *RGB* colourspace array, clipped to domain [0, 1].
+
+        Returns
+        -------
+        SpectralPowerDistribution
+            Recovered spectral power distribution.
+        """
+
+        return SpectralPowerDistribution(
+            self.RGB_to_msa(RGB),
+            self._shape.range(),
+            name='Jakob (2019) - {0}'.format(RGB))
+
+    def read(self, path):
+        """
+        Reads the lookup table from given *.npz* file.
+
+        Parameters
+        ----------
+        path : unicode
+            Lookup table file path.
+
+        Returns
+        -------
+        LUT3D_Jakob2019
+            Read lookup table.
+        """
+
+        with np.load(path) as data:
+            self.coefficients = data['coefficients']
+            self.shape = SpectralShape(*data['shape'])
+            self.name = str(data['name'])
+
+        return self
+
+    def write(self, path):
+        """
+        Writes the lookup table to given *.npz* file.
+
+        Parameters
+        ----------
+        path : unicode
+            Lookup table file path.
+
+        Returns
+        -------
+        bool
+            Definition success.
+        """
+
+        with open(path, 'wb') as file_:
+            np.savez(
+                file_,
+                coefficients=self._coefficients,
+                shape=np.array([
+                    self._shape.start, self._shape.end, self._shape.interval
+                ]),
+                name=np.array(self._name))
+
+        return True
+
+
+def _LUT3D_Jakob2019_key(colourspace, size, kwargs):
+    """
+    Returns the cache key of the *Jakob and Hanika (2019)* lookup table of
+    given *RGB* colourspace, size and generation parameters.
+
+    The key is a digest of the *RGB* colourspace and generation parameters
+    values, thus two objects with the same name but different values, e.g.
+    two illuminants, produce different keys.
+
+    Parameters
+    ----------
+    colourspace : RGB_Colourspace
+        *RGB* colourspace of the lookup table.
+    size : int
+        Lookup table samples count on each axis.
+    kwargs : dict
+        Keywords arguments for :meth:`colour.recovery.LUT3D_Jakob2019.generate`
+        method.
+
+    Returns
+    -------
+    unicode
+        Lookup table cache key.
+    """
+
+    digest = hashlib.sha1()
+
+    def update(value):
+        """
+        Updates the digest with given value.
+        """
+
+        if hasattr(value, 'wavelengths') and hasattr(value, 'values'):
+            update(value.wavelengths)
+            update(value.values)
+        elif isinstance(value, np.ndarray):
+            digest.update(str(value.dtype).encode('utf-8'))
+            digest.update(np.ascontiguousarray(value).tobytes())
+        else:
+            digest.update(repr(value).encode('utf-8'))
+
+    update(colourspace.name)
+    update(as_float_array(colourspace.primaries))
+    update(as_float_array(colourspace.whitepoint))
+    update(size)
+    for key in sorted(kwargs):
+        update(key)
+        update(kwargs[key])
+
+    return digest.hexdigest()
+
+
+def colourspace_LUT3D_Jakob2019(colourspace, size=33, directory=None,
+                                **kwargs):
+    """
+    Returns the *Jakob and Hanika (2019)* lookup table of given *RGB*
+    colourspace, generating it only once: the lookup table is cached in
+    memory and, if a directory is given, read from or written to it.
+
+    Parameters
+    ----------
+    colourspace : RGB_Colourspace
+        *RGB* colourspace to return the lookup table of.
+    size : int, optional
+        Lookup table samples count on each axis.
+    directory : unicode, optional
+        Directory the lookup table is read from or written to.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Keywords arguments for :meth:`colour.recovery.LUT3D_Jakob2019.generate`
+        method.
+
+    Returns
+    -------
+    LUT3D_Jakob2019
+        *RGB* colourspace lookup table.
+
+    Notes
+    -----
+    -   The lookup tables are cached and written using a digest of the *RGB*
+        colourspace, the size and the other generation parameters values,
+        changing any of them generates a new lookup table.
+
+    Examples
+    --------
+    >>> from colour.models import sRGB_COLOURSPACE
+    >>> colourspace_LUT3D_Jakob2019(sRGB_COLOURSPACE, 5).name
+    'sRGB'
+    """
+
+    global _COLOURSPACE_LUT3D_JAKOB2019_CACHE
+    if _COLOURSPACE_LUT3D_JAKOB2019_CACHE is None:
+        _COLOURSPACE_LUT3D_JAKOB2019_CACHE = {}
+
+    key = _LUT3D_Jakob2019_key(colourspace, size, kwargs)
+
+    path = None
+    if directory is not None:
+        path = os.path.join(
+            directory, '{0}_{1}_{2}.npz'.format(
+                re.sub('[^\\w]+', '_', colourspace.name), size, key[:16]))
+
+    LUT = _COLOURSPACE_LUT3D_JAKOB2019_CACHE.get(key)
+    if LUT is not None:
+        if path is not None and not os.path.exists(path):
+            LUT.write(path)
+
+        return LUT
+
+    LUT = LUT3D_Jakob2019()
+    if path is not None and os.path.exists(path):
+        LUT.read(path)
+    else:
+        LUT.generate(colourspace, size=size, **kwargs)
+        if path is not None:
+            LUT.write(path)
+
+    if (len(_COLOURSPACE_LUT3D_JAKOB2019_CACHE) >=
+            COLOURSPACE_LUT3D_JAKOB2019_CACHE_SIZE):
+        _COLOURSPACE_LUT3D_JAKOB2019_CACHE.clear()
+
+    _COLOURSPACE_LUT3D_JAKOB2019_CACHE[key] = LUT
+
+    return LUT
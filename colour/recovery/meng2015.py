@@ -7,6 +7,7 @@ Defines objects for reflectance recovery using *Meng, Simon and Hanika (2015)*
 method:
 
 -   :func:`colour.recovery.XYZ_to_spectral_Meng2015`
+-   :func:`colour.recovery.XYZ_to_msa_Meng2015`
 
 See Also
 --------
@@ -23,12 +24,13 @@ References
 
 from __future__ import division, unicode_literals
 
+import multiprocessing
 import numpy as np
 from scipy.optimize import minimize
 
 from colour.colorimetry import (STANDARD_OBSERVERS_CMFS,
-                                SpectralPowerDistribution, SpectralShape,
-                                ones_spd, spectral_to_XYZ_integration)
+                                SpectralPowerDistribution, SpectralShape)
+from colour.utilities import as_float_array, tsplit
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -37,7 +39,171 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['XYZ_to_spectral_Meng2015']
+__all__ = [
+    'MENG2015_BOUNDS', 'XYZ_to_spectral_Meng2015', 'XYZ_to_msa_Meng2015'
+]
+
+MENG2015_BOUNDS = (0, 1000)
+"""
+*Meng et alii (2015)* method recovered spectral values bounds.
+
+MENG2015_BOUNDS : tuple
+"""
+
+_MENG2015_OPERATORS_CACHE = None
+
+
+def _Meng2015_operators(cmfs, interval):
+    """
+    Returns the *Meng et alii (2015)* method linear operators for given colour
+    matching functions and interval and caches them if not existing.
+
+    The operators are the wavelengths, the aligned colour matching functions
+    values and the matrix :math:`M` solving the *Karush-Kuhn-Tucker* system of
+    the smoothness objective subject to the tristimulus values equality
+    constraints, i.e. :math:`a = M \cdot XYZ`.
+
+    Parameters
+    ----------
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    interval : numeric
+        Wavelength :math:`\lambda_{i}` range interval in nm.
+
+    Returns
+    -------
+    tuple
+        Wavelengths, colour matching functions values and matrix :math:`M`.
+    """
+
+    global _MENG2015_OPERATORS_CACHE
+    if _MENG2015_OPERATORS_CACHE is None:
+        _MENG2015_OPERATORS_CACHE = {}
+
+    # The colour matching functions are keyed on their values so that
+    # modified colour matching functions sharing a name are not confused.
+    key = (cmfs.wavelengths.tobytes(), cmfs.values.tobytes(), interval)
+    if key in _MENG2015_OPERATORS_CACHE:
+        return _MENG2015_OPERATORS_CACHE[key]
+
+    shape = SpectralShape(cmfs.shape.start, cmfs.shape.end, interval)
+    cmfs = cmfs.copy().align(shape)
+
+    # Equivalent to "spectral_to_XYZ_integration" definition with an equal
+    # energy illuminant.
+    x_bar = cmfs.values
+    A = 100 * np.transpose(x_bar) / np.sum(x_bar[..., 1])
+
+    bins = x_bar.shape[0]
+    D = np.diff(np.identity(bins), axis=0)
+
+    K = np.zeros((bins + 3, bins + 3))
+    K[:bins, :bins] = 2 * np.dot(np.transpose(D), D)
+    K[:bins, bins:] = np.transpose(A)
+    K[bins:, :bins] = A
+
+    b = np.zeros((bins + 3, 3))
+    b[bins:] = np.identity(3)
+
+    M = np.linalg.solve(K, b)[:bins]
+
+    operators = _MENG2015_OPERATORS_CACHE[key] = (cmfs.wavelengths, x_bar, M)
+
+    return operators
+
+
+def _Meng2015_minimize(XYZ, x_bar, interval, x_0, tolerance,
+                       maximum_iterations):
+    """
+    Minimises the *Meng et alii (2015)* method smoothness objective subject to
+    given *CIE XYZ* tristimulus values equality constraints and
+    :attr:`colour.recovery.meng2015.MENG2015_BOUNDS` attribute bounds.
+
+    Parameters
+    ----------
+    XYZ : array_like, (3,)
+        *CIE XYZ* tristimulus values to recover the spectral values from.
+    x_bar : array_like
+        Colour matching functions values.
+    interval : numeric
+        Wavelength :math:`\lambda_{i}` range interval in nm.
+    x_0 : array_like
+        Initial spectral values.
+    tolerance : numeric
+        Tolerance for termination.
+    maximum_iterations : int
+        Maximum number of iterations to perform.
+
+    Returns
+    -------
+    ndarray
+        Recovered spectral values.
+    """
+
+    def function_objective(a):
+        """
+        Objective function.
+        """
+
+        return np.sum(np.diff(a) ** 2)
+
+    x_bar, y_bar, z_bar = tsplit(x_bar)
+    S = np.ones(x_bar.shape)
+    dw = interval
+    k = 100 / (np.sum(y_bar * S) * dw)
+
+    def function_constraint(a):
+        """
+        Function defining the constraint.
+        """
+
+        # Equivalent to "spectral_to_XYZ_integration" definition with an
+        # equal energy illuminant, without the spectral power distribution
+        # update and the shapes checks.
+        return k * np.sum(
+            np.array([a * x_bar * S * dw, a * y_bar * S * dw,
+                      a * z_bar * S * dw]),
+            axis=-1) - XYZ
+
+    constraints = {'type': 'eq', 'fun': function_constraint}
+
+    bounds = np.tile(np.array(MENG2015_BOUNDS), (len(x_0), 1))
+
+    result = minimize(
+        function_objective,
+        x_0,
+        method='SLSQP',
+        constraints=constraints,
+        bounds=bounds,
+        options={'ftol': tolerance,
+                 'maxiter': maximum_iterations})
+
+    if not result.success:
+        raise RuntimeError(
+            'Optimization failed for {0} after {1} iterations: "{2}".'.format(
+                XYZ, result.nit, result.message))
+
+    return result.x
+
+
+def _wrapper_Meng2015_minimize(arguments):
+    """
+    Convenient wrapper to be able to call
+    :func:`colour.recovery.meng2015._Meng2015_minimize` definition with
+    multiple arguments.
+
+    Parameters
+    ----------
+    arguments : list
+        Arguments.
+
+    Returns
+    -------
+    ndarray
+        Recovered spectral values.
+    """
+
+    return _Meng2015_minimize(*arguments)
 
 
 def XYZ_to_spectral_Meng2015(
@@ -85,6 +251,7 @@ def XYZ_to_spectral_Meng2015(
 
     Examples
     --------
+    >>> from colour.colorimetry import spectral_to_XYZ_integration
     >>> from colour.utilities import numpy_print_options
     >>> XYZ = np.array([0.07049534, 0.10080000, 0.09558313])
     >>> spd = XYZ_to_spectral_Meng2015(XYZ, interval=10)
@@ -147,48 +314,111 @@ def XYZ_to_spectral_Meng2015(
     """
 
     XYZ = np.asarray(XYZ)
-    shape = SpectralShape(cmfs.shape.start, cmfs.shape.end, interval)
-    cmfs = cmfs.copy().align(shape)
-    illuminant = ones_spd(shape)
-    spd = ones_spd(shape)
+    wavelengths, x_bar, _M = _Meng2015_operators(cmfs, interval)
 
-    def function_objective(a):
-        """
-        Objective function.
-        """
+    x = _Meng2015_minimize(XYZ, x_bar, interval, np.ones(wavelengths.size),
+                           tolerance, maximum_iterations)
 
-        return np.sum(np.diff(a) ** 2)
+    return SpectralPowerDistribution(
+        dict(zip(wavelengths, x * 100)), name='Meng (2015) - {0}'.format(XYZ))
 
-    def function_constraint(a):
-        """
-        Function defining the constraint.
-        """
 
-        spd[:] = a
-        return spectral_to_XYZ_integration(
-            spd, cmfs=cmfs, illuminant=illuminant) - XYZ
+def XYZ_to_msa_Meng2015(
+        XYZ,
+        cmfs=STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'],
+        interval=5,
+        tolerance=1e-10,
+        maximum_iterations=2000,
+        processes=None):
+    """
+    Recovers the multi-spectral array :math:`msa` of given *CIE XYZ*
+    tristimulus values using *Meng et alii (2015)* method.
 
-    wavelengths = spd.wavelengths
-    bins = wavelengths.size
+    The smoothness objective subject to the tristimulus values equality
+    constraints is solved in closed form through the *Karush-Kuhn-Tucker*
+    system: its factorisation is shared by all the samples and the spectral
+    values are obtained with a single matrix product. The bounded *SLSQP*
+    optimisation is only performed, warm started from the closed form
+    solution, for the samples whose spectral values violate the
+    :attr:`colour.recovery.meng2015.MENG2015_BOUNDS` attribute bounds.
 
-    constraints = {'type': 'eq', 'fun': function_constraint}
+    Parameters
+    ----------
+    XYZ : array_like
+        *CIE XYZ* tristimulus values to recover the multi-spectral array
+        from.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    interval : numeric, optional
+        Wavelength :math:`\lambda_{i}` range interval in nm.
+    tolerance : numeric, optional
+        Tolerance for termination of the bounded optimisation.
+    maximum_iterations : int, optional
+        Maximum number of iterations to perform for the bounded optimisation.
+    processes : integer, optional
+        Processes count for the bounded optimisation, default to *1*, i.e. no
+        :class:`multiprocessing.Pool` class instance is created.
 
-    bounds = np.tile(np.array([0, 1000]), (bins, 1))
+    Returns
+    -------
+    ndarray
+        Multi-spectral array :math:`msa` with the wavelengths in the last
+        axis, e.g. for a 24 samples colour rendition chart and an interval of
+        5nm, the output shape will be (24, 95).
 
-    result = minimize(
-        function_objective,
-        spd.values,
-        method='SLSQP',
-        constraints=constraints,
-        bounds=bounds,
-        options={'ftol': tolerance,
-                 'maxiter': maximum_iterations})
+    Notes
+    -----
+    -   The closed form solution is the exact minimum of the objective
+        whereas :func:`colour.recovery.XYZ_to_spectral_Meng2015` definition
+        terminates within ``tolerance`` of it, thus results differ slightly.
 
-    if not result.success:
-        raise RuntimeError(
-            'Optimization failed for {0} after {1} iterations: "{2}".'.format(
-                XYZ, result.nit, result.message))
+    References
+    ----------
+    -   :cite:`Meng2015c`
 
-    return SpectralPowerDistribution(
-        dict(zip(wavelengths, result.x * 100)),
-        name='Meng (2015) - {0}'.format(XYZ))
+    Examples
+    --------
+    >>> from colour.colorimetry import (
+    ...     multi_spectral_to_XYZ_integration)
+    >>> XYZ = np.array([[0.07049534, 0.10080000, 0.09558313],
+    ...                 [0.47097710, 0.34950000, 0.11301649]])
+    >>> msa = XYZ_to_msa_Meng2015(XYZ, interval=10)
+    >>> msa.shape
+    (2, 48)
+    >>> cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']
+    >>> multi_spectral_to_XYZ_integration(
+    ...     msa, SpectralShape(360, 830, 10),
+    ...     cmfs.copy().align(SpectralShape(360, 830, 10))) / 100
+    ... # doctest: +ELLIPSIS
+    array([[ 0.0704953...,  0.1008   ...,  0.0955831...],
+           [ 0.4709771...,  0.3495   ...,  0.1130164...]])
+    """
+
+    XYZ = as_float_array(XYZ)
+    wavelengths, x_bar, M = _Meng2015_operators(cmfs, interval)
+
+    XYZ_f = np.reshape(XYZ, (-1, 3))
+    msa = np.dot(XYZ_f, np.transpose(M))
+
+    minimum, maximum = MENG2015_BOUNDS
+    violating = np.where(
+        np.any(np.logical_or(msa < minimum, msa > maximum), axis=-1))[0]
+
+    if violating.size:
+        arguments = [(XYZ_f[i], x_bar, interval,
+                      np.clip(msa[i], minimum, maximum), tolerance,
+                      maximum_iterations) for i in violating]
+
+        if processes is None or processes == 1:
+            results = [_Meng2015_minimize(*argument) for argument in arguments]
+        else:
+            pool = multiprocessing.Pool(processes=processes)
+            try:
+                results = pool.map(_wrapper_Meng2015_minimize, arguments)
+            finally:
+                pool.close()
+                pool.join()
+
+        msa[violating] = results
+
+    return np.reshape(msa * 100, XYZ.shape[:-1] + (wavelengths.size, ))
@@ -26,6 +26,7 @@ from colour.colorimetry import ILLUMINANTS
 from colour.models import (XYZ_to_RGB, normalised_primary_matrix,
                            sRGB_COLOURSPACE)
 from colour.recovery import SMITS_1999_SPDS
+from colour.utilities import as_float_array
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -36,8 +37,8 @@ __status__ = 'Production'
 
 __all__ = [
     'SMITS1999_PRIMARIES', 'SMITS1999_WHITEPOINT',
-    'SMITS1999_XYZ_TO_RGB_MATRIX', 'XYZ_to_RGB_Smits1999',
-    'RGB_to_spectral_Smits1999'
+    'SMITS1999_XYZ_TO_RGB_MATRIX', 'SMITS1999_BASIS_NAMES',
+    'XYZ_to_RGB_Smits1999', 'RGB_to_msa_Smits1999', 'RGB_to_spectral_Smits1999'
 ]
 
 SMITS1999_PRIMARIES = sRGB_COLOURSPACE.primaries
@@ -64,6 +65,18 @@ Current *Smits (1999)* method implementation *RGB* colourspace to
 SMITS1999_XYZ_TO_RGB_MATRIX : array_like, (3, 3)
 """
 
+SMITS1999_BASIS_NAMES = ('white', 'cyan', 'magenta', 'yellow', 'red', 'green',
+                         'blue')
+"""
+*Smits (1999)* method basis spectral power distributions names, in the order
+of the basis weights computed by
+:func:`colour.recovery.smits1999.RGB_to_msa_Smits1999` definition.
+
+SMITS1999_BASIS_NAMES : tuple
+"""
+
+_SMITS1999_BASIS_CACHE = None
+
 
 def XYZ_to_RGB_Smits1999(XYZ):
     """
@@ -100,6 +113,124 @@ def XYZ_to_RGB_Smits1999(XYZ):
         encoding_cctf=None)
 
 
+def _smits1999_basis():
+    """
+    Returns the *Smits (1999)* method basis spectral power distributions values
+    as an array of shape (7, W) and caches it if not existing.
+
+    Returns
+    -------
+    ndarray
+        *Smits (1999)* method basis spectral power distributions values.
+    """
+
+    global _SMITS1999_BASIS_CACHE
+    if _SMITS1999_BASIS_CACHE is None:
+        _SMITS1999_BASIS_CACHE = np.array(
+            [SMITS_1999_SPDS[name].values for name in SMITS1999_BASIS_NAMES])
+
+    return _SMITS1999_BASIS_CACHE
+
+
+def RGB_to_msa_Smits1999(RGB, out=None, chunk_size=None):
+    """
+    Recovers the multi-spectral array :math:`msa` of given *RGB* colourspace
+    array using *Smits (1999)* method.
+
+    The basis weights are computed for all the *RGB* colourspace array values
+    at once using masked branch selection and the spectral values are
+    obtained with a single matrix product with the basis spectral power
+    distributions.
+
+    Parameters
+    ----------
+    RGB : array_like
+        *RGB* colourspace array to recover the multi-spectral array from.
+    out : ndarray, optional
+        Array in which to place the multi-spectral array, it must have the
+        appropriate shape and can be an :class:`numpy.memmap` class instance.
+    chunk_size : int, optional
+        Count of *RGB* colourspace array values to process at once, bounding
+        the temporary memory used for large images.
+
+    Returns
+    -------
+    ndarray
+        Multi-spectral array :math:`msa` with the wavelengths of the
+        :attr:`colour.recovery.SMITS_1999_SPDS` attribute basis spectral power
+        distributions in the last axis, e.g. for a 512x384 *RGB* image, the
+        output shape will be (384, 512, 10).
+
+    Raises
+    ------
+    ValueError
+        If the chunk size is lower than 1.
+
+    References
+    ----------
+    -   :cite:`Smits1999a`
+
+    Examples
+    --------
+    >>> RGB = np.array([[0.02144962, 0.13154603, 0.09287601],
+    ...                 [0.45293517, 0.31732158, 0.26414773]])
+    >>> RGB_to_msa_Smits1999(RGB)  # doctest: +ELLIPSIS
+    array([[ 0.0908046...,  0.0887761...,  0.0939795...,  0.1236033...,  \
+0.1315788...,
+             0.1293411...,  0.0392680...,  0.0214496...,  0.0214496...,  \
+0.0215463...],
+           [ 0.2778771...,  0.2711318...,  0.2699066...,  0.2993287...,  \
+0.3171102...,
+             0.3172687...,  0.4301986...,  0.4527544...,  0.4532808...,  \
+0.4541050...]])
+    """
+
+    RGB = as_float_array(RGB)
+    basis = _smits1999_basis()
+
+    if out is None:
+        out = np.empty(RGB.shape[:-1] + basis.shape[-1:])
+
+    RGB_f = np.reshape(RGB, (-1, 3))
+    msa_f = np.reshape(out, (-1, basis.shape[-1]))
+
+    if chunk_size is None:
+        chunk_size = max(RGB_f.shape[0], 1)
+
+    if chunk_size < 1:
+        raise ValueError(
+            '"{0}" chunk size must be greater than or equal to 1!'.format(
+                chunk_size))
+
+    for i in range(0, RGB_f.shape[0], chunk_size):
+        R, G, B = np.transpose(RGB_f[i:i + chunk_size])
+
+        # Masks reproducing the order of the branches of the reference
+        # implementation.
+        m_R = np.logical_and(R <= G, R <= B)
+        m_G = np.logical_and(~m_R, np.logical_and(G <= R, G <= B))
+        m_B = ~np.logical_or(m_R, m_G)
+
+        weights = np.zeros((R.shape[0], len(SMITS1999_BASIS_NAMES)))
+        weights[..., 0] = np.where(m_R, R, np.where(m_G, G, B))
+        weights[..., 1] = np.where(m_R, np.minimum(G, B) - R, 0)
+        weights[..., 2] = np.where(m_G, np.minimum(R, B) - G, 0)
+        weights[..., 3] = np.where(m_B, np.minimum(R, G) - B, 0)
+        weights[..., 4] = (np.where(np.logical_and(m_G, R > B), R - B, 0) +
+                           np.where(np.logical_and(m_B, R > G), R - G, 0))
+        weights[..., 5] = (np.where(np.logical_and(m_R, G > B), G - B, 0) +
+                           np.where(np.logical_and(m_B, R <= G), G - R, 0))
+        weights[..., 6] = (np.where(np.logical_and(m_R, G <= B), B - G, 0) +
+                           np.where(np.logical_and(m_G, R <= B), B - R, 0))
+
+        msa_f[i:i + chunk_size] = np.dot(weights, basis)
+
+    if not np.shares_memory(msa_f, out):
+        out[...] = np.reshape(msa_f, out.shape)
+
+    return out
+
+
 def RGB_to_spectral_Smits1999(RGB):
     """
     Recovers the spectral power distribution of given *RGB* colourspace array
@@ -142,41 +273,8 @@ def RGB_to_spectral_Smits1999(RGB):
                               extrapolator_args={...})
     """
 
-    white_spd = SMITS_1999_SPDS['white'].copy()
-    cyan_spd = SMITS_1999_SPDS['cyan'].copy()
-    magenta_spd = SMITS_1999_SPDS['magenta'].copy()
-    yellow_spd = SMITS_1999_SPDS['yellow'].copy()
-    red_spd = SMITS_1999_SPDS['red'].copy()
-    green_spd = SMITS_1999_SPDS['green'].copy()
-    blue_spd = SMITS_1999_SPDS['blue'].copy()
-
-    R, G, B = np.ravel(RGB)
-    spd = white_spd.copy() * 0
+    spd = SMITS_1999_SPDS['white'].copy()
     spd.name = 'Smits (1999) - {0}'.format(RGB)
-
-    if R <= G and R <= B:
-        spd += white_spd * R
-        if G <= B:
-            spd += cyan_spd * (G - R)
-            spd += blue_spd * (B - G)
-        else:
-            spd += cyan_spd * (B - R)
-            spd += green_spd * (G - B)
-    elif G <= R and G <= B:
-        spd += white_spd * G
-        if R <= B:
-            spd += magenta_spd * (R - G)
-            spd += blue_spd * (B - R)
-        else:
-            spd += magenta_spd * (B - G)
-            spd += red_spd * (R - B)
-    else:
-        spd += white_spd * B
-        if R <= G:
-            spd += yellow_spd * (R - B)
-            spd += green_spd * (G - R)
-        else:
-            spd += yellow_spd * (G - B)
-            spd += red_spd * (R - G)
+    spd.values = RGB_to_msa_Smits1999(np.ravel(RGB)[:3])
 
     return spd
@@ -0,0 +1,433 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.recovery.jakob2019` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import os
+import shutil
+import tempfile
+import unittest
+import warnings
+
+from colour.colorimetry import (ILLUMINANTS_SPDS, STANDARD_OBSERVERS_CMFS,
+                                SpectralShape)
+from colour.models import RGB_COLOURSPACES, sRGB_COLOURSPACE
+from colour.recovery import (
+    JAKOB2019_SPECTRAL_SHAPE, LUT3D_Jakob2019, RGB_to_coefficients_Jakob2019,
+    coefficients_to_msa_Jakob2019, colourspace_LUT3D_Jakob2019)
+from colour.recovery import jakob2019
+from colour.utilities import ColourWarning
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'WIDE_GAMUT_COLOURSPACES', 'msa_to_RGB',
+    'TestCoefficients_to_msa_Jakob2019',
+    'TestRGB_to_coefficients_Jakob2019', 'TestLUT3D_Jakob2019',
+    'TestColourspace_LUT3D_Jakob2019'
+]
+
+WIDE_GAMUT_COLOURSPACES = ('Adobe RGB (1998)', 'DCI-P3', 'ITU-R BT.2020',
+                           'ACEScg', 'ACES2065-1', 'ProPhoto RGB')
+
+
+def msa_to_RGB(msa, shape=JAKOB2019_SPECTRAL_SHAPE):
+    """
+    Converts given multi-spectral array to *sRGB* colourspace array under
+    *CIE Illuminant D65*.
+
+    Parameters
+    ----------
+    msa : array_like
+        Multi-spectral array.
+    shape : SpectralShape, optional
+        Multi-spectral array spectral shape.
+
+    Returns
+    -------
+    ndarray
+        *sRGB* colourspace array.
+    """
+
+    cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']
+    cmfs = cmfs.copy().align(shape)
+    illuminant = ILLUMINANTS_SPDS['D65'].copy().align(shape)
+
+    W = cmfs.values * illuminant.values[..., np.newaxis]
+    XYZ = np.dot(msa, W) / np.sum(W[..., 1])
+
+    return np.dot(XYZ, np.transpose(sRGB_COLOURSPACE.XYZ_to_RGB_matrix))
+
+
+class TestCoefficients_to_msa_Jakob2019(unittest.TestCase):
+    """
+    Defines :func:`colour.recovery.jakob2019.coefficients_to_msa_Jakob2019`
+    definition unit tests methods.
+    """
+
+    def test_coefficients_to_msa_Jakob2019(self):
+        """
+        Tests :func:`colour.recovery.jakob2019.coefficients_to_msa_Jakob2019`
+        definition.
+        """
+
+        shape = SpectralShape(400, 700, 100)
+
+        np.testing.assert_almost_equal(
+            coefficients_to_msa_Jakob2019(np.array([0, 0, 0]), shape),
+            np.array([0.5, 0.5, 0.5, 0.5]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            coefficients_to_msa_Jakob2019(np.array([0, 2, -1]), shape),
+            np.array([0.14644661, 0.34188612, 0.65811388, 0.85355339]),
+            decimal=7)
+
+    def test_n_dimensional_coefficients_to_msa_Jakob2019(self):
+        """
+        Tests :func:`colour.recovery.jakob2019.coefficients_to_msa_Jakob2019`
+        definition n-dimensional arrays support.
+        """
+
+        coefficients = np.array([1, -2, 0.5])
+        msa = coefficients_to_msa_Jakob2019(coefficients)
+
+        coefficients = np.tile(coefficients, (6, 1))
+        msa = np.tile(msa, (6, 1))
+        np.testing.assert_almost_equal(
+            coefficients_to_msa_Jakob2019(coefficients), msa, decimal=7)
+
+        coefficients = np.reshape(coefficients, (2, 3, 3))
+        msa = np.reshape(msa, (2, 3, -1))
+        np.testing.assert_almost_equal(
+            coefficients_to_msa_Jakob2019(coefficients), msa, decimal=7)
+
+
+class TestRGB_to_coefficients_Jakob2019(unittest.TestCase):
+    """
+    Defines :func:`colour.recovery.jakob2019.RGB_to_coefficients_Jakob2019`
+    definition unit tests methods.
+    """
+
+    def test_RGB_to_coefficients_Jakob2019(self):
+        """
+        Tests :func:`colour.recovery.jakob2019.RGB_to_coefficients_Jakob2019`
+        definition.
+        """
+
+        RGB = np.array([[0.45293517, 0.31732158, 0.26414773],
+                        [0.90000000, 0.10000000, 0.10000000],
+                        [0.10000000, 0.20000000, 0.80000000],
+                        [0.50000000, 0.50000000, 0.50000000]])
+
+        msa = coefficients_to_msa_Jakob2019(
+            RGB_to_coefficients_Jakob2019(RGB, sRGB_COLOURSPACE))
+
+        self.assertTrue(np.all(np.logical_and(msa >= 0, msa <= 1)))
+        np.testing.assert_almost_equal(msa_to_RGB(msa), RGB, decimal=7)
+
+    def test_wide_gamut_RGB_to_coefficients_Jakob2019(self):
+        """
+        Tests :func:`colour.recovery.jakob2019.RGB_to_coefficients_Jakob2019`
+        definition with wide gamut colourspaces.
+        """
+
+        cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']
+
+        for name in WIDE_GAMUT_COLOURSPACES:
+            colourspace = RGB_COLOURSPACES[name]
+            A = jakob2019._RGB_operator(colourspace, cmfs, None,
+                                        JAKOB2019_SPECTRAL_SHAPE)
+
+            # Spectral power distributions within the spectral model gamut.
+            RGB = np.dot(
+                coefficients_to_msa_Jakob2019(
+                    np.array([[2.0, -1.0, -0.5], [-4.0, 4.0, -1.0],
+                              [0.0, 0.0, 0.0], [1.0, -3.0, 1.0]])),
+                np.transpose(A))
+            msa = coefficients_to_msa_Jakob2019(
+                RGB_to_coefficients_Jakob2019(RGB, colourspace))
+            np.testing.assert_almost_equal(
+                np.dot(msa, np.transpose(A)), RGB, decimal=7)
+
+            # The primaries are outside of the spectral model gamut.
+            with warnings.catch_warnings(record=True) as records:
+                warnings.simplefilter('always')
+                coefficients = RGB_to_coefficients_Jakob2019(
+                    np.identity(3), colourspace)
+
+            self.assertTrue(np.all(np.isfinite(coefficients)))
+            self.assertTrue(
+                any(issubclass(record.category, ColourWarning)
+                    for record in records))
+
+    def test_n_dimensional_RGB_to_coefficients_Jakob2019(self):
+        """
+        Tests :func:`colour.recovery.jakob2019.RGB_to_coefficients_Jakob2019`
+        definition n-dimensional arrays support.
+        """
+
+        RGB = np.array([0.45293517, 0.31732158, 0.26414773])
+        coefficients = RGB_to_coefficients_Jakob2019(RGB, sRGB_COLOURSPACE)
+
+        RGB = np.tile(RGB, (6, 1))
+        coefficients = np.tile(coefficients, (6, 1))
+        np.testing.assert_almost_equal(
+            RGB_to_coefficients_Jakob2019(RGB, sRGB_COLOURSPACE),
+            coefficients,
+            decimal=7)
+
+        RGB = np.reshape(RGB, (2, 3, 3))
+        coefficients = np.reshape(coefficients, (2, 3, 3))
+        np.testing.assert_almost_equal(
+            RGB_to_coefficients_Jakob2019(RGB, sRGB_COLOURSPACE),
+            coefficients,
+            decimal=7)
+
+
+class TestLUT3D_Jakob2019(unittest.TestCase):
+    """
+    Defines :class:`colour.recovery.jakob2019.LUT3D_Jakob2019` class unit
+    tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+        self._LUT = LUT3D_Jakob2019().generate(sRGB_COLOURSPACE, size=9)
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('coefficients', 'shape', 'name', 'size')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(LUT3D_Jakob2019))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('generate', 'RGB_to_coefficients', 'RGB_to_msa',
+                            'RGB_to_spectral', 'read', 'write')
+
+        for method in required_methods:
+            self.assertIn(method, dir(LUT3D_Jakob2019))
+
+    def test_generate(self):
+        """
+        Tests :meth:`colour.recovery.jakob2019.LUT3D_Jakob2019.generate`
+        method.
+        """
+
+        self.assertEqual(self._LUT.size, 9)
+        self.assertEqual(self._LUT.name, 'sRGB')
+        self.assertTupleEqual(self._LUT.coefficients.shape, (9, 9, 9, 3))
+
+        samples = np.linspace(0, 1, 9)
+        RGB = np.stack(
+            np.meshgrid(samples, samples, samples, indexing='ij'), axis=-1)
+
+        np.testing.assert_almost_equal(
+            msa_to_RGB(coefficients_to_msa_Jakob2019(
+                self._LUT.coefficients)),
+            RGB,
+            decimal=3)
+
+    def test_wide_gamut_generate(self):
+        """
+        Tests :meth:`colour.recovery.jakob2019.LUT3D_Jakob2019.generate`
+        method with wide gamut colourspaces.
+        """
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', ColourWarning)
+            specifications = (
+                [(name, 9) for name in WIDE_GAMUT_COLOURSPACES] +
+                [('ITU-R BT.2020', 17), ('ProPhoto RGB', 17)])
+            for name, size in specifications:
+                LUT = LUT3D_Jakob2019().generate(
+                    RGB_COLOURSPACES[name], size=size)
+
+                self.assertTupleEqual(LUT.coefficients.shape,
+                                      (size, size, size, 3))
+                self.assertTrue(np.all(np.isfinite(LUT.coefficients)))
+
+                msa = LUT.RGB_to_msa(np.array([0.5, 0.5, 0.5]))
+                np.testing.assert_allclose(msa, 0.5, atol=0.01)
+
+    def test_RGB_to_coefficients(self):
+        """
+        Tests
+        :meth:`colour.recovery.jakob2019.LUT3D_Jakob2019.RGB_to_coefficients`
+        method.
+        """
+
+        np.testing.assert_almost_equal(
+            self._LUT.RGB_to_coefficients(np.array([0.5, 0.25, 1.0])),
+            self._LUT.coefficients[4, 2, 8],
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            self._LUT.RGB_to_coefficients(np.array([1.5, -0.5, 1.0])),
+            self._LUT.coefficients[8, 0, 8],
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            self._LUT.RGB_to_coefficients(np.array([0.0625, 0.5, 0.5])),
+            np.mean(self._LUT.coefficients[0:2, 4, 4], axis=0),
+            decimal=7)
+
+        RGB = np.array([0.45293517, 0.31732158, 0.26414773])
+        np.testing.assert_allclose(
+            msa_to_RGB(self._LUT.RGB_to_msa(RGB)), RGB, atol=0.01)
+
+    def test_n_dimensional_RGB_to_coefficients(self):
+        """
+        Tests
+        :meth:`colour.recovery.jakob2019.LUT3D_Jakob2019.RGB_to_coefficients`
+        method n-dimensional arrays support.
+        """
+
+        RGB = np.array([0.45293517, 0.31732158, 0.26414773])
+        coefficients = self._LUT.RGB_to_coefficients(RGB)
+
+        RGB = np.tile(RGB, (6, 1))
+        coefficients = np.tile(coefficients, (6, 1))
+        np.testing.assert_almost_equal(
+            self._LUT.RGB_to_coefficients(RGB), coefficients, decimal=7)
+
+        RGB = np.reshape(RGB, (2, 3, 3))
+        coefficients = np.reshape(coefficients, (2, 3, 3))
+        np.testing.assert_almost_equal(
+            self._LUT.RGB_to_coefficients(RGB), coefficients, decimal=7)
+
+    def test_RGB_to_spectral(self):
+        """
+        Tests
+        :meth:`colour.recovery.jakob2019.LUT3D_Jakob2019.RGB_to_spectral`
+        method.
+        """
+
+        RGB = np.array([0.45293517, 0.31732158, 0.26414773])
+        spd = self._LUT.RGB_to_spectral(RGB)
+
+        self.assertEqual(spd.shape, JAKOB2019_SPECTRAL_SHAPE)
+        np.testing.assert_almost_equal(
+            spd.values, self._LUT.RGB_to_msa(RGB), decimal=7)
+
+    def test_read_write(self):
+        """
+        Tests :meth:`colour.recovery.jakob2019.LUT3D_Jakob2019.read` and
+        :meth:`colour.recovery.jakob2019.LUT3D_Jakob2019.write` methods.
+        """
+
+        path = os.path.join(self._temporary_directory, 'sRGB.npz')
+        self.assertTrue(self._LUT.write(path))
+
+        LUT = LUT3D_Jakob2019().read(path)
+        self.assertEqual(LUT.name, self._LUT.name)
+        self.assertEqual(LUT.shape, self._LUT.shape)
+        np.testing.assert_equal(LUT.coefficients, self._LUT.coefficients)
+
+
+class TestColourspace_LUT3D_Jakob2019(unittest.TestCase):
+    """
+    Defines :func:`colour.recovery.jakob2019.colourspace_LUT3D_Jakob2019`
+    definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_colourspace_LUT3D_Jakob2019(self):
+        """
+        Tests :func:`colour.recovery.jakob2019.colourspace_LUT3D_Jakob2019`
+        definition.
+        """
+
+        LUT = colourspace_LUT3D_Jakob2019(
+            sRGB_COLOURSPACE, 3, self._temporary_directory)
+
+        self.assertIs(
+            colourspace_LUT3D_Jakob2019(sRGB_COLOURSPACE, 3,
+                                        self._temporary_directory), LUT)
+
+        paths = os.listdir(self._temporary_directory)
+        self.assertEqual(len(paths), 1)
+        self.assertTrue(paths[0].startswith('sRGB_3_'))
+        np.testing.assert_equal(
+            LUT3D_Jakob2019().read(
+                os.path.join(self._temporary_directory,
+                             paths[0])).coefficients, LUT.coefficients)
+
+        LUT_i = colourspace_LUT3D_Jakob2019(
+            sRGB_COLOURSPACE, 3, self._temporary_directory, iterations=1)
+        self.assertIsNot(LUT_i, LUT)
+        self.assertFalse(np.allclose(LUT_i.coefficients, LUT.coefficients))
+        self.assertEqual(len(os.listdir(self._temporary_directory)), 2)
+
+        illuminant = ILLUMINANTS_SPDS['D65'].copy() * 0.5
+        self.assertIsNot(
+            colourspace_LUT3D_Jakob2019(
+                sRGB_COLOURSPACE, 3, illuminant=illuminant), LUT)
+
+        directory = os.path.join(self._temporary_directory, 'LUT')
+        os.makedirs(directory)
+        self.assertIs(
+            colourspace_LUT3D_Jakob2019(sRGB_COLOURSPACE, 3, directory), LUT)
+        self.assertEqual(len(os.listdir(directory)), 1)
+
+    def test_cache_size_colourspace_LUT3D_Jakob2019(self):
+        """
+        Tests :func:`colour.recovery.jakob2019.colourspace_LUT3D_Jakob2019`
+        definition cache size bound.
+        """
+
+        cache_size = jakob2019.COLOURSPACE_LUT3D_JAKOB2019_CACHE_SIZE
+        jakob2019.COLOURSPACE_LUT3D_JAKOB2019_CACHE_SIZE = 2
+        try:
+            for iterations in range(1, 5):
+                colourspace_LUT3D_Jakob2019(
+                    sRGB_COLOURSPACE, 3, iterations=iterations)
+                self.assertLessEqual(
+                    len(jakob2019._COLOURSPACE_LUT3D_JAKOB2019_CACHE), 2)
+        finally:
+            jakob2019.COLOURSPACE_LUT3D_JAKOB2019_CACHE_SIZE = cache_size
+
+
+if __name__ == '__main__':
+    unittest.main()
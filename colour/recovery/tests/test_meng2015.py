@@ -8,9 +8,10 @@ from __future__ import division, unicode_literals
 import numpy as np
 import unittest
 
-from colour.colorimetry import (STANDARD_OBSERVERS_CMFS, SpectralShape,
-                                spectral_to_XYZ_integration)
-from colour.recovery import XYZ_to_spectral_Meng2015
+from colour.colorimetry import (
+    STANDARD_OBSERVERS_CMFS, SpectralPowerDistribution, SpectralShape,
+    multi_spectral_to_XYZ_integration, spectral_to_XYZ_integration)
+from colour.recovery import XYZ_to_msa_Meng2015, XYZ_to_spectral_Meng2015
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -19,7 +20,7 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['TestXYZ_to_spectral_Meng2015']
+__all__ = ['TestXYZ_to_spectral_Meng2015', 'TestXYZ_to_msa_Meng2015']
 
 
 class TestXYZ_to_spectral_Meng2015(unittest.TestCase):
@@ -70,5 +71,107 @@ class TestXYZ_to_spectral_Meng2015(unittest.TestCase):
             decimal=7)
 
 
+class TestXYZ_to_msa_Meng2015(unittest.TestCase):
+    """
+    Defines :func:`colour.recovery.meng2015.XYZ_to_msa_Meng2015` definition
+    unit tests methods.
+    """
+
+    def test_XYZ_to_msa_Meng2015(self):
+        """
+        Tests :func:`colour.recovery.meng2015.XYZ_to_msa_Meng2015`
+        definition.
+        """
+
+        cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']
+        shape = SpectralShape(cmfs.shape.start, cmfs.shape.end, 10)
+        cmfs_c = cmfs.copy().align(shape)
+
+        XYZ = np.array([[0.07049534, 0.10080000, 0.09558313],
+                        [0.47097710, 0.34950000, 0.11301649],
+                        [0.20654008, 0.12197225, 0.05136952]])
+        msa = XYZ_to_msa_Meng2015(XYZ, interval=10)
+        self.assertTupleEqual(msa.shape, (3, 48))
+        np.testing.assert_almost_equal(
+            multi_spectral_to_XYZ_integration(msa, shape, cmfs_c) / 100,
+            XYZ,
+            decimal=7)
+
+        spd = XYZ_to_spectral_Meng2015(XYZ[0], interval=10)
+        np.testing.assert_allclose(msa[0], spd.values, atol=0.01)
+        self.assertLessEqual(
+            np.sum(np.diff(msa[0]) ** 2), np.sum(np.diff(spd.values) ** 2))
+
+    def test_n_dimensional_XYZ_to_msa_Meng2015(self):
+        """
+        Tests :func:`colour.recovery.meng2015.XYZ_to_msa_Meng2015`
+        definition n-dimensional arrays support.
+        """
+
+        XYZ = np.array([0.07049534, 0.10080000, 0.09558313])
+        msa = XYZ_to_msa_Meng2015(XYZ, interval=10)
+        self.assertTupleEqual(msa.shape, (48, ))
+
+        XYZ = np.tile(XYZ, (6, 1))
+        msa = np.tile(msa, (6, 1))
+        np.testing.assert_almost_equal(
+            XYZ_to_msa_Meng2015(XYZ, interval=10), msa, decimal=7)
+
+        XYZ = np.reshape(XYZ, (2, 3, 3))
+        msa = np.reshape(msa, (2, 3, 48))
+        np.testing.assert_almost_equal(
+            XYZ_to_msa_Meng2015(XYZ, interval=10), msa, decimal=7)
+
+    def test_bounds_XYZ_to_msa_Meng2015(self):
+        """
+        Tests :func:`colour.recovery.meng2015.XYZ_to_msa_Meng2015`
+        definition bounded optimisation.
+        """
+
+        cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']
+        shape = SpectralShape(cmfs.shape.start, cmfs.shape.end, 10)
+        cmfs_c = cmfs.copy().align(shape)
+
+        XYZ = np.array([[0.07049534, 0.10080000, 0.09558313],
+                        [0.20000000, 0.05000000, 0.90000000],
+                        [0.50000000, 0.20000000, 0.01000000]])
+        msa = XYZ_to_msa_Meng2015(XYZ, interval=10)
+        self.assertGreaterEqual(np.min(msa), 0)
+        np.testing.assert_almost_equal(
+            multi_spectral_to_XYZ_integration(msa, shape, cmfs_c) / 100,
+            XYZ,
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            XYZ_to_msa_Meng2015(XYZ, interval=10, processes=2),
+            msa,
+            decimal=7)
+
+    def test_cache_XYZ_to_msa_Meng2015(self):
+        """
+        Tests :func:`colour.recovery.meng2015.XYZ_to_msa_Meng2015`
+        definition linear operators caching.
+        """
+
+        cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']
+        shape = SpectralShape(cmfs.shape.start, cmfs.shape.end, 10)
+
+        cmfs_m = cmfs.copy()
+        cmfs_m.values = cmfs_m.values * np.array([1.0, 1.0, 0.5])
+        self.assertEqual(cmfs_m.name, cmfs.name)
+
+        XYZ = np.array([0.07049534, 0.10080000, 0.09558313])
+        msa = XYZ_to_msa_Meng2015(XYZ, cmfs, interval=10)
+        msa_m = XYZ_to_msa_Meng2015(XYZ, cmfs_m, interval=10)
+
+        self.assertFalse(np.allclose(msa, msa_m))
+        np.testing.assert_almost_equal(
+            spectral_to_XYZ_integration(
+                SpectralPowerDistribution(msa_m, shape.range()),
+                cmfs_m.copy().align(shape)) / 100,
+            XYZ,
+            decimal=7)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -7,8 +7,10 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 import unittest
+from itertools import permutations
 
-from colour.recovery import RGB_to_spectral_Smits1999
+from colour.recovery import (RGB_to_msa_Smits1999, RGB_to_spectral_Smits1999)
+from colour.utilities import ignore_numpy_errors
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -17,7 +19,109 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['TestRGB_to_spectral_Smits1999']
+__all__ = ['TestRGB_to_msa_Smits1999', 'TestRGB_to_spectral_Smits1999']
+
+
+class TestRGB_to_msa_Smits1999(unittest.TestCase):
+    """
+    Defines :func:`colour.recovery.smits1999.RGB_to_msa_Smits1999`
+    definition unit tests methods.
+    """
+
+    def test_RGB_to_msa_Smits1999(self):
+        """
+        Tests :func:`colour.recovery.smits1999.RGB_to_msa_Smits1999`
+        definition.
+        """
+
+        RGB = np.array([
+            [0.45293517, 0.31732158, 0.26414773],
+            [0.77875824, 0.57726450, 0.50453169],
+            [0.35505307, 0.47995567, 0.61088035],
+            [0.20000000, 0.20000000, 0.20000000],
+            [0.60000000, 0.20000000, 0.40000000],
+            [0.20000000, 0.60000000, 0.40000000],
+            [0.40000000, 0.60000000, 0.20000000],
+        ])
+
+        np.testing.assert_almost_equal(
+            RGB_to_msa_Smits1999(RGB),
+            np.array(
+                [RGB_to_spectral_Smits1999(RGB_i).values for RGB_i in RGB]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            RGB_to_msa_Smits1999(RGB[0]),
+            np.array([
+                0.27787714, 0.27113183, 0.26990663, 0.29932875, 0.31711026,
+                0.31726875, 0.43019862, 0.45275442, 0.45328084, 0.45410503
+            ]),
+            decimal=7)
+
+    def test_n_dimensional_RGB_to_msa_Smits1999(self):
+        """
+        Tests :func:`colour.recovery.smits1999.RGB_to_msa_Smits1999`
+        definition n-dimensional arrays support.
+        """
+
+        RGB = np.array([0.45293517, 0.31732158, 0.26414773])
+        msa = RGB_to_msa_Smits1999(RGB)
+
+        RGB = np.tile(RGB, (6, 1))
+        msa = np.tile(msa, (6, 1))
+        np.testing.assert_almost_equal(RGB_to_msa_Smits1999(RGB),
+                                       msa,
+                                       decimal=7)
+
+        RGB = np.reshape(RGB, (2, 3, 3))
+        msa = np.reshape(msa, (2, 3, 10))
+        np.testing.assert_almost_equal(RGB_to_msa_Smits1999(RGB),
+                                       msa,
+                                       decimal=7)
+
+    def test_out_RGB_to_msa_Smits1999(self):
+        """
+        Tests :func:`colour.recovery.smits1999.RGB_to_msa_Smits1999`
+        definition ``out`` and ``chunk_size`` arguments.
+        """
+
+        RGB = np.reshape(np.random.random(5 * 7 * 3), (5, 7, 3))
+        msa = RGB_to_msa_Smits1999(RGB)
+
+        out = np.zeros((5, 7, 10))
+        self.assertIs(RGB_to_msa_Smits1999(RGB, out=out, chunk_size=4), out)
+        np.testing.assert_almost_equal(out, msa, decimal=7)
+
+        out = np.zeros((5, 10, 7))
+        out = np.swapaxes(out, 1, 2)
+        self.assertIs(RGB_to_msa_Smits1999(RGB, out=out, chunk_size=4), out)
+        np.testing.assert_almost_equal(out, msa, decimal=7)
+
+        self.assertTupleEqual(
+            RGB_to_msa_Smits1999(np.zeros((0, 3))).shape, (0, 10))
+
+    def test_raise_exception_RGB_to_msa_Smits1999(self):
+        """
+        Tests :func:`colour.recovery.smits1999.RGB_to_msa_Smits1999`
+        definition raised exception.
+        """
+
+        RGB = np.random.random((4, 3))
+        self.assertRaises(
+            ValueError, RGB_to_msa_Smits1999, RGB, chunk_size=0)
+        self.assertRaises(
+            ValueError, RGB_to_msa_Smits1999, RGB, chunk_size=-1)
+
+    @ignore_numpy_errors
+    def test_nan_RGB_to_msa_Smits1999(self):
+        """
+        Tests :func:`colour.recovery.smits1999.RGB_to_msa_Smits1999`
+        definition nan support.
+        """
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = np.array(list(set(permutations(cases * 3, r=3))))
+        RGB_to_msa_Smits1999(cases)
 
 
 class TestRGB_to_spectral_Smits1999(unittest.TestCase):
@@ -5,6 +5,9 @@ Correlated Colour Temperature :math:`T_{cp}`
 
 Defines correlated colour temperature :math:`T_{cp}` computations objects:
 
+-   :func:`colour.temperature.planckian_locus_uv`: *CIE UCS* colourspace *uv*
+    chromaticity coordinates computation of the planckian radiators of given
+    temperatures.
 -   :func:`colour.temperature.uv_to_CCT_Ohno2013`: Correlated colour
     temperature :math:`T_{cp}` and :math:`\Delta_{uv}` computation of given
     *CIE UCS* colourspace *uv* chromaticity coordinates using *Ohno (2013)*
@@ -90,11 +93,12 @@ import numpy as np
 from collections import namedtuple
 
 from colour.colorimetry import (ASTME30815_PRACTISE_SHAPE,
-                                STANDARD_OBSERVERS_CMFS, blackbody_spd,
-                                spectral_to_XYZ)
+                                STANDARD_OBSERVERS_CMFS, blackbody_msa,
+                                multi_spectral_to_XYZ_integration, ones_spd)
 from colour.models import UCS_to_uv, XYZ_to_UCS
-from colour.utilities import (CaseInsensitiveMapping, as_numeric,
-                              filter_kwargs, tsplit, tstack, warning)
+from colour.utilities import (CaseInsensitiveMapping, as_float_array,
+                              as_numeric, cache_signature, filter_kwargs,
+                              tsplit, tstack, warning)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -107,7 +111,8 @@ __all__ = [
     'PLANCKIAN_TABLE_TUVD', 'CCT_MINIMAL', 'CCT_MAXIMAL', 'CCT_SAMPLES',
     'CCT_CALCULATION_ITERATIONS', 'ROBERTSON_ISOTEMPERATURE_LINES_DATA',
     'ROBERTSON_ISOTEMPERATURE_LINES_RUVT', 'ROBERTSON_ISOTEMPERATURE_LINES',
-    'planckian_table', 'planckian_table_minimal_distance_index',
+    'PLANCKIAN_LOCUS_CACHE_SIZE', 'planckian_locus_uv', 'planckian_table',
+    'planckian_table_minimal_distance_index',
     'uv_to_CCT_Ohno2013', 'CCT_to_uv_Ohno2013', 'uv_to_CCT_Robertson1968',
     'CCT_to_uv_Robertson1968', 'CCT_to_uv_Krystek1985', 'UV_TO_CCT_METHODS',
     'uv_to_CCT', 'CCT_TO_UV_METHODS', 'CCT_to_uv', 'xy_to_CCT_McCamy1992',
@@ -183,6 +188,129 @@ ROBERTSON_ISOTEMPERATURE_LINES = [
 ]
 
 
+PLANCKIAN_LOCUS_CACHE_SIZE = 4096
+"""
+Maximum count of planckian radiators *uv* chromaticity coordinates cached per
+colour matching functions by :func:`colour.temperature.planckian_locus_uv`
+definition.
+
+PLANCKIAN_LOCUS_CACHE_SIZE : int
+"""
+
+_PLANCKIAN_LOCUS_CACHE = None
+
+
+def _planckian_locus_cache(cmfs):
+    """
+    Returns the cache of given colour matching functions planckian locus, i.e.
+    the colour matching functions trimmed to *ASTM E308-15* practise shape,
+    the equal-energy illuminant and the cached *uv* chromaticity coordinates
+    per temperature.
+
+    Parameters
+    ----------
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+
+    Returns
+    -------
+    tuple
+        Trimmed colour matching functions, equal-energy illuminant and *uv*
+        chromaticity coordinates cache.
+    """
+
+    global _PLANCKIAN_LOCUS_CACHE
+    if _PLANCKIAN_LOCUS_CACHE is None:
+        _PLANCKIAN_LOCUS_CACHE = {}
+
+    # The colour matching functions are keyed on their values so that
+    # modified colour matching functions sharing a name are not confused.
+    key = (cmfs.wavelengths.tobytes(), cmfs.values.tobytes())
+    if key in _PLANCKIAN_LOCUS_CACHE:
+        return _PLANCKIAN_LOCUS_CACHE[key]
+
+    cmfs = cmfs.copy().trim(ASTME30815_PRACTISE_SHAPE)
+
+    value = _PLANCKIAN_LOCUS_CACHE[key] = (cmfs, ones_spd(cmfs.shape), {})
+
+    return value
+
+
+def planckian_locus_uv(
+        temperatures,
+        cmfs=STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'],
+        cache=True):
+    """
+    Returns the *CIE UCS* colourspace *uv* chromaticity coordinates of the
+    planckian radiators of given temperatures, i.e. the planckian locus, for
+    given colour matching functions.
+
+    The planckian radiators are computed with a single
+    :func:`colour.colorimetry.blackbody_msa` definition evaluation and
+    integrated at once with the colour matching functions trimmed to
+    *ASTM E308-15* practise shape.
+
+    Parameters
+    ----------
+    temperatures : numeric or array_like
+        Temperatures :math:`T[K]` in kelvin degrees.
+    cmfs : XYZ_ColourMatchingFunctions, optional
+        Standard observer colour matching functions.
+    cache : bool, optional
+        Whether to cache the *uv* chromaticity coordinates per colour matching
+        functions and temperature, the repeated temperatures are then not
+        integrated again.
+
+    Returns
+    -------
+    ndarray
+        *CIE UCS* colourspace *uv* chromaticity coordinates.
+
+    Notes
+    -----
+    -   The cache is keyed by the colour matching functions name and shape,
+        and is cleared once it holds more than
+        :attr:`colour.temperature.PLANCKIAN_LOCUS_CACHE_SIZE` temperatures.
+
+    Examples
+    --------
+    >>> from colour import STANDARD_OBSERVERS_CMFS
+    >>> cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']
+    >>> planckian_locus_uv([1000, 6500], cmfs)  # doctest: +ELLIPSIS
+    array([[ 0.4479628...,  0.3546296...],
+           [ 0.2004485...,  0.3103617...]])
+    """
+
+    cmfs, illuminant, locus = _planckian_locus_cache(cmfs)
+
+    temperatures = as_float_array(temperatures)
+    temperatures_f = np.ravel(temperatures)
+
+    if cache:
+        missing = np.unique(
+            [T for T in temperatures_f.tolist() if T not in locus])
+    else:
+        missing = temperatures_f
+
+    uv = np.zeros((missing.shape[0], 2))
+    if missing.size:
+        XYZ = multi_spectral_to_XYZ_integration(
+            blackbody_msa(missing, cmfs.shape), cmfs.shape, cmfs, illuminant)
+        XYZ /= np.max(XYZ, axis=-1)[..., np.newaxis]
+        uv = UCS_to_uv(XYZ_to_UCS(XYZ))
+
+    if not cache:
+        return np.reshape(uv, temperatures.shape + (2, ))
+
+    if len(locus) + missing.shape[0] > PLANCKIAN_LOCUS_CACHE_SIZE:
+        locus.clear()
+
+    locus.update(zip(missing.tolist(), uv))
+
+    return np.reshape([locus[T] for T in temperatures_f.tolist()],
+                      temperatures.shape + (2, ))
+
+
 def planckian_table(uv, cmfs, start, end, count):
     """
     Returns a planckian table from given *CIE UCS* colourspace *uv*
@@ -239,21 +367,11 @@ ui=0.4456351..., vi=0.3548306..., di=0.2514749...)]
 
     ux, vx = uv
 
-    cmfs = cmfs.copy().trim(ASTME30815_PRACTISE_SHAPE)
-
-    shape = cmfs.shape
+    Ti = np.linspace(start, end, count)
+    ui, vi = tsplit(planckian_locus_uv(Ti, cmfs))
+    di = np.hypot(ux - ui, vx - vi)
 
-    table = []
-    for Ti in np.linspace(start, end, count):
-        spd = blackbody_spd(Ti, shape)
-        XYZ = spectral_to_XYZ(spd, cmfs)
-        XYZ /= np.max(XYZ)
-        UVW = XYZ_to_UCS(XYZ)
-        ui, vi = UCS_to_uv(UVW)
-        di = np.hypot(ux - ui, vx - vi)
-        table.append(PLANCKIAN_TABLE_TUVD(Ti, ui, vi, di))
-
-    return table
+    return [PLANCKIAN_TABLE_TUVD(*x) for x in zip(Ti, ui, vi, di)]
 
 
 def planckian_table_minimal_distance_index(planckian_table_):
@@ -426,26 +544,12 @@ def CCT_to_uv_Ohno2013(
     array([ 0.1977999...,  0.3122004...])
     """
 
-    cmfs = cmfs.copy().trim(ASTME30815_PRACTISE_SHAPE)
-
-    shape = cmfs.shape
-
     delta = 0.01
 
-    spd = blackbody_spd(CCT, shape)
-    XYZ = spectral_to_XYZ(spd, cmfs)
-    XYZ *= 1 / np.max(XYZ)
-    UVW = XYZ_to_UCS(XYZ)
-    u0, v0 = UCS_to_uv(UVW)
-
     if D_uv == 0:
-        return np.array([u0, v0])
+        return planckian_locus_uv(CCT, cmfs)
     else:
-        spd = blackbody_spd(CCT + delta, shape)
-        XYZ = spectral_to_XYZ(spd, cmfs)
-        XYZ *= 1 / np.max(XYZ)
-        UVW = XYZ_to_UCS(XYZ)
-        u1, v1 = UCS_to_uv(UVW)
+        (u0, v0), (u1, v1) = planckian_locus_uv([CCT, CCT + delta], cmfs)
 
         du = u0 - u1
         dv = v0 - v1
@@ -484,57 +588,49 @@ def uv_to_CCT_Robertson1968(uv):
     array([  6.5000162...e+03,   8.3333289...e-03])
     """
 
-    u, v = uv
-
-    last_dt = last_dv = last_du = 0
-
-    for i in range(1, 31):
-        wr_ruvt = ROBERTSON_ISOTEMPERATURE_LINES[i]
-        wr_ruvt_previous = ROBERTSON_ISOTEMPERATURE_LINES[i - 1]
-
-        du = 1
-        dv = wr_ruvt.t
+    uv = as_float_array(uv)
+    shape = uv.shape
 
-        length = np.hypot(1, dv)
+    u, v = tsplit(np.reshape(uv, (-1, 2)))
 
-        du /= length
-        dv /= length
+    r_i, u_i, v_i, t_i = np.transpose(ROBERTSON_ISOTEMPERATURE_LINES_DATA)
 
-        uu = u - wr_ruvt.u
-        vv = v - wr_ruvt.v
+    length = np.hypot(1, t_i)
+    du_i = 1 / length
+    dv_i = t_i / length
 
-        dt = -uu * dv + vv * du
+    dt_i = (-(u[..., np.newaxis] - u_i) * dv_i +
+            (v[..., np.newaxis] - v_i) * du_i)
 
-        if dt <= 0 or i == 30:
-            if dt > 0:
-                dt = 0
+    # Finding the first iso-temperature line, from the second one, for which
+    # the distance to the *uv* chromaticity coordinates is not positive.
+    crossed = dt_i[..., 1:] <= 0
+    crossed[..., -1] = True
+    i = np.argmax(crossed, axis=-1) + 1
 
-            dt = -dt
+    samples = np.arange(i.shape[0])
+    dt = -np.minimum(dt_i[samples, i], 0)
+    last_dt = dt_i[samples, i - 1]
 
-            f = 0 if i == 1 else dt / (last_dt + dt)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        f = np.where(i == 1, 0, dt / (last_dt + dt))
 
-            T = 1.0e6 / (wr_ruvt_previous.r * f + wr_ruvt.r * (1 - f))
+    T = 1.0e6 / (r_i[i - 1] * f + r_i[i] * (1 - f))
 
-            uu = u - (wr_ruvt_previous.u * f + wr_ruvt.u * (1 - f))
-            vv = v - (wr_ruvt_previous.v * f + wr_ruvt.v * (1 - f))
+    uu = u - (u_i[i - 1] * f + u_i[i] * (1 - f))
+    vv = v - (v_i[i - 1] * f + v_i[i] * (1 - f))
 
-            du = du * (1 - f) + last_du * f
-            dv = dv * (1 - f) + last_dv * f
+    du = du_i[i] * (1 - f) + du_i[i - 1] * f
+    dv = dv_i[i] * (1 - f) + dv_i[i - 1] * f
 
-            length = np.hypot(du, dv)
+    length = np.hypot(du, dv)
 
-            du /= length
-            dv /= length
+    du /= length
+    dv /= length
 
-            D_uv = uu * du + vv * dv
+    D_uv = uu * du + vv * dv
 
-            break
-
-        last_dt = dt
-        last_du = du
-        last_dv = dv
-
-    return np.array([T, -D_uv])
+    return np.reshape(tstack((T, -D_uv)), shape)
 
 
 def CCT_to_uv_Robertson1968(CCT, D_uv=0):
@@ -646,10 +742,10 @@ def CCT_to_uv_Krystek1985(CCT):
     return tstack((u, v))
 
 
-UV_TO_CCT_METHODS = CaseInsensitiveMapping({
+UV_TO_CCT_METHODS = cache_signature(CaseInsensitiveMapping({
     'Ohno 2013': uv_to_CCT_Ohno2013,
     'Robertson 1968': uv_to_CCT_Robertson1968
-})
+}))
 UV_TO_CCT_METHODS.__doc__ = """
 Supported *CIE UCS* colourspace *uv* chromaticity coordinates to correlated
 colour temperature :math:`T_{cp}` computation methods.
@@ -731,11 +827,11 @@ def uv_to_CCT(uv, method='Ohno 2013', **kwargs):
     return function(uv, **filter_kwargs(function, **kwargs))
 
 
-CCT_TO_UV_METHODS = CaseInsensitiveMapping({
+CCT_TO_UV_METHODS = cache_signature(CaseInsensitiveMapping({
     'Ohno 2013': CCT_to_uv_Ohno2013,
     'Robertson 1968': CCT_to_uv_Robertson1968,
     'Krystek 1985': CCT_to_uv_Krystek1985
-})
+}))
 CCT_TO_UV_METHODS.__doc__ = """
 Supported correlated colour temperature :math:`T_{cp}` to *CIE UCS* colourspace
 *uv* chromaticity coordinates computation methods.
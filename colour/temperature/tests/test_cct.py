@@ -12,8 +12,9 @@ from itertools import permutations
 from colour.colorimetry import STANDARD_OBSERVERS_CMFS
 from colour.temperature import (
     CCT_to_uv_Ohno2013, CCT_to_uv_Robertson1968, CCT_to_uv_Krystek1985,
-    uv_to_CCT_Ohno2013, uv_to_CCT_Robertson1968, CCT_to_xy_Kang2002,
-    CCT_to_xy_CIE_D, xy_to_CCT_McCamy1992, xy_to_CCT_Hernandez1999)
+    planckian_locus_uv, uv_to_CCT_Ohno2013, uv_to_CCT_Robertson1968,
+    CCT_to_xy_Kang2002, CCT_to_xy_CIE_D, xy_to_CCT_McCamy1992,
+    xy_to_CCT_Hernandez1999)
 from colour.temperature.cct import (planckian_table,
                                     planckian_table_minimal_distance_index)
 from colour.utilities import ignore_numpy_errors
@@ -26,7 +27,8 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
 __all__ = [
-    'TestPlanckianTable', 'TestPlanckianTableMinimalDistanceIndex',
+    'TestPlanckianLocusUv', 'TestPlanckianTable',
+    'TestPlanckianTableMinimalDistanceIndex',
     'Testuv_to_CCT_Ohno2013', 'TestCCT_to_uv_Ohno2013',
     'Testuv_to_CCT_Robertson1968', 'TestCCT_to_uv_Robertson1968',
     'TestCCT_to_uv_Krystek1985', 'Testxy_to_CCT_McCamy1992',
@@ -151,6 +153,56 @@ TEMPERATURE_DUV_TO_UV = {
 }
 
 
+class TestPlanckianLocusUv(unittest.TestCase):
+    """
+    Defines :func:`colour.temperature.cct.planckian_locus_uv` definition units
+    tests methods.
+    """
+
+    def test_planckian_locus_uv(self):
+        """
+        Tests :func:`colour.temperature.cct.planckian_locus_uv` definition.
+        """
+
+        cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']
+
+        np.testing.assert_almost_equal(
+            planckian_locus_uv(PLANCKIAN_TABLE[..., 0], cmfs),
+            PLANCKIAN_TABLE[..., 1:3],
+            decimal=7)
+
+        np.testing.assert_equal(
+            planckian_locus_uv(PLANCKIAN_TABLE[..., 0], cmfs, cache=False),
+            planckian_locus_uv(PLANCKIAN_TABLE[..., 0], cmfs))
+
+        np.testing.assert_equal(
+            planckian_locus_uv(PLANCKIAN_TABLE[0, 0], cmfs),
+            planckian_locus_uv(PLANCKIAN_TABLE[..., 0], cmfs)[0])
+
+        cmfs_m = cmfs.copy()
+        cmfs_m.values = cmfs_m.values * np.array([1.0, 1.0, 0.5])
+        self.assertEqual(cmfs_m.name, cmfs.name)
+        np.testing.assert_equal(
+            planckian_locus_uv(PLANCKIAN_TABLE[..., 0], cmfs_m),
+            planckian_locus_uv(PLANCKIAN_TABLE[..., 0], cmfs_m, cache=False))
+        self.assertFalse(
+            np.allclose(
+                planckian_locus_uv(PLANCKIAN_TABLE[..., 0], cmfs_m),
+                PLANCKIAN_TABLE[..., 1:3]))
+
+    def test_n_dimensional_planckian_locus_uv(self):
+        """
+        Tests :func:`colour.temperature.cct.planckian_locus_uv` definition
+        n-dimensional arrays support.
+        """
+
+        uv = planckian_locus_uv(PLANCKIAN_TABLE[..., 0])
+
+        np.testing.assert_equal(
+            planckian_locus_uv(np.reshape(PLANCKIAN_TABLE[..., 0], (2, 5))),
+            np.reshape(uv, (2, 5, 2)))
+
+
 class TestPlanckianTable(unittest.TestCase):
     """
     Defines :func:`colour.temperature.cct.planckian_table` definition units
@@ -262,6 +314,33 @@ class Testuv_to_CCT_Robertson1968(unittest.TestCase):
             np.testing.assert_allclose(
                 uv_to_CCT_Robertson1968(value), key, atol=0.25)
 
+    def test_n_dimensional_uv_to_CCT_Robertson1968(self):
+        """
+        Tests :func:`colour.temperature.cct.uv_to_CCT_Robertson1968`
+        definition n-dimensional arrays support.
+        """
+
+        uv = np.array([0.193741375998230, 0.315221043940594])
+        CCT_D_uv = uv_to_CCT_Robertson1968(uv)
+
+        uv = np.tile(uv, (6, 1))
+        CCT_D_uv = np.tile(CCT_D_uv, (6, 1))
+        np.testing.assert_almost_equal(uv_to_CCT_Robertson1968(uv),
+                                       CCT_D_uv,
+                                       decimal=7)
+
+        uv = np.reshape(uv, (2, 3, 2))
+        CCT_D_uv = np.reshape(CCT_D_uv, (2, 3, 2))
+        np.testing.assert_almost_equal(uv_to_CCT_Robertson1968(uv),
+                                       CCT_D_uv,
+                                       decimal=7)
+
+        uv = np.array(list(TEMPERATURE_DUV_TO_UV.values()))
+        np.testing.assert_almost_equal(
+            uv_to_CCT_Robertson1968(uv),
+            np.array([uv_to_CCT_Robertson1968(uv_i) for uv_i in uv]),
+            decimal=7)
+
 
 class TestCCT_to_uv_Robertson1968(unittest.TestCase):
     """
@@ -6,11 +6,13 @@ from .common import (handle_numpy_errors, ignore_numpy_errors,
                      raise_numpy_errors, print_numpy_errors, warn_numpy_errors,
                      ignore_python_warnings, batch, is_openimageio_installed,
                      is_pandas_installed, is_iterable, is_string, is_numeric,
-                     is_integer, filter_kwargs, first_item)
-from .array import (as_numeric, as_namedtuple, closest_indexes, closest,
-                    normalise_maximum, interval, is_uniform, in_array, tstack,
-                    tsplit, row_as_diagonal, dot_vector, dot_matrix, orient,
-                    centroid, linear_conversion, fill_nan, ndarray_write)
+                     is_integer, FILTER_KWARGS_CACHE_SIZE, cache_signature,
+                     filter_kwargs, first_item)
+from .array import (set_default_float_dtype, as_float_array, as_numeric,
+                    as_namedtuple, closest_indexes, closest, normalise_maximum,
+                    interval, is_uniform, in_array, tstack, tsplit,
+                    row_as_diagonal, dot_vector, dot_matrix, orient, centroid,
+                    linear_conversion, fill_nan, ndarray_write)
 from .data_structures import Lookup, Structure, CaseInsensitiveMapping
 from .metrics import metric_mse, metric_psnr
 from .verbose import (ColourWarning, message_box, warning, filter_warnings,
@@ -20,13 +22,15 @@ __all__ = [
     'handle_numpy_errors', 'ignore_numpy_errors', 'raise_numpy_errors',
     'print_numpy_errors', 'warn_numpy_errors', 'ignore_python_warnings',
     'batch', 'is_openimageio_installed', 'is_pandas_installed', 'is_iterable',
-    'is_string', 'is_numeric', 'is_integer', 'filter_kwargs', 'first_item'
+    'is_string', 'is_numeric', 'is_integer', 'FILTER_KWARGS_CACHE_SIZE',
+    'cache_signature', 'filter_kwargs', 'first_item'
 ]
 __all__ += [
-    'as_numeric', 'as_namedtuple', 'closest_indexes', 'closest',
-    'normalise_maximum', 'interval', 'is_uniform', 'in_array', 'tstack',
-    'tsplit', 'row_as_diagonal', 'dot_vector', 'dot_matrix', 'orient',
-    'centroid', 'linear_conversion', 'fill_nan', 'ndarray_write'
+    'set_default_float_dtype', 'as_float_array', 'as_numeric', 'as_namedtuple',
+    'closest_indexes', 'closest', 'normalise_maximum', 'interval',
+    'is_uniform', 'in_array', 'tstack', 'tsplit', 'row_as_diagonal',
+    'dot_vector', 'dot_matrix', 'orient', 'centroid', 'linear_conversion',
+    'fill_nan', 'ndarray_write'
 ]
 __all__ += ['Lookup', 'Structure', 'CaseInsensitiveMapping']
 __all__ += ['metric_mse', 'metric_psnr']
@@ -20,6 +20,7 @@ numpy-fastest-way-of-computing-diagonal-for-each-row-of-a-2d-array/\
 from __future__ import division, unicode_literals
 
 import numpy as np
+import sys
 from collections import Mapping
 from contextlib import contextmanager
 
@@ -33,14 +34,91 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
 __all__ = [
-    'as_numeric', 'as_namedtuple', 'closest_indexes', 'closest',
-    'normalise_maximum', 'interval', 'is_uniform', 'in_array', 'tstack',
-    'tsplit', 'row_as_diagonal', 'dot_vector', 'dot_matrix', 'orient',
-    'centroid', 'linear_conversion', 'fill_nan', 'ndarray_write'
+    'set_default_float_dtype', 'as_float_array', 'as_numeric', 'as_namedtuple',
+    'closest_indexes', 'closest', 'normalise_maximum', 'interval',
+    'is_uniform', 'in_array', 'tstack', 'tsplit', 'row_as_diagonal',
+    'dot_vector', 'dot_matrix', 'orient', 'centroid', 'linear_conversion',
+    'fill_nan', 'ndarray_write'
 ]
 
 
-def as_numeric(a, type_=DEFAULT_FLOAT_DTYPE):
+def set_default_float_dtype(dtype=np.float64):
+    """
+    Sets *Colour* default floating point number dtype by updating the
+    ``DEFAULT_FLOAT_DTYPE`` attribute of every loaded *Colour* module.
+
+    Parameters
+    ----------
+    dtype : object
+        Floating point number dtype to set, usually :class:`np.float32` or
+        :class:`np.float64`.
+
+    Returns
+    -------
+    object
+        Previous floating point number dtype.
+
+    Warning
+    -------
+    The definition modifies global state and is not thread-safe, it is best
+    called once before any computation.
+
+    Examples
+    --------
+    >>> previous_dtype = set_default_float_dtype(np.float32)
+    >>> as_float_array([0.5, 1.0]).dtype
+    dtype('float32')
+    >>> set_default_float_dtype(previous_dtype)
+    <class 'numpy.float32'>
+    """
+
+    dtype = np.dtype(dtype).type
+
+    assert np.issubdtype(dtype, np.floating), (
+        '"{0}" dtype is not a floating point number dtype!'.format(dtype))
+
+    previous_dtype = DEFAULT_FLOAT_DTYPE
+
+    for name, module in list(sys.modules.items()):
+        if not (name == 'colour' or name.startswith('colour.')):
+            continue
+
+        if 'DEFAULT_FLOAT_DTYPE' in getattr(module, '__dict__', {}):
+            setattr(module, 'DEFAULT_FLOAT_DTYPE', dtype)
+
+    return previous_dtype
+
+
+def as_float_array(a, dtype=None):
+    """
+    Converts given :math:`a` variable to *ndarray* using given type.
+
+    Parameters
+    ----------
+    a : object
+        Variable to convert.
+    dtype : object, optional
+        Type to use for conversion, default to the type defined by
+        :attr:`colour.constants.DEFAULT_FLOAT_DTYPE` attribute.
+
+    Returns
+    -------
+    ndarray
+        :math:`a` variable converted to *ndarray*.
+
+    Examples
+    --------
+    >>> as_float_array([1, 2, 3])
+    array([ 1.,  2.,  3.])
+    """
+
+    if dtype is None:
+        dtype = DEFAULT_FLOAT_DTYPE
+
+    return np.asarray(a, dtype)
+
+
+def as_numeric(a, type_=None):
     """
     Converts given :math:`a` variable to *numeric*. In the event where
     :math:`a` cannot be converted, it is passed as is.
@@ -49,8 +127,9 @@ def as_numeric(a, type_=DEFAULT_FLOAT_DTYPE):
     ----------
     a : object
         Variable to convert.
-    type_ : object
-        Type to use for conversion.
+    type_ : object, optional
+        Type to use for conversion, default to the type defined by
+        :attr:`colour.constants.DEFAULT_FLOAT_DTYPE` attribute.
 
     Returns
     -------
@@ -65,6 +144,9 @@ def as_numeric(a, type_=DEFAULT_FLOAT_DTYPE):
     array([ 0.,  1.,  2.,  3.,  4.,  5.,  6.,  7.,  8.,  9.])
     """
 
+    if type_ is None:
+        type_ = DEFAULT_FLOAT_DTYPE
+
     try:
         return type_(a)
     except TypeError:
@@ -339,16 +421,24 @@ def in_array(a, b, tolerance=EPSILON):
     return np.any(d <= tolerance, axis=0).reshape(a.shape)
 
 
-def tstack(a):
+def tstack(a, dtype=None, out=None):
     """
     Stacks arrays in sequence along the last axis (tail).
 
-    Rebuilds arrays divided by :func:`colour.utilities.tsplit`.
+    Rebuilds arrays divided by :func:`colour.utilities.tsplit`. The arrays are
+    broadcast against each other and written into a single preallocated
+    output array.
 
     Parameters
     ----------
     a : array_like
         Array to perform the stacking.
+    dtype : object, optional
+        Type to use for conversion, default to the type resulting from the
+        given arrays types, i.e. :func:`numpy.result_type` definition.
+    out : ndarray, optional
+        Array in which to place the stacked arrays, it must have the
+        appropriate shape.
 
     Returns
     -------
@@ -383,21 +473,46 @@ def tstack(a):
              [3, 3, 3],
              [4, 4, 4],
              [5, 5, 5]]]])
+    >>> a = np.arange(0, 6)
+    >>> b = np.empty((6, 3))
+    >>> tstack((a, a, a), out=b) is b
+    True
     """
 
-    a = np.asarray(a)
+    a = [np.asarray(x) for x in a]
+
+    if out is None:
+        if dtype is None:
+            dtype = np.result_type(*a)
+
+        # :class:`numpy.broadcast` class accepts at most 32 arrays, they are
+        # thus broadcast by groups against the shape broadcast so far.
+        shape = a[0].shape
+        for i in range(1, len(a), 31):
+            shape = np.broadcast(np.broadcast_to(0, shape),
+                                 *a[i:i + 31]).shape
+        out = np.empty(shape + (len(a), ), dtype)
+
+    for i, x in enumerate(a):
+        out[..., i] = x
 
-    return np.concatenate([x[..., np.newaxis] for x in a], axis=-1)
+    return out
 
 
-def tsplit(a):
+def tsplit(a, dtype=None):
     """
     Splits arrays in sequence along the last axis (tail).
 
+    The splitting does not copy the array data: a view on the given array with
+    the last axis moved to the front is returned whenever the array already has
+    the requested type.
+
     Parameters
     ----------
     a : array_like
         Array to perform the splitting.
+    dtype : object, optional
+        Type to use for conversion, default to the given array type.
 
     Returns
     -------
@@ -436,9 +551,9 @@ def tsplit(a):
            [[0, 1, 2, 3, 4, 5]]])
     """
 
-    a = np.asarray(a)
+    a = np.asarray(a) if dtype is None else as_float_array(a, dtype)
 
-    return np.array([a[..., x] for x in range(a.shape[-1])])
+    return np.moveaxis(a, -1, 0)
 
 
 def row_as_diagonal(a):
@@ -494,7 +609,7 @@ def row_as_diagonal(a):
     return np.eye(a.shape[-1]) * a
 
 
-def dot_vector(m, v):
+def dot_vector(m, v, out=None):
     """
     Convenient wrapper around :func:`np.einsum` with the following subscripts:
     *'...ij,...j->...i'*.
@@ -508,6 +623,10 @@ def dot_vector(m, v):
         Array of 3x3 matrices.
     v : array_like
         Array of vectors.
+    out : ndarray, optional
+        Array in which to place the result, it must have the appropriate
+        shape. It can be ``v`` for in-place computation, a temporary copy of
+        ``v`` is then used.
 
     Returns
     -------
@@ -532,10 +651,16 @@ def dot_vector(m, v):
            [ 0.0794399...,  0.1220905...,  0.0955788...]])
     """
 
-    return np.einsum('...ij,...j->...i', m, v)
+    m = as_float_array(m)
+    v = as_float_array(v)
+
+    if out is not None and np.may_share_memory(out, v):
+        v = np.copy(v)
 
+    return np.einsum('...ij,...j->...i', m, v, out=out, casting='same_kind')
 
-def dot_matrix(a, b):
+
+def dot_matrix(a, b, out=None):
     """
     Convenient wrapper around :func:`np.einsum` with the following subscripts:
     *'...ij,...jk->...ik'*.
@@ -550,6 +675,9 @@ def dot_matrix(a, b):
         Array of 3x3 matrices.
     b : array_like
         Array of 3x3 matrices.
+    out : ndarray, optional
+        Array in which to place the result, it must have the appropriate
+        shape.
 
     Returns
     -------
@@ -590,7 +718,14 @@ def dot_matrix(a, b):
             [-0.0044203...,  0.0377490...,  0.9666713...]]])
     """
 
-    return np.einsum('...ij,...jk->...ik', a, b)
+    a = as_float_array(a)
+    b = as_float_array(b)
+
+    if out is not None and (np.may_share_memory(out, a) or
+                            np.may_share_memory(out, b)):
+        a, b = np.copy(a), np.copy(b)
+
+    return np.einsum('...ij,...jk->...ik', a, b, out=out, casting='same_kind')
 
 
 def orient(a, orientation):
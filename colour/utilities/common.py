@@ -19,7 +19,6 @@ import inspect
 import functools
 import numpy as np
 import warnings
-from copy import deepcopy
 from six import string_types
 
 from colour.constants import INTEGER_THRESHOLD
@@ -35,9 +34,20 @@ __all__ = [
     'handle_numpy_errors', 'ignore_numpy_errors', 'raise_numpy_errors',
     'print_numpy_errors', 'warn_numpy_errors', 'ignore_python_warnings',
     'batch', 'is_openimageio_installed', 'is_pandas_installed', 'is_iterable',
-    'is_string', 'is_numeric', 'is_integer', 'filter_kwargs', 'first_item'
+    'is_string', 'is_numeric', 'is_integer', 'FILTER_KWARGS_CACHE_SIZE',
+    'cache_signature', 'filter_kwargs', 'first_item'
 ]
 
+FILTER_KWARGS_CACHE_SIZE = 4096
+"""
+Maximum count of functions whose arguments names are cached by
+:func:`colour.utilities.filter_kwargs` definition.
+
+FILTER_KWARGS_CACHE_SIZE : int
+"""
+
+_FILTER_KWARGS_ARGUMENTS_CACHE = None
+
 
 def handle_numpy_errors(**kwargs):
     """
@@ -321,10 +331,106 @@ def is_integer(a):
     return abs(a - round(a)) <= INTEGER_THRESHOLD
 
 
+def _filter_kwargs_arguments(function):
+    """
+    Returns the arguments names of given function signature, the names are
+    cached per function code object.
+
+    Parameters
+    ----------
+    function : callable
+        Callable to return the arguments names of.
+
+    Returns
+    -------
+    frozenset
+        Arguments names.
+
+    Notes
+    -----
+    -   Keying the cache on the code object rather than on the function
+        object does not keep the bound methods instances and closures alive,
+        and the functions sharing a code object, e.g. the bound methods of a
+        class instances, share a cache entry.
+    -   The callables without a code object, e.g. classes, are not cached.
+    """
+
+    global _FILTER_KWARGS_ARGUMENTS_CACHE
+    if _FILTER_KWARGS_ARGUMENTS_CACHE is None:
+        _FILTER_KWARGS_ARGUMENTS_CACHE = {}
+
+    code = getattr(getattr(function, '__func__', function), '__code__', None)
+    if code is None:
+        return frozenset(inspect.getargspec(function)[0])
+
+    if code in _FILTER_KWARGS_ARGUMENTS_CACHE:
+        return _FILTER_KWARGS_ARGUMENTS_CACHE[code]
+
+    if len(_FILTER_KWARGS_ARGUMENTS_CACHE) >= FILTER_KWARGS_CACHE_SIZE:
+        _FILTER_KWARGS_ARGUMENTS_CACHE.clear()
+
+    arguments = _FILTER_KWARGS_ARGUMENTS_CACHE[code] = frozenset(
+        inspect.getargspec(function)[0])
+
+    return arguments
+
+
+def cache_signature(function):
+    """
+    Decorator caching given function signature arguments names for the
+    :func:`colour.utilities.filter_kwargs` definition.
+
+    Parameters
+    ----------
+    function : callable or Mapping
+        Function to decorate or mapping of functions, e.g. a dispatch table,
+        whose values signatures are cached.
+
+    Returns
+    -------
+    callable or Mapping
+        Given function or mapping of functions, unchanged.
+
+    Notes
+    -----
+    -   The signatures are otherwise cached on the first
+        :func:`colour.utilities.filter_kwargs` definition call, the decorator
+        only moves the introspection to the function definition, e.g. for the
+        functions of a dispatch table.
+    -   The signatures are cached per function code object and are cached
+        again on the next :func:`colour.utilities.filter_kwargs` definition
+        call if the cache has been cleared after reaching the
+        :attr:`colour.utilities.FILTER_KWARGS_CACHE_SIZE` attribute size.
+
+    Examples
+    --------
+    >>> @cache_signature
+    ... def fn_a(a, b=0):
+    ...     return a, b
+    >>> filter_kwargs(fn_a, b=2, c=3)
+    {'b': 2}
+    >>> fn_b = cache_signature({'fn_a': fn_a})['fn_a']
+    >>> filter_kwargs(fn_b, b=2, c=3)
+    {'b': 2}
+    """
+
+    if callable(function):
+        _filter_kwargs_arguments(function)
+    else:
+        for value in function.values():
+            _filter_kwargs_arguments(value)
+
+    return function
+
+
 def filter_kwargs(function, **kwargs):
     """
     Filters keyword arguments incompatible with the given function signature.
 
+    The function signature arguments names are cached per function code
+    object, thus the filtering costs a *dict* lookup and a *set*
+    intersection.
+
     Parameters
     ----------
     function : callable
@@ -356,14 +462,12 @@ def filter_kwargs(function, **kwargs):
     (1, 2, 3)
     """
 
-    kwargs = deepcopy(kwargs)
-    args, _varargs, _keywords, _defaults = inspect.getargspec(function)
+    if not kwargs:
+        return kwargs
 
-    args = set(kwargs.keys()) - set(args)
-    for key in args:
-        kwargs.pop(key)
+    arguments = _filter_kwargs_arguments(function)
 
-    return kwargs
+    return {key: kwargs[key] for key in arguments.intersection(kwargs)}
 
 
 def first_item(a):
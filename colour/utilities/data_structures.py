@@ -210,6 +210,40 @@ class Lookup(dict):
         return [key for key, data in self.items() if data == value]
 
 
+class _LowerKeysDict(dict):
+    """
+    Extends *dict* type to retrieve the values of missing keys using their
+    lower name, the keys being stored with both their original and lower
+    names.
+    """
+
+    def __missing__(self, item):
+        """
+        Returns the value of given missing item using its lower name.
+
+        Parameters
+        ----------
+        item : unicode
+            Item name.
+
+        Returns
+        -------
+        object
+            Item value.
+
+        Raises
+        ------
+        KeyError
+            If the lower item name is not in the *dict*.
+        """
+
+        lower = item.lower()
+        if lower == item:
+            raise KeyError(item)
+
+        return self[lower]
+
+
 class CaseInsensitiveMapping(MutableMapping):
     """
     Implements a case-insensitive mutable mapping / *dict* object.
@@ -218,6 +252,10 @@ class CaseInsensitiveMapping(MutableMapping):
     The keys are expected to be unicode or string-like objects supporting the
     :meth:`str.lower` method.
 
+    The values are additionally stored with both the original and lower names
+    of their key in a *dict* sub-class, thus retrieving a value with either
+    name costs a single *dict* lookup, only the other names are lowered.
+
     Parameters
     ----------
     data : dict
@@ -259,6 +297,7 @@ class CaseInsensitiveMapping(MutableMapping):
 
     def __init__(self, data=None, **kwargs):
         self._data = dict()
+        self._values = _LowerKeysDict()
 
         self.update({} if data is None else data, **kwargs)
 
@@ -297,7 +336,13 @@ class CaseInsensitiveMapping(MutableMapping):
             Value.
         """
 
-        self._data[item.lower()] = (item, value)
+        lower = item.lower()
+
+        if lower in self._data:
+            self._values.pop(self._data[lower][0], None)
+
+        self._data[lower] = (item, value)
+        self._values[lower] = self._values[item] = value
 
     def __getitem__(self, item):
         """
@@ -316,7 +361,7 @@ class CaseInsensitiveMapping(MutableMapping):
             Item value.
         """
 
-        return self._data[item.lower()][1]
+        return self._values[item]
 
     def __delitem__(self, item):
         """
@@ -330,7 +375,11 @@ class CaseInsensitiveMapping(MutableMapping):
             Item name.
         """
 
-        del self._data[item.lower()]
+        lower = item.lower()
+
+        name, _value = self._data.pop(lower)
+        self._values.pop(name, None)
+        self._values.pop(lower, None)
 
     def __contains__(self, item):
         """
@@ -347,7 +396,7 @@ class CaseInsensitiveMapping(MutableMapping):
             Is item in mapping.
         """
 
-        return item.lower() in self._data
+        return item in self._values or item.lower() in self._data
 
     def __iter__(self):
         """
@@ -192,10 +192,23 @@ class ModuleAPI(object):
     Define a class that allows customisation of module attributes access with
     deprecation management.
 
+    The non deprecated attributes are stored in the instance dictionary on
+    first access, the subsequent accesses are thus resolved by the regular
+    attribute lookup without calling :meth:`ModuleAPI.__getattr__` method.
+
     Parameters
     ----------
     module : module
         Module to customise attributes access.
+    changes : dict, optional
+        Module API changes, i.e. the deprecated attributes names and their
+        :class:`colour.utilities.deprecation.Renamed`,
+        :class:`colour.utilities.deprecation.Removed`,
+        :class:`colour.utilities.deprecation.FutureRename`,
+        :class:`colour.utilities.deprecation.FutureRemove`,
+        :class:`colour.utilities.deprecation.FutureAccessChange` or
+        :class:`colour.utilities.deprecation.FutureAccessRemove` class
+        instances.
 
     Methods
     -------
@@ -242,7 +255,11 @@ class ModuleAPI(object):
             else:
                 raise AttributeError(str(change))
 
-        return getattr(self._module, attribute)
+        value = getattr(self._module, attribute)
+
+        self.__dict__[attribute] = value
+
+        return value
 
     def __dir__(self):
         """
@@ -10,11 +10,11 @@ import unittest
 from collections import namedtuple
 
 from colour.constants import DEFAULT_FLOAT_DTYPE
-from colour.utilities import (as_numeric, as_namedtuple, closest_indexes,
-                              closest, normalise_maximum, interval, is_uniform,
-                              in_array, tstack, tsplit, row_as_diagonal,
-                              dot_vector, dot_matrix, orient, centroid,
-                              linear_conversion, fill_nan, ndarray_write)
+from colour.utilities import (
+    set_default_float_dtype, as_float_array, as_numeric, as_namedtuple,
+    closest_indexes, closest, normalise_maximum, interval, is_uniform,
+    in_array, tstack, tsplit, row_as_diagonal, dot_vector, dot_matrix, orient,
+    centroid, linear_conversion, fill_nan, ndarray_write)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -24,7 +24,8 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
 __all__ = [
-    'TestAsNumeric', 'TestAsNametuple', 'TestClosestIndexes', 'TestClosest',
+    'TestSetDefaultFloatDtype', 'TestAsFloatArray', 'TestAsNumeric',
+    'TestAsNametuple', 'TestClosestIndexes', 'TestClosest',
     'TestNormaliseMaximum', 'TestInterval', 'TestIsUniform', 'TestInArray',
     'TestTstack', 'TestTsplit', 'TestRowAsDiagonal', 'TestDotVector',
     'TestDotMatrix', 'TestOrient', 'TestCentroid', 'TestLinearConversion',
@@ -32,6 +33,83 @@ __all__ = [
 ]
 
 
+class TestSetDefaultFloatDtype(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.array.set_default_float_dtype` definition
+    unit tests methods.
+    """
+    def test_set_default_float_dtype(self):
+        """
+        Tests :func:`colour.utilities.array.set_default_float_dtype`
+        definition.
+        """
+
+        import colour.constants
+        import colour.utilities.array
+
+        default_dtype = colour.constants.DEFAULT_FLOAT_DTYPE
+
+        previous_dtype = set_default_float_dtype(np.float32)
+        try:
+            self.assertEqual(previous_dtype, default_dtype)
+            self.assertEqual(colour.constants.DEFAULT_FLOAT_DTYPE, np.float32)
+            self.assertEqual(colour.utilities.array.DEFAULT_FLOAT_DTYPE,
+                             np.float32)
+
+            self.assertEqual(as_float_array([1, 2, 3]).dtype, np.float32)
+            self.assertEqual(
+                tstack((1, 2, 3), np.float32).dtype, np.float32)
+            self.assertEqual(
+                dot_vector(np.identity(3), np.ones(3)).dtype, np.float32)
+
+            from colour.algebra import Extrapolator, LinearInterpolator
+            from colour.colorimetry import SpectralShape, constant_spd
+            from colour.continuous import Signal
+
+            self.assertEqual(constant_spd(1).values.dtype, np.float32)
+            self.assertEqual(
+                SpectralShape(360, 830, 1).range().dtype, np.float32)
+            interpolator = LinearInterpolator([0, 1], [0, 1])
+            self.assertEqual(interpolator(0.5).dtype, np.float32)
+            self.assertEqual(
+                Extrapolator(interpolator)(2).dtype, np.float32)
+            self.assertEqual(
+                Signal.signal_unpack_data([0, 1])[0].dtype, np.float32)
+        finally:
+            set_default_float_dtype(previous_dtype)
+
+        self.assertEqual(colour.constants.DEFAULT_FLOAT_DTYPE, default_dtype)
+
+    def test_raise_exception_set_default_float_dtype(self):
+        """
+        Tests :func:`colour.utilities.array.set_default_float_dtype`
+        definition raised exception.
+        """
+
+        self.assertRaises(AssertionError, set_default_float_dtype, np.int_)
+
+
+class TestAsFloatArray(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.array.as_float_array` definition unit
+    tests methods.
+    """
+    def test_as_float_array(self):
+        """
+        Tests :func:`colour.utilities.array.as_float_array` definition.
+        """
+
+        np.testing.assert_equal(as_float_array([1, 2, 3]), np.array([1, 2, 3]))
+
+        self.assertEqual(as_float_array([1, 2, 3]).dtype, DEFAULT_FLOAT_DTYPE)
+
+        self.assertEqual(
+            as_float_array([1, 2, 3], np.float16).dtype, np.float16)
+
+        a = np.array([1, 2, 3], dtype=DEFAULT_FLOAT_DTYPE)
+        self.assertIs(as_float_array(a), a)
+
+
 class TestAsNumeric(unittest.TestCase):
     """
     Defines :func:`colour.utilities.array.as_numeric` definition unit tests
@@ -353,6 +431,45 @@ class TestTstack(unittest.TestCase):
                 [[3, 3, 3], [4, 4, 4], [5, 5, 5]],
             ]]))
 
+        a = np.arange(0, 6)
+        np.testing.assert_almost_equal(
+            tstack([a] * 40 + [1]),
+            np.hstack([np.tile(a[:, np.newaxis], (1, 40)), np.ones((6, 1))]))
+
+    def test_out_tstack(self):
+        """
+        Tests :func:`colour.utilities.array.tstack` definition ``out``
+        argument support.
+        """
+
+        a = np.arange(0, 6)
+        b = np.zeros((6, 3))
+        self.assertIs(tstack((a, a, a), out=b), b)
+        np.testing.assert_almost_equal(b, tstack((a, a, a)))
+
+    def test_broadcasting_tstack(self):
+        """
+        Tests :func:`colour.utilities.array.tstack` definition arrays
+        broadcasting.
+        """
+
+        a = np.arange(0, 6)
+        np.testing.assert_almost_equal(tstack((a, 1, a)),
+                                       tstack((a, np.ones(6), a)))
+
+    def test_dtype_tstack(self):
+        """
+        Tests :func:`colour.utilities.array.tstack` definition ``dtype``
+        argument support.
+        """
+
+        a = np.arange(0, 6)
+        self.assertEqual(tstack((a, a, a)).dtype, a.dtype)
+        self.assertEqual(tstack((a, 1.0, a)).dtype, np.float_)
+        self.assertEqual(
+            tstack((a, a, a.astype(np.float32))).dtype, np.float64)
+        self.assertEqual(tstack((a, a, a), np.float32).dtype, np.float32)
+
 
 class TestTsplit(unittest.TestCase):
     """
@@ -406,6 +523,30 @@ class TestTsplit(unittest.TestCase):
                 [[[0, 1, 2], [3, 4, 5]]],
             ]))
 
+    def test_view_tsplit(self):
+        """
+        Tests :func:`colour.utilities.array.tsplit` definition views
+        support.
+        """
+
+        a = np.reshape(np.arange(0, 18, dtype=DEFAULT_FLOAT_DTYPE), (6, 3))
+        x, y, z = tsplit(a)
+        self.assertTrue(np.shares_memory(x, a))
+        np.testing.assert_almost_equal(x, np.arange(0, 18, 3))
+
+        self.assertFalse(np.shares_memory(tsplit(a, np.float16), a))
+
+    def test_dtype_tsplit(self):
+        """
+        Tests :func:`colour.utilities.array.tsplit` definition ``dtype``
+        argument support.
+        """
+
+        a = np.arange(0, 18).reshape((6, 3))
+        self.assertEqual(tsplit(a).dtype, a.dtype)
+        self.assertEqual(tsplit(a.astype(np.float32)).dtype, np.float32)
+        self.assertEqual(tsplit(a, np.float32).dtype, np.float32)
+
 
 class TestRowAsDiagonal(unittest.TestCase):
     """
@@ -479,6 +620,27 @@ class TestDotVector(unittest.TestCase):
             ]),
             decimal=7)
 
+    def test_out_dot_vector(self):
+        """
+        Tests :func:`colour.utilities.array.dot_vector` definition ``out``
+        argument support.
+        """
+
+        m = np.array([
+            [0.7328, 0.4296, -0.1624],
+            [-0.7036, 1.6975, 0.0061],
+            [0.0030, 0.0136, 0.9834],
+        ])
+        v = np.tile(np.array([0.07049534, 0.10080000, 0.09558313]), (6, 1))
+        v_r = dot_vector(m, v)
+
+        out = np.zeros(v.shape)
+        self.assertIs(dot_vector(m, v, out=out), out)
+        np.testing.assert_almost_equal(out, v_r, decimal=7)
+
+        self.assertIs(dot_vector(m, v, out=v), v)
+        np.testing.assert_almost_equal(v, v_r, decimal=7)
+
 
 class TestDotMatrix(unittest.TestCase):
     """
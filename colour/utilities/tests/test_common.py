@@ -5,12 +5,16 @@ Defines unit tests for :mod:`colour.utilities.common` module.
 
 from __future__ import division, unicode_literals
 
+import gc
 import numpy as np
 import unittest
+import weakref
 from collections import OrderedDict
 
-from colour.utilities import (batch, is_iterable, is_string, is_numeric,
-                              is_integer, filter_kwargs, first_item)
+from colour.utilities import (CaseInsensitiveMapping, batch, is_iterable,
+                              is_string, is_numeric, is_integer,
+                              cache_signature, filter_kwargs, first_item)
+from colour.utilities import common
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -21,7 +25,8 @@ __status__ = 'Production'
 
 __all__ = [
     'TestBatch', 'TestIsIterable', 'TestIsString', 'TestIsNumeric',
-    'TestIsInteger', 'TestFilterKwargs', 'TestFirstItem'
+    'TestIsInteger', 'TestCacheSignature', 'TestFilterKwargs',
+    'TestFirstItem'
 ]
 
 
@@ -148,6 +153,42 @@ class TestIsInteger(unittest.TestCase):
         self.assertFalse(is_integer(1.01))
 
 
+class TestCacheSignature(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.common.cache_signature` definition units
+    tests methods.
+    """
+
+    def test_cache_signature(self):
+        """
+        Tests :func:`colour.utilities.common.cache_signature` definition.
+        """
+
+        def fn_a(a, b=0):
+            """
+            :func:`cache_signature` unit tests :func:`fn_a`.
+            """
+
+            return a, b
+
+        def fn_b(a, c=0):
+            """
+            :func:`cache_signature` unit tests :func:`fn_b`.
+            """
+
+            return a, c
+
+        self.assertIs(cache_signature(fn_a), fn_a)
+        self.assertIn(fn_a.__code__, common._FILTER_KWARGS_ARGUMENTS_CACHE)
+        self.assertDictEqual(filter_kwargs(fn_a, b=2, c=3), {'b': 2})
+
+        methods = CaseInsensitiveMapping({'B': fn_b})
+        self.assertIs(cache_signature(methods), methods)
+        self.assertIn(fn_b.__code__, common._FILTER_KWARGS_ARGUMENTS_CACHE)
+        self.assertDictEqual(
+            filter_kwargs(methods['b'], b=2, c=3), {'c': 3})
+
+
 class TestFilterKwargs(unittest.TestCase):
     """
     Defines :func:`colour.utilities.common.filter_kwargs` definition units
@@ -186,6 +227,64 @@ class TestFilterKwargs(unittest.TestCase):
         self.assertTupleEqual((1, 2, 3),
                               fn_c(1, **filter_kwargs(fn_c, b=2, c=3)))
 
+        self.assertDictEqual(filter_kwargs(fn_c), {})
+
+        class Callable(object):
+            """
+            :func:`filter_kwargs` unit tests unhashable callable.
+            """
+
+            __hash__ = None
+
+            def __call__(self, a, b=0):
+                return a, b
+
+        callable_ = Callable()
+        self.assertDictEqual(
+            filter_kwargs(callable_.__call__, b=2, c=3), {'b': 2})
+
+    def test_cache_filter_kwargs(self):
+        """
+        Tests :func:`colour.utilities.common.filter_kwargs` definition
+        arguments names caching.
+        """
+
+        def fn_a(a, b=0):
+            """
+            :func:`filter_kwargs` unit tests :func:`fn_a`.
+            """
+
+            return a, b
+
+        self.assertDictEqual(filter_kwargs(fn_a, b=2, c=3), {'b': 2})
+        self.assertIn(fn_a.__code__, common._FILTER_KWARGS_ARGUMENTS_CACHE)
+
+        # A cache hit returns the cached arguments names without
+        # introspecting the function signature again.
+        common._FILTER_KWARGS_ARGUMENTS_CACHE[fn_a.__code__] = frozenset(
+            ['c'])
+        self.assertDictEqual(filter_kwargs(fn_a, b=2, c=3), {'c': 3})
+        del common._FILTER_KWARGS_ARGUMENTS_CACHE[fn_a.__code__]
+
+        class Callable(object):
+            """
+            :func:`filter_kwargs` unit tests callable.
+            """
+
+            def __call__(self, a, b=0):
+                return a, b
+
+        callable_a, callable_b = Callable(), Callable()
+        filter_kwargs(callable_a.__call__, b=2)
+        size = len(common._FILTER_KWARGS_ARGUMENTS_CACHE)
+        filter_kwargs(callable_b.__call__, b=2)
+        self.assertEqual(len(common._FILTER_KWARGS_ARGUMENTS_CACHE), size)
+
+        reference = weakref.ref(callable_a)
+        del callable_a
+        gc.collect()
+        self.assertIsNone(reference())
+
 
 class TestFirstItem(unittest.TestCase):
     """
@@ -155,6 +155,12 @@ CaseInsensitiveMapping.__setitem__` method.
         self.assertEqual(mapping['John'], 'Doe')
         self.assertEqual(mapping['john'], 'Doe')
 
+        mapping['JOHN'] = 'Smith'
+        self.assertEqual(mapping['John'], 'Smith')
+        self.assertEqual(mapping['JOHN'], 'Smith')
+        self.assertEqual(mapping['jOhN'], 'Smith')
+        self.assertListEqual(list(mapping), ['JOHN'])
+
     def test__getitem__(self):
         """
         Tests :meth:`colour.utilities.data_structures.\
@@ -171,6 +177,8 @@ CaseInsensitiveMapping.__getitem__` method.
 
         self.assertEqual(mapping['jane'], 'Doe')
 
+        self.assertRaises(KeyError, lambda: mapping['Luke'])
+
     def test__delitem__(self):
         """
         Tests :meth:`colour.utilities.data_structures.\
@@ -186,6 +194,9 @@ CaseInsensitiveMapping.__delitem__` method.
         self.assertNotIn('jane', mapping)
         self.assertEqual(len(mapping), 0)
 
+        self.assertRaises(KeyError, lambda: mapping['John'])
+        self.assertRaises(KeyError, lambda: mapping['jane'])
+
     def test__contains__(self):
         """
         Tests :meth:`colour.utilities.data_structures.\
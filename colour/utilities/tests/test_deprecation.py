@@ -5,9 +5,13 @@ Defines unit tests for :mod:`colour.utilities.deprecation` module.
 
 from __future__ import division, unicode_literals
 
+import sys
 import unittest
+from types import ModuleType
 
-from colour.utilities.deprecation import get_attribute
+from colour.utilities import suppress_warnings
+from colour.utilities.deprecation import (ModuleAPI, Removed, Renamed,
+                                          get_attribute)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -16,7 +20,78 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['TestGetAttribute']
+__all__ = ['TestModuleAPI', 'TestGetAttribute']
+
+
+class TestModuleAPI(unittest.TestCase):
+    """
+    Defines :class:`colour.utilities.deprecation.ModuleAPI` class unit tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._module = ModuleType(str('colour_test_module_api'))
+        self._module.a = 1
+        self._module.b = 2
+
+        sys.modules['colour_test_module_api'] = self._module
+
+        self._API = ModuleAPI(
+            self._module, {
+                'c': Renamed('colour_test_module_api.c',
+                             'colour_test_module_api.a'),
+                'd': Removed('colour_test_module_api.d'),
+            })
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        del sys.modules['colour_test_module_api']
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__init__', '__getattr__', '__dir__')
+
+        for method in required_methods:
+            self.assertIn(method, dir(ModuleAPI))
+
+    def test__getattr__(self):
+        """
+        Tests :meth:`colour.utilities.deprecation.ModuleAPI.__getattr__`
+        method.
+        """
+
+        self.assertNotIn('a', vars(self._API))
+        self.assertEqual(self._API.a, 1)
+        self.assertIn('a', vars(self._API))
+        self.assertEqual(self._API.a, 1)
+
+        with suppress_warnings():
+            self.assertEqual(self._API.c, 1)
+        self.assertNotIn('c', vars(self._API))
+
+        self.assertRaises(AttributeError, lambda: self._API.d)
+        self.assertRaises(AttributeError, lambda: self._API.e)
+        self.assertNotIn('e', vars(self._API))
+
+    def test__dir__(self):
+        """
+        Tests :meth:`colour.utilities.deprecation.ModuleAPI.__dir__` method.
+        """
+
+        self.assertIn('a', dir(self._API))
+        self.assertIn('b', dir(self._API))
+        self.assertNotIn('c', dir(self._API))
+        self.assertNotIn('d', dir(self._API))
 
 
 class TestGetAttribute(unittest.TestCase):
@@ -52,7 +52,7 @@ if sys.version_info[:2] <= (3, 2):
     TESTS_REQUIREMENTS += ['mock']
 
 DEVELOPMENT_REQUIREMENTS = DOCS_REQUIREMENTS + TESTS_REQUIREMENTS + [
-    'invoke', 'restructuredtext_lint', 'twine', 'yapf'
+    'asv', 'invoke', 'restructuredtext_lint', 'twine', 'yapf'
 ]
 
 
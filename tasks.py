@@ -27,8 +27,8 @@ __status__ = 'Production'
 
 __all__ = [
     'APPLICATION_NAME', 'PYTHON_PACKAGE_NAME', 'PYPI_PACKAGE_NAME', 'clean',
-    'formatting', 'tests', 'quality', 'examples', 'docs', 'todo', 'preflight',
-    'build', 'virtualise', 'tag', 'release', 'sha256'
+    'formatting', 'tests', 'quality', 'examples', 'benchmarks', 'docs', 'todo',
+    'preflight', 'build', 'virtualise', 'tag', 'release', 'sha256'
 ]
 
 APPLICATION_NAME = colour.__application_name__
@@ -195,6 +195,59 @@ def examples(ctx, plots=False):
             ctx.run('python {0}'.format(os.path.join(root, filename)))
 
 
+@task
+def benchmarks(ctx, baseline=None, factor=1.1, bench=None, quick=False):
+    """
+    Runs the benchmarks with *Airspeed Velocity* in the current environment,
+    saves their results for the current commit and compares them against the
+    saved results of given baseline commit.
+
+    Parameters
+    ----------
+    ctx : invoke.context.Context
+        Context.
+    baseline : unicode, optional
+        Baseline commit, e.g. *develop* or a tag, whose results were saved by
+        a previous run of the task, the comparison is skipped if not given.
+    factor : numeric, optional
+        Ratio above which a result difference is reported as significant.
+    bench : unicode, optional
+        Regular expression selecting the benchmarks to run.
+    quick : bool, optional
+        Whether to run each benchmark only once, the results are then not
+        saved.
+
+    Returns
+    -------
+    bool
+        Task success.
+    """
+
+    message_box('Running "Airspeed Velocity" benchmarks...')
+
+    commit = ctx.run('git rev-parse HEAD', hide=True).stdout.strip()
+
+    ctx.run('asv machine --yes')
+
+    arguments = ['--python=same', '--set-commit-hash {0}'.format(commit)]
+    if bench is not None:
+        arguments.append('--bench "{0}"'.format(bench))
+    if quick:
+        arguments.append('--quick')
+
+    ctx.run('asv run {0}'.format(' '.join(arguments)))
+
+    if baseline is not None and not quick:
+        message_box('Comparing benchmarks against "{0}" baseline...'.format(
+            baseline))
+
+        baseline = ctx.run(
+            'git rev-parse {0}'.format(baseline), hide=True).stdout.strip()
+
+        ctx.run('asv compare --split --factor {0} {1} {2}'.format(
+            factor, baseline, commit))
+
+
 @task
 def docs(ctx, plots=True, html=True, pdf=True):
     """
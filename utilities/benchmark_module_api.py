@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark ModuleAPI
+===================
+
+Compares the attribute access cost of the :mod:`colour` package, wrapped by
+the :class:`colour.utilities.deprecation.ModuleAPI` class, against the direct
+access to the underlying module attributes and the former
+:class:`colour.utilities.deprecation.ModuleAPI` class implementation resolving
+every access with its :meth:`__getattr__` method.
+
+Notes
+-----
+-   The attribute accesses are timed with the *globals* argument of
+    :func:`timeit.repeat` definition thus the utility requires *Python 3*.
+"""
+
+from __future__ import division, print_function, unicode_literals
+
+import sys
+import timeit
+
+import colour
+from colour.utilities import message_box
+from colour.utilities.deprecation import ModuleAPI, Removed, get_attribute
+
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'NUMBER', 'REPEAT', 'ModuleAPI_legacy', 'benchmark',
+    'benchmark_module_api'
+]
+
+NUMBER = 1000000
+"""
+Benchmarked attribute accesses count per repetition.
+
+NUMBER : int
+"""
+
+REPEAT = 5
+"""
+Benchmarked repetitions count.
+
+REPEAT : int
+"""
+
+
+class ModuleAPI_legacy(ModuleAPI):
+    """
+    Former :class:`colour.utilities.deprecation.ModuleAPI` class
+    implementation resolving every attribute access with its
+    :meth:`__getattr__` method.
+    """
+
+    def __getattr__(self, attribute):
+        """
+        Returns given attribute value while handling deprecation.
+
+        Parameters
+        ----------
+        attribute : unicode
+            Attribute name.
+
+        Returns
+        -------
+        object
+            Attribute value.
+        """
+
+        change = self._changes.get(attribute)
+        if change is not None:
+            if not isinstance(change, Removed):
+                colour.utilities.warning(str(change))
+                return get_attribute(change[1])
+            else:
+                raise AttributeError(str(change))
+
+        return getattr(self._module, attribute)
+
+
+def benchmark(module, attribute):
+    """
+    Benchmarks the access to given module attribute.
+
+    Parameters
+    ----------
+    module : module or ModuleAPI
+        Module to access the attribute of.
+    attribute : unicode
+        Attribute name.
+
+    Returns
+    -------
+    numeric
+        Best attribute access time in seconds.
+    """
+
+    return min(
+        timeit.repeat(
+            'module.{0}'.format(attribute),
+            globals={'module': module},
+            repeat=REPEAT,
+            number=NUMBER)) / NUMBER
+
+
+def benchmark_module_api(attribute='XYZ_to_Lab'):
+    """
+    Benchmarks the :mod:`colour` package attribute access.
+
+    Parameters
+    ----------
+    attribute : unicode, optional
+        Benchmarked attribute name.
+    """
+
+    API = sys.modules['colour']
+    module = API._module
+    API_legacy = ModuleAPI_legacy(module, API._changes)
+
+    message_box(
+        'Benchmarking "colour.{0}" attribute access.'.format(attribute))
+
+    benchmarks = (
+        ('Module', module),
+        ('ModuleAPI (legacy)', API_legacy),
+        ('ModuleAPI', API),
+    )
+
+    print('{0:<28}{1:>12}'.format('Access', 'Time (ns)'))
+    for name, module in benchmarks:
+        time = benchmark(module, attribute)
+        print('{0:<28}{1:>12.1f}'.format(name, time * 1e9))
+
+
+if __name__ == '__main__':
+    benchmark_module_api()
@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark tsplit / tstack
+=========================
+
+Compares the timings and peak memory allocations of
+:func:`colour.utilities.tsplit` and :func:`colour.utilities.tstack`
+definitions against their former copy based implementations on an *UHD-1*
+image sized array.
+
+Notes
+-----
+-   Peak memory allocations are measured with :mod:`tracemalloc` thus the
+    utility requires *Python 3*.
+"""
+
+from __future__ import division, print_function, unicode_literals
+
+import timeit
+import tracemalloc
+
+import numpy as np
+
+import colour
+from colour.utilities import as_float_array, message_box, tsplit, tstack
+
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'SHAPE', 'REPEAT', 'tsplit_legacy', 'tstack_legacy', 'benchmark',
+    'benchmark_tsplit_tstack'
+]
+
+SHAPE = (2160, 3840, 3)
+"""
+Benchmarked arrays shape.
+
+SHAPE : tuple
+"""
+
+REPEAT = 5
+"""
+Benchmarked definitions calls count.
+
+REPEAT : int
+"""
+
+
+def tsplit_legacy(a):
+    """
+    Former copy based :func:`colour.utilities.tsplit` definition
+    implementation.
+
+    Parameters
+    ----------
+    a : array_like
+        Array to perform the splitting.
+
+    Returns
+    -------
+    ndarray
+    """
+
+    a = as_float_array(a)
+
+    return np.array([a[..., x] for x in range(a.shape[-1])])
+
+
+def tstack_legacy(a):
+    """
+    Former copy based :func:`colour.utilities.tstack` definition
+    implementation.
+
+    Parameters
+    ----------
+    a : array_like
+        Array to perform the stacking.
+
+    Returns
+    -------
+    ndarray
+    """
+
+    a = as_float_array(a)
+
+    return np.concatenate([x[..., np.newaxis] for x in a], axis=-1)
+
+
+def benchmark(callable_, *args):
+    """
+    Benchmarks given callable with given arguments.
+
+    Parameters
+    ----------
+    callable_ : callable
+        Callable to benchmark.
+
+    Other Parameters
+    ----------------
+    \\*args : list, optional
+        Arguments to call the callable with.
+
+    Returns
+    -------
+    tuple
+        Best call time in seconds and peak memory allocation in bytes.
+    """
+
+    tracemalloc.start()
+    callable_(*args)
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    time = min(timeit.repeat(lambda: callable_(*args), repeat=REPEAT,
+                             number=1))
+
+    return time, peak
+
+
+def benchmark_tsplit_tstack(shape=SHAPE):
+    """
+    Benchmarks :func:`colour.utilities.tsplit` and
+    :func:`colour.utilities.tstack` definitions and a few conversions relying
+    on them.
+
+    Parameters
+    ----------
+    shape : tuple, optional
+        Benchmarked arrays shape.
+    """
+
+    a = np.random.random(shape)
+    b = tuple(tsplit_legacy(a))
+
+    message_box(
+        'Benchmarking on "{0}" shaped arrays, {1:.1f} MiB each.'.format(
+            shape, a.nbytes / 1024 ** 2))
+
+    benchmarks = (
+        ('tsplit (legacy)', tsplit_legacy, a),
+        ('tsplit', tsplit, a),
+        ('tstack (legacy)', tstack_legacy, b),
+        ('tstack', tstack, b),
+        ('tstack(tsplit) (legacy)', lambda x: tstack_legacy(tsplit_legacy(x)),
+         a),
+        ('tstack(tsplit)', lambda x: tstack(tsplit(x)), a),
+        ('XYZ_to_xyY', colour.XYZ_to_xyY, a),
+        ('XYZ_to_Lab', colour.XYZ_to_Lab, a),
+        ('Lab_to_LCHab', colour.Lab_to_LCHab, a),
+    )
+
+    print('{0:<28}{1:>12}{2:>16}'.format('Definition', 'Time (ms)',
+                                         'Peak (MiB)'))
+    for name, callable_, argument in benchmarks:
+        time, peak = benchmark(callable_, argument)
+        print('{0:<28}{1:>12.2f}{2:>16.1f}'.format(name, time * 1000,
+                                                   peak / 1024 ** 2))
+
+
+if __name__ == '__main__':
+    benchmark_tsplit_tstack()